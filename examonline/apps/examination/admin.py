@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from .models import ExaminationInfo, ExamPaperInfo, ExamStatistics, ExamStudentsInfo, RegradeJob, SubmissionJob
 
 
 # admin-시험정보 등록
@@ -51,3 +51,55 @@ class ExamStudentsInfoAdmin(admin.ModelAdmin):
     search_fields = ('exam',)
     # 페이지
     list_per_page = 20
+
+
+# admin-채점 대기열 등록
+@admin.register(SubmissionJob)
+class SubmissionJobAdmin(admin.ModelAdmin):
+    # admin 헤더
+    list_display = (
+        'test_score',
+        'status',
+        'attempts',
+        'is_auto_submitted',
+        'create_time',
+        'finish_time',
+    )
+    # 필터
+    list_filter = ('status',)
+    # 페이지
+    list_per_page = 20
+
+
+# admin-재채점 대기열 등록
+@admin.register(RegradeJob)
+class RegradeJobAdmin(admin.ModelAdmin):
+    # admin 헤더
+    list_display = (
+        'exam',
+        'status',
+        'processed_count',
+        'updated_count',
+        'create_time',
+        'finish_time',
+    )
+    # 필터
+    list_filter = ('status',)
+    # 페이지
+    list_per_page = 20
+
+
+# admin-시험 성적 통계 등록
+@admin.register(ExamStatistics)
+class ExamStatisticsAdmin(admin.ModelAdmin):
+    # admin 헤더
+    list_display = (
+        'exam',
+        'submitted_count',
+        'min_score',
+        'max_score',
+        'pass_count',
+        'update_time',
+    )
+    # 페이지
+    list_per_page = 20
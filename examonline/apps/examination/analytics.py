@@ -0,0 +1,150 @@
+"""
+Score Analytics.
+
+성적 분포, 문항 분석 지표를 NumPy vector 연산으로 계산 (Python loop 없음).
+DB 조회/cache는 services에서 담당하고, 이 module은 배열 입력만 받는 순수 함수로 유지.
+"""
+import numpy as np
+
+
+def percentile_ranks(scores):
+    """
+    점수별 백분위 순위 (0~100).
+
+    자신보다 낮은 점수 인원 + 동점 인원의 절반을 전체 인원으로 나눈 값.
+
+    Args:
+        scores: 점수 배열
+
+    Returns:
+        np.ndarray: scores와 같은 순서의 백분위 순위
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if not scores.size:
+        return np.zeros(0)
+    ordered = np.sort(scores)
+    below = np.searchsorted(ordered, scores, side='left')
+    ties = np.searchsorted(ordered, scores, side='right') - below
+    return (below + 0.5 * ties) / scores.size * 100
+
+
+def score_distribution(scores, total_score=None, buckets=10):
+    """
+    성적 분포 지표 계산.
+
+    Args:
+        scores: 점수 배열
+        total_score: 구간 계산 기준 총점 (없으면 최고 점수)
+        buckets: 구간 수
+
+    Returns:
+        dict: mean, median, std_deviation, quartiles, histogram, percentile_ranks
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    upper = total_score if total_score else (scores.max() if scores.size else 0)
+    edges = np.linspace(0, upper, buckets + 1) if upper > 0 else np.zeros(buckets + 1)
+
+    if not scores.size:
+        return {
+            'mean': 0.0,
+            'median': 0.0,
+            'std_deviation': 0.0,
+            'quartiles': {'q1': 0.0, 'q2': 0.0, 'q3': 0.0},
+            'histogram': _histogram(np.zeros(buckets, dtype=np.int64), edges),
+            'percentile_ranks': np.zeros(0),
+        }
+
+    q1, q2, q3 = np.percentile(scores, [25, 50, 75])
+    if upper > 0:
+        # 총점을 넘는 점수(배점 변경 등)는 마지막 구간에 포함
+        counts, _ = np.histogram(np.clip(scores, 0, upper), bins=edges)
+    else:
+        counts = np.zeros(buckets, dtype=np.int64)
+        counts[0] = scores.size
+
+    return {
+        'mean': round(float(scores.mean()), 2),
+        'median': round(float(q2), 2),
+        'std_deviation': round(float(scores.std()), 2),
+        'quartiles': {'q1': round(float(q1), 2), 'q2': round(float(q2), 2), 'q3': round(float(q3), 2)},
+        'histogram': _histogram(counts, edges),
+        'percentile_ranks': percentile_ranks(scores),
+    }
+
+
+def _histogram(counts, edges):
+    """구간별 인원 목록"""
+    return [
+        {'range_start': round(float(start), 2), 'range_end': round(float(end), 2), 'count': int(count)}
+        for start, end, count in zip(edges[:-1], edges[1:], counts)
+    ]
+
+
+def item_analysis(earned, correct):
+    """
+    문항 분석 지표 계산 (학생 x 문항 행렬).
+
+    - p_value (난이도): 문항 정답률
+    - discrimination (변별도): 정답 여부와 해당 문항을 뺀 총점 사이의 point-biserial 상관계수
+    - cronbach_alpha (신뢰도): 문항 득점 분산 합과 총점 분산으로 계산
+
+    Args:
+        earned: (학생 수, 문항 수) 문항별 득점 행렬
+        correct: (학생 수, 문항 수) 정답 여부 bool 행렬
+
+    Returns:
+        dict: p_value, mean_score, discrimination (계산 불가 시 nan), cronbach_alpha (계산 불가 시 None)
+    """
+    earned = np.asarray(earned, dtype=np.float64)
+    correct = np.asarray(correct, dtype=np.float64)
+    n_students, n_questions = earned.shape
+
+    if not n_students:
+        empty = np.full(n_questions, np.nan)
+        return {'p_value': empty, 'mean_score': empty, 'discrimination': empty, 'cronbach_alpha': None}
+
+    totals = earned.sum(axis=1)
+    # 문항 자신의 득점을 뺀 총점 (자기 상관으로 변별도가 부풀려지지 않도록)
+    rest = totals[:, None] - earned
+
+    correct_centered = correct - correct.mean(axis=0)
+    rest_centered = rest - rest.mean(axis=0)
+    covariance = (correct_centered * rest_centered).mean(axis=0)
+    deviation = correct.std(axis=0) * rest.std(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        discrimination = np.where(deviation > 0, covariance / deviation, np.nan)
+
+    cronbach_alpha = None
+    if n_students > 1 and n_questions > 1:
+        total_variance = totals.var(ddof=1)
+        if total_variance > 0:
+            item_variance = earned.var(axis=0, ddof=1).sum()
+            cronbach_alpha = float(n_questions / (n_questions - 1) * (1 - item_variance / total_variance))
+
+    return {
+        'p_value': correct.mean(axis=0),
+        'mean_score': earned.mean(axis=0),
+        'discrimination': discrimination,
+        'cronbach_alpha': cronbach_alpha,
+    }
+
+
+def option_counts(question_indexes, option_ids):
+    """
+    (문항, 선택지)별 선택 인원.
+
+    Args:
+        question_indexes: 선택 기록의 문항 열 번호 배열
+        option_ids: 선택 기록의 선택지 ID 배열
+
+    Returns:
+        dict: {(문항 열 번호, 선택지 ID): 인원}
+    """
+    question_indexes = np.asarray(question_indexes, dtype=np.int64)
+    option_ids = np.asarray(option_ids, dtype=np.int64)
+    if not option_ids.size:
+        return {}
+    # (문항, 선택지) 쌍을 정수 key 하나로 합쳐 1차원 unique로 집계
+    base = int(option_ids.max()) + 1
+    keys, counts = np.unique(question_indexes * base + option_ids, return_counts=True)
+    return {(int(key // base), int(key % base)): int(count) for key, count in zip(keys, counts)}
@@ -0,0 +1,323 @@
+"""
+답안 write-behind buffer.
+
+시험 중 frontend는 선택지를 클릭할 때마다 save-answer를 호출한다.
+매번 detail_records JSONField 전체를 다시 쓰는 대신, 답안을 (시험, 학생)별 Redis hash에
+O(1)로 기록하고 flusher가 모아서 한 번에 DB에 반영한다.
+
+- 저장: HSET answer_buffer:{exam_id}:{student_id} {question_id} {answer}
+- flush: 변경된 (시험, 학생) 목록(dirty set)을 꺼내 TestScores 행을 잠근 뒤
+  buffer 답안을 detail_records에 병합 (bulk_update 1회)
+- 병합은 문제별 last-writer-wins (client_ts 기준, save-answers의 JSONMerge와 같은 규칙)
+- buffer는 transaction commit 후에 비운다 (읽은 값과 같은 답안만 삭제).
+  rollback되면 buffer와 dirty 표시가 그대로 남아 다음 flush에서 다시 반영된다.
+- 제출/자동 제출은 채점 전에 반드시 flush, 응시 상태(status)는 buffer 내용을 합쳐서 반환
+
+settings.ANSWER_BUFFER_ENABLED가 False(기본값)이면 사용하지 않는다.
+Redis cache가 아니면(LocMem 등) Django cache API로 동작한다. (단일 process 개발/테스트용)
+"""
+import functools
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.db import transaction
+from django.db.models import Q
+
+from testpaper.models import TestScores
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'answer_buffer'
+DIRTY_KEY = f'{KEY_PREFIX}:dirty'
+# Django RedisCache만 사용하는 OPTIONS (redis-py connection pool에는 전달하지 않음)
+CACHE_ONLY_OPTIONS = ('pool_class', 'parser_class', 'serializer')
+# flusher가 멈춰도 buffer가 영구히 남지 않도록 설정 (시험 시간보다 충분히 길게)
+BUFFER_TIMEOUT = 60 * 60 * 24
+
+
+# 읽은 값과 같은 field만 삭제 (그 사이 새로 기록된 답안은 남김)
+DISCARD_VALUES_SCRIPT = """
+local removed = 0
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        removed = removed + redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+return removed
+"""
+
+_redis_clients = {}
+
+
+def _redis_client(alias='default'):
+    """
+    cache 설정(LOCATION/OPTIONS)과 같은 Redis에 연결하는 redis-py client (process별 1개).
+
+    Django 내장 RedisCache는 client를 공개 API로 제공하지 않으므로, 같은 설정으로 connection pool을 따로 만든다.
+    LOCATION에 여러 서버가 있으면 첫 번째(쓰기용) 서버를 사용한다.
+    """
+    client = _redis_clients.get(alias)
+    if client is None:
+        import redis
+
+        params = settings.CACHES[alias]
+        location = params['LOCATION']
+        if isinstance(location, str):
+            location = location.split(',')
+        options = {
+            name: value for name, value in params.get('OPTIONS', {}).items() if name not in CACHE_ONLY_OPTIONS
+        }
+        client = _redis_clients[alias] = redis.Redis.from_url(location[0], **options)
+    return client
+
+
+class _RedisStore:
+    """Redis hash/set 기반 저장소"""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def _client(self):
+        return _redis_client()
+
+    def put(self, key, field, value, member):
+        pipe = self._client().pipeline()
+        pipe.hset(self.cache.make_key(key), field, value)
+        pipe.expire(self.cache.make_key(key), BUFFER_TIMEOUT)
+        pipe.sadd(self.cache.make_key(DIRTY_KEY), member)
+        pipe.execute()
+
+    def peek(self, key) -> dict:
+        raw = self._client().hgetall(self.cache.make_key(key))
+        return {_decode(field): _decode(value) for field, value in raw.items()}
+
+    def discard(self, key):
+        self._client().delete(self.cache.make_key(key))
+
+    def discard_values(self, key, values):
+        args = [item for field_value in values.items() for item in field_value]
+        self._client().eval(DISCARD_VALUES_SCRIPT, 1, self.cache.make_key(key), *args)
+
+    def pop_dirty(self, count) -> list:
+        return [_decode(member) for member in self._client().spop(self.cache.make_key(DIRTY_KEY), count) or []]
+
+    def add_dirty(self, members):
+        self._client().sadd(self.cache.make_key(DIRTY_KEY), *members)
+
+
+class _CacheStore:
+    """Django cache API 기반 저장소 (Redis가 아닌 cache backend용)"""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def put(self, key, field, value, member):
+        values = self.cache.get(key) or {}
+        values[field] = value
+        self.cache.set(key, values, BUFFER_TIMEOUT)
+
+        dirty = self.cache.get(DIRTY_KEY) or set()
+        dirty.add(member)
+        self.cache.set(DIRTY_KEY, dirty, BUFFER_TIMEOUT)
+
+    def peek(self, key) -> dict:
+        return dict(self.cache.get(key) or {})
+
+    def discard(self, key):
+        self.cache.delete(key)
+
+    def discard_values(self, key, values):
+        current = self.peek(key)
+        for field, value in values.items():
+            if current.get(field) == value:
+                del current[field]
+        if current:
+            self.cache.set(key, current, BUFFER_TIMEOUT)
+        else:
+            self.cache.delete(key)
+
+    def pop_dirty(self, count) -> list:
+        dirty = self.cache.get(DIRTY_KEY) or set()
+        popped = [dirty.pop() for _ in range(min(count, len(dirty)))]
+        self.cache.set(DIRTY_KEY, dirty, BUFFER_TIMEOUT)
+        return popped
+
+    def add_dirty(self, members):
+        dirty = self.cache.get(DIRTY_KEY) or set()
+        dirty.update(members)
+        self.cache.set(DIRTY_KEY, dirty, BUFFER_TIMEOUT)
+
+
+def merge_latest(records, values, order_key='client_ts') -> dict:
+    """
+    문제별 last-writer-wins 병합 (JSONMerge(order_key=...)와 같은 규칙).
+
+    기존 답안에 order_key가 없거나 새 답안의 order_key가 같거나 늦으면 새 답안을 사용한다.
+    """
+    merged = dict(records or {})
+    for question_id, record in values.items():
+        current = merged.get(question_id)
+        current_ts = current.get(order_key) if isinstance(current, dict) else None
+        if current_ts is None or (record.get(order_key) is not None and current_ts <= record[order_key]):
+            merged[question_id] = record
+    return merged
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _store():
+    cache = caches['default']
+    if isinstance(cache, RedisCache):
+        return _RedisStore(cache)
+    return _CacheStore(cache)
+
+
+class AnswerBuffer:
+    """답안 write-behind buffer"""
+
+    FLUSH_BATCH_SIZE = 500
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, 'ANSWER_BUFFER_ENABLED', False)
+
+    @staticmethod
+    def flush_interval() -> int:
+        """주기적 flush 간격(초)"""
+        return getattr(settings, 'ANSWER_BUFFER_FLUSH_INTERVAL', 5)
+
+    @staticmethod
+    def buffer_key(exam_id, student_id) -> str:
+        return f'{KEY_PREFIX}:{exam_id}:{student_id}'
+
+    @classmethod
+    def put(cls, exam_id, student_id, question_id, answer_data):
+        """답안 1개 기록 (같은 문제는 마지막 답안으로 덮어씀)"""
+        _store().put(
+            cls.buffer_key(exam_id, student_id),
+            str(question_id),
+            json.dumps(answer_data),
+            f'{exam_id}:{student_id}',
+        )
+
+    @classmethod
+    def pending(cls, exam_id, student_id) -> dict:
+        """아직 DB에 반영되지 않은 답안 {question_id(str): answer}"""
+        if not cls.is_enabled():
+            return {}
+        values = _store().peek(cls.buffer_key(exam_id, student_id))
+        return {question_id: json.loads(value) for question_id, value in values.items()}
+
+    @classmethod
+    def merged_records(cls, exam_id, student_id, detail_records) -> dict:
+        """DB의 detail_records에 buffer 답안을 합친 결과 (DB 쓰기 없음)"""
+        pending = cls.pending(exam_id, student_id)
+        if not pending:
+            return detail_records
+        return merge_latest(detail_records, pending)
+
+    @classmethod
+    def take(cls, exam_id, student_id) -> dict:
+        """
+        buffer 답안을 꺼냄 (호출자가 TestScores 행을 잠근 상태에서 직접 반영할 때 사용).
+
+        꺼낸 답안은 호출자의 transaction이 commit된 뒤에 buffer에서 삭제한다. (rollback되면 buffer에 남음)
+        """
+        if not cls.is_enabled():
+            return {}
+        store = _store()
+        key = cls.buffer_key(exam_id, student_id)
+        values = store.peek(key)
+        if values:
+            transaction.on_commit(functools.partial(store.discard_values, key, values))
+        return {question_id: json.loads(value) for question_id, value in values.items()}
+
+    @classmethod
+    def discard(cls, exam_id, student_id):
+        """buffer 삭제 (임시 저장으로 답안 전체를 교체하는 경우)"""
+        if cls.is_enabled():
+            _store().discard(cls.buffer_key(exam_id, student_id))
+
+    @classmethod
+    def flush(cls, exam_id, student_id) -> bool:
+        """
+        (시험, 학생) 1건 flush. 제출 전 호출.
+
+        Returns:
+            bool: DB에 반영한 답안이 있으면 True
+        """
+        if not cls.is_enabled():
+            return False
+        return cls._flush_pairs([(int(exam_id), int(student_id))]) > 0
+
+    @classmethod
+    def flush_dirty(cls) -> int:
+        """
+        변경된 buffer 전체 flush (주기적 flusher에서 호출).
+
+        Returns:
+            int: 갱신한 TestScores 수
+        """
+        if not cls.is_enabled():
+            return 0
+
+        store = _store()
+        flushed = 0
+        while members := store.pop_dirty(cls.FLUSH_BATCH_SIZE):
+            pairs = []
+            for member in members:
+                exam_id, student_id = member.split(':')
+                pairs.append((int(exam_id), int(student_id)))
+            try:
+                flushed += cls._flush_pairs(pairs)
+            except Exception:
+                # 반영하지 못한 buffer는 그대로 남아 있으므로 다음 flush에서 다시 시도하도록 dirty 표시 복원
+                store.add_dirty(members)
+                raise
+        return flushed
+
+    @classmethod
+    def _flush_pairs(cls, pairs) -> int:
+        """
+        TestScores 행을 잠근 뒤 buffer 답안을 detail_records에 병합하고, commit 후 반영한 답안을 buffer에서 삭제.
+
+        행 잠금 후 buffer를 읽으므로, 제출 시 flush는 진행 중인 주기적 flush가 commit될 때까지 기다린다.
+        (제출 채점 시점에 buffer에도 DB에도 없는 답안이 생기지 않음)
+        commit 직후 삭제 전에 같은 답안을 다시 읽어 병합해도 결과는 같다.
+        """
+        store = _store()
+        condition = Q()
+        for exam_id, student_id in pairs:
+            condition |= Q(exam_id=exam_id, user_id=student_id)
+
+        with transaction.atomic():
+            test_scores = list(
+                TestScores.objects.select_for_update().filter(condition, is_submitted=False).only(
+                    'id', 'exam_id', 'user_id', 'detail_records'
+                )
+            )
+
+            changed = []
+            for test_score in test_scores:
+                key = cls.buffer_key(test_score.exam_id, test_score.user_id)
+                values = store.peek(key)
+                if not values:
+                    continue
+                test_score.detail_records = merge_latest(
+                    test_score.detail_records,
+                    {question_id: json.loads(value) for question_id, value in values.items()},
+                )
+                changed.append(test_score)
+                transaction.on_commit(functools.partial(store.discard_values, key, values))
+
+            if changed:
+                TestScores.objects.bulk_update(changed, ['detail_records'])
+
+        if changed:
+            logger.debug(f'[ANSWER_BUFFER] Flushed {len(changed)} test scores')
+        return len(changed)
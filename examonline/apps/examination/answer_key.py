@@ -0,0 +1,121 @@
+"""
+Answer Key Index.
+
+시험지별 정답 정보(문제 유형, 배점, 정답 옵션 ID 집합)를 한 번만 만들어
+프로세스 내 LRU와 Redis cache에 저장한다. 채점 시 DB 조회 없이 사용.
+
+cache key에 시험지 정답 version(key_version)을 포함하므로, 문제/선택지/배점 변경 시
+signal에서 시험지 key_version을 올리면 이전 key는 자연스럽게 사용되지 않는다.
+사용자에게 보이는 수정 시간(edit_time)은 바꾸지 않는다.
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.db.models import F
+
+from testpaper.models import TestPaperInfo, TestPaperTestQ
+from testquestion.models import OptionInfo
+
+CACHE_KEY_PREFIX = 'answer_key:v3'
+CACHE_TIMEOUT = 60 * 60 * 24
+LRU_MAXSIZE = 256
+
+
+@dataclass(frozen=True)
+class QuestionKey:
+    """문제별 정답 정보"""
+
+    question_id: int
+    tq_type: str
+    score: int
+    correct_option_ids: frozenset = field(default_factory=frozenset)
+    # 빈칸 채우기(tk) 정답 텍스트 (정답 옵션의 option 값)
+    accepted_answers: tuple = ()
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    """시험지 정답 index (불변)"""
+
+    paper_id: int
+    version: str
+    questions: dict = field(default_factory=dict)
+
+    def get(self, question_id):
+        return self.questions.get(question_id)
+
+
+def paper_version(paper) -> str:
+    """시험지 version 문자열 (key_version 기준)"""
+    return str(paper.key_version)
+
+
+def build_answer_key(paper_id, version='') -> AnswerKey:
+    """DB에서 정답 index 생성 (2 query)"""
+    paper_questions = TestPaperTestQ.objects.filter(test_paper_id=paper_id).values_list(
+        'test_question_id', 'test_question__tq_type', 'score'
+    )
+
+    question_rows = list(paper_questions)
+    correct_options = {}
+    accepted_answers = {}
+    for question_id, option_id, option_text in OptionInfo.objects.filter(
+        test_question_id__in=[row[0] for row in question_rows], is_right=True
+    ).values_list('test_question_id', 'id', 'option').order_by('id'):
+        correct_options.setdefault(question_id, set()).add(option_id)
+        accepted_answers.setdefault(question_id, []).append(option_text)
+
+    questions = {
+        question_id: QuestionKey(
+            question_id=question_id,
+            tq_type=tq_type,
+            score=score,
+            correct_option_ids=frozenset(correct_options.get(question_id, ())),
+            accepted_answers=tuple(accepted_answers.get(question_id, ())),
+        )
+        for question_id, tq_type, score in question_rows
+    }
+    return AnswerKey(paper_id=paper_id, version=version, questions=questions)
+
+
+def _cache_key(paper_id, version) -> str:
+    return f'{CACHE_KEY_PREFIX}:{paper_id}:{version}'
+
+
+@lru_cache(maxsize=LRU_MAXSIZE)
+def _load_answer_key(paper_id, version) -> AnswerKey:
+    """프로세스 내 LRU miss 시 Redis, Redis miss 시 DB에서 조회"""
+    key = _cache_key(paper_id, version)
+    answer_key = cache.get(key)
+    if answer_key is None:
+        answer_key = build_answer_key(paper_id, version)
+        cache.set(key, answer_key, CACHE_TIMEOUT)
+    return answer_key
+
+
+def get_answer_key(paper) -> AnswerKey:
+    """
+    시험지 정답 index 조회.
+
+    Args:
+        paper: TestPaperInfo 객체 (key_version으로 version 결정)
+    """
+    return _load_answer_key(paper.id, paper_version(paper))
+
+
+def touch_papers(paper_ids):
+    """시험지 version 갱신 (정답 index 재생성 유도)"""
+    TestPaperInfo.objects.filter(id__in=paper_ids).update(key_version=F('key_version') + 1)
+
+
+def touch_papers_for_questions(question_ids):
+    """문제가 포함된 모든 시험지의 version 갱신"""
+    TestPaperInfo.objects.filter(
+        testpapertestq__test_question_id__in=question_ids
+    ).update(key_version=F('key_version') + 1)
+
+
+def clear_local_cache():
+    """프로세스 내 LRU 초기화 (테스트용)"""
+    _load_answer_key.cache_clear()
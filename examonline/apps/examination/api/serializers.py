@@ -1,6 +1,8 @@
 """
 Examination API Serializers.
 """
+from datetime import timezone as dt_timezone
+
 from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
@@ -503,6 +505,8 @@ class ExamStatusSerializer(serializers.Serializer):
     submit_time = serializers.DateTimeField(allow_null=True)
     time_remaining = serializers.IntegerField(allow_null=True, help_text='남은 시간 (분)')
     draft_answers = serializers.JSONField(allow_null=True)
+    is_grading = serializers.BooleanField(help_text='비동기 채점 진행 중 여부')
+    grading_failed = serializers.BooleanField(help_text='비동기 채점 실패 여부 (재채점 전까지 점수 없음)')
     score = serializers.IntegerField(allow_null=True)
 
 
@@ -530,6 +534,54 @@ class SaveAnswerSerializer(serializers.Serializer):
     selected_options = serializers.ListField(
         child=serializers.IntegerField(), required=False, allow_empty=True
     )
+    client_ts = serializers.DateTimeField(required=False, help_text='client에서 답안을 작성한 시각 (last-writer-wins 기준)')
+
+    @staticmethod
+    def build_record(item, received_at) -> dict:
+        """
+        detail_records에 저장할 답안 1개.
+
+        client_ts가 없으면 서버 수신 시각을 사용하고, 미래 시각(client 시계 오차)은 서버 수신 시각으로 제한한다.
+        client_ts는 문자열 비교가 가능하도록 고정 길이 UTC 형식으로 저장한다.
+        """
+        client_ts = min(item.get('client_ts') or received_at, received_at).astimezone(dt_timezone.utc)
+        return {
+            'answer': item.get('answer', ''),
+            'selected_options': item.get('selected_options', []),
+            'client_ts': client_ts.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
+        }
+
+
+class SaveAnswersSerializer(serializers.Serializer):
+    """
+    일괄 답안 저장용 Serializer (offline 상태에서 쌓인 답안 전송).
+    """
+
+    MAX_ANSWERS = 500
+
+    answers = SaveAnswerSerializer(many=True)
+
+    def validate_answers(self, value):
+        """답안 개수 검증"""
+        if not value:
+            raise serializers.ValidationError('최소 1개 이상의 답안이 필요합니다.')
+        if len(value) > self.MAX_ANSWERS:
+            raise serializers.ValidationError(f'한 번에 최대 {self.MAX_ANSWERS}개까지 저장할 수 있습니다.')
+        return value
+
+    def build_records(self, received_at):
+        """
+        detail_records에 병합할 답안 {question_id(str): record}.
+
+        같은 문제는 client_ts가 가장 늦은 답안만 남긴다. (client_ts 형식은 SaveAnswerSerializer.build_record 참고)
+        """
+        records = {}
+        for item in self.validated_data['answers']:
+            record = SaveAnswerSerializer.build_record(item, received_at)
+            question_id = str(item['question_id'])
+            if question_id not in records or records[question_id]['client_ts'] <= record['client_ts']:
+                records[question_id] = record
+        return records
 
 
 class StartExamResponseSerializer(serializers.Serializer):
@@ -12,10 +12,22 @@ from rest_framework.response import Response
 
 logger = logging.getLogger(__name__)
 
-from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
-from testpaper.models import TestScores, TestPaperTestQ
-from testquestion.models import TestQuestionInfo, OptionInfo
+from core.expressions import JSONMerge
+from core.query_budget import query_budget
+from examination.answer_buffer import AnswerBuffer
+from examination.answer_key import get_answer_key
+from examination.grading import grade_one
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo, SubmissionJob
+from examination.services import (
+    AnswerRecordService,
+    ExamSnapshotService,
+    ExamStatisticsService,
+    SubmissionQueueService,
+)
+from testpaper.models import TestScores
+from testquestion.models import TestQuestionInfo
 from user.models import StudentsInfo
+from user.services import StudentDashboardService
 
 from .serializers import (
     ExamInfoSerializer,
@@ -23,7 +35,7 @@ from .serializers import (
     ExamStatusSerializer,
     SaveDraftSerializer,
     SaveAnswerSerializer,
-    ExamQuestionSerializer,
+    SaveAnswersSerializer,
     StartExamResponseSerializer,
     ExamSubmissionSerializer,
     ExamResultSerializer,
@@ -127,64 +139,54 @@ class ExamTakingViewSet(viewsets.ViewSet):
             'results': exams_data
         }, status=status.HTTP_200_OK)
 
+    @query_budget(max_queries=8, max_duplicates=1)
     @action(detail=True, methods=['get'], url_path='info')
     def exam_info(self, request, pk=None):
         """
         시험 정보 및 문제 조회.
         GET /api/v1/taking/{exam_id}/info/
+
+        학생과 무관한 시험/문제 정보는 cache된 snapshot을 사용하고,
+        응시 상태(is_started/is_submitted)만 요청마다 조회한다.
         """
         student_info = self.get_student_info(request.user)
         if not student_info:
             return Response({'detail': '학생 정보를 찾을 수 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
 
         try:
-            exam = ExaminationInfo.objects.select_related('subject').get(id=pk)
-        except ExaminationInfo.DoesNotExist:
+            exam_id = int(pk)
+        except (TypeError, ValueError):
+            return Response({'detail': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+        snapshot = ExamSnapshotService.get(exam_id)
+        if snapshot is None:
             return Response({'detail': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
         # 응시 자격 확인
-        if not ExamStudentsInfo.objects.filter(exam=exam, student=student_info).exists():
+        if not ExamStudentsInfo.objects.filter(exam_id=exam_id, student=student_info).exists():
             return Response({'detail': '이 시험에 등록되지 않았습니다.'}, status=status.HTTP_403_FORBIDDEN)
 
-        # 시험지 조회
-        exam_papers = ExamPaperInfo.objects.filter(exam=exam).select_related('paper')
-        if not exam_papers.exists():
+        if snapshot['paper_id'] is None:
             return Response({'detail': '시험지가 없습니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 첫 번째 시험지 사용 (추후 다중 시험지 지원 가능)
-        paper = exam_papers.first().paper
-
-        # 문제 조회
-        paper_questions = TestPaperTestQ.objects.filter(test_paper=paper).select_related(
-            'test_question'
-        ).prefetch_related('test_question__optioninfo_set').order_by('order')
-
-        questions = [pq.test_question for pq in paper_questions]
-
-        # 배점 정보를 미리 조회하여 N+1 방지
-        score_map = {pq.test_question_id: pq.score for pq in paper_questions}
-
         # 응시 상태 확인
-        test_score = TestScores.objects.filter(exam=exam, user=student_info).first()
-        is_started = test_score is not None and test_score.start_time is not None
-        is_submitted = test_score is not None and test_score.is_submitted
-
-        # 시험 정보 구성
-        duration = int((exam.end_time - exam.start_time).total_seconds() / 60)
+        test_score = TestScores.objects.filter(exam_id=exam_id, user=student_info).values(
+            'start_time', 'is_submitted'
+        ).first()
+        is_started = test_score is not None and test_score['start_time'] is not None
+        is_submitted = test_score is not None and test_score['is_submitted']
 
         data = {
-            'exam_id': exam.id,
-            'exam_name': exam.name,
-            'subject_name': exam.subject.subject_name,
-            'start_time': exam.start_time,
-            'end_time': exam.end_time,
-            'duration': duration,
-            'total_score': paper.total_score,
-            'passing_score': paper.passing_score,
-            'question_count': paper.question_count,
-            'questions': ExamQuestionSerializer(
-                questions, many=True, context={'paper_id': paper.id, 'score_map': score_map}
-            ).data,
+            'exam_id': snapshot['exam_id'],
+            'exam_name': snapshot['exam_name'],
+            'subject_name': snapshot['subject_name'],
+            'start_time': snapshot['start_time'],
+            'end_time': snapshot['end_time'],
+            'duration': snapshot['duration'],
+            'total_score': snapshot['total_score'],
+            'passing_score': snapshot['passing_score'],
+            'question_count': snapshot['question_count'],
+            'questions': snapshot['questions'],
             'is_started': is_started,
             'is_submitted': is_submitted,
         }
@@ -261,6 +263,8 @@ class ExamTakingViewSet(viewsets.ViewSet):
         serializer = StartExamResponseSerializer(response_data)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    # 정답 index/통계 행 cache miss와 답안 buffer 반영 포함 최대치
+    @query_budget(max_queries=24, max_duplicates=1)
     @action(detail=True, methods=['post'])
     def submit(self, request, pk=None):
         """
@@ -281,12 +285,21 @@ class ExamTakingViewSet(viewsets.ViewSet):
 
         answers = serializer.validated_data['answers']
 
-        # 시험 기록 조회
-        test_score = TestScores.objects.filter(exam=exam, user=student_info).first()
+        # buffer에 남은 답안을 DB에 반영한 뒤 시험 기록 조회
+        AnswerBuffer.flush(exam.id, student_info.id)
+        test_score = TestScores.objects.select_related('test_paper').filter(exam=exam, user=student_info).first()
         if not test_score or not test_score.start_time:
             return Response({'detail': '시험을 시작하지 않았습니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
+        idempotency_key = request.headers.get('Idempotency-Key', '')
+        if len(idempotency_key) > 64:
+            return Response({'detail': 'Idempotency-Key는 64자 이하여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
         if test_score.is_submitted:
+            # 같은 멱등성 key로 접수된 비동기 제출 재요청이면 접수 상태 반환
+            job = SubmissionQueueService.find_job(test_score.id, idempotency_key)
+            if job:
+                return self._submission_accepted(job, test_score)
             return Response({'detail': '이미 제출한 시험입니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
         # 제한 시간 확인
@@ -302,92 +315,57 @@ class ExamTakingViewSet(viewsets.ViewSet):
             if not answers and test_score.detail_records:
                 # 임시 저장된 답안에서 answer 정보 추출
                 answers = [
-                    {'question_id': int(q_id), 'answer': record.get('answer', '')}
+                    {
+                        'question_id': int(q_id),
+                        'answer': record.get('answer', ''),
+                        'selected_options': record.get('selected_options', []),
+                    }
                     for q_id, record in test_score.detail_records.items()
-                    if isinstance(record, dict)
+                    if isinstance(record, dict) and str(q_id).isdigit()
                 ]
 
-        # 자동 채점 (N+1 쿼리 최적화)
-        total_score = 0
-        detailed_records = {}
-
-        # Bulk 조회: 모든 필요한 데이터를 한 번에 가져오기
-        question_ids = [answer['question_id'] for answer in answers]
-
-        # 1. 문제 정보 bulk 조회
-        questions_dict = {
-            q.id: q for q in TestQuestionInfo.objects.filter(id__in=question_ids)
-        }
-
-        # 2. 시험지-문제 매핑 정보 bulk 조회
-        paper_questions_dict = {
-            pq.test_question_id: pq
-            for pq in TestPaperTestQ.objects.filter(
-                test_paper=test_score.test_paper,
-                test_question_id__in=question_ids
+        if SubmissionQueueService.is_enabled():
+            # 비동기 제출: 답안만 접수하고 채점은 worker에서 수행
+            job = SubmissionQueueService.enqueue(
+                test_score,
+                [dict(answer) for answer in answers],
+                submit_time=now,
+                is_auto_submitted=is_auto_submitted,
+                idempotency_key=idempotency_key,
             )
-        }
-
-        # 3. 정답 옵션 정보 bulk 조회
-        correct_options_dict = {
-            opt.test_question_id: opt
-            for opt in OptionInfo.objects.filter(
-                test_question_id__in=question_ids,
-                is_right=True
-            )
-        }
-
-        # 답안 채점
-        for answer_item in answers:
-            question_id = answer_item['question_id']
-            user_answer = answer_item.get('answer', '')
-            selected_options = answer_item.get('selected_options', [])
+            if job is None:
+                return Response({'detail': '이미 제출한 시험입니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
-            # Dict에서 조회
-            question = questions_dict.get(question_id)
-            paper_question = paper_questions_dict.get(question_id)
+            logger.info(f"[SUBMIT_QUEUED] TestScores ID: {test_score.id}, job: {job.id}, exam: {exam.id}")
+            return self._submission_accepted(job, test_score)
 
-            if not question or not paper_question:
-                continue
-
-            question_score = paper_question.score
-
-            # 채점
-            is_correct = False
-            if question.tq_type in ['xz', 'pd']:  # 객관식, OX
-                correct_option = correct_options_dict.get(question_id)
-                if correct_option:
-                    # Frontend에서 selected_options 배열로 보내는 경우 확인
-                    if selected_options:
-                        is_correct = correct_option.id in selected_options
-                    else:
-                        # 기존 방식 (answer 필드에 직접 ID가 있는 경우)
-                        is_correct = str(user_answer) == str(correct_option.id)
-
-            earned_score = question_score if is_correct else 0
-            total_score += earned_score
-
-            detailed_records[str(question_id)] = {
-                'answer': user_answer,
-                'is_correct': is_correct,
-                'score': earned_score,
-                'max_score': question_score,
-            }
+        # 자동 채점 (cache된 정답 index 사용, DB 조회 없음)
+        grade_result = grade_one(get_answer_key(test_score.test_paper), answers)
+        total_score = grade_result.total_score
 
         # 소요 시간 계산
         time_used = int((now - test_score.start_time).total_seconds() / 60)
 
-        # 제출 기록
+        # 제출 기록 (단일 UPDATE, 동시 제출 시 한 번만 반영) 및 시험 통계 증분 갱신
         with transaction.atomic():
-            test_score.test_score = total_score
-            test_score.detail_records = detailed_records
-            test_score.submit_time = now
-            test_score.is_submitted = True
-            test_score.time_used = time_used
-            test_score.save()
+            updated = TestScores.objects.filter(pk=test_score.pk, is_submitted=False).update(
+                test_score=total_score,
+                detail_records=grade_result.records,
+                submit_time=now,
+                is_submitted=True,
+                time_used=time_used,
+                is_auto_submitted=is_auto_submitted,
+            )
+            if updated:
+                ExamStatisticsService.record_submissions(exam.id, [total_score], test_score.test_paper)
+                test_score.detail_records = grade_result.records
+                AnswerRecordService.create([test_score])
+                StudentDashboardService.record_submissions([test_score])
+        if not updated:
+            return Response({'detail': '이미 제출한 시험입니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
         submit_type = 'AUTO_SUBMIT' if is_auto_submitted else 'SUBMIT'
-        logger.info(f"[{submit_type}] Saved TestScores ID: {test_score.id}, is_submitted: {test_score.is_submitted}, exam: {exam.id}, user: {student_info.id}")
+        logger.info(f"[{submit_type}] Saved TestScores ID: {test_score.id}, exam: {exam.id}, user: {student_info.id}")
 
         detail_message = '시간 초과로 자동 제출되었습니다.' if is_auto_submitted else '답안이 제출되었습니다.'
 
@@ -403,6 +381,33 @@ class ExamTakingViewSet(viewsets.ViewSet):
             status=status.HTTP_200_OK,
         )
 
+    def _submission_accepted(self, job, test_score):
+        """비동기 제출 접수 응답 (202)"""
+        return Response(
+            {
+                'detail': '답안이 접수되었습니다. 채점 중입니다.',
+                'submission_id': test_score.id,
+                'status': self._grading_status(job),
+                'is_auto_submitted': job.is_auto_submitted,
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @staticmethod
+    def _grading_status(job):
+        """비동기 채점 상태 (grading / done / failed)"""
+        if job.status == SubmissionJob.STATUS_DONE:
+            return 'done'
+        if job.status == SubmissionJob.STATUS_FAILED:
+            return 'failed'
+        return 'grading'
+
+    @staticmethod
+    def _grading_failed(test_score) -> bool:
+        """비동기 채점 실패로 확정되어 점수가 없는 응시 기록 여부"""
+        job = getattr(test_score, 'submission_job', None)
+        return job is not None and job.status == SubmissionJob.STATUS_FAILED
+
     @action(detail=True, methods=['get'])
     def status(self, request, pk=None):
         """
@@ -418,7 +423,7 @@ class ExamTakingViewSet(viewsets.ViewSet):
         except ExaminationInfo.DoesNotExist:
             return Response({'detail': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
-        test_score = TestScores.objects.filter(exam=exam, user=student_info).first()
+        test_score = TestScores.objects.select_related('submission_job').filter(exam=exam, user=student_info).first()
 
         if not test_score:
             data = {
@@ -430,6 +435,8 @@ class ExamTakingViewSet(viewsets.ViewSet):
                 'submit_time': None,
                 'time_remaining': None,
                 'draft_answers': None,
+                'is_grading': False,
+                'grading_failed': False,
                 'score': None,
             }
         else:
@@ -439,6 +446,7 @@ class ExamTakingViewSet(viewsets.ViewSet):
                 remaining_seconds = (exam.end_time - now).total_seconds()
                 time_remaining = max(0, int(remaining_seconds / 60))
 
+            grading_failed = self._grading_failed(test_score)
             data = {
                 'exam_id': exam.id,
                 'exam_name': exam.name,
@@ -447,8 +455,18 @@ class ExamTakingViewSet(viewsets.ViewSet):
                 'start_time': test_score.start_time,
                 'submit_time': test_score.submit_time,
                 'time_remaining': time_remaining,
-                'draft_answers': test_score.detail_records if not test_score.is_submitted else None,
-                'score': test_score.test_score if test_score.is_submitted else None,
+                'draft_answers': (
+                    AnswerBuffer.merged_records(exam.id, student_info.id, test_score.detail_records)
+                    if not test_score.is_submitted
+                    else None
+                ),
+                'is_grading': test_score.is_grading,
+                'grading_failed': grading_failed,
+                'score': (
+                    test_score.test_score
+                    if test_score.is_submitted and not test_score.is_grading and not grading_failed
+                    else None
+                ),
             }
 
         return Response(data, status=status.HTTP_200_OK)
@@ -478,7 +496,8 @@ class ExamTakingViewSet(viewsets.ViewSet):
         if test_score.is_submitted:
             return Response({'detail': '이미 제출한 시험입니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 임시 저장
+        # 임시 저장 (답안 전체 교체, buffer에 남은 이전 답안은 폐기)
+        AnswerBuffer.discard(exam.id, student_info.id)
         test_score.detail_records = serializer.validated_data['answers']
         test_score.save()
 
@@ -486,6 +505,7 @@ class ExamTakingViewSet(viewsets.ViewSet):
             {'detail': '임시 저장되었습니다.', 'saved_at': timezone.now()}, status=status.HTTP_200_OK
         )
 
+    @query_budget(max_queries=4, max_duplicates=1)
     @action(detail=True, methods=['post'], url_path='save-answer')
     def save_answer(self, request, pk=None):
         """
@@ -504,28 +524,77 @@ class ExamTakingViewSet(viewsets.ViewSet):
         serializer = SaveAnswerSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        test_score = TestScores.objects.filter(exam=exam, user=student_info).first()
-        if not test_score or not test_score.start_time:
-            return Response({'detail': '시험을 시작하지 않았습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        question_id = str(serializer.validated_data['question_id'])
+        # save-answers와 같은 last-writer-wins 기준 (client_ts가 없으면 서버 수신 시각)
+        answer_data = SaveAnswerSerializer.build_record(serializer.validated_data, received_at=timezone.now())
 
-        if test_score.is_submitted:
-            return Response({'detail': '이미 제출한 시험입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        attempts = TestScores.objects.filter(exam=exam, user=student_info)
 
-        # 단일 답안을 detail_records에 추가/업데이트
-        question_id = str(serializer.validated_data['question_id'])
-        answer_data = {
-            'answer': serializer.validated_data.get('answer', ''),
-            'selected_options': serializer.validated_data.get('selected_options', []),
-        }
+        if AnswerBuffer.is_enabled():
+            # write-behind: 상태만 확인하고 buffer에 기록 (flusher가 DB에 반영)
+            error = self._save_answer_error(attempts.values('start_time', 'is_submitted').first())
+            if error:
+                return error
 
-        if not test_score.detail_records:
-            test_score.detail_records = {}
+            AnswerBuffer.put(exam.id, student_info.id, question_id, answer_data)
+            return Response({'detail': '답안이 저장되었습니다.'}, status=status.HTTP_200_OK)
 
-        test_score.detail_records[question_id] = answer_data
-        test_score.save()
+        # 단일 답안만 detail_records에 병합 (조회 없이 단일 UPDATE, 다른 문제 답안은 그대로 유지)
+        updated = attempts.filter(start_time__isnull=False, is_submitted=False).update(
+            detail_records=JSONMerge('detail_records', {question_id: answer_data}, order_key='client_ts')
+        )
+        if not updated:
+            return self._save_answer_error(attempts.values('start_time', 'is_submitted').first())
 
         return Response({'detail': '답안이 저장되었습니다.'}, status=status.HTTP_200_OK)
 
+    # 답안 buffer 반영(행 잠금 + 병합) 포함 최대치
+    @query_budget(max_queries=6, max_duplicates=1)
+    @action(detail=True, methods=['post'], url_path='save-answers')
+    def save_answers(self, request, pk=None):
+        """
+        일괄 답안 저장 (offline 상태에서 쌓인 답안 전송).
+        POST /api/v1/exams/{exam_id}/save-answers/
+
+        문제별로 client_ts가 가장 늦은 답안만 남긴다 (last-writer-wins).
+        """
+        student_info = self.get_student_info(request.user)
+        if not student_info:
+            return Response({'detail': '학생 정보를 찾을 수 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            exam = ExaminationInfo.objects.get(id=pk)
+        except ExaminationInfo.DoesNotExist:
+            return Response({'detail': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = SaveAnswersSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        records = serializer.build_records(received_at=timezone.now())
+
+        # buffer에 남은 답안이 나중에 덮어쓰지 않도록 먼저 반영
+        AnswerBuffer.flush(exam.id, student_info.id)
+
+        attempts = TestScores.objects.filter(exam=exam, user=student_info)
+        updated = attempts.filter(start_time__isnull=False, is_submitted=False).update(
+            detail_records=JSONMerge('detail_records', records, order_key='client_ts')
+        )
+        if not updated:
+            return self._save_answer_error(attempts.values('start_time', 'is_submitted').first())
+
+        return Response(
+            {'detail': '답안이 저장되었습니다.', 'saved_count': len(records)}, status=status.HTTP_200_OK
+        )
+
+    def _save_answer_error(self, attempt):
+        """답안 저장 불가 사유 응답 (저장 가능하면 None)"""
+        if not attempt or not attempt['start_time']:
+            return Response({'detail': '시험을 시작하지 않았습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if attempt['is_submitted']:
+            return Response({'detail': '이미 제출한 시험입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return None
+
     @action(detail=False, methods=['get'], url_path='my')
     def my_submissions(self, request):
         """
@@ -590,6 +659,7 @@ class ExamTakingViewSet(viewsets.ViewSet):
         serializer = ExamSubmissionSerializer(submissions_data, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @query_budget(max_queries=8, max_duplicates=1)
     @action(detail=True, methods=['get'])
     def result(self, request, pk=None):
         """
@@ -606,12 +676,30 @@ class ExamTakingViewSet(viewsets.ViewSet):
             return Response({'detail': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
         logger.info(f"[RESULT] Querying TestScores for exam: {exam.id}, user: {student_info.id}")
-        test_score = TestScores.objects.select_related('test_paper__subject').filter(exam=exam, user=student_info).first()
+        test_score = TestScores.objects.select_related('test_paper__subject', 'submission_job').filter(
+            exam=exam, user=student_info
+        ).first()
         logger.info(f"[RESULT] Found test_score: {test_score.id if test_score else None}, is_submitted: {test_score.is_submitted if test_score else None}")
 
         if not test_score or not test_score.is_submitted:
             return Response({'detail': '제출된 시험이 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
+        if test_score.is_grading:
+            return Response(
+                {'detail': '채점 중입니다.', 'submission_id': test_score.id, 'status': 'grading'},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        if self._grading_failed(test_score):
+            return Response(
+                {
+                    'detail': '채점에 실패했습니다. 담당 교사에게 재채점을 요청하세요.',
+                    'submission_id': test_score.id,
+                    'status': 'failed',
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+
         # N+1 방지: 모든 question_id를 수집하여 bulk 조회
         question_ids = []
         if test_score.detail_records:
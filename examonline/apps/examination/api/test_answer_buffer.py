@@ -0,0 +1,222 @@
+"""
+Answer Buffer Tests.
+save-answer write-behind buffer 및 flush 테스트.
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.answer_buffer import AnswerBuffer
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from testpaper.models import TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture(autouse=True)
+def answer_buffer_enabled(settings):
+    settings.ANSWER_BUFFER_ENABLED = True
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(
+        username='teacher_buffer', password='testpass123', user_type='teacher', nick_name='Buffer Teacher'
+    )
+
+
+@pytest.fixture
+def student_user(db):
+    user = UserProfile.objects.create_user(
+        username='student_buffer', password='testpass123', user_type='student', nick_name='Buffer Student'
+    )
+    StudentsInfo.objects.create(user=user, student_name='Buffer Student', student_id='20250401')
+    return user
+
+
+@pytest.fixture
+def questions(db, teacher_user):
+    subject = SubjectInfo.objects.create(subject_name='Buffer Subject')
+    result = []
+    for idx in range(2):
+        question = TestQuestionInfo.objects.create(
+            name=f'Buffer Q{idx}', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+        )
+        OptionInfo.objects.create(test_question=question, option='O', is_right=True)
+        OptionInfo.objects.create(test_question=question, option='X', is_right=False)
+        result.append(question)
+    return result
+
+
+@pytest.fixture
+def test_score(db, teacher_user, student_user, questions):
+    subject = questions[0].subject
+    paper = TestPaperInfo.objects.create(
+        name='Buffer Paper', subject=subject, total_score=20, passing_score=10, question_count=2,
+        create_user=teacher_user,
+    )
+    for order, question in enumerate(questions, start=1):
+        TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=10, order=order)
+
+    now = timezone.now()
+    exam = ExaminationInfo.objects.create(
+        name='Buffer Exam', subject=subject, start_time=now - timedelta(minutes=5),
+        end_time=now + timedelta(hours=1), exam_state='1', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    ExamStudentsInfo.objects.create(exam=exam, student=student_user.studentsinfo)
+    return TestScores.objects.create(
+        exam=exam, user=student_user.studentsinfo, test_paper=paper, start_time=now - timedelta(minutes=1),
+    )
+
+
+def correct_option(question):
+    return OptionInfo.objects.get(test_question=question, is_right=True)
+
+
+def save_answer(api_client, test_score, question, option_ids):
+    return api_client.post(
+        f'/api/v1/exams/{test_score.exam_id}/save-answer/',
+        {'question_id': question.id, 'selected_options': option_ids},
+        format='json',
+    )
+
+
+@pytest.mark.django_db
+class TestAnswerBuffer:
+    """답안 buffer 테스트"""
+
+    def test_save_answer_does_not_write_db(
+        self, api_client, student_user, test_score, questions, django_assert_max_num_queries
+    ):
+        """save-answer는 상태 조회만 하고 detail_records를 쓰지 않음"""
+        api_client.force_authenticate(user=student_user)
+
+        # studentsinfo, exam, attempt 상태
+        with django_assert_max_num_queries(3):
+            response = save_answer(api_client, test_score, questions[0], [correct_option(questions[0]).id])
+
+        assert response.status_code == 200
+        test_score.refresh_from_db()
+        assert test_score.detail_records == {}
+
+    def test_status_includes_buffered_answers(self, api_client, student_user, test_score, questions):
+        """응시 상태의 draft_answers에 buffer 답안 포함"""
+        api_client.force_authenticate(user=student_user)
+        option_id = correct_option(questions[0]).id
+        save_answer(api_client, test_score, questions[0], [option_id])
+
+        response = api_client.get(f'/api/v1/exams/{test_score.exam_id}/status/')
+
+        assert response.status_code == 200
+        assert response.data['draft_answers'][str(questions[0].id)]['selected_options'] == [option_id]
+
+    def test_flush_coalesces_answers(
+        self, api_client, student_user, test_score, questions, django_capture_on_commit_callbacks
+    ):
+        """같은 문제는 마지막 답안만 남고, 한 번에 DB에 반영"""
+        api_client.force_authenticate(user=student_user)
+        wrong = OptionInfo.objects.get(test_question=questions[0], is_right=False)
+        save_answer(api_client, test_score, questions[0], [wrong.id])
+        save_answer(api_client, test_score, questions[0], [correct_option(questions[0]).id])
+        save_answer(api_client, test_score, questions[1], [correct_option(questions[1]).id])
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert AnswerBuffer.flush_dirty() == 1
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records[str(questions[0].id)]['selected_options'] == [correct_option(questions[0]).id]
+        assert len(test_score.detail_records) == 2
+        assert AnswerBuffer.pending(test_score.exam_id, test_score.user_id) == {}
+
+    def test_submit_flushes_buffer(
+        self, api_client, student_user, test_score, questions, django_capture_on_commit_callbacks
+    ):
+        """제출 전 buffer를 비워 제출 후 flusher가 채점 기록을 덮어쓰지 않음"""
+        api_client.force_authenticate(user=student_user)
+        option_id = correct_option(questions[0]).id
+        save_answer(api_client, test_score, questions[0], [option_id])
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                f'/api/v1/exams/{test_score.exam_id}/submit/',
+                {'answers': [{'question_id': questions[0].id, 'selected_options': [option_id]}]},
+                format='json',
+            )
+
+        assert response.status_code == 200
+        assert response.data['score'] == 10
+        assert AnswerBuffer.pending(test_score.exam_id, test_score.user_id) == {}
+        assert AnswerBuffer.flush_dirty() == 0
+        test_score.refresh_from_db()
+        assert test_score.detail_records[str(questions[0].id)]['is_correct'] is True
+
+    def test_failed_flush_keeps_buffer(self, api_client, student_user, test_score, questions, monkeypatch):
+        """DB 반영이 실패하면 buffer 답안과 dirty 표시가 남아 다음 flush에서 반영"""
+        api_client.force_authenticate(user=student_user)
+        save_answer(api_client, test_score, questions[0], [correct_option(questions[0]).id])
+
+        def fail(*args, **kwargs):
+            raise DatabaseError('flush failed')
+
+        with monkeypatch.context() as patch:
+            patch.setattr(TestScores.objects, 'bulk_update', fail)
+            with pytest.raises(DatabaseError):
+                AnswerBuffer.flush_dirty()
+
+        assert str(questions[0].id) in AnswerBuffer.pending(test_score.exam_id, test_score.user_id)
+        assert AnswerBuffer.flush_dirty() == 1
+        test_score.refresh_from_db()
+        assert str(questions[0].id) in test_score.detail_records
+
+    def test_flush_keeps_newer_answer(
+        self, api_client, student_user, test_score, questions, django_capture_on_commit_callbacks
+    ):
+        """flush 중에 같은 문제에 새로 기록된 답안은 commit 후에도 buffer에 남음"""
+        api_client.force_authenticate(user=student_user)
+        wrong = OptionInfo.objects.get(test_question=questions[0], is_right=False)
+        save_answer(api_client, test_score, questions[0], [wrong.id])
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AnswerBuffer.flush_dirty()
+            save_answer(api_client, test_score, questions[0], [correct_option(questions[0]).id])
+
+        pending = AnswerBuffer.pending(test_score.exam_id, test_score.user_id)
+        assert pending[str(questions[0].id)]['selected_options'] == [correct_option(questions[0]).id]
+
+    def test_save_draft_discards_buffer(self, api_client, student_user, test_score, questions):
+        """임시 저장으로 답안 전체를 교체하면 이전 buffer 답안은 반영하지 않음"""
+        api_client.force_authenticate(user=student_user)
+        save_answer(api_client, test_score, questions[0], [correct_option(questions[0]).id])
+
+        response = api_client.post(
+            f'/api/v1/exams/{test_score.exam_id}/save-draft/',
+            {'answers': {str(questions[1].id): {'answer': '', 'selected_options': []}}},
+            format='json',
+        )
+        assert response.status_code == 200
+        AnswerBuffer.flush_dirty()
+
+        test_score.refresh_from_db()
+        assert list(test_score.detail_records) == [str(questions[1].id)]
+
+    def test_flush_command_once(self, api_client, student_user, test_score, questions):
+        api_client.force_authenticate(user=student_user)
+        save_answer(api_client, test_score, questions[0], [correct_option(questions[0]).id])
+        out = StringIO()
+
+        call_command('flush_answer_buffer', '--once', stdout=out)
+
+        assert 'flush 완료: 1건' in out.getvalue()
+        test_score.refresh_from_db()
+        assert str(questions[0].id) in test_score.detail_records
@@ -0,0 +1,229 @@
+"""
+Answer Key Index Tests.
+정답 index 생성/cache 및 채점 테스트.
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.answer_key import build_answer_key, clear_local_cache, get_answer_key
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from examination.services import ExamStatisticsService
+from testpaper.models import TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(
+        username='teacher_key', password='testpass123', user_type='teacher', nick_name='Key Teacher'
+    )
+
+
+@pytest.fixture
+def student_user(db):
+    user = UserProfile.objects.create_user(
+        username='student_key', password='testpass123', user_type='student', nick_name='Key Student'
+    )
+    StudentsInfo.objects.create(user=user, student_name='Key Student', student_id='20250301')
+    return user
+
+
+@pytest.fixture
+def subject(db):
+    return SubjectInfo.objects.create(subject_name='Key Subject')
+
+
+@pytest.fixture
+def multi_answer_question(db, teacher_user, subject):
+    """정답이 2개인 객관식 문제"""
+    question = TestQuestionInfo.objects.create(
+        name='짝수를 모두 고르시오', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+    )
+    OptionInfo.objects.create(test_question=question, option='1', is_right=False)
+    OptionInfo.objects.create(test_question=question, option='2', is_right=True)
+    OptionInfo.objects.create(test_question=question, option='4', is_right=True)
+    return question
+
+
+@pytest.fixture
+def test_paper(db, teacher_user, subject, multi_answer_question):
+    paper = TestPaperInfo.objects.create(
+        name='Key Paper', subject=subject, total_score=10, passing_score=6, question_count=1,
+        create_user=teacher_user,
+    )
+    TestPaperTestQ.objects.create(test_paper=paper, test_question=multi_answer_question, score=10, order=1)
+    paper.refresh_from_db()
+    return paper
+
+
+@pytest.fixture
+def started_exam(db, teacher_user, subject, test_paper, student_user):
+    now = timezone.now()
+    exam = ExaminationInfo.objects.create(
+        name='Key Exam', subject=subject, start_time=now - timedelta(minutes=5),
+        end_time=now + timedelta(hours=1), exam_state='1', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=test_paper)
+    ExamStudentsInfo.objects.create(exam=exam, student=student_user.studentsinfo)
+    TestScores.objects.create(
+        exam=exam, user=student_user.studentsinfo, test_paper=test_paper,
+        start_time=now - timedelta(minutes=1),
+    )
+    return exam
+
+
+@pytest.mark.django_db
+class TestAnswerKey:
+    """정답 index 테스트"""
+
+    def test_multiple_correct_options_kept(self, test_paper, multi_answer_question):
+        """정답 옵션이 여러 개인 경우 모두 유지"""
+        answer_key = build_answer_key(test_paper.id)
+        question_key = answer_key.get(multi_answer_question.id)
+
+        correct_ids = set(
+            OptionInfo.objects.filter(test_question=multi_answer_question, is_right=True).values_list('id', flat=True)
+        )
+        assert question_key.correct_option_ids == correct_ids
+        assert question_key.score == 10
+        assert question_key.tq_type == 'xz'
+
+    def test_local_cache_hit_without_queries(self, test_paper, django_assert_num_queries):
+        """같은 version은 DB 조회 없이 재사용"""
+        clear_local_cache()
+        first = get_answer_key(test_paper)
+
+        with django_assert_num_queries(0):
+            second = get_answer_key(test_paper)
+
+        assert first is second
+
+    def test_version_changes_on_option_update(self, test_paper, multi_answer_question):
+        """선택지 변경 시 시험지 정답 version 갱신 및 새 index 생성 (수정 시간은 유지)"""
+        before = get_answer_key(test_paper)
+        edit_time = test_paper.edit_time
+
+        option = OptionInfo.objects.get(test_question=multi_answer_question, option='1')
+        option.is_right = True
+        option.save()
+
+        test_paper.refresh_from_db()
+        after = get_answer_key(test_paper)
+
+        assert after.version != before.version
+        assert test_paper.edit_time == edit_time
+        assert option.id in after.get(multi_answer_question.id).correct_option_ids
+        assert option.id not in before.get(multi_answer_question.id).correct_option_ids
+
+
+@pytest.fixture
+def single_answer_question(db, teacher_user, subject):
+    question = TestQuestionInfo.objects.create(
+        name='1 + 1 = ?', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+    )
+    OptionInfo.objects.create(test_question=question, option='2', is_right=True)
+    OptionInfo.objects.create(test_question=question, option='3', is_right=False)
+    return question
+
+
+@pytest.mark.django_db
+class TestAnswerKeyAfterPaperEdit:
+    """시험지 문제 변경 API 이후 새 정답 index로 채점"""
+
+    def submit_correct(self, api_client, student_user, exam, question):
+        option = OptionInfo.objects.get(test_question=question, is_right=True)
+        api_client.force_authenticate(user=student_user)
+        data = {'answers': [{'question_id': question.id, 'selected_options': [option.id]}]}
+        return api_client.post(f'/api/v1/exams/{exam.id}/submit/', data, format='json')
+
+    def test_patch_questions(
+        self, api_client, teacher_user, student_user, test_paper, started_exam, single_answer_question
+    ):
+        """문제 전체 교체(PATCH) 후 교체된 문제로 채점"""
+        before = get_answer_key(test_paper)
+        api_client.force_authenticate(user=teacher_user)
+        response = api_client.patch(
+            f'/api/v1/testpapers/{test_paper.id}/',
+            {'questions': [{'question_id': single_answer_question.id, 'score': 10, 'order': 1}]},
+            format='json',
+        )
+        assert response.status_code == 200
+
+        test_paper.refresh_from_db()
+        assert get_answer_key(test_paper).version != before.version
+
+        response = self.submit_correct(api_client, student_user, started_exam, single_answer_question)
+        assert response.data['score'] == 10
+
+    def test_add_questions(
+        self, api_client, teacher_user, student_user, test_paper, started_exam, single_answer_question
+    ):
+        """문제 추가(bulk_create) 후 추가된 문제도 채점"""
+        get_answer_key(test_paper)
+        api_client.force_authenticate(user=teacher_user)
+        response = api_client.post(
+            f'/api/v1/testpapers/{test_paper.id}/add_questions/',
+            {'questions': [{'question_id': single_answer_question.id, 'score': 10, 'order': 2}]},
+            format='json',
+        )
+        assert response.status_code == 200
+
+        response = self.submit_correct(api_client, student_user, started_exam, single_answer_question)
+        assert response.data['score'] == 10
+
+
+@pytest.mark.django_db
+class TestSubmitWithAnswerKey:
+    """정답 index 기반 제출 채점 테스트"""
+
+    def test_all_correct_options_required(self, api_client, student_user, started_exam, multi_answer_question):
+        """정답 옵션을 모두 선택해야 정답"""
+        correct_ids = list(
+            OptionInfo.objects.filter(test_question=multi_answer_question, is_right=True).values_list('id', flat=True)
+        )
+        api_client.force_authenticate(user=student_user)
+        data = {'answers': [{'question_id': multi_answer_question.id, 'selected_options': correct_ids}]}
+
+        response = api_client.post(f'/api/v1/exams/{started_exam.id}/submit/', data, format='json')
+
+        assert response.status_code == 200
+        assert response.data['score'] == 10
+
+    def test_partial_selection_is_wrong(self, api_client, student_user, started_exam, multi_answer_question):
+        """정답 옵션 일부만 선택하면 오답"""
+        one_correct = OptionInfo.objects.filter(test_question=multi_answer_question, is_right=True).first()
+        api_client.force_authenticate(user=student_user)
+        data = {'answers': [{'question_id': multi_answer_question.id, 'selected_options': [one_correct.id]}]}
+
+        response = api_client.post(f'/api/v1/exams/{started_exam.id}/submit/', data, format='json')
+
+        assert response.status_code == 200
+        assert response.data['score'] == 0
+        record = TestScores.objects.get(exam=started_exam).detail_records[str(multi_answer_question.id)]
+        assert record['is_correct'] is False
+        assert record['selected_options'] == [one_correct.id]
+
+    def test_submit_is_single_update(
+        self, api_client, student_user, started_exam, multi_answer_question, test_paper, django_assert_max_num_queries
+    ):
+        """정답 index cache hit 시 채점 관련 추가 query 없음"""
+        get_answer_key(TestPaperInfo.objects.get(id=test_paper.id))
+        api_client.force_authenticate(user=student_user)
+        data = {'answers': [{'question_id': multi_answer_question.id, 'selected_options': []}]}
+
+        ExamStatisticsService.rebuild(started_exam.id)
+
+        # studentsinfo, exam, test_score(+paper), SAVEPOINT, UPDATE, 통계 UPDATE, 답안 기록 INSERT, RELEASE
+        with django_assert_max_num_queries(8):
+            response = api_client.post(f'/api/v1/exams/{started_exam.id}/submit/', data, format='json')
+
+        assert response.status_code == 200
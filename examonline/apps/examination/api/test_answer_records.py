@@ -0,0 +1,156 @@
+"""
+Answer Record Tests.
+채점 시 문항별 답안 기록(AnswerRecord) 생성/갱신 테스트.
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from examination.services import ExamRegradeService
+from testpaper.models import AnswerRecord, TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+from user.services import StudentDashboardService
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(username='teacher_record', password='testpass123', user_type='teacher')
+
+
+@pytest.fixture
+def questions(db, teacher_user):
+    subject = SubjectInfo.objects.create(subject_name='Record Subject')
+    created = []
+    for idx in range(2):
+        question = TestQuestionInfo.objects.create(
+            name=f'Record Q{idx}', subject=subject, score=5, tq_type='xz', create_user=teacher_user
+        )
+        OptionInfo.objects.create(test_question=question, option='A', is_right=True)
+        OptionInfo.objects.create(test_question=question, option='B', is_right=False)
+        created.append(question)
+    return created
+
+
+@pytest.fixture
+def exam(db, teacher_user, questions):
+    paper = TestPaperInfo.objects.create(
+        name='Record Paper', subject=questions[0].subject, total_score=10, passing_score=5, question_count=2,
+        create_user=teacher_user,
+    )
+    for order, question in enumerate(questions, start=1):
+        TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=5, order=order)
+    now = timezone.now()
+    exam = ExaminationInfo.objects.create(
+        name='Record Exam', subject=paper.subject, start_time=now - timedelta(minutes=5),
+        end_time=now + timedelta(hours=1), exam_state='1', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    return exam
+
+
+@pytest.fixture
+def student_user(db, exam):
+    user = UserProfile.objects.create_user(username='student_record', password='testpass123', user_type='student')
+    student = StudentsInfo.objects.create(user=user, student_name='Record Student', student_id='20251201')
+    ExamStudentsInfo.objects.create(exam=exam, student=student)
+    TestScores.objects.create(
+        exam=exam, user=student, test_paper=exam.exampaperinfo_set.first().paper,
+        start_time=timezone.now() - timedelta(minutes=1),
+    )
+    return user
+
+
+def submit(api_client, exam, questions, options):
+    answers = [
+        {'question_id': question.id, 'selected_options': [OptionInfo.objects.get(test_question=question, option=option).id]}
+        for question, option in zip(questions, options)
+    ]
+    return api_client.post(f'/api/v1/exams/{exam.id}/submit/', {'answers': answers}, format='json')
+
+
+@pytest.mark.django_db
+class TestAnswerRecords:
+    """문항별 답안 기록 테스트"""
+
+    def test_submit_creates_records(self, api_client, exam, questions, student_user):
+        api_client.force_authenticate(user=student_user)
+
+        submit(api_client, exam, questions, ['A', 'B'])
+
+        records = {record.question_id: record for record in AnswerRecord.objects.filter(exam=exam)}
+        assert records[questions[0].id].is_correct is True
+        assert records[questions[0].id].earned_score == 5
+        assert records[questions[1].id].is_correct is False
+        assert records[questions[1].id].max_score == 5
+        option_b = OptionInfo.objects.get(test_question=questions[1], option='B')
+        assert records[questions[1].id].selected_options == [option_b.id]
+
+    def test_per_question_correct_rate_query(self, api_client, exam, questions, student_user):
+        api_client.force_authenticate(user=student_user)
+        submit(api_client, exam, questions, ['A', 'B'])
+
+        rates = dict(
+            AnswerRecord.objects.filter(exam=exam).values('question_id').annotate(
+                correct=Count('id', filter=Q(is_correct=True))
+            ).values_list('question_id', 'correct')
+        )
+
+        assert rates == {questions[0].id: 1, questions[1].id: 0}
+
+    def test_regrade_replaces_records(self, api_client, exam, questions, student_user):
+        api_client.force_authenticate(user=student_user)
+        submit(api_client, exam, questions, ['A', 'B'])
+        for option in OptionInfo.objects.filter(test_question=questions[1]):
+            option.is_right = option.option == 'B'
+            option.save()
+
+        ExamRegradeService.regrade(exam.id)
+
+        assert AnswerRecord.objects.filter(exam=exam).count() == 2
+        assert AnswerRecord.objects.get(question=questions[1]).is_correct is True
+
+    def test_manual_grade_updates_record(self, api_client, teacher_user, exam, questions, student_user):
+        api_client.force_authenticate(user=student_user)
+        submit(api_client, exam, questions, ['A', 'B'])
+        test_score = TestScores.objects.get(exam=exam)
+        api_client.force_authenticate(user=teacher_user)
+
+        api_client.post(f'/api/v1/scores/{test_score.id}/grade/', {'question_id': questions[1].id, 'score': 3})
+
+        record = AnswerRecord.objects.get(question=questions[1])
+        assert (record.earned_score, record.manual_graded) == (3, True)
+
+    def test_rebuild_command(self, exam, questions, student_user):
+        records = {
+            str(questions[0].id): {'answer': '', 'selected_options': [], 'is_correct': True, 'score': 5, 'max_score': 5},
+            'invalid': {'score': 1},
+        }
+        TestScores.objects.filter(exam=exam).update(is_submitted=True, test_score=5, detail_records=records)
+        out = StringIO()
+
+        call_command('rebuild_answer_records', '--exam-id', str(exam.id), stdout=out)
+        call_command('rebuild_answer_records', stdout=out)
+
+        assert '답안 기록 재생성 완료: 1건' in out.getvalue()
+        assert AnswerRecord.objects.filter(exam=exam).count() == 1
+
+    def test_student_dashboard_counts_records(self, api_client, exam, questions, student_user):
+        api_client.force_authenticate(user=student_user)
+        submit(api_client, exam, questions, ['A', 'B'])
+
+        statistics = StudentDashboardService(student_user.studentsinfo).get_dashboard_data()['statistics']
+
+        assert statistics['correct_answers'] == 1
+        assert statistics['total_questions_answered'] == 2
@@ -0,0 +1,111 @@
+"""
+Exam State Scheduler Tests.
+시작/종료 시각 기반 시험 상태 자동 전환 테스트.
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+
+from examination.models import ExaminationInfo
+from examination.services import ExamSnapshotService, ExamStateScheduler, exam_state_changed
+from user.models import SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(username='teacher_sched', password='testpass123', user_type='teacher')
+
+
+@pytest.fixture
+def subject(db):
+    return SubjectInfo.objects.create(subject_name='Scheduler Subject')
+
+
+@pytest.fixture
+def create_exam(teacher_user, subject):
+    def _create(start_offset, end_offset, exam_state='0'):
+        now = timezone.now()
+        return ExaminationInfo.objects.create(
+            name='Scheduler Exam', subject=subject, start_time=now + timedelta(minutes=start_offset),
+            end_time=now + timedelta(minutes=end_offset), exam_state=exam_state, create_user=teacher_user,
+        )
+    return _create
+
+
+def states(*exams):
+    return [ExaminationInfo.objects.get(pk=exam.pk).exam_state for exam in exams]
+
+
+@pytest.mark.django_db
+class TestExamStateScheduler:
+    """시험 상태 전환 테스트"""
+
+    def test_load_builds_heap_within_lookahead(self, create_exam):
+        now = timezone.now()
+        soon = create_exam(10, 70)
+        running = create_exam(-10, 30, exam_state='1')
+        create_exam(120, 180)
+        create_exam(-60, -30, exam_state='2')
+
+        heap = ExamStateScheduler.load(now, lookahead=60 * 60)
+
+        assert sorted((exam_id, state) for _, exam_id, state in heap) == [
+            (soon.id, '1'), (running.id, '2')
+        ]
+        assert heap[0][1] == soon.id
+
+    def test_pop_due_and_wait(self, create_exam):
+        now = timezone.now()
+        create_exam(-1, 5)
+        create_exam(2, 30)
+        heap = ExamStateScheduler.load(now)
+
+        assert len(ExamStateScheduler.pop_due(heap, now)) == 1
+        assert ExamStateScheduler.seconds_until_next(heap, now, 600) == pytest.approx(120, abs=1)
+        assert ExamStateScheduler.seconds_until_next(heap, now, 60) == 60
+        assert ExamStateScheduler.seconds_until_next([], now, 60) == 60
+
+    def test_apply_due_transitions_in_bulk(self, create_exam):
+        started = [create_exam(-5, 30) for _ in range(2)]
+        ended = create_exam(-60, -1, exam_state='1')
+        skipped = create_exam(-60, -30)
+        upcoming = create_exam(5, 30)
+
+        changed = ExamStateScheduler.apply_due()
+
+        assert sorted(changed['1']) == sorted(exam.id for exam in started)
+        assert sorted(changed['2']) == sorted([ended.id, skipped.id])
+        assert states(*started, ended, skipped, upcoming) == ['1', '1', '2', '2', '0']
+        assert ExamStateScheduler.apply_due() == {}
+
+    def test_apply_due_emits_event_and_invalidates_snapshot(self, create_exam, django_capture_on_commit_callbacks):
+        exam = create_exam(-5, 30)
+        ExamSnapshotService.get(exam.id)
+        assert cache.get(ExamSnapshotService.cache_key(exam.id)) is not None
+        events = []
+
+        def listener(sender, exam_ids, exam_state, **kwargs):
+            events.append((exam_ids, exam_state))
+
+        exam_state_changed.connect(listener)
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                ExamStateScheduler.apply_due()
+        finally:
+            exam_state_changed.disconnect(listener)
+
+        assert events == [([exam.id], '1')]
+        assert cache.get(ExamSnapshotService.cache_key(exam.id)) is None
+
+    def test_command_once(self, create_exam):
+        exam = create_exam(-5, 30)
+        out = StringIO()
+
+        call_command('run_exam_scheduler', '--once', stdout=out)
+
+        assert '상태 전환 완료: 1건' in out.getvalue()
+        assert states(exam) == ['1']
@@ -0,0 +1,212 @@
+"""
+Exam Snapshot Cache Tests.
+시험 정보 snapshot cache 및 무효화 테스트.
+"""
+import threading
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.cache import get_or_build, invalidate
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from examination.services import ExamSnapshotService
+from testpaper.models import TestPaperInfo, TestPaperTestQ
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(
+        username='teacher_snapshot', password='testpass123', user_type='teacher', nick_name='Snapshot Teacher'
+    )
+
+
+@pytest.fixture
+def student_user(db):
+    user = UserProfile.objects.create_user(
+        username='student_snapshot', password='testpass123', user_type='student', nick_name='Snapshot Student'
+    )
+    StudentsInfo.objects.create(user=user, student_name='Snapshot Student', student_id='20250201')
+    return user
+
+
+@pytest.fixture
+def subject(db):
+    return SubjectInfo.objects.create(subject_name='Snapshot Subject')
+
+
+@pytest.fixture
+def question(db, teacher_user, subject):
+    question = TestQuestionInfo.objects.create(
+        name='1+1=?', subject=subject, score=10, tq_type='xz', tq_degree='jd', create_user=teacher_user
+    )
+    OptionInfo.objects.create(test_question=question, option='1', is_right=False)
+    OptionInfo.objects.create(test_question=question, option='2', is_right=True)
+    return question
+
+
+@pytest.fixture
+def test_paper(db, teacher_user, subject, question):
+    paper = TestPaperInfo.objects.create(
+        name='Snapshot Paper', subject=subject, total_score=10, passing_score=6, question_count=1,
+        create_user=teacher_user,
+    )
+    TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=10, order=1)
+    return paper
+
+
+@pytest.fixture
+def exam(db, teacher_user, subject, test_paper, student_user):
+    now = timezone.now()
+    exam = ExaminationInfo.objects.create(
+        name='Snapshot Exam', subject=subject, start_time=now - timedelta(minutes=5),
+        end_time=now + timedelta(hours=1), exam_state='1', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=test_paper)
+    ExamStudentsInfo.objects.create(exam=exam, student=student_user.studentsinfo)
+    return exam
+
+
+@pytest.mark.django_db
+class TestExamSnapshotService:
+    """ExamSnapshotService 테스트"""
+
+    def test_snapshot_excludes_answer(self, exam):
+        """snapshot에 정답 정보가 포함되지 않음"""
+        snapshot = ExamSnapshotService.get(exam.id)
+
+        assert snapshot['paper_id'] is not None
+        assert len(snapshot['questions']) == 1
+        for option in snapshot['questions'][0]['options']:
+            assert 'is_right' not in option
+
+    def test_snapshot_missing_exam(self, db):
+        """존재하지 않는 시험은 None"""
+        assert ExamSnapshotService.get(99999) is None
+
+    def test_snapshot_cached(self, exam, django_assert_num_queries):
+        """두 번째 조회부터 DB query 없음"""
+        ExamSnapshotService.get(exam.id)
+
+        with django_assert_num_queries(0):
+            ExamSnapshotService.get(exam.id)
+
+    def test_invalidate_on_option_change(self, exam, question, django_capture_on_commit_callbacks):
+        """선택지 변경 시 snapshot 무효화 (transaction commit 이후)"""
+        ExamSnapshotService.get(exam.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            OptionInfo.objects.create(test_question=question, option='3', is_right=False)
+            # commit 전에는 다른 요청이 변경 전 데이터로 다시 만들지 않도록 유지
+            assert cache.get(ExamSnapshotService.cache_key(exam.id)) is not None
+
+        assert cache.get(ExamSnapshotService.cache_key(exam.id)) is None
+        snapshot = ExamSnapshotService.get(exam.id)
+        assert len(snapshot['questions'][0]['options']) == 3
+
+    def test_invalidate_on_paper_question_change(
+        self, exam, test_paper, teacher_user, subject, django_capture_on_commit_callbacks
+    ):
+        """시험지 문제 추가 시 snapshot 무효화"""
+        ExamSnapshotService.get(exam.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            new_question = TestQuestionInfo.objects.create(
+                name='2+2=?', subject=subject, score=5, tq_type='xz', create_user=teacher_user
+            )
+            TestPaperTestQ.objects.create(test_paper=test_paper, test_question=new_question, score=5, order=2)
+
+        snapshot = ExamSnapshotService.get(exam.id)
+        assert [q['id'] for q in snapshot['questions']][-1] == new_question.id
+        assert snapshot['questions'][-1]['assigned_score'] == 5
+
+    def test_invalidate_on_exam_change(self, exam, django_capture_on_commit_callbacks):
+        """시험 정보 변경 시 snapshot 무효화"""
+        ExamSnapshotService.get(exam.id)
+
+        exam.name = 'Renamed Exam'
+        with django_capture_on_commit_callbacks(execute=True):
+            exam.save()
+
+        assert ExamSnapshotService.get(exam.id)['exam_name'] == 'Renamed Exam'
+
+
+class TestSingleFlight:
+    """get_or_build single-flight 테스트"""
+
+    def test_waits_for_lock_holder(self):
+        """lock 보유 중에는 builder를 실행하지 않고 결과를 기다림"""
+        calls = []
+        cache.add('sf-key:lock', 'other', 10)
+
+        def publish():
+            cache.set('sf-key', 'built-by-holder')
+            cache.delete('sf-key:lock')
+
+        timer = threading.Timer(0.1, publish)
+        timer.start()
+        value = get_or_build('sf-key', lambda: calls.append(1) or 'built-by-waiter', wait_timeout=2)
+        timer.join()
+
+        assert value == 'built-by-holder'
+        assert calls == []
+
+    def test_invalidate_during_build_skips_store(self):
+        """build 중 invalidate되면 lock 보유자는 결과를 반환만 하고 저장하지 않음"""
+        def builder():
+            invalidate('sf-stale')
+            return 'stale'
+
+        assert get_or_build('sf-stale', builder) == 'stale'
+        assert cache.get('sf-stale') is None
+        assert get_or_build('sf-stale', lambda: 'fresh') == 'fresh'
+        assert cache.get('sf-stale') == 'fresh'
+
+    def test_builds_once_and_caches_none(self):
+        """None 결과도 cache하여 반복 생성하지 않음"""
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return None
+
+        assert get_or_build('sf-none', builder) is None
+        assert get_or_build('sf-none', builder) is None
+        assert len(calls) == 1
+
+
+@pytest.mark.django_db
+class TestExamInfoEndpoint:
+    """exam_info API의 snapshot 사용 테스트"""
+
+    def test_exam_info_uses_snapshot(self, api_client, student_user, exam, django_assert_max_num_queries):
+        """snapshot cache hit 시 학생별 query만 실행"""
+        api_client.force_authenticate(user=student_user)
+        first = api_client.get(f'/api/v1/exams/{exam.id}/info/')
+        assert first.status_code == 200
+
+        # studentsinfo, 등록 여부, 응시 상태
+        with django_assert_max_num_queries(3):
+            second = api_client.get(f'/api/v1/exams/{exam.id}/info/')
+
+        assert second.status_code == 200
+        assert second.data['questions'] == first.data['questions']
+        assert second.data['is_started'] is False
+
+    def test_exam_info_without_paper(self, api_client, student_user, exam):
+        """시험지가 없는 시험"""
+        ExamPaperInfo.objects.filter(exam=exam).delete()
+
+        api_client.force_authenticate(user=student_user)
+        response = api_client.get(f'/api/v1/exams/{exam.id}/info/')
+
+        assert response.status_code == 400
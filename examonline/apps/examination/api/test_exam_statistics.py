@@ -0,0 +1,174 @@
+"""
+Exam Statistics Tests.
+시험별 성적 통계 row 증분 갱신 및 재집계 테스트.
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStatistics, ExamStudentsInfo
+from examination.services import ExamStatisticsService, ExpiredAttemptSweeper
+from testpaper.models import TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(username='teacher_stats', password='testpass123', user_type='teacher')
+
+
+@pytest.fixture
+def question(db, teacher_user):
+    subject = SubjectInfo.objects.create(subject_name='Stats Subject')
+    question = TestQuestionInfo.objects.create(
+        name='Stats Q', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+    )
+    OptionInfo.objects.create(test_question=question, option='O', is_right=True)
+    OptionInfo.objects.create(test_question=question, option='X', is_right=False)
+    return question
+
+
+@pytest.fixture
+def exam(db, teacher_user, question):
+    paper = TestPaperInfo.objects.create(
+        name='Stats Paper', subject=question.subject, total_score=10, passing_score=6, question_count=1,
+        create_user=teacher_user,
+    )
+    TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=10, order=1)
+    now = timezone.now()
+    exam = ExaminationInfo.objects.create(
+        name='Stats Exam', subject=question.subject, start_time=now - timedelta(minutes=5),
+        end_time=now + timedelta(hours=1), exam_state='1', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    return exam
+
+
+def start_student(exam, idx, **fields):
+    user = UserProfile.objects.create_user(username=f'student_stats_{idx}', password='testpass123', user_type='student')
+    student = StudentsInfo.objects.create(user=user, student_name=f'Stats {idx}', student_id=f'2025090{idx}')
+    ExamStudentsInfo.objects.create(exam=exam, student=student)
+    test_score = TestScores.objects.create(
+        exam=exam, user=student, test_paper=exam.exampaperinfo_set.first().paper,
+        start_time=timezone.now() - timedelta(minutes=1), **fields,
+    )
+    return user, test_score
+
+
+def submit(api_client, exam, question, user, correct=True):
+    option = OptionInfo.objects.get(test_question=question, is_right=correct)
+    api_client.force_authenticate(user=user)
+    data = {'answers': [{'question_id': question.id, 'selected_options': [option.id]}]}
+    return api_client.post(f'/api/v1/exams/{exam.id}/submit/', data, format='json')
+
+
+@pytest.mark.django_db
+class TestExamStatisticsService:
+    """통계 row 갱신 테스트"""
+
+    def test_submit_updates_statistics_incrementally(self, api_client, exam, question):
+        users = [start_student(exam, idx)[0] for idx in range(3)]
+
+        submit(api_client, exam, question, users[0])
+        submit(api_client, exam, question, users[1], correct=False)
+        submit(api_client, exam, question, users[2])
+
+        stats = ExamStatistics.objects.get(pk=exam.id)
+        assert stats.submitted_count == 3
+        assert stats.score_sum == 20
+        assert stats.score_sq_sum == 200
+        assert (stats.min_score, stats.max_score) == (0, 10)
+        assert stats.pass_count == 2
+        assert stats.histogram == {'0': 1, '9': 2}
+
+    def test_record_change_adjusts_buckets(self, exam):
+        start_student(exam, 1, is_submitted=True, test_score=4)
+        start_student(exam, 2, is_submitted=True, test_score=2)
+        start_student(exam, 3, is_submitted=True, test_score=10)
+        ExamStatisticsService.rebuild(exam.id)
+
+        TestScores.objects.filter(exam=exam, test_score=4).update(test_score=7)
+        ExamStatisticsService.record_change(exam.id, 4, 7)
+
+        stats = ExamStatistics.objects.get(pk=exam.id)
+        assert stats.score_sum == 19
+        assert stats.score_sq_sum == 153
+        assert stats.pass_count == 2
+        assert stats.min_score == 2
+        assert stats.histogram == {'2': 1, '4': 0, '7': 1, '9': 1}
+
+    def test_record_change_of_extreme_rebuilds(self, exam):
+        _, top = start_student(exam, 1, is_submitted=True, test_score=10)
+        start_student(exam, 2, is_submitted=True, test_score=6)
+        ExamStatisticsService.rebuild(exam.id)
+
+        TestScores.objects.filter(pk=top.pk).update(test_score=5)
+        ExamStatisticsService.record_change(exam.id, 10, 5)
+
+        stats = ExamStatistics.objects.get(pk=exam.id)
+        assert (stats.min_score, stats.max_score) == (5, 6)
+        assert stats.pass_count == 1
+
+    def test_sweeper_updates_statistics(self, exam, question):
+        ExamStatisticsService.rebuild(exam.id)
+        ExaminationInfo.objects.filter(pk=exam.pk).update(end_time=timezone.now() - timedelta(minutes=10))
+        option = OptionInfo.objects.get(test_question=question, is_right=True)
+        for idx in range(2):
+            start_student(exam, idx, detail_records={str(question.id): {'answer': '', 'selected_options': [option.id]}})
+
+        ExpiredAttemptSweeper.sweep()
+
+        stats = ExamStatistics.objects.get(pk=exam.id)
+        assert stats.submitted_count == 2
+        assert stats.score_sum == 20
+
+    def test_rebuild_command(self, exam):
+        start_student(exam, 1, is_submitted=True, test_score=9)
+        start_student(exam, 2, is_submitted=False)
+        out = StringIO()
+
+        call_command('rebuild_exam_statistics', '--exam-id', str(exam.id), stdout=out)
+
+        assert '통계 재집계 완료: 1개 시험' in out.getvalue()
+        stats = ExamStatistics.objects.get(pk=exam.id)
+        assert (stats.submitted_count, stats.score_sum, stats.pass_count) == (1, 9, 1)
+
+
+@pytest.mark.django_db
+class TestExamStatisticsAPI:
+    """통계 API 테스트"""
+
+    def test_statistics_reads_summary_row(self, api_client, teacher_user, exam, question, django_assert_num_queries):
+        user, _ = start_student(exam, 1)
+        submit(api_client, exam, question, user)
+        api_client.force_authenticate(user=teacher_user)
+
+        # exam, 작성자, 통계 row
+        with django_assert_num_queries(3):
+            response = api_client.get(f'/api/v1/scores/exam/{exam.id}/statistics/')
+
+        assert response.status_code == 200
+        assert response.data['submitted_count'] == 1
+        assert response.data['average_score'] == 10.0
+        assert response.data['pass_rate'] == 100.0
+
+    def test_manual_grade_updates_statistics(self, api_client, teacher_user, exam, question):
+        user, test_score = start_student(exam, 1)
+        submit(api_client, exam, question, user, correct=False)
+        api_client.force_authenticate(user=teacher_user)
+
+        api_client.post(f'/api/v1/scores/{test_score.id}/grade/', {'question_id': question.id, 'score': 7})
+
+        response = api_client.get(f'/api/v1/scores/exam/{exam.id}/statistics/')
+        assert response.data['average_score'] == 7.0
+        assert response.data['pass_count'] == 1
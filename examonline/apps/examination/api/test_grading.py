@@ -0,0 +1,174 @@
+"""
+Grading Engine Tests.
+채점기 registry, 빈칸 채우기 정규화, 일괄 채점 테스트.
+"""
+import random
+
+import pytest
+
+from examination.answer_key import AnswerKey, QuestionKey, build_answer_key
+from examination.grading import get_grader, grade_many, grade_one, normalize_text
+from testpaper.models import TestPaperInfo, TestPaperTestQ
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import SubjectInfo, UserProfile
+
+
+def make_answer_key():
+    """객관식(정답 2개), OX, 빈칸 채우기, 정답 없는 문제, 미지원 유형으로 구성된 정답 index"""
+    questions = {
+        1: QuestionKey(question_id=1, tq_type='xz', score=10, correct_option_ids=frozenset({11, 13})),
+        2: QuestionKey(question_id=2, tq_type='pd', score=5, correct_option_ids=frozenset({21})),
+        3: QuestionKey(
+            question_id=3, tq_type='tk', score=7, correct_option_ids=frozenset({31}),
+            accepted_answers=('Seoul', '서울'),
+        ),
+        4: QuestionKey(question_id=4, tq_type='xz', score=3, correct_option_ids=frozenset()),
+        5: QuestionKey(question_id=5, tq_type='jd', score=20, correct_option_ids=frozenset()),
+    }
+    return AnswerKey(paper_id=1, version='v', questions=questions)
+
+
+@pytest.fixture
+def tk_paper(db):
+    teacher = UserProfile.objects.create_user(
+        username='teacher_grading', password='testpass123', user_type='teacher', nick_name='Grading Teacher'
+    )
+    subject = SubjectInfo.objects.create(subject_name='Grading Subject')
+    question = TestQuestionInfo.objects.create(
+        name='대한민국의 수도는?', subject=subject, score=5, tq_type='tk', create_user=teacher
+    )
+    OptionInfo.objects.create(test_question=question, option='서울', is_right=True)
+    OptionInfo.objects.create(test_question=question, option='부산', is_right=False)
+    paper = TestPaperInfo.objects.create(
+        name='Grading Paper', subject=subject, total_score=5, passing_score=3, question_count=1, create_user=teacher
+    )
+    TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=5, order=1)
+    return paper, question
+
+
+class TestGraders:
+    """채점기 registry 테스트"""
+
+    def test_normalize_text(self):
+        """유니코드 NFKC, 공백 축약, 대소문자 무시"""
+        assert normalize_text('  Ｓｅｏｕｌ   City ') == 'seoul city'
+        assert normalize_text(None) == ''
+
+    def test_fill_blank_normalized_match(self):
+        """빈칸 채우기는 정규화 후 비교"""
+        answer_key = make_answer_key()
+
+        result = grade_one(answer_key, [{'question_id': 3, 'answer': ' SEOUL '}])
+
+        assert result.records['3']['is_correct'] is True
+        assert result.total_score == 7
+
+    def test_fill_blank_empty_answer_is_wrong(self):
+        answer_key = make_answer_key()
+
+        result = grade_one(answer_key, [{'question_id': 3, 'answer': '   '}])
+
+        assert result.records['3']['is_correct'] is False
+
+    def test_unknown_type_is_never_correct(self):
+        """채점기가 없는 유형은 오답 처리 (수동 채점 대상)"""
+        answer_key = make_answer_key()
+
+        result = grade_one(answer_key, [{'question_id': 5, 'answer': '서술형 답안'}])
+
+        assert result.records['5']['is_correct'] is False
+        assert result.records['5']['max_score'] == 20
+        assert get_grader('unknown').is_correct(answer_key.get(5), {}) is False
+
+    def test_legacy_answer_field(self):
+        """answer 필드에 옵션 ID를 보내는 기존 방식 지원"""
+        answer_key = make_answer_key()
+
+        result = grade_one(answer_key, [{'question_id': 2, 'answer': '21'}])
+
+        assert result.records['2']['is_correct'] is True
+
+    def test_unknown_question_skipped(self):
+        answer_key = make_answer_key()
+
+        result = grade_one(answer_key, [{'question_id': 999, 'answer': '1'}])
+
+        assert result.records == {}
+        assert result.total_score == 0
+
+    def test_detail_records_input(self):
+        """임시 저장 형식(detail_records)도 채점 가능"""
+        answer_key = make_answer_key()
+
+        result = grade_one(answer_key, {'1': {'answer': '', 'selected_options': [13, 11]}})
+
+        assert result.records['1']['is_correct'] is True
+
+    def test_malformed_ids_ignored(self):
+        """정수가 아닌 옵션/문제 ID는 무시 (임시 저장 답안은 검증 없이 저장됨)"""
+        answer_key = make_answer_key()
+        answers = {
+            '1': {'selected_options': ['11', 'abc', None, 13, True]},
+            '2': {'selected_options': ['x'], 'answer': '21'},
+            'abc': {'selected_options': [1]},
+        }
+
+        for result in (grade_one(answer_key, answers), grade_many(answer_key, [answers])[0]):
+            assert result.records['1']['is_correct'] is True
+            assert result.records['1']['selected_options'] == [11, 13]
+            assert result.records['2']['is_correct'] is True
+            assert set(result.records) == {'1', '2'}
+
+
+class TestGradeMany:
+    """일괄 채점 테스트"""
+
+    def test_matches_grade_one(self):
+        """무작위 답안에 대해 grade_many 결과가 grade_one과 동일"""
+        answer_key = make_answer_key()
+        rng = random.Random(42)
+        option_pool = {1: [11, 12, 13, 14], 2: [21, 22], 4: [41, 42]}
+        text_pool = ['Seoul', ' seoul ', '부산', '', '서울']
+
+        submissions = []
+        for _ in range(200):
+            answers = []
+            for question_id in (1, 2, 3, 4, 5, 999):
+                if rng.random() < 0.2:
+                    continue
+                if question_id in option_pool:
+                    if rng.random() < 0.2:
+                        answers.append({'question_id': question_id, 'answer': str(rng.choice(option_pool[question_id]))})
+                    else:
+                        count = rng.randint(0, len(option_pool[question_id]))
+                        selected = rng.sample(option_pool[question_id], count)
+                        answers.append({'question_id': question_id, 'answer': '', 'selected_options': selected})
+                else:
+                    answers.append({'question_id': question_id, 'answer': rng.choice(text_pool)})
+            submissions.append(answers)
+
+        batch = grade_many(answer_key, submissions)
+
+        assert len(batch) == len(submissions)
+        for result, answers in zip(batch, submissions):
+            expected = grade_one(answer_key, answers)
+            assert result.total_score == expected.total_score
+            assert result.records == expected.records
+
+    def test_empty_submissions(self):
+        assert grade_many(make_answer_key(), []) == []
+
+
+@pytest.mark.django_db
+class TestFillBlankAnswerKey:
+    """빈칸 채우기 정답 index 테스트"""
+
+    def test_accepted_answers_from_options(self, tk_paper):
+        """정답 옵션 텍스트를 빈칸 채우기 정답으로 사용"""
+        paper, question = tk_paper
+
+        answer_key = build_answer_key(paper.id)
+
+        assert answer_key.get(question.id).accepted_answers == ('서울',)
+        result = grade_one(answer_key, [{'question_id': question.id, 'answer': '서울 '}])
+        assert result.total_score == 5
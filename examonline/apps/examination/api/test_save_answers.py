@@ -0,0 +1,182 @@
+"""
+Batch Save Answers API Tests.
+일괄 답안 저장 (last-writer-wins) 테스트.
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.answer_buffer import AnswerBuffer
+from examination.models import ExaminationInfo, ExamStudentsInfo
+from testpaper.models import TestScores
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def student_user(db):
+    user = UserProfile.objects.create_user(
+        username='student_batch', password='testpass123', user_type='student', nick_name='Batch Student'
+    )
+    StudentsInfo.objects.create(user=user, student_name='Batch Student', student_id='20250601')
+    return user
+
+
+@pytest.fixture
+def exam(db, student_user):
+    teacher = UserProfile.objects.create_user(username='teacher_batch', password='testpass123', user_type='teacher')
+    subject = SubjectInfo.objects.create(subject_name='Batch Subject')
+    now = timezone.now()
+    exam = ExaminationInfo.objects.create(
+        name='Batch Exam', subject=subject, start_time=now - timedelta(minutes=5),
+        end_time=now + timedelta(hours=1), exam_state='1', create_user=teacher,
+    )
+    ExamStudentsInfo.objects.create(exam=exam, student=student_user.studentsinfo)
+    return exam
+
+
+@pytest.fixture
+def test_score(db, exam, student_user):
+    return TestScores.objects.create(
+        exam=exam, user=student_user.studentsinfo, start_time=timezone.now() - timedelta(minutes=1),
+    )
+
+
+def post_answers(api_client, exam, answers):
+    return api_client.post(f'/api/v1/exams/{exam.id}/save-answers/', {'answers': answers}, format='json')
+
+
+def save_answer(api_client, exam, answer):
+    return api_client.post(f'/api/v1/exams/{exam.id}/save-answer/', answer, format='json')
+
+
+@pytest.mark.django_db
+class TestSaveAnswers:
+    """일괄 답안 저장 테스트"""
+
+    def test_save_batch_in_single_update(
+        self, api_client, student_user, exam, test_score, django_assert_max_num_queries
+    ):
+        """여러 답안을 UPDATE 1회로 저장"""
+        api_client.force_authenticate(user=student_user)
+        answers = [
+            {'question_id': 1, 'answer': 'a', 'client_ts': '2025-01-01T00:00:01Z'},
+            {'question_id': 2, 'selected_options': [7], 'client_ts': '2025-01-01T00:00:02Z'},
+        ]
+
+        # studentsinfo, exam, UPDATE
+        with django_assert_max_num_queries(3):
+            response = post_answers(api_client, exam, answers)
+
+        assert response.status_code == 200
+        assert response.data['saved_count'] == 2
+        test_score.refresh_from_db()
+        assert test_score.detail_records['1']['answer'] == 'a'
+        assert test_score.detail_records['2']['selected_options'] == [7]
+        assert test_score.detail_records['2']['client_ts'] == '2025-01-01T00:00:02.000000Z'
+
+    def test_last_writer_wins(self, api_client, student_user, exam, test_score):
+        """client_ts가 더 오래된 답안은 무시 (같은 요청 안의 중복 포함)"""
+        api_client.force_authenticate(user=student_user)
+        post_answers(api_client, exam, [{'question_id': 1, 'answer': 'latest', 'client_ts': '2025-01-01T00:00:10Z'}])
+
+        response = post_answers(api_client, exam, [
+            {'question_id': 1, 'answer': 'stale', 'client_ts': '2025-01-01T00:00:05Z'},
+            {'question_id': 2, 'answer': 'newer', 'client_ts': '2025-01-01T00:00:09Z'},
+            {'question_id': 2, 'answer': 'older', 'client_ts': '2025-01-01T00:00:08Z'},
+        ])
+
+        assert response.status_code == 200
+        test_score.refresh_from_db()
+        assert test_score.detail_records['1']['answer'] == 'latest'
+        assert test_score.detail_records['2']['answer'] == 'newer'
+
+    def test_overrides_answer_without_timestamp(self, api_client, student_user, exam, test_score):
+        """client_ts가 없는 기존 답안(이전 형식)은 덮어씀"""
+        TestScores.objects.filter(pk=test_score.pk).update(detail_records={'1': {'answer': 'old'}})
+        api_client.force_authenticate(user=student_user)
+
+        post_answers(api_client, exam, [{'question_id': 1, 'answer': 'new'}])
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records['1']['answer'] == 'new'
+
+    def test_single_save_keeps_order_with_batch(self, api_client, student_user, exam, test_score):
+        """save-answer 답안에도 client_ts가 기록되어 더 오래된 offline 답안이 덮어쓰지 않음"""
+        api_client.force_authenticate(user=student_user)
+
+        save_answer(api_client, exam, {'question_id': 1, 'answer': 'online'})
+        save_answer(api_client, exam, {'question_id': 2, 'answer': 'old', 'client_ts': '2025-01-01T00:00:05Z'})
+        post_answers(api_client, exam, [
+            {'question_id': 1, 'answer': 'offline', 'client_ts': '2025-01-01T00:00:00Z'},
+            {'question_id': 2, 'answer': 'newer', 'client_ts': '2025-01-01T00:00:06Z'},
+        ])
+        save_answer(api_client, exam, {'question_id': 2, 'answer': 'stale', 'client_ts': '2025-01-01T00:00:01Z'})
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records['1']['answer'] == 'online'
+        assert test_score.detail_records['2']['answer'] == 'newer'
+
+    def test_buffered_save_keeps_order_with_batch(
+        self, settings, api_client, student_user, exam, test_score, django_capture_on_commit_callbacks
+    ):
+        """buffer flush도 같은 last-writer-wins 규칙으로 병합"""
+        settings.ANSWER_BUFFER_ENABLED = True
+        api_client.force_authenticate(user=student_user)
+
+        save_answer(api_client, exam, {'question_id': 1, 'answer': 'online'})
+        post_answers(api_client, exam, [
+            {'question_id': 1, 'answer': 'offline', 'client_ts': '2025-01-01T00:00:00Z'},
+            {'question_id': 2, 'answer': 'newer', 'client_ts': '2025-01-01T00:00:06Z'},
+        ])
+        save_answer(api_client, exam, {'question_id': 2, 'answer': 'stale', 'client_ts': '2025-01-01T00:00:01Z'})
+
+        status_response = api_client.get(f'/api/v1/exams/{exam.id}/status/')
+        assert status_response.data['draft_answers']['2']['answer'] == 'newer'
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AnswerBuffer.flush_dirty()
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records['1']['answer'] == 'online'
+        assert test_score.detail_records['2']['answer'] == 'newer'
+
+    def test_future_timestamp_clamped(self, api_client, student_user, exam, test_score):
+        """client 시계가 앞서 있어도 client_ts는 서버 수신 시각으로 제한되어 이후 답안이 무시되지 않음"""
+        api_client.force_authenticate(user=student_user)
+        future = (timezone.now() + timedelta(days=1)).isoformat()
+
+        post_answers(api_client, exam, [{'question_id': 1, 'answer': 'skewed', 'client_ts': future}])
+        save_answer(api_client, exam, {'question_id': 1, 'answer': 'later'})
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records['1']['answer'] == 'later'
+
+    def test_already_submitted(self, api_client, student_user, exam, test_score):
+        TestScores.objects.filter(pk=test_score.pk).update(is_submitted=True)
+        api_client.force_authenticate(user=student_user)
+
+        response = post_answers(api_client, exam, [{'question_id': 1, 'answer': 'a'}])
+
+        assert response.status_code == 400
+        assert '이미 제출한 시험' in response.data['detail']
+
+    def test_not_started(self, api_client, student_user, exam):
+        api_client.force_authenticate(user=student_user)
+
+        response = post_answers(api_client, exam, [{'question_id': 1, 'answer': 'a'}])
+
+        assert response.status_code == 400
+
+    def test_empty_answers(self, api_client, student_user, exam, test_score):
+        api_client.force_authenticate(user=student_user)
+
+        response = post_answers(api_client, exam, [])
+
+        assert response.status_code == 400
@@ -0,0 +1,250 @@
+"""
+Submission Queue Tests.
+비동기 제출 접수(202), 멱등성, 채점 worker 테스트.
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStatistics, ExamStudentsInfo, SubmissionJob
+from examination.services import ExamRegradeService, ExamStatisticsService, SubmissionQueueService
+from testpaper.models import TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture(autouse=True)
+def async_submit_enabled(settings):
+    settings.ASYNC_SUBMIT_ENABLED = True
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(
+        username='teacher_queue', password='testpass123', user_type='teacher', nick_name='Queue Teacher'
+    )
+
+
+@pytest.fixture
+def question(db, teacher_user):
+    subject = SubjectInfo.objects.create(subject_name='Queue Subject')
+    question = TestQuestionInfo.objects.create(
+        name='Queue Q', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+    )
+    OptionInfo.objects.create(test_question=question, option='O', is_right=True)
+    OptionInfo.objects.create(test_question=question, option='X', is_right=False)
+    return question
+
+
+@pytest.fixture
+def exam(db, teacher_user, question):
+    paper = TestPaperInfo.objects.create(
+        name='Queue Paper', subject=question.subject, total_score=10, passing_score=6, question_count=1,
+        create_user=teacher_user,
+    )
+    TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=10, order=1)
+    now = timezone.now()
+    exam = ExaminationInfo.objects.create(
+        name='Queue Exam', subject=question.subject, start_time=now - timedelta(minutes=5),
+        end_time=now + timedelta(hours=1), exam_state='1', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    return exam
+
+
+def start_student(exam, idx):
+    user = UserProfile.objects.create_user(username=f'student_queue_{idx}', password='testpass123', user_type='student')
+    student = StudentsInfo.objects.create(user=user, student_name=f'Queue Student {idx}', student_id=f'2025070{idx}')
+    ExamStudentsInfo.objects.create(exam=exam, student=student)
+    TestScores.objects.create(
+        exam=exam, user=student, test_paper=exam.exampaperinfo_set.first().paper,
+        start_time=timezone.now() - timedelta(minutes=1),
+    )
+    return user
+
+
+def submit(api_client, exam, question, correct=True, **headers):
+    option = OptionInfo.objects.get(test_question=question, is_right=correct)
+    data = {'answers': [{'question_id': question.id, 'selected_options': [option.id]}]}
+    return api_client.post(f'/api/v1/exams/{exam.id}/submit/', data, format='json', headers=headers)
+
+
+@pytest.mark.django_db
+class TestAsyncSubmit:
+    """비동기 제출 접수 테스트"""
+
+    def test_submit_returns_202_without_grading(self, api_client, exam, question):
+        user = start_student(exam, 1)
+        api_client.force_authenticate(user=user)
+
+        response = submit(api_client, exam, question)
+
+        assert response.status_code == 202
+        assert response.data['status'] == 'grading'
+        test_score = TestScores.objects.get(exam=exam, user=user.studentsinfo)
+        assert test_score.is_submitted is True
+        assert test_score.is_grading is True
+        assert test_score.detail_records == {}
+        assert SubmissionJob.objects.get(test_score=test_score).status == SubmissionJob.STATUS_PENDING
+
+    def test_status_and_result_report_grading(self, api_client, exam, question):
+        user = start_student(exam, 1)
+        api_client.force_authenticate(user=user)
+        submit(api_client, exam, question)
+
+        status_response = api_client.get(f'/api/v1/exams/{exam.id}/status/')
+        result_response = api_client.get(f'/api/v1/exams/{exam.id}/result/')
+
+        assert status_response.data['is_grading'] is True
+        assert status_response.data['score'] is None
+        assert result_response.status_code == 202
+        assert result_response.data['status'] == 'grading'
+
+    def test_retry_with_same_key_is_idempotent(self, api_client, exam, question):
+        """같은 Idempotency-Key로 재요청하면 작업을 새로 만들지 않고 접수 상태 반환"""
+        user = start_student(exam, 1)
+        api_client.force_authenticate(user=user)
+        submit(api_client, exam, question, **{'Idempotency-Key': 'abc'})
+
+        retry = submit(api_client, exam, question, **{'Idempotency-Key': 'abc'})
+        other = submit(api_client, exam, question, **{'Idempotency-Key': 'other'})
+
+        assert retry.status_code == 202
+        assert other.status_code == 400
+        assert SubmissionJob.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestGradingWorker:
+    """채점 worker 테스트"""
+
+    def test_process_batch_finalizes_scores(self, api_client, exam, question):
+        users = [start_student(exam, idx) for idx in range(3)]
+        for idx, user in enumerate(users):
+            api_client.force_authenticate(user=user)
+            submit(api_client, exam, question, correct=idx != 1)
+
+        assert SubmissionQueueService.process_batch() == 3
+        assert SubmissionQueueService.process_batch() == 0
+
+        scores = {s.user_id: s for s in TestScores.objects.filter(exam=exam)}
+        assert [scores[user.studentsinfo.id].test_score for user in users] == [10, 0, 10]
+        assert all(not score.is_grading for score in scores.values())
+        assert set(SubmissionJob.objects.values_list('status', flat=True)) == {SubmissionJob.STATUS_DONE}
+
+        api_client.force_authenticate(user=users[0])
+        result = api_client.get(f'/api/v1/exams/{exam.id}/result/')
+        assert result.status_code == 200
+        assert result.data['submission']['score'] == 10
+
+    def test_stale_processing_job_is_reclaimed(self, api_client, exam, question):
+        """worker 중단으로 처리 중에 멈춘 작업은 LOCK_TIMEOUT 후 재처리"""
+        user = start_student(exam, 1)
+        api_client.force_authenticate(user=user)
+        submit(api_client, exam, question)
+        SubmissionJob.objects.update(
+            status=SubmissionJob.STATUS_PROCESSING,
+            locked_at=timezone.now() - timedelta(seconds=SubmissionQueueService.LOCK_TIMEOUT + 1),
+        )
+
+        assert SubmissionQueueService.process_batch() == 1
+        job = SubmissionJob.objects.get()
+        assert job.status == SubmissionJob.STATUS_DONE
+        assert job.attempts == 1
+
+    def test_failed_job_gives_up_after_max_attempts(self, api_client, exam, question, monkeypatch):
+        """MAX_ATTEMPTS까지 실패하면 채점 실패로 확정되어 결과 조회가 202에 머물지 않고, 재채점으로 복구"""
+        user = start_student(exam, 1)
+        api_client.force_authenticate(user=user)
+        submit(api_client, exam, question)
+
+        def fail(*args, **kwargs):
+            raise ValueError('grading failed')
+
+        with monkeypatch.context() as patch:
+            patch.setattr('examination.services.grade_many', fail)
+            for attempt in range(1, SubmissionQueueService.MAX_ATTEMPTS + 1):
+                assert SubmissionQueueService.process_batch() == 1
+                job = SubmissionJob.objects.get()
+                assert job.attempts == attempt
+            assert SubmissionQueueService.process_batch() == 0
+
+        assert job.status == SubmissionJob.STATUS_FAILED
+        assert job.error == 'grading failed'
+        test_score = TestScores.objects.get(exam=exam)
+        assert test_score.is_grading is False
+        assert test_score.detail_records[str(question.id)]['selected_options']
+
+        # 채점 실패로 확정된 성적(0점)도 전체 재집계와 같게 통계에 반영
+        stats = ExamStatistics.objects.get(pk=exam.id)
+        assert (stats.submitted_count, stats.score_sum) == (1, 0)
+
+        status_response = api_client.get(f'/api/v1/exams/{exam.id}/status/')
+        assert status_response.data['is_grading'] is False
+        assert status_response.data['grading_failed'] is True
+        assert status_response.data['score'] is None
+        result_response = api_client.get(f'/api/v1/exams/{exam.id}/result/')
+        assert result_response.status_code == 409
+        assert result_response.data['status'] == 'failed'
+
+        ExamRegradeService.regrade(exam.id)
+
+        assert SubmissionJob.objects.get().status == SubmissionJob.STATUS_DONE
+        result_response = api_client.get(f'/api/v1/exams/{exam.id}/result/')
+        assert result_response.status_code == 200
+        assert result_response.data['submission']['score'] == 10
+
+    def test_reclaimed_job_recorded_once(self, api_client, exam, question):
+        """LOCK_TIMEOUT 후 재처리된 작업을 원래 worker가 뒤늦게 확정해도 통계는 한 번만 반영"""
+        user = start_student(exam, 1)
+        api_client.force_authenticate(user=user)
+        submit(api_client, exam, question)
+        SubmissionQueueService.claim(1)
+        stale_jobs = list(SubmissionJob.objects.select_related('test_score__test_paper'))
+        SubmissionJob.objects.update(
+            locked_at=timezone.now() - timedelta(seconds=SubmissionQueueService.LOCK_TIMEOUT + 1),
+        )
+
+        assert SubmissionQueueService.process_batch() == 1
+        SubmissionQueueService._finalize(stale_jobs)
+
+        stats = ExamStatistics.objects.get(pk=exam.id)
+        assert (stats.submitted_count, stats.score_sum) == (1, 10)
+        rebuilt = ExamStatisticsService.rebuild(exam.id)
+        assert (rebuilt.submitted_count, rebuilt.score_sum) == (1, 10)
+        assert SubmissionJob.objects.get().status == SubmissionJob.STATUS_DONE
+
+    def test_stale_job_with_max_attempts_gives_up(self, api_client, exam, question):
+        """마지막 시도 중 worker가 멈춘 작업은 재처리하지 않고 채점 실패로 확정"""
+        user = start_student(exam, 1)
+        api_client.force_authenticate(user=user)
+        submit(api_client, exam, question)
+        SubmissionJob.objects.update(
+            status=SubmissionJob.STATUS_PROCESSING,
+            attempts=SubmissionQueueService.MAX_ATTEMPTS,
+            locked_at=timezone.now() - timedelta(seconds=SubmissionQueueService.LOCK_TIMEOUT + 1),
+        )
+
+        assert SubmissionQueueService.process_batch() == 0
+        assert SubmissionJob.objects.get().status == SubmissionJob.STATUS_FAILED
+        assert TestScores.objects.get(exam=exam).is_grading is False
+
+    def test_worker_command_once(self, api_client, exam, question):
+        user = start_student(exam, 1)
+        api_client.force_authenticate(user=user)
+        submit(api_client, exam, question)
+        out = StringIO()
+
+        call_command('run_grading_workers', '--workers', '1', '--once', stdout=out)
+
+        assert '채점 완료: 1건' in out.getvalue()
+        assert TestScores.objects.get(exam=exam).test_score == 10
@@ -0,0 +1,172 @@
+"""
+Expired Attempt Sweeper Tests.
+시간 초과 미제출 응시 기록 자동 제출 테스트.
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.utils import timezone
+
+from examination.answer_buffer import AnswerBuffer
+from examination.models import ExaminationInfo, ExamPaperInfo
+from examination.services import ExamStatisticsService, ExpiredAttemptSweeper
+from testpaper.models import TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(username='teacher_sweep', password='testpass123', user_type='teacher')
+
+
+@pytest.fixture
+def question(db, teacher_user):
+    subject = SubjectInfo.objects.create(subject_name='Sweep Subject')
+    question = TestQuestionInfo.objects.create(
+        name='Sweep Q', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+    )
+    OptionInfo.objects.create(test_question=question, option='O', is_right=True)
+    OptionInfo.objects.create(test_question=question, option='X', is_right=False)
+    return question
+
+
+def create_exam(teacher_user, question, end_time):
+    paper = TestPaperInfo.objects.create(
+        name='Sweep Paper', subject=question.subject, total_score=10, passing_score=6, question_count=1,
+        create_user=teacher_user,
+    )
+    TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=10, order=1)
+    exam = ExaminationInfo.objects.create(
+        name='Sweep Exam', subject=question.subject, start_time=end_time - timedelta(hours=1), end_time=end_time,
+        exam_state='1', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    return exam
+
+
+def create_attempts(exam, question, count, correct=True):
+    option = OptionInfo.objects.get(test_question=question, is_right=correct)
+    attempts = []
+    for _ in range(count):
+        idx = StudentsInfo.objects.count()
+        user = UserProfile.objects.create_user(username=f'student_sweep_{idx}', password='testpass123')
+        student = StudentsInfo.objects.create(user=user, student_name=f'Sweep {idx}', student_id=f'2025080{idx}')
+        attempts.append(TestScores.objects.create(
+            exam=exam, user=student, test_paper=exam.exampaperinfo_set.first().paper,
+            start_time=exam.start_time + timedelta(minutes=10),
+            detail_records={str(question.id): {'answer': '', 'selected_options': [option.id]}},
+        ))
+    return attempts
+
+
+@pytest.mark.django_db
+class TestExpiredAttemptSweeper:
+    """시간 초과 자동 제출 테스트"""
+
+    def test_sweep_grades_saved_answers(self, teacher_user, question):
+        exam = create_exam(teacher_user, question, timezone.now() - timedelta(minutes=10))
+        correct = create_attempts(exam, question, 2)
+        wrong = create_attempts(exam, question, 1, correct=False)
+
+        assert ExpiredAttemptSweeper.sweep(batch_size=2) == 3
+
+        for attempt, expected in [(correct[0], 10), (correct[1], 10), (wrong[0], 0)]:
+            attempt.refresh_from_db()
+            assert attempt.is_submitted is True
+            assert attempt.is_auto_submitted is True
+            assert attempt.test_score == expected
+            assert attempt.submit_time == exam.end_time
+            assert attempt.time_used == 50
+
+    def test_active_and_grace_period_attempts_untouched(self, teacher_user, question):
+        """진행 중인 시험과 유예 시간 이내의 시험은 처리하지 않음"""
+        active = create_exam(teacher_user, question, timezone.now() + timedelta(minutes=10))
+        just_ended = create_exam(teacher_user, question, timezone.now() - timedelta(seconds=10))
+        create_attempts(active, question, 1)
+        create_attempts(just_ended, question, 1)
+
+        assert ExpiredAttemptSweeper.sweep() == 0
+        assert TestScores.objects.filter(is_submitted=True).count() == 0
+
+    def test_not_started_and_submitted_attempts_skipped(self, teacher_user, question):
+        exam = create_exam(teacher_user, question, timezone.now() - timedelta(minutes=10))
+        submitted, not_started = create_attempts(exam, question, 2)
+        TestScores.objects.filter(pk=submitted.pk).update(is_submitted=True, test_score=7)
+        TestScores.objects.filter(pk=not_started.pk).update(start_time=None)
+
+        assert ExpiredAttemptSweeper.sweep() == 0
+        submitted.refresh_from_db()
+        assert submitted.test_score == 7
+
+    def test_sweep_includes_buffered_answers(
+        self, settings, teacher_user, question, django_capture_on_commit_callbacks
+    ):
+        """답안 buffer에만 남은 답안도 채점에 포함"""
+        settings.ANSWER_BUFFER_ENABLED = True
+        exam = create_exam(teacher_user, question, timezone.now() - timedelta(minutes=10))
+        (attempt,) = create_attempts(exam, question, 1, correct=False)
+        right = OptionInfo.objects.get(test_question=question, is_right=True)
+        AnswerBuffer.put(exam.id, attempt.user_id, question.id, {'answer': '', 'selected_options': [right.id]})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ExpiredAttemptSweeper.sweep()
+
+        attempt.refresh_from_db()
+        assert attempt.test_score == 10
+        assert AnswerBuffer.pending(exam.id, attempt.user_id) == {}
+
+    def test_failed_sweep_keeps_buffered_answers(self, settings, teacher_user, question, monkeypatch):
+        """자동 제출 transaction이 rollback되면 buffer 답안이 남아 다음 sweep에서 채점"""
+        settings.ANSWER_BUFFER_ENABLED = True
+        exam = create_exam(teacher_user, question, timezone.now() - timedelta(minutes=10))
+        (attempt,) = create_attempts(exam, question, 1, correct=False)
+        right = OptionInfo.objects.get(test_question=question, is_right=True)
+        AnswerBuffer.put(exam.id, attempt.user_id, question.id, {'answer': '', 'selected_options': [right.id]})
+
+        def fail(*args, **kwargs):
+            raise DatabaseError('sweep failed')
+
+        with monkeypatch.context() as patch:
+            patch.setattr(ExamStatisticsService, 'record_test_scores', fail)
+            with pytest.raises(DatabaseError):
+                ExpiredAttemptSweeper.sweep()
+
+        attempt.refresh_from_db()
+        assert attempt.is_submitted is False
+        assert str(question.id) in AnswerBuffer.pending(exam.id, attempt.user_id)
+
+        assert ExpiredAttemptSweeper.sweep() == 1
+        attempt.refresh_from_db()
+        assert attempt.test_score == 10
+
+    def test_malformed_draft_does_not_fail_batch(self, teacher_user, question):
+        """임시 저장된 잘못된 옵션/문제 ID는 무시하고 같은 batch의 다른 응시도 처리"""
+        exam = create_exam(teacher_user, question, timezone.now() - timedelta(minutes=10))
+        malformed, normal = create_attempts(exam, question, 2)
+        right = OptionInfo.objects.get(test_question=question, is_right=True)
+        TestScores.objects.filter(pk=malformed.pk).update(detail_records={
+            str(question.id): {'answer': '', 'selected_options': ['abc', str(right.id), None]},
+            'q-1': {'answer': 'x'},
+        })
+
+        assert ExpiredAttemptSweeper.sweep() == 2
+
+        malformed.refresh_from_db()
+        normal.refresh_from_db()
+        assert (malformed.is_submitted, malformed.test_score) == (True, 10)
+        assert malformed.detail_records[str(question.id)]['selected_options'] == [right.id]
+        assert (normal.is_submitted, normal.test_score) == (True, 10)
+
+    def test_command_once(self, teacher_user, question):
+        exam = create_exam(teacher_user, question, timezone.now() - timedelta(minutes=10))
+        create_attempts(exam, question, 3)
+        out = StringIO()
+
+        call_command('sweep_expired_attempts', '--once', '--batch-size', '2', stdout=out)
+
+        assert '자동 제출 완료: 3건' in out.getvalue()
+        assert TestScores.objects.filter(exam=exam, is_auto_submitted=True).count() == 3
@@ -265,6 +265,31 @@ class TestSaveAnswer:
         score = TestScores.objects.get(exam=exam_setup, user=student_info)
         assert score.detail_records[str(question.id)]['answer'] == "2"
 
+    def test_save_answer_keeps_other_answers(
+        self, api_client, student_user, student_info, exam_setup, test_paper, question, django_assert_max_num_queries
+    ):
+        """해당 문제 답안만 부분 갱신 (TestScores 조회 없이 UPDATE 1회)"""
+        api_client.force_authenticate(user=student_user)
+
+        TestScores.objects.create(
+            exam=exam_setup,
+            user=student_info,
+            test_paper=test_paper,
+            start_time=timezone.now(),
+            detail_records={'99999': {'answer': 'other tab'}}
+        )
+
+        url = f"/api/v1/exams/{exam_setup.id}/save-answer/"
+        data = {"question_id": question.id, "answer": "2"}
+        # studentsinfo, exam, UPDATE
+        with django_assert_max_num_queries(3):
+            response = api_client.post(url, data, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        score = TestScores.objects.get(exam=exam_setup, user=student_info)
+        assert score.detail_records['99999'] == {'answer': 'other tab'}
+        assert score.detail_records[str(question.id)]['answer'] == "2"
+
     def test_save_answer_not_started(self, api_client, student_user, student_info, exam_setup, question):
         """시험을 시작하지 않은 상태에서 답안 저장 시도"""
         api_client.force_authenticate(user=student_user)
@@ -13,6 +13,7 @@ from rest_framework import filters
 
 from core.api.permissions import IsTeacher, IsExamCreator
 from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from examination.services import exam_state_changed
 from user.models import StudentsInfo
 
 from .filters import ExaminationFilter
@@ -45,6 +46,8 @@ class ExaminationViewSet(viewsets.ModelViewSet):
     search_fields = ['name']
     ordering_fields = ['create_time', 'start_time', 'end_time', 'student_num']
     ordering = ['-create_time']
+    # ?cursor= 요청 시 keyset pagination
+    cursor_pagination = True
 
     def get_queryset(self):
         """QuerySet 최적화 (N+1 query 방지)
@@ -195,6 +198,7 @@ class ExaminationViewSet(viewsets.ModelViewSet):
 
         exam.exam_state = new_state
         exam.save()
+        exam_state_changed.send(sender=ExaminationInfo, exam_ids=[exam.id], exam_state=exam.exam_state)
 
         return Response(
             {
@@ -236,6 +240,7 @@ class ExaminationViewSet(viewsets.ModelViewSet):
         # 시험 시작 (시험 중 상태로 변경)
         exam.exam_state = '1'
         exam.save()
+        exam_state_changed.send(sender=ExaminationInfo, exam_ids=[exam.id], exam_state=exam.exam_state)
 
         serializer = ExaminationDetailSerializer(exam)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -5,3 +5,7 @@ class ExaminationConfig(AppConfig):
     name = 'examination'
     # admin에서 app 이름 바꾸기
     verbose_name = '시험 정보（Exam_Info）'
+
+    def ready(self):
+        # 시험 snapshot cache 무효화 signal 등록
+        from examination import signals  # noqa: F401
@@ -0,0 +1,18 @@
+"""
+Grading engine.
+
+문제 유형별 채점기 registry와 단건/일괄 채점 API.
+"""
+from examination.grading.engine import GradeResult, grade_many, grade_one
+from examination.grading.graders import BaseGrader, get_grader, normalize_text, option_ids, register_grader
+
+__all__ = [
+    'BaseGrader',
+    'GradeResult',
+    'get_grader',
+    'grade_many',
+    'grade_one',
+    'normalize_text',
+    'option_ids',
+    'register_grader',
+]
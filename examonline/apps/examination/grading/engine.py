@@ -0,0 +1,174 @@
+"""
+채점 engine.
+
+grade_one: 답안 1건 채점 (제출 시)
+grade_many: 답안 여러 건 일괄 채점 (재채점, 자동 제출 등)
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from examination.grading.graders import get_grader, option_ids, parse_selected_options
+
+
+@dataclass
+class GradeResult:
+    """채점 결과"""
+
+    total_score: int = 0
+    # detail_records 형식 {question_id(str): {...}}
+    records: dict = field(default_factory=dict)
+
+
+def _normalize_answers(answers):
+    """
+    답안을 {question_id(int): answer(dict)} 형태로 변환.
+
+    리스트([{'question_id': 1, ...}]) 또는 detail_records 형식({'1': {...}}) 모두 지원.
+    같은 문제에 대한 중복 답안은 마지막 답안을 사용.
+    임시 저장 답안은 검증 없이 저장되므로 문제 ID가 정수가 아닌 답안은 무시한다.
+    """
+    if isinstance(answers, dict):
+        items = answers.items()
+    else:
+        items = ((answer.get('question_id'), answer) for answer in answers if isinstance(answer, dict))
+    return {
+        int(question_id): answer
+        for question_id, answer in items
+        if isinstance(answer, dict) and str(question_id).isdigit()
+    }
+
+
+def _build_record(answer, is_correct, question_key):
+    earned = question_key.score if is_correct else 0
+    return {
+        'answer': answer.get('answer', ''),
+        'selected_options': option_ids(answer.get('selected_options') or []),
+        'is_correct': is_correct,
+        'score': earned,
+        'max_score': question_key.score,
+    }
+
+
+def grade_one(answer_key, answers) -> GradeResult:
+    """
+    답안 1건 채점.
+
+    Args:
+        answer_key: AnswerKey
+        answers: 답안 리스트 또는 detail_records 형식 dict
+    """
+    result = GradeResult()
+    for question_id, answer in _normalize_answers(answers).items():
+        question_key = answer_key.get(question_id)
+        if question_key is None:
+            continue
+
+        is_correct = get_grader(question_key.tq_type).is_correct(question_key, answer)
+        record = _build_record(answer, is_correct, question_key)
+        result.total_score += record['score']
+        result.records[str(question_id)] = record
+    return result
+
+
+class _ChoiceMatrix:
+    """
+    객관식 일괄 채점용 option column layout.
+
+    문제마다 정답 옵션 column + "그 외 옵션" column 1개를 배정한다.
+    학생 선택 행렬 S와 정답 벡터 C를 비교해 문제 구간 전체가 일치하면 정답.
+    """
+
+    def __init__(self, question_keys):
+        self.question_ids = []
+        self.starts = []
+        self.option_columns = {}
+        self.other_columns = {}
+        correct = []
+
+        for question_key in question_keys:
+            self.question_ids.append(question_key.question_id)
+            self.starts.append(len(correct))
+            for option_id in sorted(question_key.correct_option_ids):
+                self.option_columns[(question_key.question_id, option_id)] = len(correct)
+                correct.append(True)
+            self.other_columns[question_key.question_id] = len(correct)
+            correct.append(False)
+
+        self.correct = np.array(correct, dtype=bool)
+        self.scores = np.array([q.score for q in question_keys], dtype=np.int64)
+        self.has_correct = np.array([bool(q.correct_option_ids) for q in question_keys], dtype=bool)
+        self.question_index = {question_id: idx for idx, question_id in enumerate(self.question_ids)}
+
+    def column(self, question_id, option_id):
+        return self.option_columns.get((question_id, option_id), self.other_columns[question_id])
+
+    def grade(self, selections, n_rows):
+        """
+        Args:
+            selections: (row, question_id, selected_option_ids) iterable
+            n_rows: 제출 건수
+
+        Returns:
+            np.ndarray: (n_rows, n_questions) 정답 여부 bool 행렬
+        """
+        selected = np.zeros((n_rows, len(self.correct)), dtype=bool)
+        rows, cols = [], []
+        for row, question_id, selected_ids in selections:
+            for option_id in selected_ids:
+                rows.append(row)
+                cols.append(self.column(question_id, option_id))
+        if rows:
+            selected[np.array(rows), np.array(cols)] = True
+
+        matches = selected == self.correct
+        correct = np.logical_and.reduceat(matches, np.array(self.starts), axis=1)
+        return correct & self.has_correct
+
+
+def grade_many(answer_key, submissions) -> list:
+    """
+    답안 여러 건 일괄 채점.
+
+    객관식/OX처럼 vectorized 채점기 유형은 NumPy 행렬 연산으로 한 번에 채점하고,
+    나머지 유형(빈칸 채우기 등)은 채점기를 개별 호출한다.
+
+    Args:
+        answer_key: AnswerKey
+        submissions: 답안(grade_one과 같은 형식) 목록
+
+    Returns:
+        list[GradeResult]: submissions와 같은 순서
+    """
+    normalized = [_normalize_answers(answers) for answers in submissions]
+    vector_keys = [q for q in answer_key.questions.values() if get_grader(q.tq_type).vectorized]
+    matrix = _ChoiceMatrix(vector_keys) if vector_keys else None
+
+    correct = None
+    if matrix is not None:
+        selections = (
+            (row, question_id, parse_selected_options(answer))
+            for row, answers in enumerate(normalized)
+            for question_id, answer in answers.items()
+            if question_id in matrix.question_index
+        )
+        correct = matrix.grade(selections, len(normalized))
+
+    results = []
+    for row, answers in enumerate(normalized):
+        result = GradeResult()
+        for question_id, answer in answers.items():
+            question_key = answer_key.get(question_id)
+            if question_key is None:
+                continue
+
+            if matrix is not None and question_id in matrix.question_index:
+                is_correct = bool(correct[row, matrix.question_index[question_id]])
+            else:
+                is_correct = get_grader(question_key.tq_type).is_correct(question_key, answer)
+
+            record = _build_record(answer, is_correct, question_key)
+            result.total_score += record['score']
+            result.records[str(question_id)] = record
+        results.append(result)
+    return results
@@ -0,0 +1,120 @@
+"""
+문제 유형(tq_type)별 채점기 및 registry.
+"""
+import re
+import unicodedata
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+_registry = {}
+
+
+def register_grader(*tq_types):
+    """
+    채점기 등록 decorator.
+
+    Usage:
+        @register_grader('xz', 'pd')
+        class ChoiceGrader(BaseGrader): ...
+    """
+    def decorator(grader_class):
+        instance = grader_class()
+        for tq_type in tq_types:
+            _registry[tq_type] = instance
+        return grader_class
+
+    return decorator
+
+
+def get_grader(tq_type):
+    """문제 유형에 맞는 채점기 조회 (미등록 유형은 항상 오답 처리)"""
+    return _registry.get(tq_type, _null_grader)
+
+
+def option_ids(values) -> list:
+    """
+    옵션 ID 목록 정규화.
+
+    임시 저장(save-draft) 답안은 검증 없이 저장되므로 정수로 해석할 수 없는 값은 무시한다.
+    """
+    if isinstance(values, (str, int)):
+        values = [values]
+    elif not isinstance(values, (list, tuple)):
+        return []
+
+    ids = []
+    for value in values:
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, int):
+            ids.append(value)
+        elif str(value).strip().isdigit():
+            ids.append(int(str(value).strip()))
+    return ids
+
+
+def parse_selected_options(answer):
+    """
+    답안에서 선택한 옵션 ID 집합 추출.
+
+    selected_options 배열을 우선 사용하고, 없으면 answer 필드의 옵션 ID를 사용 (기존 방식).
+    """
+    selected = option_ids(answer.get('selected_options') or [])
+    if selected:
+        return set(selected)
+
+    raw = str(answer.get('answer', '') or '').strip()
+    return {int(raw)} if raw.isdigit() else set()
+
+
+def normalize_text(value) -> str:
+    """빈칸 채우기 답안 정규화 (유니코드 NFKC, 공백 축약, 대소문자 무시)"""
+    text = unicodedata.normalize('NFKC', str(value or ''))
+    return _WHITESPACE_PATTERN.sub(' ', text).strip().casefold()
+
+
+class BaseGrader:
+    """
+    채점기 기본 class.
+
+    vectorized=True인 채점기는 grade_many()에서 NumPy 일괄 채점 대상이 된다.
+    (선택한 옵션 ID 집합이 정답 옵션 ID 집합과 같으면 정답)
+    """
+
+    vectorized = False
+
+    def is_correct(self, question_key, answer) -> bool:
+        raise NotImplementedError
+
+
+class NullGrader(BaseGrader):
+    """채점 방법이 없는 유형 (수동 채점 대상)"""
+
+    def is_correct(self, question_key, answer) -> bool:
+        return False
+
+
+@register_grader('xz', 'pd')
+class ChoiceGrader(BaseGrader):
+    """객관식/OX: 정답 옵션 전체를 정확히 선택해야 정답"""
+
+    vectorized = True
+
+    def is_correct(self, question_key, answer) -> bool:
+        if not question_key.correct_option_ids:
+            return False
+        return parse_selected_options(answer) == question_key.correct_option_ids
+
+
+@register_grader('tk')
+class FillBlankGrader(BaseGrader):
+    """빈칸 채우기: 정규화한 답안이 정답 텍스트 중 하나와 같으면 정답"""
+
+    def is_correct(self, question_key, answer) -> bool:
+        user_answer = normalize_text(answer.get('answer', ''))
+        if not user_answer:
+            return False
+        return any(user_answer == normalize_text(accepted) for accepted in question_key.accepted_answers)
+
+
+_null_grader = NullGrader()
@@ -0,0 +1,109 @@
+"""
+Query plan regression 검사 스크립트
+
+Usage:
+    uv run python manage.py check_query_plans [--case question.list.teacher] [--cost-threshold 0.5]
+        [--cost-floor 100] [--min-rows 10000] [--baseline benchmarks/baselines/query_plans.json] [--update-baseline]
+        [--output plans.json] [--analyze]
+"""
+import json
+import subprocess
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'baselines' / 'query_plans.json'
+
+
+class Command(BaseCommand):
+    help = (
+        '주요 목록 API와 대시보드 service의 SELECT 실행 계획(EXPLAIN ANALYZE, BUFFERS)을 수집하여 '
+        'baseline 대비 큰 table Seq Scan 발생 또는 비용 증가가 있으면 실패'
+    )
+
+    def add_arguments(self, parser):
+        from benchmarks.plans import CASES, COST_FLOOR, COST_THRESHOLD, MIN_ROWS
+
+        parser.add_argument('--case', action='append', dest='cases', choices=sorted(CASES), help='검사할 case (기본값 전체)')
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='baseline JSON 경로')
+        parser.add_argument('--update-baseline', action='store_true', help='검사 대신 현재 실행 계획을 baseline으로 저장')
+        parser.add_argument('--cost-threshold', type=float, default=COST_THRESHOLD, help='허용 비용 증가 비율')
+        parser.add_argument('--cost-floor', type=float, default=COST_FLOOR, help='비용 증가를 검사할 최소 비용')
+        parser.add_argument('--min-rows', type=int, default=MIN_ROWS, help='Seq Scan을 regression으로 볼 최소 table 행 수')
+        parser.add_argument('--output', default=None, help='수집한 실행 계획 요약 JSON 저장 경로')
+        parser.add_argument('--analyze', action='store_true', help='수집 전에 ANALYZE로 table 통계 갱신')
+
+    def handle(self, *args, **options):
+        from django.db import connection
+
+        from benchmarks.plans import check, collect, plan_context, relation_rows
+
+        if options['analyze']:
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+        try:
+            context = plan_context()
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        report = collect(context, options['cases'])
+
+        for case, queries in report.items():
+            cost = sum(query['cost'] for query in queries.values())
+            elapsed = sum(query['time_ms'] for query in queries.values())
+            self.stdout.write(f'  {case}: SELECT {len(queries)}건, cost {cost:.1f}, {elapsed:.1f}ms')
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+
+        baseline_path = Path(options['baseline'])
+        if options['update_baseline']:
+            cases = report
+            if baseline_path.exists() and options['cases']:
+                # 일부 case만 갱신하는 경우 나머지 case는 유지
+                cases = {**json.loads(baseline_path.read_text(encoding='utf-8'))['cases'], **report}
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps({
+                'meta': {
+                    'commit': self._commit(),
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    'rows': self._table_rows(relation_rows()),
+                },
+                'cases': cases,
+            }, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+            self.stdout.write(self.style.SUCCESS(f'baseline 저장: {baseline_path}'))
+            return
+
+        if not baseline_path.exists():
+            raise CommandError(f'baseline이 없습니다: {baseline_path} (--update-baseline으로 생성)')
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+
+        regressions = check(
+            report, baseline['cases'], options['cost_threshold'], options['min_rows'], options['cost_floor']
+        )
+        for regression in regressions:
+            self.stdout.write(self.style.ERROR(f'  {regression}'))
+        if regressions:
+            raise CommandError(f'실행 계획 regression {len(regressions)}건')
+        self.stdout.write(self.style.SUCCESS('실행 계획 검사 통과'))
+
+    @staticmethod
+    def _table_rows(rows):
+        """baseline 생성 당시 주요 table 행 수 (data 규모 기록용)"""
+        tables = [
+            'user_userprofile', 'user_studentsinfo', 'testquestion_testquestioninfo', 'testquestion_optioninfo',
+            'testpaper_testpaperinfo', 'testpaper_testscores', 'examination_examinationinfo',
+            'examination_examstudentsinfo',
+        ]
+        return {table: rows.get(table, 0) for table in tables}
+
+    @staticmethod
+    def _commit():
+        """현재 git commit (git이 없으면 None)"""
+        try:
+            result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
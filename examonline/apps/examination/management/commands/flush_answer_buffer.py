@@ -0,0 +1,42 @@
+"""
+답안 write-behind buffer flusher
+
+Usage:
+    uv run python manage.py flush_answer_buffer [--interval 5] [--once]
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Redis 답안 buffer를 주기적으로 TestScores.detail_records에 반영'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=int, default=None, help='flush 간격(초), 기본값 ANSWER_BUFFER_FLUSH_INTERVAL')
+        parser.add_argument('--once', action='store_true', help='한 번만 flush 후 종료')
+
+    def handle(self, *args, **options):
+        from examination.answer_buffer import AnswerBuffer
+
+        if not AnswerBuffer.is_enabled():
+            raise CommandError('ANSWER_BUFFER_ENABLED 설정이 꺼져 있습니다.')
+
+        if options['once']:
+            flushed = AnswerBuffer.flush_dirty()
+            self.stdout.write(self.style.SUCCESS(f'flush 완료: {flushed}건'))
+            return
+
+        interval = options['interval'] or AnswerBuffer.flush_interval()
+        self.stdout.write(f'답안 buffer flusher 시작 (간격 {interval}초)')
+        try:
+            while True:
+                started = time.monotonic()
+                flushed = AnswerBuffer.flush_dirty()
+                if flushed:
+                    self.stdout.write(f'  {flushed}건 반영')
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            # 종료 전 남은 답안 반영
+            flushed = AnswerBuffer.flush_dirty()
+            self.stdout.write(self.style.SUCCESS(f'flusher 종료 (마지막 flush {flushed}건)'))
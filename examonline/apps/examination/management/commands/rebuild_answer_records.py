@@ -0,0 +1,38 @@
+"""
+문항별 답안 기록 재생성 스크립트
+
+Usage:
+    uv run python manage.py rebuild_answer_records [--exam-id 1 --exam-id 2] [--chunk-size 1000]
+"""
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = '제출된 성적의 detail_records에서 문항별 답안 기록(AnswerRecord)을 다시 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--exam-id', type=int, action='append', dest='exam_ids', help='대상 시험 ID (기본값 전체)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='한 번에 처리할 성적 수')
+
+    def handle(self, *args, **options):
+        from examination.services import AnswerRecordService
+        from testpaper.models import TestScores
+
+        scores = TestScores.objects.filter(is_submitted=True, is_grading=False)
+        if options['exam_ids']:
+            scores = scores.filter(exam_id__in=options['exam_ids'])
+
+        chunk_size = options['chunk_size']
+        rows = scores.only('id', 'exam_id', 'detail_records').order_by('pk').iterator(chunk_size=chunk_size)
+
+        processed = 0
+        while chunk := list(islice(rows, chunk_size)):
+            with transaction.atomic():
+                AnswerRecordService.replace(chunk)
+            processed += len(chunk)
+            self.stdout.write(f'  {processed}건 처리')
+
+        self.stdout.write(self.style.SUCCESS(f'답안 기록 재생성 완료: {processed}건'))
@@ -0,0 +1,31 @@
+"""
+시험 성적 통계 재집계 스크립트
+
+Usage:
+    uv run python manage.py rebuild_exam_statistics [--exam-id 1 --exam-id 2]
+"""
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = '제출된 성적(TestScores)에서 시험별 성적 통계(ExamStatistics)를 다시 집계'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--exam-id', type=int, action='append', dest='exam_ids', help='대상 시험 ID (기본값 전체)')
+
+    def handle(self, *args, **options):
+        from examination.models import ExaminationInfo
+        from examination.services import ExamStatisticsService
+
+        exams = ExaminationInfo.objects.order_by('pk')
+        if options['exam_ids']:
+            exams = exams.filter(pk__in=options['exam_ids'])
+        exam_ids = exams.values_list('pk', flat=True)
+
+        rebuilt = 0
+        for exam_id in exam_ids:
+            stats = ExamStatisticsService.rebuild(exam_id)
+            rebuilt += 1
+            self.stdout.write(f'  시험 {exam_id}: 제출 {stats.submitted_count}건')
+
+        self.stdout.write(self.style.SUCCESS(f'통계 재집계 완료: {rebuilt}개 시험'))
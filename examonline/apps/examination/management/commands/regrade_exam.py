@@ -0,0 +1,35 @@
+"""
+시험 재채점 스크립트
+
+Usage:
+    uv run python manage.py regrade_exam <exam_id> [--chunk-size 1000]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = '정답 변경 후 시험의 제출 성적 전체를 현재 정답 기준으로 재채점'
+
+    def add_arguments(self, parser):
+        parser.add_argument('exam_id', type=int, help='재채점할 시험 ID')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='한 번에 처리할 성적 수')
+
+    def handle(self, *args, **options):
+        from examination.models import ExaminationInfo
+        from examination.services import ExamRegradeService
+
+        exam_id = options['exam_id']
+        if not ExaminationInfo.objects.filter(id=exam_id).exists():
+            raise CommandError(f'시험을 찾을 수 없습니다: {exam_id}')
+
+        self.stdout.write(f'시험 {exam_id} 재채점 시작...')
+
+        def report(processed, updated, total):
+            self.stdout.write(f'  {processed}/{total} 처리, {updated}건 변경')
+
+        result = ExamRegradeService.regrade(exam_id, chunk_size=options['chunk_size'], on_progress=report)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'재채점 완료: {result["processed"]}건 처리, {result["updated"]}건 변경')
+        )
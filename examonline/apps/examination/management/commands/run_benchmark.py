@@ -0,0 +1,112 @@
+"""
+시험 응시 흐름 benchmark 스크립트
+
+Usage:
+    uv run python manage.py run_benchmark [--students 200] [--teachers 2] [--exams-per-teacher 5] [--questions 20]
+        [--answers 5] [--concurrency 20] [--base-url http://localhost:8000] [--output result.json]
+        [--compare baseline.json] [--keep-data]
+"""
+import json
+import subprocess
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        '응시 데이터를 생성하고 start -> info -> save-answer x k -> submit -> result 흐름을 동시에 실행하여 '
+        'endpoint별 latency(p50/p95/p99), 처리량, query 수를 JSON으로 출력 '
+        '(--base-url 지정 시 같은 DB를 사용하는 실행 중인 server로 요청)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=200, help='학생(응시) 수')
+        parser.add_argument('--teachers', type=int, default=2, help='교사 수')
+        parser.add_argument('--exams-per-teacher', type=int, default=5, help='교사별 시험 수')
+        parser.add_argument('--questions', type=int, default=20, help='시험별 문항 수')
+        parser.add_argument('--answers', type=int, default=5, help='응시당 save-answer 호출 수')
+        parser.add_argument('--concurrency', type=int, default=20, help='동시 worker 수')
+        parser.add_argument('--seed', type=int, default=0, help='난수 seed')
+        parser.add_argument('--base-url', default=None, help='요청할 server 주소 (없으면 현재 process에서 처리)')
+        parser.add_argument('--output', default=None, help='결과 JSON 저장 경로 (없으면 stdout)')
+        parser.add_argument('--compare', default=None, help='비교할 이전 결과 JSON 경로')
+        parser.add_argument('--keep-data', action='store_true', help='생성한 데이터 유지')
+
+    def handle(self, *args, **options):
+        from django.test.utils import override_settings
+
+        from benchmarks.dataset import seed_exam_load
+        from benchmarks.runner import ClientTransport, HttpTransport, compare, run_lifecycle, summarize
+
+        prefix = f'bench{int(time.time())}'
+        self.stderr.write(
+            f'데이터 생성: 학생 {options["students"]}명, 시험 {options["teachers"] * options["exams_per_teacher"]}개, '
+            f'시험별 문항 {options["questions"]}개'
+        )
+        dataset = seed_exam_load(
+            prefix, teachers=options['teachers'], exams_per_teacher=options['exams_per_teacher'],
+            students=options['students'], questions=options['questions'], seed=options['seed'],
+        )
+
+        run_options = {
+            'concurrency': options['concurrency'],
+            'answers_per_attempt': options['answers'],
+            'seed': options['seed'],
+        }
+        self.stderr.write(f'응시 흐름 실행: worker {options["concurrency"]}개')
+        try:
+            if options['base_url']:
+                samples, elapsed = run_lifecycle(HttpTransport(options['base_url']), dataset.attempts, **run_options)
+            else:
+                # query 수는 Server-Timing header로 수집, budget 초과는 예외 대신 log로만 기록
+                with override_settings(QUERY_BUDGET_ENABLED=True, QUERY_BUDGET_RAISE=False):
+                    samples, elapsed = run_lifecycle(ClientTransport(), dataset.attempts, **run_options)
+        finally:
+            if not options['keep_data']:
+                dataset.cleanup()
+
+        report = {
+            'meta': {
+                'commit': self._commit(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'target': options['base_url'] or 'client',
+                'students': options['students'],
+                'exams': options['teachers'] * options['exams_per_teacher'],
+                'questions': options['questions'],
+                'answers_per_attempt': options['answers'],
+                'concurrency': options['concurrency'],
+            },
+            **summarize(samples, elapsed),
+        }
+
+        content = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(content)
+            self.stderr.write(f'결과 저장: {options["output"]}')
+        else:
+            self.stdout.write(content)
+
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as f:
+                baseline = json.load(f)
+            for endpoint, change in compare(report, baseline).items():
+                (old_p95, new_p95), (old_queries, new_queries) = change['p95_ms'], change['queries']
+                self.stderr.write(
+                    f'  {endpoint}: p95 {old_p95}ms -> {new_p95}ms, queries {old_queries} -> {new_queries}'
+                )
+
+        total = report['total']
+        self.stderr.write(self.style.SUCCESS(
+            f'benchmark 완료: {total["requests"]}건, {total["rps"]} req/s, 오류 {total["errors"]}건'
+        ))
+
+    @staticmethod
+    def _commit():
+        """현재 git commit (git이 없으면 None)"""
+        try:
+            result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
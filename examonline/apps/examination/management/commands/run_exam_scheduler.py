@@ -0,0 +1,57 @@
+"""
+시험 상태 자동 전환 scheduler
+
+Usage:
+    uv run python manage.py run_exam_scheduler [--once] [--lookahead 3600] [--reload-interval 60]
+"""
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = '시작/종료 시각에 맞춰 시험 상태(시험 전 -> 시험 중 -> 시험 종료)를 일괄 전환'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='도래한 전환만 처리 후 종료')
+        parser.add_argument('--lookahead', type=int, default=None, help='heap에 불러올 전환 시각 범위(초)')
+        parser.add_argument(
+            '--reload-interval', type=int, default=60, help='시험 일정 변경 반영을 위한 heap 재구성 간격(초)'
+        )
+
+    def handle(self, *args, **options):
+        from django.utils import timezone
+
+        from examination.services import ExamStateScheduler
+
+        def apply(now):
+            changed = ExamStateScheduler.apply_due(now)
+            for exam_state, exam_ids in changed.items():
+                self.stdout.write(f'  상태 {exam_state} 전환: {len(exam_ids)}건')
+            return sum(len(exam_ids) for exam_ids in changed.values())
+
+        if options['once']:
+            processed = apply(timezone.now())
+            self.stdout.write(self.style.SUCCESS(f'상태 전환 완료: {processed}건'))
+            return
+
+        reload_interval = options['reload_interval']
+        self.stdout.write(f'시험 상태 scheduler 시작 (heap 재구성 간격 {reload_interval}초)')
+        try:
+            heap, reload_at = [], None
+            while True:
+                now = timezone.now()
+                if reload_at is None or now >= reload_at:
+                    # 재구성 시점에도 전환을 적용해 heap에 없던(일정이 변경된) 시험도 반영
+                    apply(now)
+                    heap = ExamStateScheduler.load(now, options['lookahead'])
+                    ExamStateScheduler.pop_due(heap, now)
+                    reload_at = now + timedelta(seconds=reload_interval)
+                elif ExamStateScheduler.pop_due(heap, now):
+                    apply(now)
+
+                wait = ExamStateScheduler.seconds_until_next(heap, now, (reload_at - now).total_seconds())
+                time.sleep(wait)
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS('scheduler 종료'))
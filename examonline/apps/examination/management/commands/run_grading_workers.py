@@ -0,0 +1,80 @@
+"""
+비동기 제출 채점 worker
+
+제출 대기열(SubmissionJob)을 우선 처리하고, 비어 있으면 재채점 대기열(RegradeJob)을 처리한다.
+
+Usage:
+    uv run python manage.py run_grading_workers [--workers 4] [--batch-size 50] [--once]
+"""
+import multiprocessing
+import time
+
+from django.core.management.base import BaseCommand
+
+
+def _init_worker():
+    """worker process 초기화 (spawn 방식에서도 Django 사용 가능하도록)"""
+    import django
+
+    django.setup()
+
+
+def _run_worker(batch_size, poll_interval, once):
+    """
+    대기열이 빌 때까지(once) 또는 계속 작업을 처리.
+
+    Returns:
+        int: 처리한 작업 수
+    """
+    from examination.services import ExamRegradeService, SubmissionQueueService
+
+    processed = 0
+    try:
+        while True:
+            count = SubmissionQueueService.process_batch(batch_size) or ExamRegradeService.process_next()
+            processed += count
+            if count:
+                continue
+            if once:
+                break
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        pass
+    return processed
+
+
+def _run_pool_worker(batch_size, poll_interval, once):
+    """pool worker process 진입점 (종료 시 DB 연결 정리)"""
+    from django.db import connections
+
+    try:
+        return _run_worker(batch_size, poll_interval, once)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = '비동기 제출 대기열(SubmissionJob)과 재채점 대기열(RegradeJob)을 처리하는 worker pool 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count(), help='worker process 수')
+        parser.add_argument('--batch-size', type=int, default=50, help='worker가 한 번에 가져올 작업 수')
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='대기열이 비었을 때 재확인 간격(초)')
+        parser.add_argument('--once', action='store_true', help='대기열이 비면 종료')
+
+    def handle(self, *args, **options):
+        from django.db import connections
+
+        workers = max(1, options['workers'])
+        worker_args = (options['batch_size'], options['poll_interval'], options['once'])
+        self.stdout.write(f'채점 worker {workers}개 시작...')
+
+        if workers == 1:
+            processed = _run_worker(*worker_args)
+        else:
+            # fork 전에 부모 process의 DB 연결을 닫아 worker 간 연결 공유 방지
+            connections.close_all()
+            with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+                processed = sum(pool.starmap(_run_pool_worker, [worker_args] * workers))
+
+        self.stdout.write(self.style.SUCCESS(f'채점 완료: {processed}건'))
@@ -0,0 +1,43 @@
+"""
+시간 초과 응시 기록 자동 제출 스크립트
+
+Usage:
+    uv run python manage.py sweep_expired_attempts [--once] [--interval 60] [--batch-size 500]
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = '종료 시각이 지난 미제출 응시 기록을 임시 저장 답안으로 채점하고 자동 제출 처리'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='한 번만 실행 후 종료')
+        parser.add_argument('--interval', type=int, default=60, help='실행 간격(초)')
+        parser.add_argument('--batch-size', type=int, default=500, help='한 번에 처리할 응시 기록 수')
+        parser.add_argument('--grace-period', type=int, default=None, help='종료 시각 이후 유예 시간(초)')
+
+    def handle(self, *args, **options):
+        from examination.services import ExpiredAttemptSweeper
+
+        def report(processed):
+            self.stdout.write(f'  {processed}건 자동 제출')
+
+        def sweep():
+            return ExpiredAttemptSweeper.sweep(
+                grace_period=options['grace_period'], batch_size=options['batch_size'], on_progress=report
+            )
+
+        if options['once']:
+            processed = sweep()
+            self.stdout.write(self.style.SUCCESS(f'자동 제출 완료: {processed}건'))
+            return
+
+        self.stdout.write(f'시간 초과 응시 기록 sweeper 시작 (간격 {options["interval"]}초)')
+        try:
+            while True:
+                sweep()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS('sweeper 종료'))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:54
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('examination', '0005_examinationinfo_exam_state_idx_and_more'),
+        ('testpaper', '0006_testscores_is_grading'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(max_length=100, unique=True, verbose_name='멱등성 key')),
+                ('answers', models.JSONField(default=list, verbose_name='제출 답안')),
+                ('is_auto_submitted', models.BooleanField(default=False, verbose_name='자동 제출 여부')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('processing', '채점 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('attempts', models.IntegerField(default=0, verbose_name='시도 횟수')),
+                ('error', models.TextField(blank=True, default='', verbose_name='오류 내용')),
+                ('create_time', models.DateTimeField(default=django.utils.timezone.now, verbose_name='생성 시간')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='처리 시작 시간')),
+                ('finish_time', models.DateTimeField(blank=True, null=True, verbose_name='완료 시간')),
+                ('test_score', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='submission_job', to='testpaper.testscores', verbose_name='학생 성적 정보')),
+            ],
+            options={
+                'verbose_name': '채점 대기열',
+                'verbose_name_plural': '채점 대기열',
+                'indexes': [models.Index(fields=['status', 'id'], name='submission_job_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('examination', '0006_submissionjob'),
+        ('user', '0003_alter_emailverifyrecord_id_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='examinationinfo',
+            index=models.Index(fields=['end_time'], name='exam_end_time_idx'),
+        ),
+    ]
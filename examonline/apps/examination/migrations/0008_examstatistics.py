@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:08
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('examination', '0007_examinationinfo_exam_end_time_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExamStatistics',
+            fields=[
+                ('exam', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='statistics', serialize=False, to='examination.examinationinfo', verbose_name='시험')),
+                ('submitted_count', models.IntegerField(default=0, verbose_name='제출 인원')),
+                ('score_sum', models.BigIntegerField(default=0, verbose_name='점수 합계')),
+                ('score_sq_sum', models.BigIntegerField(default=0, verbose_name='점수 제곱 합계')),
+                ('min_score', models.IntegerField(blank=True, null=True, verbose_name='최저 점수')),
+                ('max_score', models.IntegerField(blank=True, null=True, verbose_name='최고 점수')),
+                ('pass_count', models.IntegerField(default=0, verbose_name='합격 인원')),
+                ('passing_score', models.IntegerField(blank=True, null=True, verbose_name='합격 점수')),
+                ('total_score', models.IntegerField(blank=True, null=True, verbose_name='총점')),
+                ('histogram', models.JSONField(default=dict, verbose_name='점수 구간별 인원')),
+                ('update_time', models.DateTimeField(default=django.utils.timezone.now, verbose_name='갱신 시간')),
+            ],
+            options={
+                'verbose_name': '시험 성적 통계',
+                'verbose_name_plural': '시험 성적 통계',
+            },
+        ),
+    ]
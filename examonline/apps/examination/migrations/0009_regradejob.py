@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:34
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('examination', '0008_examstatistics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegradeJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('processing', '재채점 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('total_count', models.IntegerField(default=0, verbose_name='대상 수')),
+                ('processed_count', models.IntegerField(default=0, verbose_name='처리 수')),
+                ('updated_count', models.IntegerField(default=0, verbose_name='변경 수')),
+                ('error', models.TextField(blank=True, default='', verbose_name='오류 내용')),
+                ('create_time', models.DateTimeField(default=django.utils.timezone.now, verbose_name='생성 시간')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='처리 시작 시간')),
+                ('finish_time', models.DateTimeField(blank=True, null=True, verbose_name='완료 시간')),
+                ('exam', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='regrade_jobs', to='examination.examinationinfo', verbose_name='시험')),
+            ],
+            options={
+                'verbose_name': '재채점 대기열',
+                'verbose_name_plural': '재채점 대기열',
+                'indexes': [models.Index(fields=['status', 'id'], name='regrade_job_status_idx')],
+            },
+        ),
+    ]
@@ -2,7 +2,7 @@ from django.db import models
 from django.utils import timezone
 
 from user.models import UserProfile, StudentsInfo, SubjectInfo
-from testpaper.models import TestPaperInfo
+from testpaper.models import TestPaperInfo, TestScores
 
 
 # 시험 정보
@@ -34,6 +34,7 @@ class ExaminationInfo(models.Model):
         indexes = [
             models.Index(fields=['exam_state'], name='exam_state_idx'),
             models.Index(fields=['start_time', 'end_time'], name='exam_time_range_idx'),
+            models.Index(fields=['end_time'], name='exam_end_time_idx'),
             models.Index(fields=['create_user'], name='exam_create_user_idx'),
         ]
 
@@ -76,3 +77,105 @@ class ExamStudentsInfo(models.Model):
 
     def __str__(self):
         return self.exam.name
+
+
+# 채점 대기열 (비동기 제출)
+class SubmissionJob(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    test_score = models.OneToOneField(
+        TestScores, on_delete=models.CASCADE, related_name='submission_job', verbose_name='학생 성적 정보')
+    idempotency_key = models.CharField(max_length=100, unique=True, verbose_name='멱등성 key')
+    answers = models.JSONField(default=list, verbose_name='제출 답안')
+    is_auto_submitted = models.BooleanField(default=False, verbose_name='자동 제출 여부')
+    status = models.CharField(
+        choices=(
+            (STATUS_PENDING, '대기'),
+            (STATUS_PROCESSING, '채점 중'),
+            (STATUS_DONE, '완료'),
+            (STATUS_FAILED, '실패'),
+        ),
+        default=STATUS_PENDING,
+        max_length=10,
+        verbose_name='상태',
+    )
+    attempts = models.IntegerField(default=0, verbose_name='시도 횟수')
+    error = models.TextField(default='', blank=True, verbose_name='오류 내용')
+    create_time = models.DateTimeField(default=timezone.now, verbose_name='생성 시간')
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name='처리 시작 시간')
+    finish_time = models.DateTimeField(null=True, blank=True, verbose_name='완료 시간')
+
+    class Meta:
+        verbose_name = '채점 대기열'
+        verbose_name_plural = verbose_name
+        indexes = [
+            models.Index(fields=['status', 'id'], name='submission_job_status_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.test_score_id} ({self.status})'
+
+
+# 시험 재채점 대기열 (재채점 API 접수 -> 채점 worker 처리)
+class RegradeJob(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    exam = models.ForeignKey(
+        ExaminationInfo, on_delete=models.CASCADE, related_name='regrade_jobs', verbose_name='시험')
+    status = models.CharField(
+        choices=(
+            (STATUS_PENDING, '대기'),
+            (STATUS_PROCESSING, '재채점 중'),
+            (STATUS_DONE, '완료'),
+            (STATUS_FAILED, '실패'),
+        ),
+        default=STATUS_PENDING,
+        max_length=10,
+        verbose_name='상태',
+    )
+    total_count = models.IntegerField(default=0, verbose_name='대상 수')
+    processed_count = models.IntegerField(default=0, verbose_name='처리 수')
+    updated_count = models.IntegerField(default=0, verbose_name='변경 수')
+    error = models.TextField(default='', blank=True, verbose_name='오류 내용')
+    create_time = models.DateTimeField(default=timezone.now, verbose_name='생성 시간')
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name='처리 시작 시간')
+    finish_time = models.DateTimeField(null=True, blank=True, verbose_name='완료 시간')
+
+    class Meta:
+        verbose_name = '재채점 대기열'
+        verbose_name_plural = verbose_name
+        indexes = [
+            models.Index(fields=['status', 'id'], name='regrade_job_status_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.exam_id} ({self.status})'
+
+
+# 시험 성적 통계 (제출/재채점/수동 채점 시 증분 갱신)
+class ExamStatistics(models.Model):
+    exam = models.OneToOneField(
+        ExaminationInfo, on_delete=models.CASCADE, primary_key=True, related_name='statistics', verbose_name='시험')
+    submitted_count = models.IntegerField(default=0, verbose_name='제출 인원')
+    score_sum = models.BigIntegerField(default=0, verbose_name='점수 합계')
+    score_sq_sum = models.BigIntegerField(default=0, verbose_name='점수 제곱 합계')
+    min_score = models.IntegerField(null=True, blank=True, verbose_name='최저 점수')
+    max_score = models.IntegerField(null=True, blank=True, verbose_name='최고 점수')
+    pass_count = models.IntegerField(default=0, verbose_name='합격 인원')
+    passing_score = models.IntegerField(null=True, blank=True, verbose_name='합격 점수')
+    total_score = models.IntegerField(null=True, blank=True, verbose_name='총점')
+    histogram = models.JSONField(default=dict, verbose_name='점수 구간별 인원')
+    update_time = models.DateTimeField(default=timezone.now, verbose_name='갱신 시간')
+
+    class Meta:
+        verbose_name = '시험 성적 통계'
+        verbose_name_plural = verbose_name
+
+    def __str__(self):
+        return f'{self.exam_id} ({self.submitted_count})'
@@ -0,0 +1,1097 @@
+"""
+Examination Services.
+
+시험 응시 관련 비즈니스 로직을 View에서 분리.
+"""
+import heapq
+import logging
+from collections import Counter
+from datetime import timedelta
+from itertools import islice
+
+import numpy as np
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Coalesce, Greatest, Least
+from django.dispatch import Signal
+from django.utils import timezone
+
+from core.cache import get_or_build, invalidate as invalidate_cache
+from core.expressions import JSONIncrement
+from examination.analytics import item_analysis, option_counts, score_distribution
+from examination.answer_buffer import AnswerBuffer, merge_latest
+from examination.answer_key import get_answer_key
+from examination.grading import GradeResult, grade_many, option_ids
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStatistics, RegradeJob, SubmissionJob
+from testpaper.models import AnswerRecord, TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo
+from user.services import StudentDashboardService
+
+logger = logging.getLogger(__name__)
+
+# 시험 상태 변경 event (sender=ExaminationInfo, exam_ids=[...], exam_state='0'|'1'|'2')
+exam_state_changed = Signal()
+
+
+class ExamSnapshotService:
+    """
+    시험지 snapshot 조회 서비스.
+
+    시험 시작 시점에 수백 명이 동시에 같은 시험 정보를 조회하므로,
+    학생과 무관한 부분(시험 정보, 문제, 선택지, 배점)을 한 번만 만들어 cache에 저장한다.
+    시험/시험지/문제/선택지가 변경되면 signal에서 invalidate한다.
+    """
+
+    KEY_PREFIX = 'exam_snapshot'
+    TIMEOUT = 60 * 10
+    LOCK_TIMEOUT = 10
+
+    @classmethod
+    def cache_key(cls, exam_id) -> str:
+        return f'{cls.KEY_PREFIX}:{exam_id}'
+
+    @classmethod
+    def get(cls, exam_id):
+        """
+        시험 snapshot 조회 (cache miss 시 single-flight로 생성).
+
+        Returns:
+            dict | None: 시험이 없으면 None
+        """
+        return get_or_build(
+            cls.cache_key(exam_id),
+            lambda: cls.build(exam_id),
+            timeout=cls.TIMEOUT,
+            lock_timeout=cls.LOCK_TIMEOUT,
+        )
+
+    @classmethod
+    def build(cls, exam_id):
+        """
+        DB에서 snapshot 생성.
+
+        정답 정보(is_right)는 포함하지 않는다.
+        """
+        from examination.api.serializers import ExamQuestionSerializer
+
+        exam = ExaminationInfo.objects.select_related('subject').filter(id=exam_id).first()
+        if exam is None:
+            return None
+
+        snapshot = {
+            'exam_id': exam.id,
+            'exam_name': exam.name,
+            'subject_name': exam.subject.subject_name,
+            'start_time': exam.start_time,
+            'end_time': exam.end_time,
+            'duration': int((exam.end_time - exam.start_time).total_seconds() / 60),
+            'paper_id': None,
+            'total_score': None,
+            'passing_score': None,
+            'question_count': None,
+            'questions': [],
+        }
+
+        # 첫 번째 시험지 사용 (추후 다중 시험지 지원 가능)
+        exam_paper = ExamPaperInfo.objects.filter(exam=exam).select_related('paper').first()
+        if exam_paper is None:
+            return snapshot
+
+        paper = exam_paper.paper
+        paper_questions = list(
+            TestPaperTestQ.objects.filter(test_paper=paper).select_related(
+                'test_question'
+            ).prefetch_related('test_question__optioninfo_set').order_by('order')
+        )
+        questions = [pq.test_question for pq in paper_questions]
+        score_map = {pq.test_question_id: pq.score for pq in paper_questions}
+
+        snapshot.update({
+            'paper_id': paper.id,
+            'total_score': paper.total_score,
+            'passing_score': paper.passing_score,
+            'question_count': paper.question_count,
+            'questions': ExamQuestionSerializer(
+                questions, many=True, context={'paper_id': paper.id, 'score_map': score_map}
+            ).data,
+        })
+        return snapshot
+
+    @classmethod
+    def invalidate(cls, exam_ids):
+        """시험 snapshot 삭제 (transaction commit 이후)"""
+        keys = [cls.cache_key(exam_id) for exam_id in set(exam_ids)]
+        if keys:
+            # commit 전에 삭제하면 다른 요청이 변경 전 데이터로 snapshot을 다시 만들 수 있음
+            transaction.on_commit(lambda: invalidate_cache(*keys))
+
+    @classmethod
+    def invalidate_for_papers(cls, paper_ids):
+        """시험지를 사용하는 모든 시험의 snapshot 삭제"""
+        exam_ids = ExamPaperInfo.objects.filter(paper_id__in=paper_ids).values_list('exam_id', flat=True)
+        cls.invalidate(exam_ids)
+
+    @classmethod
+    def invalidate_for_questions(cls, question_ids):
+        """문제가 포함된 시험지를 사용하는 모든 시험의 snapshot 삭제"""
+        exam_ids = ExamPaperInfo.objects.filter(
+            paper__testpapertestq__test_question_id__in=question_ids
+        ).values_list('exam_id', flat=True)
+        cls.invalidate(exam_ids)
+
+
+class ExamStatisticsService:
+    """
+    시험 성적 통계(ExamStatistics) 관리 서비스.
+
+    통계 API가 요청마다 count/aggregate를 반복하지 않도록 시험별 요약 row를 유지한다.
+    제출/수동 채점 시 호출자의 transaction 안에서 F expression으로 증분 갱신하므로
+    동시 제출 간 갱신이 누락되지 않고, 재채점처럼 다수 성적이 바뀌면 전체를 다시 집계한다.
+    (평균/분산은 점수 합계와 제곱 합계로 계산)
+    """
+
+    # 점수 구간 수 (총점 대비 10% 단위)
+    BUCKETS = 10
+
+    @classmethod
+    def bucket(cls, score, total_score) -> int:
+        """점수가 속한 구간 (0 ~ BUCKETS-1)"""
+        if not total_score or total_score <= 0:
+            return 0
+        return min(cls.BUCKETS - 1, max(0, score * cls.BUCKETS // total_score))
+
+    @classmethod
+    def summarize(cls, score_counts, passing_score, total_score) -> dict:
+        """
+        {점수: 인원} 집계를 통계 field 값으로 변환.
+
+        Returns:
+            dict: submitted_count, score_sum, score_sq_sum, min_score, max_score, pass_count, histogram
+        """
+        histogram = Counter()
+        for score, count in score_counts.items():
+            histogram[str(cls.bucket(score, total_score))] += count
+        return {
+            'submitted_count': sum(score_counts.values()),
+            'score_sum': sum(score * count for score, count in score_counts.items()),
+            'score_sq_sum': sum(score * score * count for score, count in score_counts.items()),
+            'min_score': min(score_counts, default=None),
+            'max_score': max(score_counts, default=None),
+            'pass_count': (
+                0 if passing_score is None
+                else sum(count for score, count in score_counts.items() if score >= passing_score)
+            ),
+            'histogram': dict(histogram),
+        }
+
+    @classmethod
+    def get(cls, exam_id):
+        """시험 통계 조회 (없으면 TestScores에서 집계해 생성)"""
+        return ExamStatistics.objects.filter(pk=exam_id).first() or cls.rebuild(exam_id)
+
+    @classmethod
+    def rebuild(cls, exam_id):
+        """
+        TestScores에서 시험 통계 전체 재집계.
+
+        통계 row를 잠근 뒤 집계하므로, 동시에 들어온 증분 갱신은 재집계 이후에 반영된다.
+        """
+        exam_paper = ExamPaperInfo.objects.filter(exam_id=exam_id).select_related('paper').first()
+        paper = exam_paper.paper if exam_paper else None
+        passing_score = paper.passing_score if paper else None
+        total_score = paper.total_score if paper else None
+
+        with transaction.atomic():
+            stats = ExamStatistics.objects.select_for_update().filter(pk=exam_id).first()
+            score_counts = dict(
+                TestScores.objects.filter(exam_id=exam_id, is_submitted=True, is_grading=False)
+                .values_list('test_score')
+                .annotate(count=Count('id'))
+                .order_by()
+            )
+            fields = cls.summarize(score_counts, passing_score, total_score)
+            fields.update(passing_score=passing_score, total_score=total_score, update_time=timezone.now())
+
+            if stats is None:
+                try:
+                    with transaction.atomic():
+                        return ExamStatistics.objects.create(exam_id=exam_id, **fields)
+                except IntegrityError:
+                    # 동시에 생성된 경우 해당 row를 잠그고 다시 집계
+                    return cls.rebuild(exam_id)
+
+            for field, value in fields.items():
+                setattr(stats, field, value)
+            stats.save()
+        return stats
+
+    @classmethod
+    def rebuild_for_paper(cls, paper):
+        """
+        시험지의 합격 점수/총점이 바뀐 경우 그 시험지를 사용하는 시험의 통계 재집계.
+
+        통계 row에 저장된 합격 점수/총점이 시험지와 같으면 재집계하지 않는다.
+        """
+        exam_ids = ExamStatistics.objects.filter(
+            exam_id__in=ExamPaperInfo.objects.filter(paper=paper).values('exam_id')
+        ).exclude(passing_score=paper.passing_score, total_score=paper.total_score).values_list('exam_id', flat=True)
+        for exam_id in exam_ids:
+            cls.rebuild(exam_id)
+
+    @classmethod
+    def record_submissions(cls, exam_id, scores, paper=None):
+        """
+        제출 성적 반영 (제출 UPDATE와 같은 transaction 안에서 호출).
+
+        Args:
+            exam_id: 시험 ID
+            scores: 새로 확정된 점수 목록
+            paper: 채점한 시험지 (합격 점수/점수 구간 기준, 조회 query 없이 증분 갱신)
+        """
+        if not scores:
+            return
+        passing_score = paper.passing_score if paper else None
+        total_score = paper.total_score if paper else None
+        added = cls.summarize(Counter(scores), passing_score, total_score)
+        if not cls._apply(exam_id, added):
+            # 첫 제출 (또는 통계 도입 이전 시험): 방금 저장한 성적을 포함해 집계
+            cls.rebuild(exam_id)
+
+    @classmethod
+    def record_test_scores(cls, test_scores):
+        """일괄 확정된 TestScores를 시험별로 묶어 반영 (test_paper는 select_related 권장)"""
+        by_exam = {}
+        for test_score in test_scores:
+            if test_score.exam_id:
+                by_exam.setdefault(test_score.exam_id, []).append(test_score)
+        for exam_id, exam_scores in by_exam.items():
+            cls.record_submissions(
+                exam_id, [test_score.test_score for test_score in exam_scores], exam_scores[0].test_paper
+            )
+
+    @classmethod
+    def record_change(cls, exam_id, old_score, new_score):
+        """
+        제출 성적의 점수 변경 반영 (수동 채점).
+
+        최저/최고 점수는 증분으로 되돌릴 수 없으므로, 기존 최저/최고 점수가 바뀌는 경우에만 재집계한다.
+        """
+        if old_score == new_score:
+            return
+        row = ExamStatistics.objects.filter(pk=exam_id).values(
+            'passing_score', 'total_score', 'min_score', 'max_score'
+        ).first()
+        if row is None or (old_score == row['min_score'] and new_score > old_score) or (
+            old_score == row['max_score'] and new_score < old_score
+        ):
+            cls.rebuild(exam_id)
+            return
+
+        added = cls.summarize({new_score: 1}, row['passing_score'], row['total_score'])
+        removed = cls.summarize({old_score: 1}, row['passing_score'], row['total_score'])
+        cls._apply(exam_id, added, removed)
+
+    @staticmethod
+    def _apply(exam_id, added, removed=None):
+        """
+        증분 UPDATE (F expression).
+
+        Returns:
+            int: 갱신한 row 수 (통계 row가 없으면 0)
+        """
+        removed = removed or {
+            'submitted_count': 0, 'score_sum': 0, 'score_sq_sum': 0, 'pass_count': 0, 'histogram': {}
+        }
+        histogram = Counter(added['histogram'])
+        histogram.subtract(removed['histogram'])
+
+        return ExamStatistics.objects.filter(pk=exam_id).update(
+            submitted_count=F('submitted_count') + (added['submitted_count'] - removed['submitted_count']),
+            score_sum=F('score_sum') + (added['score_sum'] - removed['score_sum']),
+            score_sq_sum=F('score_sq_sum') + (added['score_sq_sum'] - removed['score_sq_sum']),
+            pass_count=F('pass_count') + (added['pass_count'] - removed['pass_count']),
+            min_score=Least(Coalesce('min_score', Value(added['min_score'])), Value(added['min_score'])),
+            max_score=Greatest(Coalesce('max_score', Value(added['max_score'])), Value(added['max_score'])),
+            histogram=JSONIncrement('histogram', {key: delta for key, delta in histogram.items() if delta}),
+            update_time=timezone.now(),
+        )
+
+
+class AnswerRecordService:
+    """
+    문항별 답안 기록(AnswerRecord) 관리 서비스.
+
+    detail_records는 API 호환을 위해 유지하고, 분석 query는 JSON 문서 전체를 읽는 대신
+    채점 시점에 bulk_create한 AnswerRecord를 index로 GROUP BY 한다.
+    """
+
+    BATCH_SIZE = 1000
+
+    @staticmethod
+    def build(test_score_id, exam_id, detail_records) -> list:
+        """detail_records를 AnswerRecord 목록으로 변환 (채점 기록이 있는 문항만)"""
+        records = []
+        for question_id, record in (detail_records or {}).items():
+            if not isinstance(record, dict) or not str(question_id).isdigit():
+                continue
+            records.append(AnswerRecord(
+                test_score_id=test_score_id,
+                exam_id=exam_id,
+                question_id=int(question_id),
+                selected_options=option_ids(record.get('selected_options') or []),
+                is_correct=bool(record.get('is_correct')),
+                earned_score=record.get('score') or 0,
+                max_score=record.get('max_score') or 0,
+                manual_graded=bool(record.get('manual_graded')),
+            ))
+        return records
+
+    @classmethod
+    def create(cls, test_scores):
+        """처음 채점된 TestScores의 답안 기록 일괄 생성"""
+        records = [
+            record
+            for test_score in test_scores
+            for record in cls.build(test_score.id, test_score.exam_id, test_score.detail_records)
+        ]
+        AnswerRecord.objects.bulk_create(records, batch_size=cls.BATCH_SIZE)
+
+    @classmethod
+    def replace(cls, test_scores):
+        """다시 채점된 TestScores의 답안 기록 교체"""
+        AnswerRecord.objects.filter(test_score_id__in=[test_score.id for test_score in test_scores]).delete()
+        cls.create(test_scores)
+
+    @classmethod
+    def update_question(cls, test_score, question_id):
+        """한 문항의 답안 기록 갱신 (수동 채점)"""
+        AnswerRecord.objects.filter(test_score_id=test_score.id, question_id=question_id).delete()
+        AnswerRecord.objects.bulk_create(
+            cls.build(test_score.id, test_score.exam_id, {
+                str(question_id): test_score.detail_records.get(str(question_id)),
+            })
+        )
+
+
+class ScoreDistributionService:
+    """
+    시험 성적 분포 조회 서비스.
+
+    제출 성적 전체를 배열로 읽어 분포 지표와 학생별 백분위 순위를 한 번에 계산하고 cache에 저장한다.
+    cache key에 통계 row의 갱신 시각을 포함하므로 다음 제출/채점 변경 시 자동으로 새로 계산된다.
+    """
+
+    KEY_PREFIX = 'exam_distribution'
+    TIMEOUT = 60 * 60
+
+    @classmethod
+    def cache_key(cls, exam_id, version) -> str:
+        return f'{cls.KEY_PREFIX}:{exam_id}:{version.timestamp()}'
+
+    @classmethod
+    def get(cls, exam_id, stats=None):
+        """
+        시험 성적 분포 조회.
+
+        Args:
+            exam_id: 시험 ID
+            stats: 이미 조회한 ExamStatistics (cache version)
+        """
+        stats = stats or ExamStatisticsService.get(exam_id)
+        return get_or_build(cls.cache_key(exam_id, stats.update_time), lambda: cls.build(exam_id, stats), cls.TIMEOUT)
+
+    @classmethod
+    def build(cls, exam_id, stats):
+        """제출 성적 배열로 분포 지표 계산"""
+        rows = list(
+            TestScores.objects.filter(exam_id=exam_id, is_submitted=True, is_grading=False)
+            .order_by('-test_score', 'user_id')
+            .values_list('user_id', 'user__student_name', 'test_score')
+        )
+        scores = np.fromiter((row[2] for row in rows), dtype=np.int64, count=len(rows))
+        distribution = score_distribution(scores, stats.total_score, ExamStatisticsService.BUCKETS)
+        ranks = distribution.pop('percentile_ranks')
+
+        distribution['students'] = [
+            {'student_id': student_id, 'student_name': student_name, 'score': score, 'percentile_rank': round(rank, 2)}
+            for (student_id, student_name, score), rank in zip(rows, ranks.tolist())
+        ]
+        return distribution
+
+
+class ItemAnalysisService:
+    """
+    시험 문항 분석 서비스.
+
+    문항별 답안 기록(AnswerRecord)을 chunk 단위로 읽어 학생 x 문항 득점/정답 행렬을 만들고,
+    난이도(p-value), 변별도(point-biserial), 선택지별 선택 비율, Cronbach's alpha를 계산해 cache에 저장한다.
+    cache key는 성적 분포와 같이 통계 row의 갱신 시각을 version으로 사용한다.
+    """
+
+    KEY_PREFIX = 'exam_item_analysis'
+    TIMEOUT = 60 * 60
+    CHUNK_SIZE = 2000
+
+    @classmethod
+    def cache_key(cls, exam_id, version) -> str:
+        return f'{cls.KEY_PREFIX}:{exam_id}:{version.timestamp()}'
+
+    @classmethod
+    def get(cls, exam_id, stats=None):
+        """시험 문항 분석 조회"""
+        stats = stats or ExamStatisticsService.get(exam_id)
+        return get_or_build(cls.cache_key(exam_id, stats.update_time), lambda: cls.build(exam_id), cls.TIMEOUT)
+
+    @classmethod
+    def build(cls, exam_id):
+        """
+        문항 분석 계산.
+
+        Returns:
+            dict: student_count, question_count, cronbach_alpha, items
+        """
+        exam_paper = ExamPaperInfo.objects.filter(exam_id=exam_id).first()
+        if exam_paper is None:
+            return {'student_count': 0, 'question_count': 0, 'cronbach_alpha': None, 'items': []}
+
+        questions = list(
+            TestPaperTestQ.objects.filter(test_paper_id=exam_paper.paper_id).order_by('order').values_list(
+                'test_question_id', 'test_question__name', 'test_question__tq_type', 'score'
+            )
+        )
+        columns = {question_id: index for index, (question_id, *_) in enumerate(questions)}
+        rows = {
+            score_id: index
+            for index, score_id in enumerate(
+                TestScores.objects.filter(
+                    exam_id=exam_id, test_paper_id=exam_paper.paper_id, is_submitted=True, is_grading=False
+                ).order_by('pk').values_list('id', flat=True)
+            )
+        }
+
+        earned = np.zeros((len(rows), len(questions)))
+        correct = np.zeros((len(rows), len(questions)), dtype=bool)
+        selected_columns, selected_options = [], []
+
+        answer_records = AnswerRecord.objects.filter(
+            exam_id=exam_id, question_id__in=list(columns), test_score__test_paper_id=exam_paper.paper_id,
+            test_score__is_submitted=True, test_score__is_grading=False,
+        ).values_list('test_score_id', 'question_id', 'is_correct', 'earned_score', 'selected_options')
+        for score_id, question_id, is_correct, earned_score, options in answer_records.iterator(
+            chunk_size=cls.CHUNK_SIZE
+        ):
+            row, column = rows.get(score_id), columns[question_id]
+            if row is None:
+                # 성적 ID 조회 이후 제출된 답안은 다음 갱신 때 반영
+                continue
+            earned[row, column] = earned_score
+            correct[row, column] = is_correct
+            for option_id in options:
+                selected_columns.append(column)
+                selected_options.append(option_id)
+
+        return cls._result(questions, earned, correct, selected_columns, selected_options)
+
+    @staticmethod
+    def _result(questions, earned, correct, selected_columns, selected_options):
+        """행렬 계산 결과를 문항별 응답 data로 변환"""
+        n_students = earned.shape[0]
+        metrics = item_analysis(earned, correct)
+        counts = option_counts(selected_columns, selected_options)
+
+        options_by_question = {}
+        for option_id, question_id, option, is_right in OptionInfo.objects.filter(
+            test_question_id__in=[question[0] for question in questions]
+        ).order_by('id').values_list('id', 'test_question_id', 'option', 'is_right'):
+            options_by_question.setdefault(question_id, []).append((option_id, option, is_right))
+
+        def metric(values, index):
+            value = values[index]
+            return None if np.isnan(value) else round(float(value), 4)
+
+        items = []
+        for index, (question_id, name, tq_type, max_score) in enumerate(questions):
+            options = []
+            for option_id, option, is_right in options_by_question.get(question_id, []):
+                count = counts.get((index, option_id), 0)
+                options.append({
+                    'option_id': option_id,
+                    'option': option,
+                    'is_right': is_right,
+                    'count': count,
+                    'ratio': round(count / n_students, 4) if n_students else 0.0,
+                })
+            items.append({
+                'question_id': question_id,
+                'question_name': name,
+                'tq_type': tq_type,
+                'max_score': max_score,
+                'p_value': metric(metrics['p_value'], index),
+                'mean_score': metric(metrics['mean_score'], index),
+                'discrimination': metric(metrics['discrimination'], index),
+                'options': options,
+            })
+
+        alpha = metrics['cronbach_alpha']
+        return {
+            'student_count': n_students,
+            'question_count': len(questions),
+            'cronbach_alpha': None if alpha is None else round(alpha, 4),
+            'items': items,
+        }
+
+
+class ExamRegradeService:
+    """
+    시험 재채점 서비스.
+
+    시험 종료 후 정답(OptionInfo.is_right)이 수정되면 기존 성적을 현재 정답 기준으로 다시 채점한다.
+    제출 답안을 chunk 단위로 읽어 일괄 채점(grade_many)하고,
+    변경된 성적만 bulk_update로 저장하므로 제출 건수와 무관하게 메모리 사용량이 일정하다.
+    chunk마다 성적 행을 잠근 뒤(select_for_update) 다시 읽어 채점하므로 동시에 수행된 수동 채점을 덮어쓰지 않으며,
+    수동 채점(manual_graded)된 문항의 점수는 유지한다.
+
+    선택/입력 답안이 없는 기록(이전 frontend가 answer=''만 보낸 제출 등)은 다시 채점할 근거가 없으므로 기존 채점 결과를 유지한다.
+
+    재채점 API는 RegradeJob으로 접수하고, 채점 worker(manage.py run_grading_workers)가 process_next()로 처리한다.
+    비동기 제출이 꺼져 있으면(worker 없이 운영) 재채점 API 요청 안에서 바로 처리한다.
+    """
+
+    CHUNK_SIZE = 1000
+    LOCK_TIMEOUT = 60 * 30
+
+    @classmethod
+    def enqueue(cls, exam_id):
+        """
+        재채점 접수 (같은 시험의 대기/처리 중 작업이 있으면 그 작업 반환).
+
+        Returns:
+            RegradeJob
+        """
+        job = RegradeJob.objects.filter(
+            exam_id=exam_id, status__in=[RegradeJob.STATUS_PENDING, RegradeJob.STATUS_PROCESSING]
+        ).order_by('-id').first()
+        return job or RegradeJob.objects.create(exam_id=exam_id)
+
+    @classmethod
+    def process_next(cls, job_id=None) -> int:
+        """
+        대기열에서 재채점 작업 1건 처리.
+
+        다른 worker가 잠근 행은 건너뛰고(SKIP LOCKED), LOCK_TIMEOUT이 지난 처리 중 작업은 재처리한다.
+
+        Args:
+            job_id: 지정하면 해당 작업만 처리 (재채점 API에서 바로 처리하는 경우)
+
+        Returns:
+            int: 처리한 작업 수 (대기열이 비어 있으면 0)
+        """
+        now = timezone.now()
+        stale = now - timedelta(seconds=cls.LOCK_TIMEOUT)
+        jobs = RegradeJob.objects.select_for_update(skip_locked=True).filter(
+            Q(status=RegradeJob.STATUS_PENDING) | Q(status=RegradeJob.STATUS_PROCESSING, locked_at__lt=stale)
+        )
+        if job_id is not None:
+            jobs = jobs.filter(pk=job_id)
+        with transaction.atomic():
+            job = jobs.order_by('id').first()
+            if job is None:
+                return 0
+            RegradeJob.objects.filter(pk=job.pk).update(status=RegradeJob.STATUS_PROCESSING, locked_at=now)
+
+        def report(processed, updated, total):
+            RegradeJob.objects.filter(pk=job.pk).update(
+                processed_count=processed, updated_count=updated, total_count=total, locked_at=timezone.now()
+            )
+
+        try:
+            cls.regrade(job.exam_id, on_progress=report)
+        except Exception as exc:
+            logger.exception(f'[REGRADE] Failed job: {job.id}')
+            RegradeJob.objects.filter(pk=job.pk).update(
+                status=RegradeJob.STATUS_FAILED, error=str(exc), finish_time=timezone.now()
+            )
+        else:
+            RegradeJob.objects.filter(pk=job.pk).update(status=RegradeJob.STATUS_DONE, finish_time=timezone.now())
+        return 1
+
+    @classmethod
+    def regrade(cls, exam_id, chunk_size=None, on_progress=None):
+        """
+        시험의 제출 성적 전체 재채점.
+
+        Args:
+            exam_id: 시험 ID
+            chunk_size: 한 번에 처리할 성적 수
+            on_progress: chunk 처리 후 호출 callback(processed, updated, total)
+
+        Returns:
+            dict: {'total': 대상 수, 'processed': 처리 수, 'updated': 변경 수}
+        """
+        chunk_size = chunk_size or cls.CHUNK_SIZE
+        scores = TestScores.objects.filter(exam_id=exam_id, is_submitted=True, is_grading=False).exclude(
+            test_paper=None
+        )
+        total = scores.count()
+
+        paper_ids = scores.values_list('test_paper_id', flat=True).distinct()
+        answer_keys = {paper.id: get_answer_key(paper) for paper in TestPaperInfo.objects.filter(id__in=paper_ids)}
+
+        score_ids = scores.order_by('pk').values_list('pk', flat=True).iterator(chunk_size=chunk_size)
+
+        processed = 0
+        updated = 0
+        while chunk_ids := list(islice(score_ids, chunk_size)):
+            with transaction.atomic():
+                # 잠근 뒤 다시 읽어 그 사이 수동 채점된 점수도 반영
+                chunk = list(
+                    scores.filter(pk__in=chunk_ids).select_for_update(of=('self',)).only(
+                        'id', 'exam_id', 'user_id', 'test_paper_id', 'test_score', 'detail_records'
+                    ).order_by('pk')
+                )
+                changed = cls._regrade_chunk(chunk, answer_keys)
+                if changed:
+                    TestScores.objects.bulk_update(changed, ['test_score', 'detail_records'], batch_size=chunk_size)
+                    AnswerRecordService.replace(changed)
+                    StudentDashboardService.invalidate([test_score.user_id for test_score in changed])
+                    # 채점 실패로 확정된 비동기 제출도 재채점으로 점수가 확정됨
+                    SubmissionJob.objects.filter(
+                        test_score__in=changed, status=SubmissionJob.STATUS_FAILED
+                    ).update(status=SubmissionJob.STATUS_DONE, finish_time=timezone.now())
+
+            processed += len(chunk_ids)
+            updated += len(changed)
+            if on_progress:
+                on_progress(processed, updated, total)
+
+        if updated:
+            ExamStatisticsService.rebuild(exam_id)
+        return {'total': total, 'processed': processed, 'updated': updated}
+
+    @staticmethod
+    def _has_answer(record) -> bool:
+        """다시 채점할 수 있는 선택 옵션/입력 답안이 있는 기록인지 여부"""
+        return bool(option_ids(record.get('selected_options') or []) or str(record.get('answer') or '').strip())
+
+    @classmethod
+    def _regrade_chunk(cls, chunk, answer_keys):
+        """chunk 재채점 후 점수/채점 기록이 바뀐 성적만 반환"""
+        by_paper = {}
+        for score in chunk:
+            by_paper.setdefault(score.test_paper_id, []).append(score)
+
+        changed = []
+        for paper_id, paper_scores in by_paper.items():
+            results = grade_many(answer_keys[paper_id], [score.detail_records or {} for score in paper_scores])
+
+            for score, result in zip(paper_scores, results):
+                records = result.records
+                # 수동 채점한 문항은 교사가 준 점수, 답안이 남아 있지 않은 문항은 기존 채점 결과 유지
+                for question_id, old_record in (score.detail_records or {}).items():
+                    if isinstance(old_record, dict) and (
+                        old_record.get('manual_graded') or not cls._has_answer(old_record)
+                    ):
+                        records[question_id] = old_record
+
+                total_score = sum(record.get('score', 0) for record in records.values())
+                if total_score != score.test_score or records != score.detail_records:
+                    score.test_score = total_score
+                    score.detail_records = records
+                    changed.append(score)
+        return changed
+
+
+class SubmissionQueueService:
+    """
+    비동기 제출 대기열 서비스.
+
+    시험 종료 시각에 모든 학생이 동시에 자동 제출하면 요청 안에서 채점하는 부하가 몰린다.
+    settings.ASYNC_SUBMIT_ENABLED가 True이면 제출 요청은 답안과 멱등성 key만 저장(SubmissionJob)하고
+    바로 202를 반환하며, 채점 worker(manage.py run_grading_workers)가 대기열에서 꺼내 채점한다.
+
+    - 대기열: SubmissionJob table (별도 broker 불필요, SELECT ... FOR UPDATE SKIP LOCKED로 작업 분배)
+    - 채점 중: TestScores.is_submitted=True, is_grading=True (답안 수정 불가, 결과 조회 시 grading)
+    - 멱등성: 같은 key로 재요청하면 기존 작업 상태를 반환, worker 중단 시 LOCK_TIMEOUT 후 재처리
+    - 실패: MAX_ATTEMPTS까지 재시도 후 채점 실패로 확정 (is_grading 해제, 결과 조회 시 failed)
+    """
+
+    BATCH_SIZE = 50
+    MAX_ATTEMPTS = 3
+    LOCK_TIMEOUT = 60 * 5
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, 'ASYNC_SUBMIT_ENABLED', False)
+
+    @staticmethod
+    def job_key(test_score_id, idempotency_key=None) -> str:
+        """응시 기록별 멱등성 key (client key가 없으면 응시 기록당 1개)"""
+        return f'{test_score_id}:{idempotency_key or ""}'
+
+    @classmethod
+    def find_job(cls, test_score_id, idempotency_key=None):
+        """같은 멱등성 key로 접수된 작업 조회"""
+        return SubmissionJob.objects.filter(idempotency_key=cls.job_key(test_score_id, idempotency_key)).first()
+
+    @classmethod
+    def enqueue(cls, test_score, answers, submit_time, is_auto_submitted=False, idempotency_key=None):
+        """
+        제출 접수 (채점은 worker에서 수행).
+
+        Returns:
+            SubmissionJob | None: 이미 제출된 응시 기록이면 None
+        """
+        time_used = int((submit_time - test_score.start_time).total_seconds() / 60)
+        with transaction.atomic():
+            updated = TestScores.objects.filter(pk=test_score.pk, is_submitted=False).update(
+                is_submitted=True,
+                is_grading=True,
+                submit_time=submit_time,
+                time_used=time_used,
+                is_auto_submitted=is_auto_submitted,
+            )
+            if not updated:
+                return None
+
+            StudentDashboardService.invalidate([test_score.user_id])
+            return SubmissionJob.objects.create(
+                test_score=test_score,
+                idempotency_key=cls.job_key(test_score.pk, idempotency_key),
+                answers=answers,
+                is_auto_submitted=is_auto_submitted,
+            )
+
+    @classmethod
+    def claim(cls, batch_size):
+        """
+        처리할 작업 ID 확보.
+
+        다른 worker가 잠근 행은 건너뛰고(SKIP LOCKED), LOCK_TIMEOUT이 지난 처리 중 작업은 재처리한다.
+        MAX_ATTEMPTS를 다 쓴 채 멈춘 작업은 재처리하지 않고 채점 실패로 확정한다.
+        """
+        now = timezone.now()
+        stale = now - timedelta(seconds=cls.LOCK_TIMEOUT)
+        with transaction.atomic():
+            abandoned = SubmissionJob.objects.select_for_update(skip_locked=True).filter(
+                status=SubmissionJob.STATUS_PROCESSING, locked_at__lt=stale, attempts__gte=cls.MAX_ATTEMPTS
+            )
+            for job in abandoned:
+                cls._give_up(job, '채점 worker가 제한 시간 안에 처리하지 못했습니다.')
+
+            job_ids = list(
+                SubmissionJob.objects.select_for_update(skip_locked=True).filter(
+                    Q(status=SubmissionJob.STATUS_PENDING)
+                    | Q(status=SubmissionJob.STATUS_PROCESSING, locked_at__lt=stale, attempts__lt=cls.MAX_ATTEMPTS)
+                ).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if job_ids:
+                SubmissionJob.objects.filter(id__in=job_ids).update(
+                    status=SubmissionJob.STATUS_PROCESSING, locked_at=now, attempts=F('attempts') + 1
+                )
+        return job_ids
+
+    @classmethod
+    def process_batch(cls, batch_size=None) -> int:
+        """
+        대기열에서 작업을 꺼내 채점 후 성적 확정.
+
+        Returns:
+            int: 처리한 작업 수 (대기열이 비어 있으면 0)
+        """
+        job_ids = cls.claim(batch_size or cls.BATCH_SIZE)
+        if not job_ids:
+            return 0
+
+        jobs = list(SubmissionJob.objects.filter(id__in=job_ids).select_related('test_score__test_paper'))
+        by_paper = {}
+        for job in jobs:
+            by_paper.setdefault(job.test_score.test_paper_id, []).append(job)
+
+        for paper_jobs in by_paper.values():
+            try:
+                cls._finalize(paper_jobs)
+            except Exception as exc:
+                logger.exception(f'[GRADING] Failed jobs: {[job.id for job in paper_jobs]}')
+                cls._mark_failed(paper_jobs, exc)
+        return len(jobs)
+
+    @classmethod
+    def _finalize(cls, jobs):
+        """
+        같은 시험지 작업 일괄 채점 및 성적 확정.
+
+        LOCK_TIMEOUT 후 다른 worker가 재처리한 작업과 겹칠 수 있으므로, 아직 채점 중인 성적만 잠가 확정하고
+        통계/문항별 기록도 이번에 확정한 성적만 반영한다. (이미 확정된 작업은 완료 처리만 함)
+        """
+        paper = jobs[0].test_score.test_paper
+        if paper is None:
+            results = [GradeResult() for _ in jobs]
+        else:
+            results = grade_many(get_answer_key(paper), [job.answers for job in jobs])
+
+        test_scores = []
+        for job, result in zip(jobs, results):
+            test_score = job.test_score
+            test_score.test_score = result.total_score
+            test_score.detail_records = result.records
+            test_score.is_grading = False
+            test_scores.append(test_score)
+
+        with transaction.atomic():
+            grading_ids = set(
+                TestScores.objects.select_for_update().filter(
+                    pk__in=[test_score.pk for test_score in test_scores], is_grading=True
+                ).values_list('pk', flat=True)
+            )
+            test_scores = [test_score for test_score in test_scores if test_score.pk in grading_ids]
+            if test_scores:
+                TestScores.objects.bulk_update(test_scores, ['test_score', 'detail_records', 'is_grading'])
+                ExamStatisticsService.record_test_scores(test_scores)
+                AnswerRecordService.replace(test_scores)
+                StudentDashboardService.invalidate([test_score.user_id for test_score in test_scores])
+            SubmissionJob.objects.filter(id__in=[job.id for job in jobs]).update(
+                status=SubmissionJob.STATUS_DONE, finish_time=timezone.now(), error=''
+            )
+
+    @classmethod
+    def _mark_failed(cls, jobs, exc):
+        """
+        실패한 작업은 MAX_ATTEMPTS까지 재시도 대기열로 되돌림.
+
+        마지막 시도도 실패하면 같은 batch의 다른 작업 때문일 수 있으므로 작업별로 한 번 더 채점하고,
+        그래도 실패한 작업만 채점 실패로 확정한다.
+        """
+        retry_ids = [job.id for job in jobs if job.attempts < cls.MAX_ATTEMPTS]
+        if retry_ids:
+            SubmissionJob.objects.filter(id__in=retry_ids).update(status=SubmissionJob.STATUS_PENDING, error=str(exc))
+
+        for job in jobs:
+            if job.attempts < cls.MAX_ATTEMPTS:
+                continue
+            error = exc
+            if len(jobs) > 1:
+                try:
+                    cls._finalize([job])
+                    continue
+                except Exception as job_exc:
+                    logger.exception(f'[GRADING] Failed job: {job.id}')
+                    error = job_exc
+            cls._give_up(job, error)
+
+    @staticmethod
+    def _give_up(job, error):
+        """
+        채점 실패 확정.
+
+        결과 조회가 채점 중(202)에 머물지 않도록 is_grading을 해제하고, 제출 답안은 detail_records에 남긴다.
+        채점 중이 아닌 성적은 통계 재집계에 포함되므로 현재 점수(채점 전 0점)를 통계에도 반영한다.
+        (교사가 재채점하면 점수, 통계, 문항별 기록에 반영되고 작업도 완료 처리됨)
+        """
+        records = {
+            str(answer['question_id']): {
+                'answer': answer.get('answer', ''),
+                'selected_options': answer.get('selected_options', []),
+            }
+            for answer in job.answers
+            if isinstance(answer, dict) and 'question_id' in answer
+        }
+        with transaction.atomic():
+            # 다른 worker가 이미 확정한 성적은 덮어쓰지 않음 (실패한 채점이 바꾼 instance 대신 저장된 점수 사용)
+            test_score = TestScores.objects.select_for_update(of=('self',)).select_related('test_paper').filter(
+                pk=job.test_score_id, is_grading=True
+            ).first()
+            if test_score is not None:
+                test_score.is_grading = False
+                test_score.detail_records = records
+                test_score.save(update_fields=['is_grading', 'detail_records'])
+                if test_score.exam_id:
+                    ExamStatisticsService.record_submissions(
+                        test_score.exam_id, [test_score.test_score], test_score.test_paper
+                    )
+                StudentDashboardService.invalidate([test_score.user_id])
+            SubmissionJob.objects.filter(pk=job.pk).update(
+                status=SubmissionJob.STATUS_FAILED, error=str(error), finish_time=timezone.now()
+            )
+        logger.error(f'[GRADING] Gave up job {job.id} (test score {job.test_score_id}): {error}')
+
+
+class ExpiredAttemptSweeper:
+    """
+    시간 초과 응시 기록 자동 제출 서비스.
+
+    client가 종료 시각 이후 submit을 호출하지 않으면(탭 종료 등) 응시 기록이 미제출로 남아
+    성적 통계에서 빠진다. 종료 시각(+유예 시간)이 지난 미제출 응시 기록을 batch 단위로 잠가
+    임시 저장된 답안(detail_records + 답안 buffer)으로 채점하고 자동 제출 처리한다.
+    batch마다 다시 조회하므로(처리된 행은 조건에서 빠짐) 대상 수와 무관하게 메모리 사용량이 일정하다.
+    """
+
+    BATCH_SIZE = 500
+    # client의 시간 초과 자동 제출 요청과 경합하지 않도록 종료 시각 이후 대기 시간 (초)
+    GRACE_PERIOD = 60
+
+    @classmethod
+    def expired_attempts(cls, now=None, grace_period=None):
+        """종료 시각이 지난 미제출 응시 기록"""
+        now = now or timezone.now()
+        grace_period = cls.GRACE_PERIOD if grace_period is None else grace_period
+        return TestScores.objects.filter(
+            is_submitted=False,
+            start_time__isnull=False,
+            exam__end_time__lt=now - timedelta(seconds=grace_period),
+        )
+
+    @classmethod
+    def sweep(cls, now=None, grace_period=None, batch_size=None, on_progress=None):
+        """
+        시간 초과 응시 기록 일괄 자동 제출.
+
+        Args:
+            now: 기준 시각 (기본값 현재)
+            grace_period: 종료 시각 이후 유예 시간(초)
+            batch_size: 한 번에 처리할 응시 기록 수
+            on_progress: batch 처리 후 호출 callback(processed)
+
+        Returns:
+            int: 자동 제출한 응시 기록 수
+        """
+        batch_size = batch_size or cls.BATCH_SIZE
+        attempts = cls.expired_attempts(now, grace_period)
+
+        processed = 0
+        while True:
+            with transaction.atomic():
+                # 동시에 제출 중인 응시 기록은 건너뜀 (제출 요청이 처리)
+                batch = list(
+                    attempts.select_for_update(skip_locked=True, of=('self',)).select_related(
+                        'exam', 'test_paper'
+                    ).order_by('pk')[:batch_size]
+                )
+                if not batch:
+                    break
+                cls._submit_batch(batch)
+
+            processed += len(batch)
+            if on_progress:
+                on_progress(processed)
+        return processed
+
+    @staticmethod
+    def _submit_batch(batch):
+        """잠근 응시 기록을 시험지별로 일괄 채점 후 자동 제출 처리"""
+        by_paper = {}
+        for test_score in batch:
+            records = merge_latest(test_score.detail_records, AnswerBuffer.take(test_score.exam_id, test_score.user_id))
+            by_paper.setdefault(test_score.test_paper_id, []).append((test_score, records))
+
+        for paper_attempts in by_paper.values():
+            paper = paper_attempts[0][0].test_paper
+            if paper is None:
+                results = [GradeResult() for _ in paper_attempts]
+            else:
+                results = grade_many(get_answer_key(paper), [records for _, records in paper_attempts])
+
+            for (test_score, _), result in zip(paper_attempts, results):
+                submit_time = test_score.exam.end_time
+                test_score.test_score = result.total_score
+                test_score.detail_records = result.records
+                test_score.is_submitted = True
+                test_score.is_auto_submitted = True
+                test_score.submit_time = submit_time
+                test_score.time_used = max(0, int((submit_time - test_score.start_time).total_seconds() / 60))
+
+        TestScores.objects.bulk_update(
+            batch,
+            ['test_score', 'detail_records', 'is_submitted', 'is_auto_submitted', 'submit_time', 'time_used'],
+        )
+        ExamStatisticsService.record_test_scores(batch)
+        AnswerRecordService.create(batch)
+        StudentDashboardService.record_submissions(batch)
+
+
+class ExamStateScheduler:
+    """
+    시간 기반 시험 상태 전환 서비스.
+
+    exam_state는 update_state/publish로만 바뀌어 시작/종료 시각이 지나도 갱신되지 않았다.
+    lookahead 구간 안의 시작/종료 시각을 min-heap으로 불러와 경계 시각에 도달한 시험의 상태를
+    상태별 UPDATE 1회로 일괄 전환하고 exam_state_changed event를 보낸다.
+    (0: 시험 전 -> 1: 시험 중 -> 2: 시험 종료)
+    """
+
+    STATE_READY = '0'
+    STATE_RUNNING = '1'
+    STATE_FINISHED = '2'
+    # heap에 불러올 전환 시각 범위 (초)
+    LOOKAHEAD = 60 * 60
+
+    @classmethod
+    def load(cls, now=None, lookahead=None):
+        """
+        lookahead 구간 안의 상태 전환 heap 생성 (이미 지난 전환 포함).
+
+        Returns:
+            list: (전환 시각, exam_id, 전환 후 상태) min-heap
+        """
+        now = now or timezone.now()
+        horizon = now + timedelta(seconds=cls.LOOKAHEAD if lookahead is None else lookahead)
+        exams = ExaminationInfo.objects.filter(
+            Q(exam_state=cls.STATE_READY, start_time__lte=horizon)
+            | Q(exam_state__in=[cls.STATE_READY, cls.STATE_RUNNING], end_time__lte=horizon)
+        ).values_list('id', 'exam_state', 'start_time', 'end_time')
+
+        heap = []
+        for exam_id, exam_state, start_time, end_time in exams:
+            if exam_state == cls.STATE_READY and start_time < end_time:
+                heap.append((start_time, exam_id, cls.STATE_RUNNING))
+            if end_time <= horizon:
+                heap.append((end_time, exam_id, cls.STATE_FINISHED))
+        heapq.heapify(heap)
+        return heap
+
+    @staticmethod
+    def pop_due(heap, now):
+        """전환 시각이 지난 항목을 heap에서 꺼냄"""
+        due = []
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap))
+        return due
+
+    @staticmethod
+    def seconds_until_next(heap, now, default):
+        """다음 전환 시각까지 남은 시간(초), heap이 비었으면 default"""
+        if not heap:
+            return default
+        return min(default, max(0.0, (heap[0][0] - now).total_seconds()))
+
+    @classmethod
+    def apply_due(cls, now=None):
+        """
+        경계 시각이 지난 시험의 상태를 일괄 전환.
+
+        heap은 언제 깨어날지만 결정하고, 전환 대상은 DB 조건으로 다시 판단한다
+        (heap을 불러온 뒤 시험 시간이 수정되어도 잘못 전환하지 않음).
+
+        Returns:
+            dict: {전환 후 상태: [exam_id, ...]}
+        """
+        now = now or timezone.now()
+        transitions = [
+            (cls.STATE_FINISHED, Q(exam_state__in=[cls.STATE_READY, cls.STATE_RUNNING], end_time__lte=now)),
+            (cls.STATE_RUNNING, Q(exam_state=cls.STATE_READY, start_time__lte=now, end_time__gt=now)),
+        ]
+
+        changed = {}
+        for exam_state, condition in transitions:
+            with transaction.atomic():
+                exam_ids = list(
+                    ExaminationInfo.objects.select_for_update(skip_locked=True)
+                    .filter(condition)
+                    .values_list('id', flat=True)
+                )
+                if not exam_ids:
+                    continue
+                ExaminationInfo.objects.filter(id__in=exam_ids).update(exam_state=exam_state)
+            changed[exam_state] = exam_ids
+            exam_state_changed.send(sender=ExaminationInfo, exam_ids=exam_ids, exam_state=exam_state)
+        return changed
@@ -0,0 +1,57 @@
+"""
+Examination signal handlers.
+
+시험지/문제 변경 시 cache된 시험 snapshot을 무효화(transaction commit 이후)하고,
+정답 index 재생성을 위해 시험지 정답 version(key_version)을 갱신.
+시험지 합격 점수/총점이 바뀌면 시험 통계를 재집계.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from examination.answer_key import touch_papers, touch_papers_for_questions
+from examination.models import ExaminationInfo, ExamPaperInfo
+from examination.services import ExamSnapshotService, ExamStatisticsService, exam_state_changed
+from testpaper.models import TestPaperInfo, TestPaperTestQ
+from testquestion.models import OptionInfo, TestQuestionInfo
+
+
+@receiver([post_save, post_delete], sender=ExaminationInfo)
+def invalidate_exam_snapshot(sender, instance, **kwargs):
+    ExamSnapshotService.invalidate([instance.id])
+
+
+@receiver(exam_state_changed, sender=ExaminationInfo)
+def invalidate_exam_state_snapshot(sender, exam_ids, **kwargs):
+    # 일괄 UPDATE는 post_save를 보내지 않으므로 상태 전환 event로 무효화
+    ExamSnapshotService.invalidate(exam_ids)
+
+
+@receiver([post_save, post_delete], sender=ExamPaperInfo)
+def invalidate_exam_paper_snapshot(sender, instance, **kwargs):
+    ExamSnapshotService.invalidate([instance.exam_id])
+
+
+@receiver(post_save, sender=TestPaperInfo)
+def invalidate_paper_snapshot(sender, instance, created, **kwargs):
+    ExamSnapshotService.invalidate_for_papers([instance.id])
+    if not created:
+        # 통계 row의 합격 인원은 저장 당시 합격 점수 기준이므로 재집계
+        ExamStatisticsService.rebuild_for_paper(instance)
+
+
+@receiver([post_save, post_delete], sender=TestPaperTestQ)
+def invalidate_paper_question_snapshot(sender, instance, **kwargs):
+    ExamSnapshotService.invalidate_for_papers([instance.test_paper_id])
+    touch_papers([instance.test_paper_id])
+
+
+@receiver(post_save, sender=TestQuestionInfo)
+def invalidate_question_snapshot(sender, instance, **kwargs):
+    ExamSnapshotService.invalidate_for_questions([instance.id])
+    touch_papers_for_questions([instance.id])
+
+
+@receiver([post_save, post_delete], sender=OptionInfo)
+def invalidate_option_snapshot(sender, instance, **kwargs):
+    ExamSnapshotService.invalidate_for_questions([instance.test_question_id])
+    touch_papers_for_questions([instance.test_question_id])
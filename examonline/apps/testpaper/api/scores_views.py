@@ -3,22 +3,32 @@ Scores API Views.
 성적 조회 및 관리 API.
 """
 from django.db import transaction
-from django.db.models import Avg, Max, Min, Count, Q
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from examination.models import ExaminationInfo, ExamStudentsInfo
+from examination.models import ExaminationInfo
+from examination.services import (
+    AnswerRecordService,
+    ExamRegradeService,
+    ExamStatisticsService,
+    ItemAnalysisService,
+    ScoreDistributionService,
+    SubmissionQueueService,
+)
 from testpaper.models import TestScores, TestPaperTestQ
 from testquestion.models import TestQuestionInfo
+from user.services import StudentDashboardService
 
 from .serializers import (
     MyScoreListSerializer,
     MyScoreDetailSerializer,
     ExamScoreListSerializer,
     ExamStatisticsSerializer,
+    ExamDistributionSerializer,
+    ItemAnalysisSerializer,
     ManualGradeSerializer,
 )
 
@@ -128,58 +138,133 @@ class ScoresViewSet(viewsets.ViewSet):
         if exam.create_user != request.user:
             return Response({'detail': '권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
 
-        # 통계 계산
-        total_students = ExamStudentsInfo.objects.filter(exam=exam).count()
-        scores = TestScores.objects.filter(exam=exam, is_submitted=True)
-
-        submitted_count = scores.count()
-        not_submitted_count = total_students - submitted_count
-
-        if submitted_count == 0:
-            data = {
-                'exam_id': exam.id,
-                'exam_name': exam.name,
-                'total_students': total_students,
-                'submitted_count': 0,
-                'not_submitted_count': not_submitted_count,
-                'average_score': 0,
-                'highest_score': 0,
-                'lowest_score': 0,
-                'pass_count': 0,
-                'fail_count': 0,
-                'pass_rate': 0.0,
-            }
-        else:
-            stats = scores.aggregate(avg_score=Avg('test_score'), max_score=Max('test_score'), min_score=Min('test_score'))
-
-            # 합격/불합격 수 계산
-            paper = exam.exampaperinfo_set.first().paper if exam.exampaperinfo_set.exists() else None
-            if paper:
-                pass_count = scores.filter(test_score__gte=paper.passing_score).count()
-                fail_count = submitted_count - pass_count
-                pass_rate = (pass_count / submitted_count * 100) if submitted_count > 0 else 0
-            else:
-                pass_count = 0
-                fail_count = 0
-                pass_rate = 0.0
-
-            data = {
-                'exam_id': exam.id,
-                'exam_name': exam.name,
-                'total_students': total_students,
-                'submitted_count': submitted_count,
-                'not_submitted_count': not_submitted_count,
-                'average_score': round(stats['avg_score'], 2) if stats['avg_score'] else 0,
-                'highest_score': stats['max_score'] or 0,
-                'lowest_score': stats['min_score'] or 0,
-                'pass_count': pass_count,
-                'fail_count': fail_count,
-                'pass_rate': round(pass_rate, 2),
-            }
-
+        data = self._statistics_data(exam, ExamStatisticsService.get(exam.id))
         serializer = ExamStatisticsSerializer(data)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=['get'], url_path='exam/(?P<exam_id>[^/.]+)/distribution')
+    def exam_distribution(self, request, exam_id=None):
+        """
+        시험 성적 분포 조회 (교사용).
+        GET /api/v1/scores/exam/{exam_id}/distribution/
+
+        통계에 더해 구간별 인원, 중앙값, 표준편차, 사분위수, 학생별 백분위 순위를 반환.
+        (다음 제출 전까지 cache)
+        """
+        if request.user.user_type != 'teacher':
+            return Response({'detail': '교사만 접근할 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            exam = ExaminationInfo.objects.get(id=exam_id)
+        except ExaminationInfo.DoesNotExist:
+            return Response({'detail': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+        # 시험 작성자만 조회 가능
+        if exam.create_user != request.user:
+            return Response({'detail': '권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        stats = ExamStatisticsService.get(exam.id)
+        data = self._statistics_data(exam, stats)
+        data.update(ScoreDistributionService.get(exam.id, stats))
+
+        serializer = ExamDistributionSerializer(data)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='exam/(?P<exam_id>[^/.]+)/item-analysis')
+    def item_analysis(self, request, exam_id=None):
+        """
+        시험 문항 분석 조회 (교사용).
+        GET /api/v1/scores/exam/{exam_id}/item-analysis/
+
+        문항별 난이도(p-value), 변별도(point-biserial), 선택지별 선택 비율과 Cronbach's alpha를 반환.
+        (다음 제출 전까지 cache)
+        """
+        if request.user.user_type != 'teacher':
+            return Response({'detail': '교사만 접근할 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            exam = ExaminationInfo.objects.get(id=exam_id)
+        except ExaminationInfo.DoesNotExist:
+            return Response({'detail': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+        # 시험 작성자만 조회 가능
+        if exam.create_user != request.user:
+            return Response({'detail': '권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        data = {'exam_id': exam.id, 'exam_name': exam.name, **ItemAnalysisService.get(exam.id)}
+
+        serializer = ItemAnalysisSerializer(data)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def _statistics_data(self, exam, stats):
+        """시험 통계 row를 응답 data로 변환 (평균은 점수 합계로 계산, 응시 대상 수는 학생 등록 시 갱신되는 student_num)"""
+        total_students = exam.student_num
+        submitted_count = stats.submitted_count
+
+        return {
+            'exam_id': exam.id,
+            'exam_name': exam.name,
+            'total_students': total_students,
+            'submitted_count': submitted_count,
+            'not_submitted_count': total_students - submitted_count,
+            'average_score': round(stats.score_sum / submitted_count, 2) if submitted_count else 0,
+            'highest_score': stats.max_score or 0,
+            'lowest_score': stats.min_score or 0,
+            'pass_count': stats.pass_count,
+            'fail_count': submitted_count - stats.pass_count if stats.passing_score is not None else 0,
+            'pass_rate': round(stats.pass_count / submitted_count * 100, 2) if submitted_count else 0.0,
+        }
+
+    @action(detail=False, methods=['get', 'post'], url_path='exam/(?P<exam_id>[^/.]+)/regrade')
+    def regrade(self, request, exam_id=None):
+        """
+        시험 재채점 (교사용).
+        POST /api/v1/scores/exam/{exam_id}/regrade/ - 재채점 접수 (202)
+        GET /api/v1/scores/exam/{exam_id}/regrade/ - 최근 재채점 진행 상황
+
+        정답 수정 후 제출된 성적 전체를 현재 정답 기준으로 다시 채점 (수동 채점 점수는 유지).
+        제출 건수가 많으면 요청 시간 안에 끝나지 않으므로 대기열에 접수하고 채점 worker가 처리한다. (202)
+        비동기 제출이 꺼져 있으면 채점 worker가 없으므로 요청 안에서 바로 처리한다. (200)
+        """
+        if request.user.user_type != 'teacher':
+            return Response({'detail': '교사만 접근할 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            exam = ExaminationInfo.objects.get(id=exam_id)
+        except ExaminationInfo.DoesNotExist:
+            return Response({'detail': '시험을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+        # 시험 작성자만 재채점 가능
+        if exam.create_user != request.user:
+            return Response({'detail': '권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        if request.method == 'POST':
+            job = ExamRegradeService.enqueue(exam.id)
+            if not SubmissionQueueService.is_enabled():
+                ExamRegradeService.process_next(job_id=job.id)
+                job.refresh_from_db()
+                return Response(self._regrade_job_data(job), status=status.HTTP_200_OK)
+            return Response(
+                {'detail': '재채점이 접수되었습니다.', **self._regrade_job_data(job)}, status=status.HTTP_202_ACCEPTED
+            )
+
+        job = exam.regrade_jobs.order_by('-id').first()
+        if job is None:
+            return Response({'detail': '재채점 기록이 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(self._regrade_job_data(job), status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _regrade_job_data(job):
+        return {
+            'exam_id': job.exam_id,
+            'job_id': job.id,
+            'status': job.status,
+            'total_count': job.total_count,
+            'processed_count': job.processed_count,
+            'updated_count': job.updated_count,
+            'error': job.error,
+        }
+
     @action(detail=False, methods=['get'], url_path='exam/(?P<exam_id>[^/.]+)/student/(?P<student_id>[^/.]+)')
     def student_score_detail(self, request, exam_id=None, student_id=None):
         """
@@ -236,6 +321,8 @@ class ScoresViewSet(viewsets.ViewSet):
 
         # detail_records 업데이트
         with transaction.atomic():
+            # 재채점과 동시에 수정되지 않도록 잠근 뒤 최신 답안 기록을 다시 읽음
+            score = TestScores.objects.select_for_update().get(pk=score.pk)
             if not score.detail_records:
                 score.detail_records = {}
 
@@ -251,9 +338,15 @@ class ScoresViewSet(viewsets.ViewSet):
                 score.detail_records[question_id_str]['comment'] = comment
 
             # 총점 재계산
+            old_total = score.test_score
             score.test_score = score.test_score - old_score + new_score
             score.save()
 
+            if score.exam_id and score.is_submitted and not score.is_grading:
+                ExamStatisticsService.record_change(score.exam_id, old_total, score.test_score)
+            AnswerRecordService.update_question(score, question_id)
+            StudentDashboardService.invalidate([score.user_id])
+
         return Response(
             {'detail': '채점이 완료되었습니다.', 'new_total_score': score.test_score}, status=status.HTTP_200_OK
         )
@@ -7,6 +7,7 @@ from django.db.models import Sum
 from rest_framework import serializers
 
 from core.api.fields import XSSSanitizedCharField
+from examination.answer_key import touch_papers
 from testpaper.models import TestPaperInfo, TestPaperTestQ
 from testquestion.api.serializers import QuestionListSerializer
 from testquestion.models import TestQuestionInfo
@@ -255,6 +256,10 @@ class TestPaperUpdateSerializer(serializers.ModelSerializer):
             instance.question_count = instance.testpapertestq_set.count()
 
         instance.save()
+        if questions_data is not None:
+            # 위 save가 문제 변경 signal의 key_version 증가를 이전 값으로 덮어쓰므로, 모든 저장 후 정답 version 갱신
+            touch_papers([instance.pk])
+            instance.refresh_from_db(fields=['key_version'])
 
         # passing_score 검증 (문제가 있는 경우에만)
         if instance.question_count > 0 and instance.passing_score > instance.total_score:
@@ -284,6 +289,59 @@ class AddQuestionsSerializer(serializers.Serializer):
         return value
 
 
+class BlueprintItemSerializer(serializers.Serializer):
+    """
+    자동 출제 blueprint 항목 Serializer.
+    문제 유형 x 난이도별 문항 수.
+    """
+
+    tq_type = serializers.ChoiceField(choices=TestQuestionInfo._meta.get_field('tq_type').choices)
+    tq_degree = serializers.ChoiceField(choices=TestQuestionInfo._meta.get_field('tq_degree').choices)
+    count = serializers.IntegerField(min_value=1)
+
+
+class AutoAssembleSerializer(serializers.Serializer):
+    """
+    시험지 자동 출제용 Serializer.
+    과목, blueprint, 목표 총점을 받아 문제를 무작위로 선택한다.
+    """
+
+    MAX_QUESTIONS = 500
+
+    name = XSSSanitizedCharField(max_length=50)
+    subject_id = serializers.PrimaryKeyRelatedField(queryset=SubjectInfo.objects.all(), source='subject')
+    tp_degree = serializers.ChoiceField(choices=TestPaperInfo._meta.get_field('tp_degree').choices, default='jd')
+    total_score = serializers.IntegerField(default=100, min_value=1)
+    passing_score = serializers.IntegerField(default=60, min_value=0)
+    blueprint = BlueprintItemSerializer(many=True, allow_empty=False)
+
+    def validate_blueprint(self, value):
+        """
+        유형/난이도 조합 중복 및 전체 문항 수 검증.
+        """
+        combinations = [(item['tq_type'], item['tq_degree']) for item in value]
+        if len(combinations) != len(set(combinations)):
+            raise serializers.ValidationError('동일한 유형/난이도 조합을 중복하여 지정할 수 없습니다.')
+
+        if sum(item['count'] for item in value) > self.MAX_QUESTIONS:
+            raise serializers.ValidationError(f'한 번에 최대 {self.MAX_QUESTIONS}문항까지 출제할 수 있습니다.')
+
+        return value
+
+    def validate(self, attrs):
+        """
+        총점은 문항 수 이상(문항당 최소 1점), 합격점은 총점 이하여야 함.
+        """
+        question_count = sum(item['count'] for item in attrs['blueprint'])
+        if attrs['total_score'] < question_count:
+            raise serializers.ValidationError({'total_score': f'총점은 문항 수({question_count}) 이상이어야 합니다.'})
+
+        if attrs['passing_score'] > attrs['total_score']:
+            raise serializers.ValidationError({'passing_score': f'합격점은 총점({attrs["total_score"]}) 이하여야 합니다.'})
+
+        return attrs
+
+
 # ==================== 성적 관련 Serializers ====================
 
 from testpaper.models import TestScores
@@ -471,6 +529,68 @@ class ExamStatisticsSerializer(serializers.Serializer):
     pass_rate = serializers.FloatField()
 
 
+class ScoreBucketSerializer(serializers.Serializer):
+    """점수 구간별 인원 Serializer"""
+
+    range_start = serializers.FloatField()
+    range_end = serializers.FloatField()
+    count = serializers.IntegerField()
+
+
+class StudentPercentileSerializer(serializers.Serializer):
+    """학생별 백분위 순위 Serializer"""
+
+    student_id = serializers.IntegerField()
+    student_name = serializers.CharField()
+    score = serializers.IntegerField()
+    percentile_rank = serializers.FloatField()
+
+
+class ExamDistributionSerializer(ExamStatisticsSerializer):
+    """시험 성적 분포 Serializer (통계 + 분포 지표)"""
+
+    mean = serializers.FloatField()
+    median = serializers.FloatField()
+    std_deviation = serializers.FloatField()
+    quartiles = serializers.DictField(child=serializers.FloatField())
+    histogram = ScoreBucketSerializer(many=True)
+    students = StudentPercentileSerializer(many=True)
+
+
+class OptionFrequencySerializer(serializers.Serializer):
+    """선택지별 선택 인원 Serializer"""
+
+    option_id = serializers.IntegerField()
+    option = serializers.CharField()
+    is_right = serializers.BooleanField()
+    count = serializers.IntegerField()
+    ratio = serializers.FloatField()
+
+
+class ItemStatisticsSerializer(serializers.Serializer):
+    """문항별 분석 지표 Serializer"""
+
+    question_id = serializers.IntegerField()
+    question_name = serializers.CharField()
+    tq_type = serializers.CharField()
+    max_score = serializers.IntegerField()
+    p_value = serializers.FloatField(allow_null=True)
+    mean_score = serializers.FloatField(allow_null=True)
+    discrimination = serializers.FloatField(allow_null=True)
+    options = OptionFrequencySerializer(many=True)
+
+
+class ItemAnalysisSerializer(serializers.Serializer):
+    """시험 문항 분석 Serializer"""
+
+    exam_id = serializers.IntegerField()
+    exam_name = serializers.CharField()
+    student_count = serializers.IntegerField()
+    question_count = serializers.IntegerField()
+    cronbach_alpha = serializers.FloatField(allow_null=True)
+    items = ItemStatisticsSerializer(many=True)
+
+
 class ManualGradeSerializer(serializers.Serializer):
     """수동 채점용 Serializer"""
 
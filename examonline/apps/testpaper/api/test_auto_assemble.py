@@ -0,0 +1,163 @@
+"""
+Test Paper Auto Assembly API tests.
+"""
+
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from testpaper.models import TestPaperInfo
+from testpaper.services import PaperAssemblyService
+from testquestion.models import TestQuestionInfo
+from testquestion.services import QuestionPoolService
+from user.models import SubjectInfo, UserProfile
+
+URL = '/api/v1/testpapers/auto-assemble/'
+
+
+@pytest.fixture(autouse=True)
+def clear_pools():
+    cache.clear()
+    QuestionPoolService.clear_local_cache()
+    yield
+    QuestionPoolService.clear_local_cache()
+
+
+@pytest.fixture
+def teacher(db):
+    return UserProfile.objects.create_user(username='assembler', password='testpass', user_type='teacher')
+
+
+@pytest.fixture
+def other_teacher(db):
+    return UserProfile.objects.create_user(username='colleague', password='testpass', user_type='teacher')
+
+
+@pytest.fixture
+def client(teacher):
+    api_client = APIClient()
+    api_client.force_authenticate(user=teacher)
+    return api_client
+
+
+@pytest.fixture
+def subject(db):
+    return SubjectInfo.objects.create(subject_name='Assembly')
+
+
+def _questions(subject, user, count, tq_type='xz', tq_degree='jd', **fields):
+    return [
+        TestQuestionInfo.objects.create(
+            name=f'{tq_type}-{tq_degree}-{idx}', subject=subject, score=5,
+            tq_type=tq_type, tq_degree=tq_degree, create_user=user, **fields,
+        )
+        for idx in range(count)
+    ]
+
+
+def _payload(subject, blueprint, **fields):
+    return {'name': 'Auto', 'subject_id': subject.id, 'blueprint': blueprint, **fields}
+
+
+@pytest.mark.django_db
+class TestAutoAssemble:
+    """시험지 자동 출제 테스트"""
+
+    def test_assembles_paper_from_blueprint(self, client, teacher, other_teacher, subject):
+        """blueprint 조합별 문항 수만큼 본인/공유 문제에서 선택하고 목표 총점으로 배점"""
+        own = _questions(subject, teacher, 4)
+        shared = _questions(subject, other_teacher, 3, is_share=True)
+        _questions(subject, other_teacher, 5)  # 다른 교사의 비공유 문제
+        hard = _questions(subject, teacher, 3, tq_type='pd', tq_degree='kn')
+
+        blueprint = [{'tq_type': 'xz', 'tq_degree': 'jd', 'count': 6}, {'tq_type': 'pd', 'tq_degree': 'kn', 'count': 2}]
+        response = client.post(URL, _payload(subject, blueprint, total_score=50, passing_score=30), format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+
+        questions = response.data['questions']
+        ids = [item['question']['id'] for item in questions]
+        assert len(set(ids)) == 8
+        assert set(ids[:6]) <= {question.id for question in own + shared}
+        assert set(ids[6:]) <= {question.id for question in hard}
+        assert [item['order'] for item in questions] == list(range(1, 9))
+        assert sum(item['score'] for item in questions) == 50
+
+        paper = TestPaperInfo.objects.get(pk=response.data['id'])
+        assert (paper.total_score, paper.passing_score, paper.question_count) == (50, 30, 8)
+        assert paper.create_user == teacher
+
+    def test_insufficient_questions(self, client, teacher, subject):
+        """조건에 맞는 문제가 부족하면 400, 시험지 미생성"""
+        _questions(subject, teacher, 2)
+        blueprint = [{'tq_type': 'xz', 'tq_degree': 'jd', 'count': 3}]
+
+        response = client.post(URL, _payload(subject, blueprint), format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert '필요 3개, 가능 2개' in response.data['blueprint']
+        assert not TestPaperInfo.objects.exists()
+
+    def test_pool_follows_question_changes(self, client, teacher, subject):
+        """signal로 pool 갱신, signal 없이 삭제된 문제는 재확인 후 제외"""
+        blueprint = [{'tq_type': 'xz', 'tq_degree': 'jd', 'count': 1}]
+        first, = _questions(subject, teacher, 1)
+        assert client.post(URL, _payload(subject, blueprint), format='json').status_code == status.HTTP_201_CREATED
+
+        # 생성 signal로 새 문제가 pool에 포함
+        second, = _questions(subject, teacher, 1)
+        blueprint[0]['count'] = 2
+        assert client.post(URL, _payload(subject, blueprint), format='json').status_code == status.HTTP_201_CREATED
+
+        # queryset.update는 signal이 없으므로 pool에 남아 있지만 선택되지 않음
+        TestQuestionInfo.objects.filter(pk=first.pk).update(is_del=True)
+        blueprint[0]['count'] = 1
+        for _ in range(3):
+            response = client.post(URL, _payload(subject, blueprint), format='json')
+            assert [item['question']['id'] for item in response.data['questions']] == [second.id]
+
+    def test_validation_errors(self, client, teacher, subject):
+        """중복 조합, 문항 수보다 작은 총점, 총점보다 큰 합격점은 400"""
+        _questions(subject, teacher, 3)
+        item = {'tq_type': 'xz', 'tq_degree': 'jd', 'count': 3}
+
+        response = client.post(URL, _payload(subject, [item, item]), format='json')
+        assert 'blueprint' in response.data
+        response = client.post(URL, _payload(subject, [item], total_score=2, passing_score=0), format='json')
+        assert 'total_score' in response.data
+        response = client.post(URL, _payload(subject, [item], total_score=10, passing_score=20), format='json')
+        assert 'passing_score' in response.data
+        assert client.post(URL, _payload(subject, []), format='json').status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_student_forbidden(self, subject):
+        """학생은 자동 출제 불가"""
+        student = UserProfile.objects.create_user(username='pupil', password='testpass', user_type='student')
+        api_client = APIClient()
+        api_client.force_authenticate(user=student)
+
+        blueprint = [{'tq_type': 'xz', 'tq_degree': 'jd', 'count': 1}]
+        assert api_client.post(URL, _payload(subject, blueprint), format='json').status_code == status.HTTP_403_FORBIDDEN
+
+    def test_warm_pool_query_count(self, teacher, subject, django_assert_max_num_queries):
+        """pool이 만들어진 뒤에는 문항 수와 무관하게 고정 query 수"""
+        _questions(subject, teacher, 30)
+        blueprint = [{'tq_type': 'xz', 'tq_degree': 'jd', 'count': 20}]
+        fields = {'name': 'Warm', 'subject': subject, 'passing_score': 0}
+        PaperAssemblyService.assemble(teacher, blueprint, 100, **fields)
+
+        # 문제 재확인 SELECT, savepoint, 시험지 INSERT(+ snapshot 무효화 signal), 매핑 bulk INSERT
+        with django_assert_max_num_queries(6):
+            paper = PaperAssemblyService.assemble(teacher, blueprint, 100, **fields)
+        assert paper.testpapertestq_set.count() == 20
+
+
+class TestDistribute:
+    """목표 총점 배분 테스트"""
+
+    @pytest.mark.parametrize('weights, total_score', [([5, 5, 5], 10), ([1, 2, 3, 0], 17), ([10] * 7, 7), ([3, 1], 100)])
+    def test_sum_and_minimum(self, weights, total_score):
+        scores = PaperAssemblyService.distribute(weights, total_score)
+        assert sum(scores) == total_score
+        assert min(scores) >= 1
+
+    def test_proportional_to_question_score(self):
+        assert PaperAssemblyService.distribute([1, 3], 10) == [3, 7]
@@ -0,0 +1,181 @@
+"""
+Item Analysis API Tests.
+문항 분석 (난이도, 변별도, 선택지 분포, 신뢰도) 테스트.
+"""
+import time
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.analytics import item_analysis, option_counts
+from examination.models import ExaminationInfo, ExamPaperInfo
+from examination.services import AnswerRecordService, ExamStatisticsService
+from testpaper.models import TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(username='teacher_item', password='testpass123', user_type='teacher')
+
+
+@pytest.fixture
+def questions(db, teacher_user):
+    subject = SubjectInfo.objects.create(subject_name='Item Subject')
+    created = []
+    for idx in range(2):
+        question = TestQuestionInfo.objects.create(
+            name=f'Item Q{idx}', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+        )
+        OptionInfo.objects.create(test_question=question, option='A', is_right=True)
+        OptionInfo.objects.create(test_question=question, option='B', is_right=False)
+        created.append(question)
+    return created
+
+
+@pytest.fixture
+def examination(db, teacher_user, questions):
+    paper = TestPaperInfo.objects.create(
+        name='Item Paper', subject=questions[0].subject, total_score=20, passing_score=10, question_count=2,
+        create_user=teacher_user,
+    )
+    for order, question in enumerate(questions, start=1):
+        TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=10, order=order)
+    start_time = timezone.now() - timedelta(days=1)
+    exam = ExaminationInfo.objects.create(
+        name='Item Exam', subject=paper.subject, start_time=start_time, end_time=start_time + timedelta(hours=2),
+        exam_state='2', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    return exam
+
+
+def create_submission(examination, questions, answers):
+    """answers: 문제별 선택 옵션 ('A'/'B')"""
+    paper = examination.exampaperinfo_set.first().paper
+    idx = StudentsInfo.objects.count()
+    user = UserProfile.objects.create_user(username=f'student_item_{idx}', password='testpass123')
+    student = StudentsInfo.objects.create(user=user, student_name=f'Item {idx}', student_id=f'2025110{idx}')
+    records = {}
+    for question, answer in zip(questions, answers):
+        option = OptionInfo.objects.get(test_question=question, option=answer)
+        records[str(question.id)] = {
+            'answer': '', 'selected_options': [option.id], 'is_correct': option.is_right,
+            'score': 10 if option.is_right else 0, 'max_score': 10,
+        }
+    test_score = TestScores.objects.create(
+        exam=examination, user=student, test_paper=paper, is_submitted=True, detail_records=records,
+        test_score=sum(record['score'] for record in records.values()),
+        start_time=timezone.now() - timedelta(hours=2), submit_time=timezone.now() - timedelta(hours=1),
+    )
+    AnswerRecordService.create([test_score])
+    return test_score
+
+
+class TestItemAnalytics:
+    """NumPy 문항 분석 계산 테스트"""
+
+    def test_metrics(self):
+        correct = np.array([[1, 1, 1], [1, 1, 0], [1, 0, 0], [0, 0, 0]], dtype=bool)
+        earned = correct * 5.0
+
+        result = item_analysis(earned, correct)
+
+        assert result['p_value'].tolist() == [0.75, 0.5, 0.25]
+        assert result['mean_score'].tolist() == [3.75, 2.5, 1.25]
+        # 정답자가 총점도 높은 문항은 변별도 양수
+        assert (result['discrimination'] > 0).all()
+        totals = earned.sum(axis=1)
+        expected_alpha = 3 / 2 * (1 - earned.var(axis=0, ddof=1).sum() / totals.var(ddof=1))
+        assert result['cronbach_alpha'] == pytest.approx(expected_alpha)
+
+    def test_constant_item_has_no_discrimination(self):
+        correct = np.array([[1, 1], [1, 0]], dtype=bool)
+
+        result = item_analysis(correct * 1.0, correct)
+
+        assert np.isnan(result['discrimination'][0])
+
+    def test_option_counts(self):
+        assert option_counts([0, 0, 1, 0], [7, 8, 9, 7]) == {(0, 7): 2, (0, 8): 1, (1, 9): 1}
+        assert option_counts([], []) == {}
+
+    def test_large_matrix_compute_time(self):
+        """학생 10,000명 x 200문항 계산은 1초 이내"""
+        rng = np.random.default_rng(0)
+        correct = rng.random((10_000, 200)) < 0.6
+        earned = correct * 5.0
+        selected_columns, selected_options = rng.integers(0, 200, 2_000_000), rng.integers(1, 800, 2_000_000)
+
+        started = time.perf_counter()
+        result = item_analysis(earned, correct)
+        option_counts(selected_columns, selected_options)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 1.0
+        assert result['p_value'].shape == (200,)
+
+
+@pytest.mark.django_db
+class TestItemAnalysisAPI:
+    """문항 분석 API 테스트"""
+
+    def test_item_analysis(self, api_client, teacher_user, examination, questions):
+        for answers in [('A', 'A'), ('A', 'B'), ('A', 'B'), ('B', 'B')]:
+            create_submission(examination, questions, answers)
+        api_client.force_authenticate(user=teacher_user)
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/item-analysis/')
+
+        assert response.status_code == 200
+        assert response.data['student_count'] == 4
+        assert response.data['question_count'] == 2
+        first, second = response.data['items']
+        assert first['question_id'] == questions[0].id
+        assert first['p_value'] == 0.75
+        assert second['p_value'] == 0.25
+        assert first['discrimination'] > 0
+        assert [(option['option'], option['count'], option['ratio']) for option in first['options']] == [
+            ('A', 3, 0.75), ('B', 1, 0.25)
+        ]
+        assert response.data['cronbach_alpha'] is not None
+
+    def test_cached_until_next_submission(self, api_client, teacher_user, examination, questions):
+        create_submission(examination, questions, ('A', 'A'))
+        api_client.force_authenticate(user=teacher_user)
+        api_client.get(f'/api/v1/scores/exam/{examination.id}/item-analysis/')
+
+        new_score = create_submission(examination, questions, ('B', 'B'))
+        cached = api_client.get(f'/api/v1/scores/exam/{examination.id}/item-analysis/')
+        ExamStatisticsService.record_test_scores([new_score])
+        refreshed = api_client.get(f'/api/v1/scores/exam/{examination.id}/item-analysis/')
+
+        assert cached.data['student_count'] == 1
+        assert refreshed.data['student_count'] == 2
+
+    def test_no_submissions(self, api_client, teacher_user, examination):
+        api_client.force_authenticate(user=teacher_user)
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/item-analysis/')
+
+        assert response.status_code == 200
+        assert response.data['student_count'] == 0
+        assert response.data['items'][0]['p_value'] is None
+        assert response.data['cronbach_alpha'] is None
+
+    def test_student_forbidden(self, api_client, examination):
+        student = UserProfile.objects.create_user(username='student_item_x', password='testpass123')
+        api_client.force_authenticate(user=student)
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/item-analysis/')
+
+        assert response.status_code == 403
@@ -0,0 +1,268 @@
+"""
+Regrade API Tests.
+정답 변경 후 시험 재채점 API/management command 테스트.
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.models import ExaminationInfo, ExamPaperInfo, RegradeJob
+from examination.services import ExamRegradeService
+from testpaper.models import TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(
+        username='teacher_regrade', password='testpass123', user_type='teacher', nick_name='Regrade Teacher'
+    )
+
+
+@pytest.fixture
+def another_teacher(db):
+    return UserProfile.objects.create_user(
+        username='teacher2_regrade', password='testpass123', user_type='teacher', nick_name='Another Teacher'
+    )
+
+
+@pytest.fixture
+def subject(db):
+    return SubjectInfo.objects.create(subject_name='Regrade Subject')
+
+
+@pytest.fixture
+def question(db, teacher_user, subject):
+    """정답이 잘못 지정된 객관식 문제 (A가 정답으로 등록됨)"""
+    question = TestQuestionInfo.objects.create(
+        name='올바른 것은?', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+    )
+    OptionInfo.objects.create(test_question=question, option='A', is_right=True)
+    OptionInfo.objects.create(test_question=question, option='B', is_right=False)
+    return question
+
+
+@pytest.fixture
+def essay_question(db, teacher_user, subject):
+    return TestQuestionInfo.objects.create(
+        name='서술하시오', subject=subject, score=5, tq_type='jd', create_user=teacher_user
+    )
+
+
+@pytest.fixture
+def examination(db, teacher_user, subject, question, essay_question):
+    paper = TestPaperInfo.objects.create(
+        name='Regrade Paper', subject=subject, total_score=15, passing_score=9, question_count=2,
+        create_user=teacher_user,
+    )
+    TestPaperTestQ.objects.create(test_paper=paper, test_question=question, score=10, order=1)
+    TestPaperTestQ.objects.create(test_paper=paper, test_question=essay_question, score=5, order=2)
+
+    start_time = timezone.now() - timedelta(days=1)
+    exam = ExaminationInfo.objects.create(
+        name='Regrade Exam', subject=subject, start_time=start_time, end_time=start_time + timedelta(hours=2),
+        exam_state='2', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    return exam
+
+
+@pytest.fixture
+def async_submit(settings):
+    """비동기 제출(채점 worker 운영) 환경"""
+    settings.ASYNC_SUBMIT_ENABLED = True
+
+
+def create_submissions(examination, question, essay_question, count):
+    """B를 선택한 제출 count건 (첫 번째 학생은 서술형 수동 채점 3점)"""
+    paper = examination.exampaperinfo_set.first().paper
+    option_a = OptionInfo.objects.get(test_question=question, option='A')
+    option_b = OptionInfo.objects.get(test_question=question, option='B')
+
+    scores = []
+    for idx in range(count):
+        user = UserProfile.objects.create_user(
+            username=f'student_regrade_{idx}', password='testpass123', user_type='student'
+        )
+        student = StudentsInfo.objects.create(user=user, student_name=f'Student {idx}', student_id=f'2025{idx:04d}')
+        selected = option_a.id if idx % 2 else option_b.id
+        is_correct = selected == option_a.id
+        detail_records = {
+            str(question.id): {
+                'answer': '', 'selected_options': [selected], 'is_correct': is_correct,
+                'score': 10 if is_correct else 0, 'max_score': 10,
+            },
+            str(essay_question.id): {
+                'answer': '답안', 'selected_options': [], 'is_correct': False, 'score': 0, 'max_score': 5,
+            },
+        }
+        if idx == 0:
+            detail_records[str(essay_question.id)].update({'score': 3, 'manual_graded': True})
+        scores.append(TestScores.objects.create(
+            exam=examination, user=student, test_paper=paper, is_submitted=True,
+            start_time=timezone.now() - timedelta(hours=2), submit_time=timezone.now() - timedelta(hours=1),
+            test_score=sum(record['score'] for record in detail_records.values()),
+            detail_records=detail_records,
+        ))
+    return scores
+
+
+def fix_answer_key(question):
+    """정답을 A -> B로 수정"""
+    OptionInfo.objects.filter(test_question=question, option='A').update(is_right=False)
+    option_b = OptionInfo.objects.get(test_question=question, option='B')
+    option_b.is_right = True
+    option_b.save()
+
+
+@pytest.mark.django_db
+class TestRegradeAPI:
+    """재채점 API 테스트"""
+
+    def test_regrade_after_answer_key_change(
+        self, async_submit, api_client, teacher_user, examination, question, essay_question
+    ):
+        """정답 수정 후 재채점 시 성적 갱신, 수동 채점 점수 유지"""
+        scores = create_submissions(examination, question, essay_question, 4)
+        fix_answer_key(question)
+        api_client.force_authenticate(user=teacher_user)
+
+        response = api_client.post(f'/api/v1/scores/exam/{examination.id}/regrade/')
+
+        # 요청 안에서는 접수만 하고 worker가 처리
+        assert response.status_code == 202
+        assert response.data['status'] == RegradeJob.STATUS_PENDING
+        assert TestScores.objects.get(id=scores[0].id).test_score == 3
+        assert ExamRegradeService.process_next() == 1
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/regrade/')
+        assert response.data['status'] == RegradeJob.STATUS_DONE
+        assert response.data['processed_count'] == 4
+        assert response.data['updated_count'] == 4
+
+        first = TestScores.objects.get(id=scores[0].id)
+        assert first.test_score == 13  # B 선택(10) + 수동 채점(3)
+        assert first.detail_records[str(question.id)]['is_correct'] is True
+        assert first.detail_records[str(essay_question.id)]['manual_graded'] is True
+
+        second = TestScores.objects.get(id=scores[1].id)
+        assert second.test_score == 0
+        assert second.detail_records[str(question.id)]['is_correct'] is False
+
+    def test_regrade_without_change(
+        self, async_submit, api_client, teacher_user, examination, question, essay_question
+    ):
+        """정답이 바뀌지 않았으면 변경 없음"""
+        create_submissions(examination, question, essay_question, 2)
+        api_client.force_authenticate(user=teacher_user)
+
+        api_client.post(f'/api/v1/scores/exam/{examination.id}/regrade/')
+        ExamRegradeService.process_next()
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/regrade/')
+        assert response.status_code == 200
+        assert response.data['updated_count'] == 0
+
+    def test_pending_job_reused(self, async_submit, api_client, teacher_user, examination):
+        """처리 전 중복 요청은 같은 작업 반환, 대기열이 비면 0"""
+        api_client.force_authenticate(user=teacher_user)
+
+        first = api_client.post(f'/api/v1/scores/exam/{examination.id}/regrade/')
+        second = api_client.post(f'/api/v1/scores/exam/{examination.id}/regrade/')
+
+        assert first.data['job_id'] == second.data['job_id']
+        assert ExamRegradeService.process_next() == 1
+        assert ExamRegradeService.process_next() == 0
+
+    def test_regrade_inline_without_async_submit(
+        self, api_client, teacher_user, examination, question, essay_question
+    ):
+        """비동기 제출이 꺼져 있으면 채점 worker 없이 요청 안에서 재채점"""
+        scores = create_submissions(examination, question, essay_question, 2)
+        fix_answer_key(question)
+        api_client.force_authenticate(user=teacher_user)
+
+        response = api_client.post(f'/api/v1/scores/exam/{examination.id}/regrade/')
+
+        assert response.status_code == 200
+        assert response.data['status'] == RegradeJob.STATUS_DONE
+        assert response.data['updated_count'] == 2
+        assert TestScores.objects.get(id=scores[0].id).test_score == 13
+        assert ExamRegradeService.process_next() == 0
+
+    def test_legacy_record_without_answer_kept(self, examination, question, essay_question):
+        """선택 옵션이 기록되지 않은 이전 제출은 기존 채점 결과 유지"""
+        scores = create_submissions(examination, question, essay_question, 2)
+        records = scores[1].detail_records
+        records[str(question.id)].update({'answer': '', 'selected_options': []})
+        TestScores.objects.filter(pk=scores[1].pk).update(detail_records=records)
+        fix_answer_key(question)
+
+        ExamRegradeService.regrade(examination.id)
+
+        legacy = TestScores.objects.get(id=scores[1].id)
+        assert legacy.test_score == 10
+        assert legacy.detail_records[str(question.id)]['is_correct'] is True
+        assert TestScores.objects.get(id=scores[0].id).test_score == 13
+
+    def test_manual_grade_during_regrade_kept(self, examination, question, essay_question):
+        """재채점 대상 조회 이후 수동 채점된 점수는 chunk를 잠근 뒤 다시 읽어 유지"""
+        scores = create_submissions(examination, question, essay_question, 2)
+        fix_answer_key(question)
+
+        def manual_grade_between_chunks(processed, updated, total):
+            if processed == 1:
+                records = scores[1].detail_records
+                records[str(essay_question.id)].update({'score': 4, 'manual_graded': True})
+                TestScores.objects.filter(pk=scores[1].pk).update(detail_records=records, test_score=14)
+
+        ExamRegradeService.regrade(examination.id, chunk_size=1, on_progress=manual_grade_between_chunks)
+
+        second = TestScores.objects.get(id=scores[1].id)
+        assert second.test_score == 4  # A 선택(정답 수정 후 0) + 수동 채점(4)
+        assert second.detail_records[str(essay_question.id)]['manual_graded'] is True
+
+    def test_regrade_not_creator(self, api_client, another_teacher, examination):
+        api_client.force_authenticate(user=another_teacher)
+
+        response = api_client.post(f'/api/v1/scores/exam/{examination.id}/regrade/')
+
+        assert response.status_code == 403
+
+    def test_regrade_not_found(self, api_client, teacher_user):
+        api_client.force_authenticate(user=teacher_user)
+
+        response = api_client.post('/api/v1/scores/exam/99999/regrade/')
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestRegradeCommand:
+    """재채점 management command 테스트"""
+
+    def test_regrade_in_chunks(self, examination, question, essay_question):
+        """chunk 단위로 처리하고 chunk마다 진행 상황 출력"""
+        create_submissions(examination, question, essay_question, 5)
+        fix_answer_key(question)
+        out = StringIO()
+
+        call_command('regrade_exam', examination.id, '--chunk-size', '2', stdout=out)
+
+        output = out.getvalue()
+        assert '2/5' in output
+        assert '4/5' in output
+        assert '5/5' in output
+        assert '5건 변경' in output
+        scores = TestScores.objects.filter(exam=examination).order_by('id')
+        assert [score.test_score for score in scores] == [13, 0, 10, 0, 10]
@@ -0,0 +1,137 @@
+"""
+Score Distribution API Tests.
+시험 성적 분포/백분위 API 테스트.
+"""
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from examination.analytics import percentile_ranks, score_distribution
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from examination.services import ExamStatisticsService
+from testpaper.models import TestPaperInfo, TestScores
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(username='teacher_dist', password='testpass123', user_type='teacher')
+
+
+@pytest.fixture
+def examination(db, teacher_user):
+    subject = SubjectInfo.objects.create(subject_name='Distribution Subject')
+    paper = TestPaperInfo.objects.create(
+        name='Distribution Paper', subject=subject, total_score=100, passing_score=60, question_count=1,
+        create_user=teacher_user,
+    )
+    start_time = timezone.now() - timedelta(days=1)
+    exam = ExaminationInfo.objects.create(
+        name='Distribution Exam', subject=subject, start_time=start_time, end_time=start_time + timedelta(hours=2),
+        exam_state='2', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    return exam
+
+
+def create_scores(examination, scores):
+    paper = examination.exampaperinfo_set.first().paper
+    created = []
+    for score in scores:
+        idx = StudentsInfo.objects.count()
+        user = UserProfile.objects.create_user(username=f'student_dist_{idx}', password='testpass123')
+        student = StudentsInfo.objects.create(user=user, student_name=f'Student {idx}', student_id=f'2025100{idx}')
+        ExamStudentsInfo.objects.create(exam=examination, student=student)
+        created.append(TestScores.objects.create(
+            exam=examination, user=student, test_paper=paper, is_submitted=True, test_score=score,
+            start_time=timezone.now() - timedelta(hours=2), submit_time=timezone.now() - timedelta(hours=1),
+        ))
+    return created
+
+
+class TestScoreAnalytics:
+    """NumPy 분포 계산 테스트"""
+
+    def test_percentile_ranks_with_ties(self):
+        ranks = percentile_ranks([50, 70, 70, 90])
+        assert ranks.tolist() == [12.5, 50.0, 50.0, 87.5]
+
+    def test_distribution_metrics(self):
+        scores = np.array([40, 55, 60, 75, 90, 100])
+
+        result = score_distribution(scores, total_score=100, buckets=10)
+
+        assert result['mean'] == pytest.approx(70.0)
+        assert result['median'] == pytest.approx(67.5)
+        assert result['std_deviation'] == pytest.approx(round(float(scores.std()), 2))
+        assert result['quartiles'] == {'q1': 56.25, 'q2': 67.5, 'q3': 86.25}
+        assert [bucket['count'] for bucket in result['histogram']] == [0, 0, 0, 0, 1, 1, 1, 1, 0, 2]
+        assert result['histogram'][9] == {'range_start': 90.0, 'range_end': 100.0, 'count': 2}
+
+    def test_empty_scores(self):
+        result = score_distribution([], total_score=100)
+
+        assert result['median'] == 0.0
+        assert sum(bucket['count'] for bucket in result['histogram']) == 0
+        assert result['percentile_ranks'].size == 0
+
+
+@pytest.mark.django_db
+class TestScoreDistributionAPI:
+    """성적 분포 API 테스트"""
+
+    def test_distribution(self, api_client, teacher_user, examination):
+        create_scores(examination, [40, 60, 80, 100])
+        api_client.force_authenticate(user=teacher_user)
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/distribution/')
+
+        assert response.status_code == 200
+        assert response.data['submitted_count'] == 4
+        assert response.data['average_score'] == 70.0
+        assert response.data['median'] == 70.0
+        assert response.data['quartiles']['q1'] == 55.0
+        students = response.data['students']
+        assert [student['score'] for student in students] == [100, 80, 60, 40]
+        assert [student['percentile_rank'] for student in students] == [87.5, 62.5, 37.5, 12.5]
+
+    def test_cached_until_next_submission(self, api_client, teacher_user, examination, django_assert_num_queries):
+        create_scores(examination, [40, 60])
+        api_client.force_authenticate(user=teacher_user)
+        api_client.get(f'/api/v1/scores/exam/{examination.id}/distribution/')
+
+        # exam, 작성자, 통계 row (성적 조회 없음)
+        with django_assert_num_queries(3):
+            api_client.get(f'/api/v1/scores/exam/{examination.id}/distribution/')
+
+        (new_score,) = create_scores(examination, [100])
+        ExamStatisticsService.record_test_scores([new_score])
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/distribution/')
+        assert response.data['submitted_count'] == 3
+        assert len(response.data['students']) == 3
+
+    def test_no_submissions(self, api_client, teacher_user, examination):
+        api_client.force_authenticate(user=teacher_user)
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/distribution/')
+
+        assert response.status_code == 200
+        assert response.data['students'] == []
+        assert response.data['std_deviation'] == 0.0
+
+    def test_not_creator(self, api_client, examination):
+        other = UserProfile.objects.create_user(username='teacher_dist2', password='testpass123', user_type='teacher')
+        api_client.force_authenticate(user=other)
+
+        response = api_client.get(f'/api/v1/scores/exam/{examination.id}/distribution/')
+
+        assert response.status_code == 403
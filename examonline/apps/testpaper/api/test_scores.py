@@ -242,6 +242,7 @@ class TestExamStatistics:
         # 학생들 등록
         ExamStudentsInfo.objects.create(exam=examination, student=student_user.studentsinfo)
         ExamStudentsInfo.objects.create(exam=examination, student=student_user2.studentsinfo)
+        ExaminationInfo.objects.filter(pk=examination.pk).update(student_num=2)
 
         # student2 성적 추가 (불합격)
         TestScores.objects.create(
@@ -272,6 +273,7 @@ class TestExamStatistics:
     def test_exam_statistics_no_submissions(self, api_client, teacher_user, examination, student_user):
         """제출 없는 경우 통계"""
         ExamStudentsInfo.objects.create(exam=examination, student=student_user.studentsinfo)
+        ExaminationInfo.objects.filter(pk=examination.pk).update(student_num=1)
 
         api_client.force_authenticate(user=teacher_user)
         response = api_client.get(f'/api/v1/scores/exam/{examination.id}/statistics/')
@@ -283,6 +285,20 @@ class TestExamStatistics:
         assert response.data['average_score'] == 0
         assert response.data['pass_count'] == 0
 
+    def test_exam_statistics_follow_passing_score(self, api_client, teacher_user, examination, submitted_score):
+        """시험지 합격 점수를 바꾸면 합격 인원을 새 기준으로 재집계"""
+        api_client.force_authenticate(user=teacher_user)
+        url = f'/api/v1/scores/exam/{examination.id}/statistics/'
+        assert api_client.get(url).data['pass_count'] == 1
+
+        paper = examination.exampaperinfo_set.first().paper
+        paper.passing_score = submitted_score.test_score + 1
+        paper.save()
+
+        response = api_client.get(url)
+        assert response.data['pass_count'] == 0
+        assert response.data['fail_count'] == 1
+
     def test_exam_statistics_forbidden_for_student(self, api_client, student_user, examination):
         """학생은 통계 조회 불가"""
         api_client.force_authenticate(user=student_user)
@@ -3,7 +3,7 @@ Test Paper Management API views.
 """
 
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import Prefetch, Sum
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -11,15 +11,18 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from core.api.permissions import IsTeacher, IsExamCreator
+from examination.answer_key import touch_papers
 from testpaper.api.filters import TestPaperFilter
 from testpaper.api.serializers import (
     AddQuestionsSerializer,
+    AutoAssembleSerializer,
     TestPaperCreateSerializer,
     TestPaperDetailSerializer,
     TestPaperListSerializer,
     TestPaperUpdateSerializer,
 )
 from testpaper.models import TestPaperInfo, TestPaperTestQ
+from testpaper.services import InsufficientQuestionsError, PaperAssemblyService
 from testquestion.api.serializers import QuestionDetailSerializer
 
 
@@ -73,7 +76,7 @@ class TestPaperViewSet(viewsets.ModelViewSet):
         """
         Action별 Permission 설정.
         """
-        if self.action in ['create']:
+        if self.action in ['create', 'auto_assemble']:
             return [IsAuthenticated(), IsTeacher()]
         elif self.action in ['update', 'partial_update', 'destroy', 'add_questions', 'remove_question']:
             return [IsAuthenticated(), IsExamCreator()]
@@ -93,6 +96,8 @@ class TestPaperViewSet(viewsets.ModelViewSet):
             return TestPaperUpdateSerializer
         elif self.action == 'add_questions':
             return AddQuestionsSerializer
+        elif self.action == 'auto_assemble':
+            return AutoAssembleSerializer
         return TestPaperDetailSerializer
 
     @extend_schema(
@@ -180,8 +185,9 @@ class TestPaperViewSet(viewsets.ModelViewSet):
                     )
                 )
 
-            # 한 번의 쿼리로 모두 생성
+            # 한 번의 쿼리로 모두 생성 (bulk_create는 signal이 없으므로 정답 version 직접 갱신)
             TestPaperTestQ.objects.bulk_create(paper_questions)
+            touch_papers([paper.id])
 
             # total_score, question_count 재계산
             self._update_paper_stats(paper)
@@ -219,6 +225,42 @@ class TestPaperViewSet(viewsets.ModelViewSet):
         paper.refresh_from_db()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @extend_schema(
+        tags=['papers'],
+        summary='시험지 자동 출제',
+        description=(
+            '과목과 blueprint(문제 유형 x 난이도별 문항 수)에 맞는 문제를 무작위로 선택하여 시험지를 생성합니다. '
+            '목표 총점은 문제 점수 비율로 배점합니다. 교사만 가능하며, 본인 문제와 공유 문제에서 선택합니다.'
+        ),
+        request=AutoAssembleSerializer,
+        responses={201: TestPaperDetailSerializer},
+    )
+    @action(detail=False, methods=['post'], url_path='auto-assemble')
+    def auto_assemble(self, request):
+        """
+        blueprint로 시험지 자동 출제.
+        """
+        serializer = AutoAssembleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = dict(serializer.validated_data)
+        blueprint = data.pop('blueprint')
+        try:
+            paper = PaperAssemblyService.assemble(request.user, blueprint, **data)
+        except InsufficientQuestionsError as exc:
+            return Response({'blueprint': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 응답용 조회 (문제 정보까지 고정 query 수로 조회)
+        paper = TestPaperInfo.objects.select_related('subject', 'create_user').prefetch_related(
+            Prefetch(
+                'testpapertestq_set',
+                queryset=TestPaperTestQ.objects.select_related(
+                    'test_question__subject', 'test_question__create_user'
+                ),
+            )
+        ).get(pk=paper.pk)
+        return Response(TestPaperDetailSerializer(paper).data, status=status.HTTP_201_CREATED)
+
     def _update_paper_stats(self, paper):
         """
         시험지의 total_score와 question_count 재계산.
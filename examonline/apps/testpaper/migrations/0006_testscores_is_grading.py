@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testpaper', '0005_testscores_exam_testscores_is_submitted_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testscores',
+            name='is_grading',
+            field=models.BooleanField(default=False, verbose_name='채점 중 여부'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('examination', '0007_examinationinfo_exam_end_time_idx'),
+        ('testpaper', '0006_testscores_is_grading'),
+        ('user', '0003_alter_emailverifyrecord_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testscores',
+            name='is_auto_submitted',
+            field=models.BooleanField(default=False, verbose_name='자동 제출 여부'),
+        ),
+        migrations.AddIndex(
+            model_name='testscores',
+            index=models.Index(condition=models.Q(('is_submitted', False)), fields=['exam', 'is_submitted'], name='testscore_in_progress_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('examination', '0008_examstatistics'),
+        ('testpaper', '0007_testscores_is_auto_submitted_and_more'),
+        ('testquestion', '0005_rename_creat_user_testquestioninfo_create_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnswerRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('selected_options', models.JSONField(blank=True, default=list, verbose_name='선택 옵션 ID')),
+                ('is_correct', models.BooleanField(default=False, verbose_name='정답 여부')),
+                ('earned_score', models.IntegerField(default=0, verbose_name='득점')),
+                ('max_score', models.IntegerField(default=0, verbose_name='배점')),
+                ('manual_graded', models.BooleanField(default=False, verbose_name='수동 채점 여부')),
+                ('exam', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='examination.examinationinfo', verbose_name='시험 정보')),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answer_records', to='testquestion.testquestioninfo', verbose_name='문제')),
+                ('test_score', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answer_records', to='testpaper.testscores', verbose_name='학생 성적 정보')),
+            ],
+            options={
+                'verbose_name': '문항별 답안 기록',
+                'verbose_name_plural': '문항별 답안 기록',
+                'indexes': [models.Index(fields=['exam', 'question', 'is_correct'], name='answer_record_exam_q_idx'), models.Index(fields=['question', 'is_correct'], name='answer_record_question_idx')],
+                'constraints': [models.UniqueConstraint(fields=('test_score', 'question'), name='answer_record_score_question_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testpaper', '0008_answerrecord'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testpaperinfo',
+            name='key_version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='정답 version'),
+        ),
+    ]
@@ -0,0 +1,88 @@
+"""
+기존 제출 성적의 detail_records에서 문항별 답안 기록(AnswerRecord) 생성.
+
+0008_answerrecord 이전에 제출된 성적은 답안 기록이 없어 문항 분석/오답 통계에서 빠지므로,
+rebuild_answer_records command와 같은 변환으로 채운다.
+(migration은 이후 코드 변경과 무관하게 동작해야 하므로 AnswerRecordService.build 변환을 옮겨 historical model로 생성)
+성적이 많으면 migration 대신 `manage.py rebuild_answer_records --exam-id ...`로 나누어 실행할 수 있다.
+"""
+from itertools import islice
+
+from django.db import migrations
+
+CHUNK_SIZE = 1000
+
+
+def option_ids(values):
+    """옵션 ID 목록 정규화 (정수로 해석할 수 없는 값은 무시)"""
+    if isinstance(values, (str, int)):
+        values = [values]
+    elif not isinstance(values, (list, tuple)):
+        return []
+
+    ids = []
+    for value in values:
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, int):
+            ids.append(value)
+        elif str(value).strip().isdigit():
+            ids.append(int(str(value).strip()))
+    return ids
+
+
+def build_records(AnswerRecord, test_score_id, exam_id, detail_records):
+    """detail_records를 AnswerRecord 목록으로 변환 (채점 기록이 있는 문항만)"""
+    records = []
+    for question_id, record in (detail_records or {}).items():
+        if not isinstance(record, dict) or not str(question_id).isdigit():
+            continue
+        records.append(AnswerRecord(
+            test_score_id=test_score_id,
+            exam_id=exam_id,
+            question_id=int(question_id),
+            selected_options=option_ids(record.get('selected_options') or []),
+            is_correct=bool(record.get('is_correct')),
+            earned_score=record.get('score') or 0,
+            max_score=record.get('max_score') or 0,
+            manual_graded=bool(record.get('manual_graded')),
+        ))
+    return records
+
+
+def backfill_answer_records(apps, schema_editor):
+    TestScores = apps.get_model('testpaper', 'TestScores')
+    AnswerRecord = apps.get_model('testpaper', 'AnswerRecord')
+    TestQuestionInfo = apps.get_model('testquestion', 'TestQuestionInfo')
+
+    # 답안 기록이 이미 있는 성적(0008 이후 채점)은 건너뜀
+    scores = TestScores.objects.filter(is_submitted=True, is_grading=False).exclude(
+        id__in=AnswerRecord.objects.values('test_score_id')
+    )
+    rows = scores.values_list('id', 'exam_id', 'detail_records').order_by('pk').iterator(chunk_size=CHUNK_SIZE)
+    while chunk := list(islice(rows, CHUNK_SIZE)):
+        records = [
+            record
+            for test_score_id, exam_id, detail_records in chunk
+            for record in build_records(AnswerRecord, test_score_id, exam_id, detail_records)
+        ]
+        # 오래된 기록에 남은 삭제된 문제는 제외 (FK)
+        question_ids = set(
+            TestQuestionInfo.objects.filter(id__in={record.question_id for record in records}).values_list(
+                'id', flat=True
+            )
+        )
+        AnswerRecord.objects.bulk_create(
+            [record for record in records if record.question_id in question_ids], batch_size=CHUNK_SIZE
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testpaper', '0009_testpaperinfo_key_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_answer_records, migrations.RunPython.noop),
+    ]
@@ -18,6 +18,8 @@ class TestPaperInfo(models.Model):
     create_user = models.ForeignKey(UserProfile, on_delete=models.SET_NULL, null=True, verbose_name='작성자')
     create_time = models.DateTimeField(default=timezone.now, verbose_name='생성 시간')
     edit_time = models.DateTimeField(auto_now=True, verbose_name='수정 시간')
+    # 정답 index cache version (문제/선택지/배점 변경 시 signal에서 증가)
+    key_version = models.PositiveIntegerField(default=0, editable=False, verbose_name='정답 version')
 
     class Meta:
         verbose_name = '시험지 정보'
@@ -57,6 +59,8 @@ class TestScores(models.Model):
     start_time = models.DateTimeField(null=True, blank=True, verbose_name='시험 시작 시간')
     submit_time = models.DateTimeField(null=True, blank=True, verbose_name='제출 시간')
     is_submitted = models.BooleanField(default=False, verbose_name='제출 여부')
+    is_grading = models.BooleanField(default=False, verbose_name='채점 중 여부')
+    is_auto_submitted = models.BooleanField(default=False, verbose_name='자동 제출 여부')
     time_used = models.IntegerField(default=0, verbose_name='소요 시간(분)')
 
     class Meta:
@@ -65,7 +69,42 @@ class TestScores(models.Model):
         indexes = [
             models.Index(fields=['user', 'test_paper']),
             models.Index(fields=['exam', 'user']),
+            # 미제출 응시 기록 조회용 (시간 초과 자동 제출)
+            models.Index(
+                fields=['exam', 'is_submitted'], name='testscore_in_progress_idx', condition=models.Q(is_submitted=False)
+            ),
         ]
 
     def __str__(self):
         return self.user.student_name
+
+
+# 문항별 답안 기록 (detail_records 정규화, 분석용)
+class AnswerRecord(models.Model):
+    test_score = models.ForeignKey(
+        TestScores, on_delete=models.CASCADE, related_name='answer_records', verbose_name='학생 성적 정보')
+    exam = models.ForeignKey(
+        'examination.ExaminationInfo', on_delete=models.CASCADE, null=True, blank=True, verbose_name='시험 정보')
+    question = models.ForeignKey(
+        TestQuestionInfo, on_delete=models.CASCADE, related_name='answer_records', verbose_name='문제')
+    selected_options = models.JSONField(default=list, blank=True, verbose_name='선택 옵션 ID')
+    is_correct = models.BooleanField(default=False, verbose_name='정답 여부')
+    earned_score = models.IntegerField(default=0, verbose_name='득점')
+    max_score = models.IntegerField(default=0, verbose_name='배점')
+    manual_graded = models.BooleanField(default=False, verbose_name='수동 채점 여부')
+
+    class Meta:
+        verbose_name = '문항별 답안 기록'
+        verbose_name_plural = verbose_name
+        constraints = [
+            models.UniqueConstraint(fields=['test_score', 'question'], name='answer_record_score_question_uniq'),
+        ]
+        indexes = [
+            # 시험별 문항 정답률 집계
+            models.Index(fields=['exam', 'question', 'is_correct'], name='answer_record_exam_q_idx'),
+            # 문항별 정답률 집계 (시험 전체)
+            models.Index(fields=['question', 'is_correct'], name='answer_record_question_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.test_score_id}:{self.question_id}'
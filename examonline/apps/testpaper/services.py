@@ -0,0 +1,134 @@
+"""
+Test Paper services.
+"""
+import numpy as np
+from django.db import transaction
+
+from testpaper.models import TestPaperInfo, TestPaperTestQ
+from testquestion.services import QuestionPoolService, QuestionVisibilityService
+
+
+class InsufficientQuestionsError(Exception):
+    """출제 조건에 맞는 문제 수 부족"""
+
+    def __init__(self, tq_type, tq_degree, required, available):
+        self.tq_type = tq_type
+        self.tq_degree = tq_degree
+        self.required = required
+        self.available = available
+        super().__init__(
+            f'조건에 맞는 문제가 부족합니다 (유형 {tq_type}, 난이도 {tq_degree}: 필요 {required}개, 가능 {available}개).'
+        )
+
+
+class PaperAssemblyService:
+    """
+    시험지 자동 출제 서비스.
+
+    blueprint(유형 x 난이도별 문항 수)에 맞는 문제를 QuestionPoolService의 문제 id pool에서 무작위로 뽑고,
+    목표 총점을 문제 점수 비율로 배점하여 시험지와 시험지-문제 매핑을 한 transaction으로 생성한다.
+    뽑은 문제는 한 번의 query로 조회 범위/조건을 다시 확인하며, pool이 오래된 경우 pool을 다시 만들어 부족분만 다시 뽑는다.
+    """
+
+    MAX_ATTEMPTS = 3
+
+    @classmethod
+    def sample(cls, user, subject_id, blueprint, rng=None) -> list:
+        """
+        blueprint 항목별 무작위 문제 선택.
+
+        Args:
+            blueprint: [{'tq_type', 'tq_degree', 'count'}] (유형/난이도 조합 중복 없음)
+            rng: numpy Generator (기본: 새 Generator)
+
+        Returns:
+            list[tuple[int, int]]: blueprint 순서의 (문제 id, 문제 점수)
+
+        Raises:
+            InsufficientQuestionsError: 조건에 맞는 문제가 부족한 경우
+        """
+        rng = rng or np.random.default_rng()
+        counts = {(subject_id, item['tq_type'], item['tq_degree']): item['count'] for item in blueprint}
+        candidates = QuestionPoolService.candidates(user, counts)
+        # pool key별 {문제 id: 점수}
+        selected = {pool_key: {} for pool_key in counts}
+
+        for _ in range(cls.MAX_ATTEMPTS):
+            drawn = {}
+            for pool_key, count in counts.items():
+                missing = count - len(selected[pool_key])
+                if not missing:
+                    continue
+                pool = candidates[pool_key]
+                if selected[pool_key]:
+                    pool = pool[~np.isin(pool, list(selected[pool_key]))]
+                if len(pool) < missing:
+                    raise InsufficientQuestionsError(*pool_key[1:], count, len(pool) + len(selected[pool_key]))
+                drawn[pool_key] = rng.choice(pool, size=missing, replace=False).tolist()
+
+            rows = {
+                question_id: row
+                for question_id, *row in QuestionVisibilityService.visible(user).filter(
+                    pk__in=[question_id for question_ids in drawn.values() for question_id in question_ids]
+                ).values_list('id', 'subject_id', 'tq_type', 'tq_degree', 'score')
+            }
+            stale = set()
+            for pool_key, question_ids in drawn.items():
+                for question_id in question_ids:
+                    row = rows.get(question_id)
+                    if row is not None and tuple(row[:3]) == pool_key:
+                        selected[pool_key][question_id] = row[3]
+                    else:
+                        stale.add(pool_key)
+
+            if not stale:
+                return [item for pool_key in counts for item in selected[pool_key].items()]
+
+            # signal 없이 변경된 문제가 pool에 남아 있음 -> pool 재생성 후 부족분만 다시 선택
+            QuestionPoolService.invalidate(stale)
+            candidates.update(QuestionPoolService.candidates(user, stale))
+
+        pool_key = next(iter(stale))
+        raise InsufficientQuestionsError(*pool_key[1:], counts[pool_key], len(selected[pool_key]))
+
+    @staticmethod
+    def distribute(weights, total_score) -> list:
+        """
+        총점을 가중치(문제 점수) 비율로 배분.
+
+        문항당 1점을 먼저 배정하고 남은 점수를 비율로 나눈 뒤, 버림으로 남는 점수는 소수부가 큰 문항부터 1점씩 더한다.
+        total_score는 문항 수 이상이어야 한다.
+        """
+        weights = np.maximum(np.asarray(weights, dtype=float), 1)
+        extra = total_score - len(weights)
+        shares = extra * weights / weights.sum()
+        scores = np.floor(shares).astype(int)
+        remainder = extra - int(scores.sum())
+        scores[np.argsort(scores - shares, kind='stable')[:remainder]] += 1
+        return (scores + 1).tolist()
+
+    @classmethod
+    def assemble(cls, user, blueprint, total_score, rng=None, **paper_fields):
+        """
+        blueprint로 시험지 생성.
+
+        Args:
+            blueprint: [{'tq_type', 'tq_degree', 'count'}]
+            total_score: 목표 총점 (문항 수 이상)
+            paper_fields: name, subject, tp_degree, passing_score 등 TestPaperInfo field
+
+        Returns:
+            TestPaperInfo
+        """
+        picks = cls.sample(user, paper_fields['subject'].pk, blueprint, rng)
+        scores = cls.distribute([score for _, score in picks], total_score)
+
+        with transaction.atomic():
+            paper = TestPaperInfo.objects.create(
+                total_score=total_score, question_count=len(picks), create_user=user, **paper_fields
+            )
+            TestPaperTestQ.objects.bulk_create([
+                TestPaperTestQ(test_paper=paper, test_question_id=question_id, score=score, order=order)
+                for order, ((question_id, _), score) in enumerate(zip(picks, scores), start=1)
+            ])
+        return paper
@@ -3,8 +3,11 @@ Question Management API filters.
 """
 
 import django_filters
+from rest_framework import filters
+from rest_framework.settings import api_settings
 
 from testquestion.models import TestQuestionInfo
+from testquestion.services import QuestionSearchService
 
 
 class QuestionFilter(django_filters.FilterSet):
@@ -50,3 +53,23 @@ class QuestionFilter(django_filters.FilterSet):
             'created_before',
             'create_user',
         ]
+
+
+class QuestionSearchFilter(filters.SearchFilter):
+    """
+    문제 검색 backend.
+
+    search 검색어를 name ILIKE 대신 QuestionSearchService 전문 검색(GIN index)으로 처리하고,
+    ordering을 지정하지 않은 경우 검색 순위순(같은 순위는 기존 정렬)으로 정렬한다.
+    OrderingFilter 다음에 실행되어야 한다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        text = ' '.join(self.get_search_terms(request))
+        if not text:
+            return queryset
+
+        queryset = QuestionSearchService.search(queryset, text)
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by('-search_rank', *queryset.query.order_by)
+        return queryset
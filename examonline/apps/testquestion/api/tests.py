@@ -1,13 +1,16 @@
 """
 Question Management API tests.
 """
+from io import StringIO
 
 import pytest
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from testquestion.models import OptionInfo, TestQuestionInfo
+from testquestion.services import QuestionSearchService
 from user.models import SubjectInfo, UserProfile
 
 
@@ -312,3 +315,154 @@ class TestMyAndSharedEndpoints:
         assert response.status_code == status.HTTP_200_OK
 
 
+
+
+@pytest.mark.django_db
+class TestQuestionSearch:
+    """문제 전문 검색 테스트"""
+
+    @pytest.fixture
+    def questions(self, teacher_user, subject):
+        def create(name, options, is_share=False):
+            question = TestQuestionInfo.objects.create(
+                name=name, subject=subject, score=5, tq_type='xz', tq_degree='zd',
+                is_share=is_share, create_user=teacher_user,
+            )
+            for idx, option in enumerate(options):
+                OptionInfo.objects.create(test_question=question, option=option, is_right=idx == 0)
+            return question
+
+        return {
+            'equation': create('이차 방정식의 근을 구하시오', ['x = 2', 'x = 3']),
+            'option': create('다음 중 올바른 것은?', ['방정식은 등호를 포함한다', '부등식은 등호가 없다'], is_share=True),
+            'other': create('광합성의 산물은?', ['포도당', '이산화탄소']),
+        }
+
+    def _search(self, api_client, user, text, url_name='question-list', **params):
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse(url_name), {'search': text, **params})
+        assert response.status_code == status.HTTP_200_OK
+        return [item['id'] for item in response.data['results']]
+
+    def test_prefix_matches_word_with_particle(self, api_client, teacher_user, questions):
+        """조사가 붙은 단어도 prefix로 검색되고, 제목 일치가 선택지 일치보다 앞선다"""
+        ids = self._search(api_client, teacher_user, '방정식')
+        assert ids == [questions['equation'].id, questions['option'].id]
+
+    def test_all_terms_required(self, api_client, teacher_user, questions):
+        """여러 단어는 모두 포함해야 한다"""
+        ids = self._search(api_client, teacher_user, '방정식 근')
+        assert ids == [questions['equation'].id]
+
+    def test_explicit_ordering_overrides_rank(self, api_client, teacher_user, questions):
+        """ordering 지정 시 검색 순위 대신 지정한 정렬 사용"""
+        ids = self._search(api_client, teacher_user, '방정식', ordering='-create_time')
+        assert ids == [questions['option'].id, questions['equation'].id]
+
+    def test_cursor_pagination_keeps_rank_order(self, api_client, teacher_user, questions):
+        """cursor pagination에서도 검색 순위순으로 이어진다"""
+        api_client.force_authenticate(user=teacher_user)
+        first = api_client.get(reverse('question-list'), {'search': '방정식', 'cursor': '', 'page_size': 1}).data
+        second = api_client.get(first['next']).data
+        ids = [item['id'] for item in first['results'] + second['results']]
+        assert ids == [questions['equation'].id, questions['option'].id]
+
+    def test_symbols_only_returns_empty(self, api_client, teacher_user, questions):
+        """검색 가능한 단어가 없으면 빈 결과"""
+        assert self._search(api_client, teacher_user, '&|!') == []
+
+    def test_my_and_shared_endpoints(self, api_client, teacher_user, questions):
+        """내 문제/공유 문제 목록도 같은 검색 사용"""
+        assert self._search(api_client, teacher_user, '방정식', 'question-my') == [
+            questions['equation'].id, questions['option'].id,
+        ]
+        assert self._search(api_client, teacher_user, '방정식', 'question-shared') == [questions['option'].id]
+
+    def test_option_change_refreshes_vector(self, api_client, teacher_user, questions):
+        """선택지 수정/삭제 시 search_vector 갱신"""
+        option = questions['other'].optioninfo_set.get(option='포도당')
+        option.option = '글루코스'
+        option.save()
+        assert self._search(api_client, teacher_user, '글루코스') == [questions['other'].id]
+
+        option.delete()
+        assert self._search(api_client, teacher_user, '글루코스') == []
+
+    def test_rebuild_command_backfills_missing(self, api_client, teacher_user, questions):
+        """bulk 생성 등으로 비어 있는 search_vector를 command로 채운다"""
+        TestQuestionInfo.objects.update(search_vector=None)
+        assert self._search(api_client, teacher_user, '광합성') == []
+
+        call_command('rebuild_search_vectors', '--missing-only', stdout=StringIO())
+        assert self._search(api_client, teacher_user, '광합성') == [questions['other'].id]
+
+    def test_trigram_matches_substring(self, api_client, teacher_user, questions):
+        """pg_trgm이 있으면 단어 중간 일치도 검색"""
+        if not QuestionSearchService.trigram_enabled():
+            pytest.skip('pg_trgm extension이 설치되지 않은 DB')
+        assert questions['other'].id in self._search(api_client, teacher_user, '합성의')
+
+
+@pytest.mark.django_db
+class TestQuestionVisibility:
+    """문제 조회 범위(본인 문제 + 다른 교사 공유 문제) 테스트"""
+
+    @pytest.fixture
+    def bank(self, teacher_user, subject):
+        other = UserProfile.objects.create_user(username='teacher2', password='testpass123', user_type='teacher')
+
+        def create(name, owner, is_share=False, is_del=False):
+            return TestQuestionInfo.objects.create(
+                name=name, subject=subject, score=5, tq_type='xz', tq_degree='zd',
+                is_share=is_share, is_del=is_del, create_user=owner,
+            )
+
+        return {
+            'mine': create('mine', teacher_user),
+            'mine_shared': create('mine shared', teacher_user, is_share=True),
+            'other_shared': create('other shared', other, is_share=True),
+            'other_private': create('other private', other),
+            'deleted_shared': create('deleted shared', other, is_share=True, is_del=True),
+            'orphan_shared': create('orphan shared', None, is_share=True),
+        }
+
+    def _ids(self, api_client, user, **params):
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse('question-list'), params)
+        assert response.status_code == status.HTTP_200_OK
+        return [item['id'] for item in response.data['results']], response.data['count']
+
+    def test_teacher_list(self, api_client, teacher_user, bank):
+        """본인 문제와 공유 문제를 중복 없이 최신순으로 조회"""
+        ids, count = self._ids(api_client, teacher_user)
+        expected = ['orphan_shared', 'other_shared', 'mine_shared', 'mine']
+        assert ids == [bank[name].id for name in expected]
+        assert count == 4
+
+    def test_student_list(self, api_client, student_user, bank):
+        """학생은 공유 문제만 조회"""
+        ids, _ = self._ids(api_client, student_user)
+        assert ids == [bank[name].id for name in ['orphan_shared', 'other_shared', 'mine_shared']]
+
+    def test_filters_and_cursor_apply_to_union(self, api_client, teacher_user, bank):
+        """filter, 정렬, cursor pagination이 UNION ALL 목록에도 적용"""
+        ids, count = self._ids(api_client, teacher_user, is_share='true', ordering='create_time')
+        assert ids == [bank[name].id for name in ['mine_shared', 'other_shared', 'orphan_shared']]
+        assert count == 3
+
+        first = api_client.get(reverse('question-list'), {'cursor': '', 'page_size': 3}).data
+        second = api_client.get(first['next']).data
+        assert [item['id'] for item in first['results'] + second['results']] == [
+            bank[name].id for name in ['orphan_shared', 'other_shared', 'mine_shared', 'mine']
+        ]
+
+    def test_retrieve_scope(self, api_client, teacher_user, bank):
+        """단건 조회도 같은 조회 범위 (다른 교사의 비공유/삭제 문제는 404)"""
+        api_client.force_authenticate(user=teacher_user)
+        for name, expected in [
+            ('other_shared', status.HTTP_200_OK),
+            ('other_private', status.HTTP_404_NOT_FOUND),
+            ('deleted_shared', status.HTTP_404_NOT_FOUND),
+        ]:
+            response = api_client.get(reverse('question-detail', kwargs={'pk': bank[name].id}))
+            assert response.status_code == expected, name
@@ -2,15 +2,15 @@
 Question Management API views.
 """
 
-from django.db.models import Q
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
-from rest_framework import status, viewsets
+from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from core.api.permissions import IsQuestionOwner, IsTeacher
-from testquestion.api.filters import QuestionFilter
+from testquestion.api.filters import QuestionFilter, QuestionSearchFilter
 from testquestion.api.serializers import (
     QuestionCreateSerializer,
     QuestionDetailSerializer,
@@ -19,6 +19,7 @@ from testquestion.api.serializers import (
     QuestionUpdateSerializer,
 )
 from testquestion.models import TestQuestionInfo
+from testquestion.services import QuestionVisibilityService
 
 
 @extend_schema_view(
@@ -27,7 +28,7 @@ from testquestion.models import TestQuestionInfo
         summary='문제 목록 조회',
         description='필터링, 검색, 정렬을 지원하는 문제 목록 조회 API.',
         parameters=[
-            OpenApiParameter(name='search', description='문제 제목 검색'),
+            OpenApiParameter(name='search', description='문제 제목/선택지 전문 검색 (ordering 미지정 시 검색 순위순)'),
             OpenApiParameter(name='ordering', description='정렬 기준 (create_time, -create_time, score, -score)'),
         ],
     ),
@@ -44,12 +45,17 @@ class QuestionViewSet(viewsets.ModelViewSet):
     - 교사만 문제 생성/수정/삭제 가능
     - 학생은 공유된 문제만 조회 가능
     - Soft Delete 적용 (is_del=True)
+    - search: 제목/선택지 전문 검색 (QuestionSearchFilter)
     """
 
+    # 검색 순위 정렬이 기본 정렬보다 우선하도록 검색을 마지막에 적용
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, QuestionSearchFilter]
     filterset_class = QuestionFilter
     search_fields = ['name']
     ordering_fields = ['create_time', 'score', 'tq_degree', 'edit_time']
     ordering = ['-create_time']
+    # ?cursor= 요청 시 keyset pagination (공유 문제 등 깊은 page에서 OFFSET scan 방지)
+    cursor_pagination = True
 
     def get_queryset(self):
         """
@@ -61,17 +67,20 @@ class QuestionViewSet(viewsets.ModelViewSet):
         if getattr(self, 'swagger_fake_view', False):
             return TestQuestionInfo.objects.none()
 
-        user = self.request.user
-        base_qs = TestQuestionInfo.objects.filter(is_del=False)
-
-        if user.user_type == 'teacher':
-            # 교사: 본인 문제 + 공유 문제
-            return base_qs.filter(Q(create_user=user) | Q(is_share=True)).select_related(
-                'subject', 'create_user'
-            ).distinct()
-        else:
-            # 학생: 공유 문제만
-            return base_qs.filter(is_share=True).select_related('subject', 'create_user')
+        queryset = TestQuestionInfo.objects.select_related('subject', 'create_user')
+        if self.action == 'list':
+            # 목록은 filter 적용 후 filter_queryset에서 조회 범위 조건별 UNION ALL branch로 제한
+            return queryset
+        return QuestionVisibilityService.visible(self.request.user, queryset)
+
+    def filter_queryset(self, queryset):
+        """
+        목록 조회는 filter/검색/정렬 적용 후 조회 범위 조건별 UNION ALL로 실행.
+        """
+        queryset = super().filter_queryset(queryset)
+        if self.action == 'list':
+            queryset = QuestionVisibilityService.union(queryset, self.request.user)
+        return queryset
 
     def get_permissions(self):
         """
@@ -5,3 +5,7 @@ class TestquestionConfig(AppConfig):
     name = 'testquestion'
     # admin에서 app 이름 바꾸기
     verbose_name = '시험 문제 정보（TQ_Info）'
+
+    def ready(self):
+        # 전문 검색 search_vector 갱신 signal 등록
+        from testquestion import signals  # noqa: F401
@@ -0,0 +1,30 @@
+"""
+문제 전문 검색 vector 재생성 스크립트
+
+Usage:
+    uv run python manage.py rebuild_search_vectors [--missing-only] [--chunk-size 5000]
+"""
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = '문제 제목과 선택지로 전문 검색용 search_vector를 다시 계산 (bulk_create로 생성된 문제 backfill)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--missing-only', action='store_true', help='search_vector가 없는 문제만 처리')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='한 번에 갱신할 문제 수')
+
+    def handle(self, *args, **options):
+        from testquestion.models import TestQuestionInfo
+        from testquestion.services import QuestionSearchService
+
+        questions = TestQuestionInfo.objects.all()
+        if options['missing_only']:
+            questions = questions.filter(search_vector__isnull=True)
+
+        processed = 0
+        for count in QuestionSearchService.rebuild(questions, options['chunk_size']):
+            processed += count
+            self.stdout.write(f'  {processed}건 처리')
+
+        self.stdout.write(self.style.SUCCESS(f'검색 vector 재생성 완료: {processed}건'))
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:23
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+# pg_trgm을 설치할 수 있는 경우에만 문제 제목 trigram index 생성
+# (extension이 없거나 생성 권한이 없는 DB에서는 전문 검색만 사용)
+CREATE_TRIGRAM_INDEX = '''
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS question_name_trgm_idx
+            ON testquestion_testquestioninfo USING gin (name gin_trgm_ops);
+    END IF;
+EXCEPTION WHEN insufficient_privilege THEN
+    RAISE NOTICE 'pg_trgm extension을 생성할 권한이 없어 trigram index를 건너뜀';
+END $$;
+'''
+
+# 기존 문제의 search_vector 채우기 (QuestionSearchService.vector()와 같은 계산식, GIN index 생성 전에 실행)
+FILL_SEARCH_VECTOR = '''
+UPDATE testquestion_testquestioninfo AS question
+SET search_vector = (
+    setweight(to_tsvector('simple'::regconfig, COALESCE(question.name, '')), 'A')
+    || setweight(to_tsvector('simple'::regconfig, COALESCE((
+        SELECT string_agg(choice.option, ' ' ORDER BY choice.id)
+        FROM testquestion_optioninfo AS choice
+        WHERE choice.test_question_id = question.id
+    ), '')), 'B')
+);
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testquestion', '0005_rename_creat_user_testquestioninfo_create_user'),
+        ('user', '0003_alter_emailverifyrecord_id_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testquestioninfo',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='검색 vector'),
+        ),
+        migrations.RunSQL(FILL_SEARCH_VECTOR, reverse_sql=migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='testquestioninfo',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='question_search_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGRAM_INDEX, reverse_sql='DROP INDEX IF EXISTS question_name_trgm_idx;'),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testquestion', '0006_question_search_vector'),
+        ('user', '0003_alter_emailverifyrecord_id_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='testquestioninfo',
+            name='testquestio_is_del_442017_idx',
+        ),
+        migrations.AddIndex(
+            model_name='testquestioninfo',
+            index=models.Index(condition=models.Q(('is_del', False)), fields=['create_user', '-create_time', '-id'], name='question_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testquestioninfo',
+            index=models.Index(condition=models.Q(('is_del', False), ('is_share', True)), fields=['-create_time', '-id'], name='question_shared_idx'),
+        ),
+    ]
@@ -1,4 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 from user.models import UserProfile, SubjectInfo
@@ -21,13 +24,22 @@ class TestQuestionInfo(models.Model):
     create_time = models.DateTimeField(default=timezone.now, verbose_name='생성 시간')
     create_user = models.ForeignKey(UserProfile, on_delete=models.SET_NULL, null=True, verbose_name='출제자')
     edit_time = models.DateTimeField(auto_now=True, verbose_name='수정 시간')
+    # 제목 + 선택지 전문 검색용 (QuestionSearchService가 갱신)
+    search_vector = SearchVectorField(null=True, editable=False, verbose_name='검색 vector')
 
     class Meta:
         verbose_name = '시험 문제 정보'
         verbose_name_plural = verbose_name
         indexes = [
             models.Index(fields=['subject', 'tq_type', 'tq_degree']),
-            models.Index(fields=['is_del', 'is_share']),
+            # 조회 범위(QuestionVisibilityService) branch별 최신순 index (삭제된 문제 제외)
+            models.Index(
+                fields=['create_user', '-create_time', '-id'], condition=Q(is_del=False), name='question_owner_idx'
+            ),
+            models.Index(
+                fields=['-create_time', '-id'], condition=Q(is_del=False, is_share=True), name='question_shared_idx'
+            ),
+            GinIndex(fields=['search_vector'], name='question_search_idx'),
         ]
 
     def __str__(self):
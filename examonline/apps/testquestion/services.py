@@ -0,0 +1,238 @@
+"""
+Question services.
+"""
+import re
+import uuid
+from dataclasses import dataclass
+from functools import cache, lru_cache
+
+import numpy as np
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.core.cache import cache as django_cache
+from django.db import connection
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Cast, Coalesce
+
+from core.querysets import union_all
+from testquestion.models import OptionInfo, TestQuestionInfo
+
+_SEARCH_TERM = re.compile(r'\w+')
+
+
+class QuestionVisibilityService:
+    """
+    문제 조회 범위 서비스.
+
+    - 교사: 본인 문제 + 다른 교사의 공유 문제
+    - 학생: 공유 문제
+
+    두 조건은 서로 겹치지 않도록 나누어(공유 문제 중 본인 문제 제외) 단건 조회는 DISTINCT 없는 OR로,
+    목록 조회는 각 조건을 partial index(question_owner_idx, question_shared_idx)로 읽는 UNION ALL로 실행한다.
+    """
+
+    @staticmethod
+    def branches(user):
+        """조회 범위를 이루는 서로 겹치지 않는 조건 목록"""
+        if user.user_type == 'teacher':
+            return [Q(create_user=user), Q(is_share=True) & ~Q(create_user=user)]
+        return [Q(is_share=True)]
+
+    @classmethod
+    def visible(cls, user, queryset=None):
+        """
+        사용자가 조회할 수 있는 문제 (삭제 제외).
+
+        단건 조회/수정 등 목록 외 조회의 기준 queryset으로 사용한다.
+        """
+        queryset = TestQuestionInfo.objects.all() if queryset is None else queryset
+        condition = Q()
+        for branch in cls.branches(user):
+            condition |= branch
+        return queryset.filter(condition, is_del=False)
+
+    @classmethod
+    def union(cls, queryset, user):
+        """
+        조회 범위 조건별 UNION ALL로 제한한 문제 목록.
+
+        queryset은 조회 범위를 적용하지 않은(filter/검색/정렬만 적용) queryset이어야 한다.
+        visible()의 OR 조건이 branch에 함께 남으면 행 수 추정이 작아져 index 순서 scan을 쓰지 않으므로,
+        branch마다 자기 조건만 추가하여 정렬 + LIMIT이 partial index scan으로 내려가게 한다.
+        정렬은 queryset 정렬에 pk를 마지막 기준으로 추가한다.
+        """
+        queryset = queryset.filter(is_del=False)
+        ordering = list(queryset.query.order_by or TestQuestionInfo._meta.ordering)
+        if not any(str(name).lstrip('-') in ('pk', 'id') for name in ordering):
+            ordering.append('-pk' if ordering and str(ordering[0]).startswith('-') else 'pk')
+        return union_all(*(queryset.filter(branch) for branch in cls.branches(user)), ordering=ordering)
+
+
+class QuestionSearchService:
+    """
+    문제 전문 검색 서비스.
+
+    문제 제목(가중치 A)과 선택지 텍스트(가중치 B)로 만든 search_vector(GIN index)를 단어 prefix로 검색한다.
+    PostgreSQL에 한국어 형태소 설정이 없으므로 'simple' 설정(공백/문장부호 단위 분리)을 사용하고,
+    pg_trgm이 설치된 DB에서는 조사가 붙거나 단어 중간이 일치하는 제목을 trigram index(부분 일치, 유사도)로 보완한다.
+    """
+
+    CONFIG = 'simple'
+    CHUNK_SIZE = 5000
+
+    @classmethod
+    def vector(cls):
+        """search_vector 계산식 (UPDATE에 사용)"""
+        options = (
+            OptionInfo.objects.filter(test_question=OuterRef('pk'))
+            .order_by()
+            .values('test_question')
+            .annotate(text=StringAgg('option', ' ', order_by='id'))
+            .values('text')
+        )
+        return (
+            SearchVector('name', weight='A', config=cls.CONFIG)
+            + SearchVector(
+                Coalesce(Subquery(options), Value(''), output_field=TextField()), weight='B', config=cls.CONFIG
+            )
+        )
+
+    @classmethod
+    def refresh(cls, question_ids):
+        """문제 search_vector 갱신 (제목/선택지 변경 시)"""
+        TestQuestionInfo.objects.filter(pk__in=question_ids).update(search_vector=cls.vector())
+
+    @classmethod
+    def rebuild(cls, queryset=None, chunk_size=None):
+        """
+        search_vector 일괄 재계산 (bulk_create 등 signal 없이 생성된 문제 backfill)
+
+        Yields:
+            int: 처리한 문제 수 (chunk마다)
+        """
+        chunk_size = chunk_size or cls.CHUNK_SIZE
+        queryset = TestQuestionInfo.objects.all() if queryset is None else queryset
+        question_ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+        for start in range(0, len(question_ids), chunk_size):
+            chunk = question_ids[start:start + chunk_size]
+            cls.refresh(chunk)
+            yield len(chunk)
+
+    @staticmethod
+    @cache
+    def trigram_enabled() -> bool:
+        """pg_trgm extension 설치 여부 (process당 1회 확인)"""
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def search(cls, queryset, text):
+        """
+        검색어로 문제 queryset 필터링 후 검색 순위(search_rank) annotate.
+
+        각 단어를 prefix로 모두 포함하는 문제를 찾는다 ('방정식' -> '방정식을', '방정식의').
+        """
+        terms = _SEARCH_TERM.findall(text)
+        if not terms:
+            return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+        # \\w 문자만 남기므로 tsquery 문법 문자가 들어가지 않음
+        query = SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw', config=cls.CONFIG)
+        condition = Q(search_vector=query)
+        rank = SearchRank(F('search_vector'), query)
+        if cls.trigram_enabled():
+            condition |= Q(name__icontains=text) | Q(name__trigram_similar=text)
+            rank = rank + TrigramSimilarity('name', text)
+
+        # real(float4)인 ts_rank를 double로 변환해 cursor로 전달한 순위 값이 그대로 비교되게 함
+        return queryset.filter(condition).annotate(search_rank=Cast(rank, FloatField()))
+
+
+@dataclass(frozen=True)
+class QuestionPool:
+    """과목/유형/난이도별 문제 id pool (불변, 삭제 문제 제외)"""
+
+    ids: np.ndarray
+    owners: np.ndarray
+    shared: np.ndarray
+
+    def candidates(self, user) -> np.ndarray:
+        """사용자 조회 범위(QuestionVisibilityService와 동일)의 문제 id"""
+        if user.user_type == 'teacher':
+            return self.ids[self.shared | (self.owners == user.pk)]
+        return self.ids[self.shared]
+
+
+def build_question_pool(subject_id, tq_type, tq_degree) -> QuestionPool:
+    """DB에서 문제 id pool 생성 (subject/tq_type/tq_degree index 사용)"""
+    rows = TestQuestionInfo.objects.filter(
+        subject_id=subject_id, tq_type=tq_type, tq_degree=tq_degree, is_del=False
+    ).order_by().values_list('id', 'create_user_id', 'is_share')
+    rows = list(rows)
+    return QuestionPool(
+        ids=np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)),
+        # 출제자가 없는 문제(-1)는 공유 문제만 조회 가능
+        owners=np.fromiter((row[1] or -1 for row in rows), dtype=np.int64, count=len(rows)),
+        shared=np.fromiter((row[2] for row in rows), dtype=bool, count=len(rows)),
+    )
+
+
+@lru_cache(maxsize=256)
+def _load_question_pool(subject_id, tq_type, tq_degree, version) -> QuestionPool:
+    return build_question_pool(subject_id, tq_type, tq_degree)
+
+
+class QuestionPoolService:
+    """
+    무작위 출제용 문제 id pool 서비스.
+
+    과목/유형/난이도별 문제 id, 출제자, 공유 여부를 numpy 배열로 만들어 프로세스 내 LRU에 저장하고,
+    ORDER BY random() 없이 pool에서 표본을 뽑는다.
+    pool version은 cache에 저장하여 문제 생성/수정/삭제 signal에서 갱신하면 모든 프로세스가 새 pool을 만든다.
+    signal 없이 변경된 문제(queryset.update 등)가 pool에 남을 수 있으므로 표본은 사용 전에 DB로 다시 확인한다.
+    """
+
+    VERSION_PREFIX = 'question_pool:version'
+
+    @classmethod
+    def version_key(cls, subject_id, tq_type, tq_degree) -> str:
+        return f'{cls.VERSION_PREFIX}:{subject_id}:{tq_type}:{tq_degree}'
+
+    @classmethod
+    def versions(cls, pool_keys) -> dict:
+        """pool key (subject_id, tq_type, tq_degree)별 version 조회 (없으면 생성)"""
+        cache_keys = {pool_key: cls.version_key(*pool_key) for pool_key in pool_keys}
+        found = django_cache.get_many(list(cache_keys.values()))
+        versions = {}
+        for pool_key, cache_key in cache_keys.items():
+            version = found.get(cache_key)
+            if version is None:
+                django_cache.add(cache_key, uuid.uuid4().hex, None)
+                version = django_cache.get(cache_key)
+            versions[pool_key] = version
+        return versions
+
+    @classmethod
+    def candidates(cls, user, pool_keys) -> dict:
+        """
+        pool key별 사용자가 출제할 수 있는 문제 id 배열.
+
+        Args:
+            pool_keys: (subject_id, tq_type, tq_degree) 목록
+        """
+        versions = cls.versions(pool_keys)
+        return {
+            pool_key: _load_question_pool(*pool_key, version).candidates(user)
+            for pool_key, version in versions.items()
+        }
+
+    @classmethod
+    def invalidate(cls, pool_keys):
+        """pool version 갱신 (다음 조회 시 pool 재생성)"""
+        django_cache.delete_many([cls.version_key(*pool_key) for pool_key in set(pool_keys)])
+
+    @staticmethod
+    def clear_local_cache():
+        """프로세스 내 LRU 초기화 (테스트용)"""
+        _load_question_pool.cache_clear()
@@ -0,0 +1,34 @@
+"""
+Question signal handlers.
+
+문제 제목/선택지 변경 시 전문 검색용 search_vector 갱신,
+문제 생성/수정/삭제 시 무작위 출제용 문제 id pool 갱신.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from testquestion.models import OptionInfo, TestQuestionInfo
+from testquestion.services import QuestionPoolService, QuestionSearchService
+
+# 문제 id pool 구성에 영향을 주는 field
+POOL_FIELDS = {
+    'subject', 'subject_id', 'tq_type', 'tq_degree', 'is_del', 'is_share', 'create_user', 'create_user_id',
+}
+
+
+@receiver(post_save, sender=TestQuestionInfo)
+def refresh_question_search_vector(sender, instance, update_fields=None, **kwargs):
+    # 제목을 포함하지 않는 부분 저장은 검색 내용이 바뀌지 않음
+    if update_fields is None or 'name' in update_fields:
+        QuestionSearchService.refresh([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=TestQuestionInfo)
+def invalidate_question_pool(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or POOL_FIELDS.intersection(update_fields):
+        QuestionPoolService.invalidate([(instance.subject_id, instance.tq_type, instance.tq_degree)])
+
+
+@receiver([post_save, post_delete], sender=OptionInfo)
+def refresh_option_search_vector(sender, instance, **kwargs):
+    QuestionSearchService.refresh([instance.test_question_id])
@@ -0,0 +1,153 @@
+"""
+Student Dashboard Cache Tests.
+학생 대시보드 snapshot cache 및 증분 반영 테스트.
+"""
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from examination.services import exam_state_changed
+from testpaper.models import AnswerRecord, TestPaperInfo, TestScores
+from testquestion.models import TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+from user.services import StudentDashboardService
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(username='teacher_dash_cache', password='testpass123', user_type='teacher')
+
+
+@pytest.fixture
+def student_info(db):
+    user = UserProfile.objects.create_user(username='student_dash_cache', password='testpass123', nick_name='Cache')
+    return StudentsInfo.objects.create(user=user, student_name='Cache Student', student_id='20251001')
+
+
+@pytest.fixture
+def question(teacher_user):
+    subject = SubjectInfo.objects.create(subject_name='Cache Subject')
+    return TestQuestionInfo.objects.create(
+        name='Cache Q', subject=subject, score=10, tq_type='xz', create_user=teacher_user
+    )
+
+
+def create_exam(teacher_user, question, start_time, name='Cache Exam'):
+    paper = TestPaperInfo.objects.create(
+        name=f'{name} Paper', subject=question.subject, total_score=100, passing_score=60, question_count=1,
+        create_user=teacher_user,
+    )
+    exam = ExaminationInfo.objects.create(
+        name=name, subject=question.subject, start_time=start_time, end_time=start_time + timedelta(hours=1),
+        exam_state='2', create_user=teacher_user,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+    return exam
+
+
+def submit(student_info, exam, question, score, correct=True):
+    test_score = TestScores.objects.create(
+        user=student_info, exam=exam, test_paper=exam.exampaperinfo_set.first().paper, test_score=score,
+        is_submitted=True, start_time=exam.start_time, submit_time=exam.start_time + timedelta(minutes=30),
+    )
+    AnswerRecord.objects.create(
+        test_score=test_score, exam=exam, question=question, is_correct=correct,
+        earned_score=10 if correct else 0, max_score=10,
+    )
+    return test_score
+
+
+def fresh_dashboard(student_info):
+    cache.delete(StudentDashboardService.cache_key(student_info.id))
+    return StudentDashboardService(student_info).get_dashboard_data()
+
+
+@pytest.mark.django_db
+class TestStudentDashboardCache:
+    """학생 대시보드 snapshot cache 테스트"""
+
+    def test_cached_dashboard_needs_no_queries(self, django_assert_num_queries, teacher_user, student_info, question):
+        now = timezone.now()
+        for days in range(8):
+            exam = create_exam(teacher_user, question, now - timedelta(days=days + 1), name=f'Past {days}')
+            ExamStudentsInfo.objects.create(exam=exam, student=student_info)
+            submit(student_info, exam, question, 50 + days * 5)
+        upcoming = create_exam(teacher_user, question, now + timedelta(days=1), name='Upcoming')
+        ExamStudentsInfo.objects.create(exam=upcoming, student=student_info)
+
+        data = StudentDashboardService(student_info).get_dashboard_data()
+
+        with django_assert_num_queries(0):
+            cached = StudentDashboardService(student_info).get_dashboard_data()
+
+        assert cached == data
+        assert data['statistics']['total_exams_taken'] == 8
+        assert data['statistics']['average_score'] == 67.5
+        assert data['statistics']['pass_rate'] == 75.0
+        assert data['statistics']['correct_answers'] == 8
+        assert data['statistics']['upcoming_exams_count'] == 1
+        assert [exam['exam_name'] for exam in data['upcoming_exams']] == ['Upcoming']
+        assert [entry['exam_name'] for entry in data['score_trend']] == [f'Past {days}' for days in range(5)]
+        assert data['progress'][0]['completed_lectures'] == 8
+        assert data['progress'][0]['total_lectures'] == 9
+
+    def test_submission_applied_incrementally(
+        self, django_capture_on_commit_callbacks, teacher_user, student_info, question
+    ):
+        now = timezone.now()
+        first = create_exam(teacher_user, question, now - timedelta(days=2), name='First')
+        submit(student_info, first, question, 40, correct=False)
+        StudentDashboardService(student_info).get_dashboard_data()
+
+        second = create_exam(teacher_user, question, now - timedelta(hours=2), name='Second')
+        test_score = submit(student_info, second, question, 90)
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentDashboardService.record_submissions([test_score])
+
+        data = StudentDashboardService(student_info).get_dashboard_data()
+        assert data['statistics']['total_exams_taken'] == 2
+        assert data['statistics']['average_score'] == 65.0
+        assert data['statistics']['pass_rate'] == 50.0
+        assert data['statistics']['correct_answers'] == 1
+        assert data['statistics']['total_questions_answered'] == 2
+        assert data['recent_submissions'][0]['id'] == test_score.id
+        assert data == fresh_dashboard(student_info)
+
+    def test_submission_already_in_snapshot_not_counted_twice(
+        self, django_capture_on_commit_callbacks, teacher_user, student_info, question
+    ):
+        exam = create_exam(teacher_user, question, timezone.now() - timedelta(days=1))
+        test_score = submit(student_info, exam, question, 80)
+        StudentDashboardService(student_info).get_dashboard_data()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            StudentDashboardService.record_submissions([test_score])
+
+        data = StudentDashboardService(student_info).get_dashboard_data()
+        assert data['statistics']['total_exams_taken'] == 1
+
+    def test_enrollment_and_exam_change_invalidate(
+        self, django_capture_on_commit_callbacks, teacher_user, student_info, question
+    ):
+        key = StudentDashboardService.cache_key(student_info.id)
+        exam = create_exam(teacher_user, question, timezone.now() + timedelta(days=1))
+
+        StudentDashboardService(student_info).get_dashboard_data()
+        with django_capture_on_commit_callbacks(execute=True):
+            ExamStudentsInfo.objects.create(exam=exam, student=student_info)
+        assert cache.get(key) is None
+
+        StudentDashboardService(student_info).get_dashboard_data()
+        with django_capture_on_commit_callbacks(execute=True):
+            exam_state_changed.send(sender=ExaminationInfo, exam_ids=[exam.id], exam_state='1')
+        assert cache.get(key) is None
+
+        StudentDashboardService(student_info).get_dashboard_data()
+        with django_capture_on_commit_callbacks(execute=True):
+            exam.name = 'Renamed'
+            exam.save()
+        assert cache.get(key) is None
+        assert StudentDashboardService(student_info).get_dashboard_data()['upcoming_exams'][0]['exam_name'] == 'Renamed'
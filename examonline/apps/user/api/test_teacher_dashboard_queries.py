@@ -0,0 +1,117 @@
+"""
+Teacher Dashboard Query Tests.
+교사 대시보드 집계 결과 및 쿼리 수 회귀 테스트.
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from testpaper.models import TestPaperInfo, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, UserProfile
+from user.services import TeacherDashboardService
+
+# 최근 문제 2 (+ 선택지 prefetch) + 최근 시험지 1 + 진행 중 시험 2 (+ 시험지 prefetch) + 통계 3
+DASHBOARD_QUERIES = 8
+
+
+@pytest.fixture
+def teacher_user(db):
+    return UserProfile.objects.create_user(username='teacher_dash_sql', password='testpass123', user_type='teacher')
+
+
+@pytest.fixture
+def subject(db):
+    return SubjectInfo.objects.create(subject_name='Rollup Subject')
+
+
+@pytest.fixture
+def students(db):
+    infos = []
+    for idx in range(3):
+        user = UserProfile.objects.create_user(username=f'student_dash_sql_{idx}', password='testpass123')
+        infos.append(StudentsInfo.objects.create(user=user, student_name=f'Rollup {idx}', student_id=f'2025110{idx}'))
+    return infos
+
+
+def create_questions(teacher_user, subject):
+    last_month = timezone.now().replace(day=1) - timedelta(days=3)
+    specs = [
+        ('xz', 'jd', True, None), ('xz', 'zd', False, None), ('pd', 'jd', True, None), ('pd', 'jd', False, last_month),
+    ]
+    for idx, (tq_type, tq_degree, is_share, create_time) in enumerate(specs):
+        question = TestQuestionInfo.objects.create(
+            name=f'Rollup Q{idx}', subject=subject, score=10, tq_type=tq_type, tq_degree=tq_degree,
+            is_share=is_share, create_user=teacher_user,
+        )
+        if create_time:
+            TestQuestionInfo.objects.filter(pk=question.pk).update(create_time=create_time)
+        OptionInfo.objects.create(test_question=question, option='O', is_right=True)
+    TestQuestionInfo.objects.create(
+        name='Deleted Q', subject=subject, score=10, tq_type='xz', is_del=True, create_user=teacher_user
+    )
+
+
+def create_exams(teacher_user, subject, students, count):
+    paper = TestPaperInfo.objects.create(
+        name='Rollup Paper', subject=subject, total_score=100, passing_score=60, create_user=teacher_user
+    )
+    now = timezone.now()
+    for idx in range(count):
+        exam = ExaminationInfo.objects.create(
+            name=f'Rollup Exam {idx}', subject=subject, start_time=now - timedelta(hours=1),
+            end_time=now + timedelta(hours=1), create_user=teacher_user,
+        )
+        ExamPaperInfo.objects.create(exam=exam, paper=paper)
+        for student, score in zip(students, [90, 70, 40]):
+            ExamStudentsInfo.objects.create(exam=exam, student=student)
+            TestScores.objects.create(
+                exam=exam, user=student, test_paper=paper, test_score=score, is_submitted=True, submit_time=now
+            )
+
+
+@pytest.mark.django_db
+class TestTeacherDashboardRollup:
+    """교사 대시보드 집계 테스트"""
+
+    def test_statistics(self, teacher_user, subject, students):
+        create_questions(teacher_user, subject)
+        create_exams(teacher_user, subject, students, 2)
+
+        data = TeacherDashboardService(teacher_user).get_dashboard_data()
+
+        assert data['question_statistics'] == {
+            'total_questions': 4,
+            'shared_questions': 2,
+            'questions_by_type': {'xz': 2, 'pd': 2},
+            'questions_by_difficulty': {'jd': 3, 'zd': 1},
+            'trend': 2,
+            'this_month_created': 3,
+        }
+        assert data['testpaper_statistics'] == {'total_testpapers': 1, 'trend': 1, 'this_month_created': 1}
+        student_statistics = data['student_statistics']
+        assert student_statistics['total_students'] == 3
+        assert student_statistics['total_submissions'] == 6
+        assert student_statistics['average_score'] == 66.7
+        assert student_statistics['pass_rate'] == 66.7
+        assert student_statistics['submissions_trend'] == 6
+
+    def test_empty_teacher(self, teacher_user):
+        data = TeacherDashboardService(teacher_user).get_dashboard_data()
+
+        assert data['question_statistics']['total_questions'] == 0
+        assert data['testpaper_statistics']['total_testpapers'] == 0
+        assert data['student_statistics']['total_students'] == 0
+        assert data['student_statistics']['pass_rate'] == 0.0
+
+    @pytest.mark.parametrize('exam_count', [1, 12])
+    def test_query_count_independent_of_exam_count(
+        self, django_assert_num_queries, teacher_user, subject, students, exam_count
+    ):
+        create_questions(teacher_user, subject)
+        create_exams(teacher_user, subject, students, exam_count)
+
+        with django_assert_num_queries(DASHBOARD_QUERIES):
+            TeacherDashboardService(teacher_user).get_dashboard_data()
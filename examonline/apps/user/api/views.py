@@ -11,6 +11,7 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from core.api.permissions import IsTeacher
+from core.query_budget import query_budget
 from user.api.serializers import (
     CustomTokenObtainPairSerializer,
     PasswordChangeSerializer,
@@ -204,6 +205,7 @@ class StudentDashboardView(generics.RetrieveAPIView):
         summary='학생 대시보드 조회',
         description='현재 로그인한 학생의 대시보드 데이터를 조회합니다.',
     )
+    @query_budget(max_queries=12, max_duplicates=2)
     def get(self, request, *args, **kwargs):
         # 학생 프로필 조회
         try:
@@ -238,6 +240,7 @@ class TeacherDashboardView(generics.RetrieveAPIView):
         summary='교사 대시보드 조회',
         description='현재 로그인한 교사의 대시보드 데이터를 조회합니다.',
     )
+    @query_budget(max_queries=10, max_duplicates=1)
     def get(self, request, *args, **kwargs):
         # Service를 통해 대시보드 데이터 조회
         service = TeacherDashboardService(request.user)
@@ -261,6 +264,8 @@ class StudentListViewSet(viewsets.ReadOnlyModelViewSet):
     """
     serializer_class = StudentListSerializer
     permission_classes = [IsAuthenticated, IsTeacher]
+    # ?cursor= 요청 시 keyset pagination ((date_joined, id) 기준)
+    cursor_pagination = True
 
     def get_queryset(self):
         """
@@ -5,3 +5,7 @@ class UserConfig(AppConfig):
     name = 'user'
     # admin에서 app 이름 바꾸기
     verbose_name = '사용자 정보（UserInfo）'
+
+    def ready(self):
+        # 학생 대시보드 cache 무효화 signal 등록
+        from user import signals  # noqa: F401
@@ -0,0 +1,59 @@
+"""
+대량 데이터 생성 스크립트
+
+Usage:
+    uv run python manage.py seed_bulk [--students 100000 --teachers 1000 --questions 200000 --exams 50000
+        --questions-per-exam 20 --scores 1000000] [--seed 0] [--prefix bulk] [--answer-records]
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        '운영 규모의 교사/학생/문항/시험/성적 데이터를 bulk_create로 batch 생성 '
+        '(seed가 같으면 같은 데이터, 성적마다 detail_records와 시험 통계 포함)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--teachers', type=int, default=100, help='교사 수')
+        parser.add_argument('--students', type=int, default=10000, help='학생 수')
+        parser.add_argument('--questions', type=int, default=20000, help='문항 수 (교사별로 나누어 출제)')
+        parser.add_argument('--exams', type=int, default=500, help='시험 수 (시험마다 시험지 1개)')
+        parser.add_argument('--questions-per-exam', type=int, default=20, help='시험별 문항 수')
+        parser.add_argument('--scores', type=int, default=100000, help='제출 성적 수 (시험마다 고르게 배분)')
+        parser.add_argument('--months', type=int, default=12, help='시험 시행 기간 (최근 N개월)')
+        parser.add_argument('--seed', type=int, default=0, help='난수 seed')
+        parser.add_argument('--prefix', default='bulk', help='username/시험 이름 prefix')
+        parser.add_argument(
+            '--answer-records', action='store_true', help='문항별 답안 기록(AnswerRecord)도 생성 (성적 수 x 문항 수 행)'
+        )
+
+    def handle(self, *args, **options):
+        from benchmarks.dataset import PASSWORD
+        from benchmarks.volume import VolumeSpec, seed_volume
+
+        spec = VolumeSpec(
+            teachers=options['teachers'],
+            students=options['students'],
+            questions=options['questions'],
+            exams=options['exams'],
+            questions_per_exam=options['questions_per_exam'],
+            scores=options['scores'],
+            months=options['months'],
+            answer_records=options['answer_records'],
+        )
+
+        self.stdout.write(f'대량 데이터 생성 시작 (prefix={options["prefix"]}, seed={options["seed"]})')
+        started = time.perf_counter()
+        try:
+            counts = seed_volume(options['prefix'], spec, seed=options['seed'], log=self.stdout.write)
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        for name, count in counts.items():
+            self.stdout.write(f'  {name}: {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'대량 데이터 생성 완료: {time.perf_counter() - started:.1f}초 (비밀번호 {PASSWORD})'
+        ))
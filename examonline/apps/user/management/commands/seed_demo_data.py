@@ -2,14 +2,22 @@
 데모 데이터 생성 스크립트
 
 Usage:
-    uv run python manage.py seed_demo_data
+    uv run python manage.py seed_demo_data [--students 1000 --teachers 5 --exams-per-teacher 4 --questions 20]
 """
+import time
 
 from django.core.management.base import BaseCommand
 
 
 class Command(BaseCommand):
-    help = '포트폴리오 데모용 샘플 데이터 생성'
+    help = '포트폴리오 데모용 샘플 데이터 생성 (--students 지정 시 진행 중인 시험과 등록 학생을 대량으로 추가 생성)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=0, help='추가 생성할 응시 학생 수')
+        parser.add_argument('--teachers', type=int, default=1, help='추가 생성할 교사 수')
+        parser.add_argument('--exams-per-teacher', type=int, default=1, help='교사별 시험 수')
+        parser.add_argument('--questions', type=int, default=10, help='시험별 문항 수')
+        parser.add_argument('--prefix', default=None, help='추가 생성 계정 username prefix (기본값 load<timestamp>)')
 
     def handle(self, *args, **options):
         from django.contrib.auth import get_user_model
@@ -150,6 +158,20 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.SUCCESS(f'문제 생성: {q_data["name"][:20]}...'))
             questions.append(question)
 
+        # 6. 대량 응시 데이터 (benchmark와 같은 생성 로직 사용)
+        if options['students'] > 0:
+            from benchmarks.dataset import PASSWORD, seed_exam_load
+
+            prefix = options['prefix'] or f'load{int(time.time())}'
+            dataset = seed_exam_load(
+                prefix, teachers=options['teachers'], exams_per_teacher=options['exams_per_teacher'],
+                students=options['students'], questions=options['questions'],
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f'응시 데이터 생성: 학생 {len(dataset.attempts)}명 '
+                f'({prefix}_student0~{options["students"] - 1} / {PASSWORD})'
+            ))
+
         self.stdout.write('')
         self.stdout.write(self.style.SUCCESS('데모 데이터 생성 완료!'))
         self.stdout.write('')
@@ -4,15 +4,20 @@ User Dashboard Services.
 비즈니스 로직을 View에서 분리하여 재사용성과 테스트 용이성을 개선.
 """
 
+from collections import Counter
 from datetime import timedelta
 
-from django.db.models import Case, Count, Avg, F, Prefetch, When
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, Count, F, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from core.cache import get_or_build, invalidate as invalidate_cache
 from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
-from testpaper.models import TestPaperInfo, TestScores
+from testpaper.models import AnswerRecord, TestPaperInfo, TestScores
 from testquestion.models import TestQuestionInfo
-from user.models import StudentsInfo
+from user.models import StudentsInfo, UserProfile
 
 
 class StudentDashboardService:
@@ -20,66 +25,118 @@ class StudentDashboardService:
     학생 대시보드 데이터 조회 서비스.
 
     학생의 통계, 성적 추이, 예정된 시험, 학습 진행률을 제공.
+
+    전체 제출 내역을 매번 다시 집계하지 않도록 학생별 snapshot(누적 합계, 월별/과목별 집계,
+    최근 제출 5건, 등록 시험 목록)을 cache에 저장한다. 제출 시에는 snapshot에 증분 반영하고,
+    등록/시험 변경/재채점 시에는 무효화하므로 조회 비용은 제출 이력 길이와 무관하다.
+    현재 시각에 따라 달라지는 값(월별 trend, 예정 시험)은 조회 시 snapshot에서 계산한다.
     """
 
+    KEY_PREFIX = 'student_dashboard'
+    # 증분 반영과 rebuild가 경합한 경우의 오차가 남는 최대 시간
+    TIMEOUT = 60 * 60
+    RECENT_LIMIT = 5
+    UPCOMING_LIMIT = 10
+
     def __init__(self, student_info: StudentsInfo):
         self.student_info = student_info
         self.user = student_info.user
         self.now = timezone.now()
 
+    @classmethod
+    def cache_key(cls, student_id):
+        return f'{cls.KEY_PREFIX}:{student_id}'
+
     def get_dashboard_data(self) -> dict:
         """
         대시보드 전체 데이터 조회.
 
-        Query 최적화: 공통 데이터를 한 번만 조회하여 재사용
+        cache된 snapshot을 사용하고, 없으면 한 번 집계하여 저장
 
         Returns:
             dict: 통계, 성적 추이, 예정 시험, 진행률, 최근 제출 내역
         """
-        # 1. 공통 데이터 조회 (Query Reuse)
-        submissions_qs = self._get_submissions()
-        submissions_list = list(submissions_qs)  # QuerySet을 list로 변환 (1회 query)
+        snapshot = get_or_build(self.cache_key(self.student_info.id), self._build_snapshot, self.TIMEOUT)
+        recent = snapshot['recent']
 
-        # 2. enrolled_exam_ids 한 번만 조회 (여러 메서드에서 재사용)
-        enrolled_exam_ids = list(ExamStudentsInfo.objects.filter(
-            student=self.student_info
-        ).values_list('exam_id', flat=True))
-
-        # 3. recent_submissions_list 한 번만 조회 (score_trend, recent_submissions에서 재사용)
-        recent_submissions_list = sorted(submissions_list, key=lambda x: x.submit_time, reverse=True)[:5]
+        return {
+            'statistics': self._get_statistics(snapshot),
+            'score_trend': [entry['trend'] for entry in recent if entry['trend']],
+            'upcoming_exams': self._get_upcoming_exams(snapshot),
+            'progress': self._get_progress(snapshot),
+            'recent_submissions': [entry['submission'] for entry in recent if entry['submission']],
+            'wrong_questions': [],
+        }
 
-        # 4. subject_total_exams_dict 한 번만 조회 (progress에서 재사용, N+1 방지)
-        subject_total_exams_dict = dict(
-            ExamStudentsInfo.objects.filter(
-                student=self.student_info
-            ).values('exam__subject__subject_name').annotate(
-                total=Count('id')
-            ).values_list('exam__subject__subject_name', 'total')
-        )
+    @classmethod
+    def record_submissions(cls, test_scores):
+        """
+        새로 제출된 응시 기록을 cache된 snapshot에 증분 반영 (transaction commit 이후).
 
-        # 5. 조회된 데이터를 각 메서드에 전달하여 재사용
-        statistics = self._get_statistics(submissions_list, enrolled_exam_ids)
-        score_trend = self._get_score_trend(recent_submissions_list)
-        upcoming_exams = self._get_upcoming_exams(enrolled_exam_ids)
-        progress = self._get_progress(submissions_list, subject_total_exams_dict)
-        recent_submissions = self._get_recent_submissions(recent_submissions_list)
+        snapshot이 없는 학생은 다음 조회 시 rebuild되므로 건너뛴다.
 
-        return {
-            'statistics': statistics,
-            'score_trend': score_trend,
-            'upcoming_exams': upcoming_exams,
-            'progress': progress,
-            'recent_submissions': recent_submissions,
-            'wrong_questions': [],
+        Args:
+            test_scores: 제출 처리된 TestScores 목록
+        """
+        submitted = [(test_score.user_id, test_score.id) for test_score in test_scores]
+        if submitted:
+            transaction.on_commit(lambda: cls._apply_submissions(submitted))
+
+    @classmethod
+    def invalidate(cls, student_ids):
+        """학생 snapshot 무효화 (transaction commit 이후)"""
+        keys = [cls.cache_key(student_id) for student_id in set(student_ids)]
+        if keys:
+            transaction.on_commit(lambda: invalidate_cache(*keys))
+
+    @classmethod
+    def invalidate_for_exams(cls, exam_ids):
+        """시험에 등록된 학생들의 snapshot 무효화"""
+        cls.invalidate(ExamStudentsInfo.objects.filter(exam_id__in=exam_ids).values_list('student_id', flat=True))
+
+    @classmethod
+    def _apply_submissions(cls, submitted):
+        snapshots = cache.get_many({cls.cache_key(student_id) for student_id, _ in submitted})
+        if not snapshots:
+            return
+
+        test_score_ids = [
+            test_score_id for student_id, test_score_id in submitted if cls.cache_key(student_id) in snapshots
+        ]
+        submissions = cls._submission_queryset().filter(id__in=test_score_ids, is_submitted=True)
+        answer_counts = {
+            row['test_score_id']: row
+            for row in AnswerRecord.objects.filter(test_score_id__in=test_score_ids).values(
+                'test_score_id'
+            ).annotate(total=Count('id'), correct=Count('id', filter=Q(is_correct=True)))
         }
 
-    def _get_submissions(self):
-        """제출된 시험 기록 조회 (N+1 쿼리 방지)"""
-        return TestScores.objects.filter(
-            user=self.student_info,
-            is_submitted=True
-        ).select_related(
-            'exam', 'exam__subject', 'exam__create_user', 'test_paper'
+        updated = {}
+        for sub in submissions:
+            key = cls.cache_key(sub.user_id)
+            snapshot = snapshots[key]
+            # rebuild가 먼저 반영한 제출은 다시 더하지 않음
+            if any(entry['id'] == sub.id for entry in snapshot['recent']):
+                continue
+            counts = answer_counts.get(sub.id, {'total': 0, 'correct': 0})
+            cls._add_totals(
+                snapshot, sub.test_score, sub.submit_time,
+                sub.test_paper.passing_score if sub.test_paper else None,
+                sub.exam.subject.subject_name if sub.exam and sub.exam.subject else None,
+            )
+            snapshot['correct'] += counts['correct']
+            snapshot['answered'] += counts['total']
+            cls._add_recent(snapshot, cls._recent_entry(sub))
+            updated[key] = snapshot
+
+        if updated:
+            cache.set_many(updated, cls.TIMEOUT)
+
+    @staticmethod
+    def _submission_queryset():
+        """제출 기록 조회 (N+1 쿼리 방지, 분석에 쓰지 않는 detail_records는 제외)"""
+        return TestScores.objects.defer('detail_records').select_related(
+            'exam', 'exam__subject', 'exam__create_user', 'test_paper', 'user__user'
         ).prefetch_related(
             Prefetch(
                 'exam__exampaperinfo_set',
@@ -90,7 +147,77 @@ class StudentDashboardService:
             )
         )
 
-    def _serialize_testpaper(self, paper) -> dict:
+    def _build_snapshot(self) -> dict:
+        """
+        제출/등록 내역 전체를 집계하여 snapshot 생성 (cache miss 시 1회)
+
+        누적 합계는 필요한 column만 조회하고, 직렬화가 필요한 최근 제출만 관계를 함께 조회
+        """
+        snapshot = {
+            'exams_taken': 0,
+            'score_sum': 0,
+            'pass_count': 0,
+            'correct': 0,
+            'answered': 0,
+            'months': {},
+            'subjects_completed': {},
+            'recent': [],
+        }
+
+        submissions = TestScores.objects.filter(user=self.student_info, is_submitted=True)
+        rows = submissions.values_list(
+            'test_score', 'submit_time', 'test_paper__passing_score', 'exam__subject__subject_name'
+        )
+        for score, submit_time, passing_score, subject_name in rows:
+            self._add_totals(snapshot, score, submit_time, passing_score, subject_name)
+
+        if snapshot['exams_taken']:
+            answer_stats = AnswerRecord.objects.filter(test_score__in=submissions).aggregate(
+                total=Count('id'), correct=Count('id', filter=Q(is_correct=True))
+            )
+            snapshot['correct'] = answer_stats['correct']
+            snapshot['answered'] = answer_stats['total']
+
+            recent_qs = self._submission_queryset().filter(
+                user=self.student_info, is_submitted=True
+            ).order_by(F('submit_time').desc(nulls_last=True), '-id')[:self.RECENT_LIMIT]
+            snapshot['recent'] = [self._recent_entry(sub) for sub in recent_qs]
+
+        # 과목별 등록 시험 수 (진행률 분모)
+        snapshot['subjects_enrolled'] = dict(
+            ExamStudentsInfo.objects.filter(
+                student=self.student_info
+            ).values('exam__subject__subject_name').annotate(
+                total=Count('id')
+            ).values_list('exam__subject__subject_name', 'total')
+        )
+        snapshot['enrolled_exams'] = self._get_enrolled_exams()
+        return snapshot
+
+    @staticmethod
+    def _add_totals(snapshot, score, submit_time, passing_score, subject_name):
+        """제출 1건을 누적 합계, 월별 집계, 과목별 완료 수에 반영"""
+        snapshot['exams_taken'] += 1
+        snapshot['score_sum'] += score
+        if passing_score is not None and score >= passing_score:
+            snapshot['pass_count'] += 1
+        if submit_time:
+            month = snapshot['months'].setdefault(submit_time.strftime('%Y-%m'), [0, 0])
+            month[0] += 1
+            month[1] += score
+        if subject_name:
+            completed = snapshot['subjects_completed']
+            completed[subject_name] = completed.get(subject_name, 0) + 1
+
+    @classmethod
+    def _add_recent(cls, snapshot, entry):
+        """최근 제출 목록에 추가 (제출 시간 내림차순, 최대 RECENT_LIMIT개)"""
+        recent = snapshot['recent'] + [entry]
+        recent.sort(key=lambda item: (item['submit_time'] is not None, item['submit_time'], item['id']), reverse=True)
+        snapshot['recent'] = recent[:cls.RECENT_LIMIT]
+
+    @staticmethod
+    def _serialize_testpaper(paper) -> dict:
         """
         TestPaperInfo 객체를 dictionary로 직렬화
 
@@ -120,127 +247,60 @@ class StudentDashboardService:
             'updated_at': paper.edit_time.isoformat() if paper.edit_time else None,
         }
 
-    def _get_statistics(self, submissions_list: list, enrolled_exam_ids: list) -> dict:
+    def _get_statistics(self, snapshot: dict) -> dict:
         """
-        통계 데이터 계산
+        통계 데이터 계산 (snapshot의 누적 합계 사용)
 
         Args:
-            submissions_list: 제출 내역 목록 (재사용)
-            enrolled_exam_ids: 등록된 시험 ID 목록 (재사용)
+            snapshot: 학생 대시보드 snapshot
         """
-        total_exams_taken = len(submissions_list)
+        total_exams_taken = snapshot['exams_taken']
 
         if total_exams_taken > 0:
-            # Python에서 평균 점수 계산 (DB query 절약)
-            total_score = sum(sub.test_score for sub in submissions_list)
-            average_score = round(total_score / total_exams_taken, 1)
-
-            # 합격률 및 정답률 계산
-            passed_count = 0
-            total_correct = 0
-            total_questions = 0
-
-            for sub in submissions_list:
-                if sub.test_paper and sub.test_score >= sub.test_paper.passing_score:
-                    passed_count += 1
-
-                # 정답 수 계산
-                if sub.detail_records:
-                    for q_id, record in sub.detail_records.items():
-                        if isinstance(record, dict):
-                            total_questions += 1
-                            if record.get('is_correct', False):
-                                total_correct += 1
-
-            pass_rate = round((passed_count / total_exams_taken) * 100, 1)
+            average_score = round(snapshot['score_sum'] / total_exams_taken, 1)
+            pass_rate = round((snapshot['pass_count'] / total_exams_taken) * 100, 1)
         else:
             average_score = 0.0
             pass_rate = 0.0
-            total_correct = 0
-            total_questions = 0
 
-        # 예정된 시험 수 (전달받은 enrolled_exam_ids 재사용)
-        upcoming_count = ExaminationInfo.objects.filter(
-            id__in=enrolled_exam_ids,
-            start_time__gte=self.now
-        ).count()
+        # 예정된 시험 수
+        upcoming_count = sum(1 for exam in snapshot['enrolled_exams'] if exam['start_time'] >= self.now)
 
-        # 전월 대비 Trend 계산
+        # 전월 대비 Trend 계산 (월별 집계 사용)
         this_month_start = self.now.replace(
             day=1, hour=0, minute=0, second=0, microsecond=0
         )
-        last_month_end = this_month_start - timedelta(days=1)
-        last_month_start = last_month_end.replace(day=1)
+        last_month_start = (this_month_start - timedelta(days=1)).replace(day=1)
 
-        this_month_exams = [
-            sub for sub in submissions_list
-            if sub.submit_time and sub.submit_time >= this_month_start
-        ]
-        last_month_exams = [
-            sub for sub in submissions_list
-            if sub.submit_time and last_month_start <= sub.submit_time < this_month_start
-        ]
+        this_month_count, this_month_sum = snapshot['months'].get(this_month_start.strftime('%Y-%m'), (0, 0))
+        last_month_count, last_month_sum = snapshot['months'].get(last_month_start.strftime('%Y-%m'), (0, 0))
 
-        exams_trend = len(this_month_exams) - len(last_month_exams)
+        exams_trend = this_month_count - last_month_count
 
         # 평균 점수 Trend 계산
-        this_month_avg = None
-        last_month_avg = None
-        if this_month_exams:
-            this_month_avg = sum(sub.test_score for sub in this_month_exams) / len(this_month_exams)
-        if last_month_exams:
-            last_month_avg = sum(sub.test_score for sub in last_month_exams) / len(last_month_exams)
-
         avg_score_trend = 0.0
-        if this_month_avg is not None and last_month_avg is not None:
-            avg_score_trend = round(this_month_avg - last_month_avg, 1)
+        if this_month_count and last_month_count:
+            avg_score_trend = round(this_month_sum / this_month_count - last_month_sum / last_month_count, 1)
 
         return {
             'total_exams_taken': total_exams_taken,
             'average_score': average_score,
             'pass_rate': pass_rate,
-            'correct_answers': total_correct,
-            'total_questions_answered': total_questions,
+            'correct_answers': snapshot['correct'],
+            'total_questions_answered': snapshot['answered'],
             'upcoming_exams_count': upcoming_count,
             'exams_trend': exams_trend,
             'avg_score_trend': avg_score_trend,
         }
 
-    def _get_score_trend(self, recent_submissions_list: list) -> list:
+    def _get_enrolled_exams(self) -> list:
         """
-        성적 추이 (최근 5개 시험)
+        종료되지 않은 등록 시험 목록 (시작 시간순)
 
-        Args:
-            recent_submissions_list: 최근 제출 내역 목록 (재사용)
+        진행 중인 시험도 포함, 종료 여부는 조회 시점에 다시 판단
         """
-        score_trend = []
-
-        for sub in recent_submissions_list:
-            if sub.exam and sub.test_paper:
-                percentage = round(
-                    (sub.test_score / sub.test_paper.total_score) * 100
-                ) if sub.test_paper.total_score > 0 else 0
-
-                score_trend.append({
-                    'exam_name': sub.exam.name,
-                    'score': sub.test_score,
-                    'percentage': percentage,
-                    'date': sub.submit_time.strftime('%Y-%m-%d') if sub.submit_time else None,
-                })
-
-        return score_trend
-
-    def _get_upcoming_exams(self, enrolled_exam_ids: list) -> list:
-        """
-        예정된 시험 목록 (최대 10개)
-
-        Args:
-            enrolled_exam_ids: 등록된 시험 ID 목록 (재사용)
-        """
-        # Upcoming exams 조회 (N+1 쿼리 방지)
-        # end_time__gt=self.now로 변경하여 진행 중인 시험도 포함
-        upcoming_exams_qs = ExaminationInfo.objects.filter(
-            id__in=enrolled_exam_ids,
+        exams_qs = ExaminationInfo.objects.filter(
+            id__in=ExamStudentsInfo.objects.filter(student=self.student_info).values('exam_id'),
             end_time__gt=self.now
         ).select_related('create_user', 'subject').prefetch_related(
             Prefetch(
@@ -252,14 +312,14 @@ class StudentDashboardService:
             )
         ).order_by('start_time')
 
-        # 데이터 직렬화
-        upcoming_exams = []
-        for exam in upcoming_exams_qs[:10]:
+        enrolled_exams = []
+        for exam in exams_qs:
             exam_papers = getattr(exam, 'prefetched_exam_papers', [])
             exam_paper = exam_papers[0] if exam_papers else None
 
+            data = None
             if exam_paper and exam_paper.paper:
-                upcoming_exams.append({
+                data = {
                     'id': exam.id,
                     'exam_name': exam.name,
                     'testpaper': self._serialize_testpaper(exam_paper.paper),
@@ -272,30 +332,35 @@ class StudentDashboardService:
                     } if exam.create_user else None,
                     'created_at': exam.create_time.isoformat() if exam.create_time else None,
                     'updated_at': exam.create_time.isoformat() if exam.create_time else None,
-                })
+                }
+            enrolled_exams.append({'start_time': exam.start_time, 'end_time': exam.end_time, 'data': data})
+
+        return enrolled_exams
 
-        return upcoming_exams
+    def _get_upcoming_exams(self, snapshot: dict) -> list:
+        """
+        예정된 시험 목록 (최대 10개)
 
-    def _get_progress(self, submissions_list: list, subject_total_exams_dict: dict) -> list:
+        Args:
+            snapshot: 학생 대시보드 snapshot
+        """
+        upcoming_exams = [
+            exam['data'] for exam in snapshot['enrolled_exams']
+            if exam['data'] and exam['end_time'] > self.now
+        ]
+        return upcoming_exams[:self.UPCOMING_LIMIT]
+
+    def _get_progress(self, snapshot: dict) -> list:
         """
         과목별 진행률
 
         Args:
-            submissions_list: 제출 내역 목록 (재사용)
-            subject_total_exams_dict: 과목별 전체 시험 수 dictionary (재사용, N+1 방지)
+            snapshot: 학생 대시보드 snapshot
         """
         progress = []
 
-        # Python에서 과목별 완료 수 계산 (DB query 절약)
-        subject_completed = {}
-        for sub in submissions_list:
-            if sub.exam and sub.exam.subject:
-                subject_name = sub.exam.subject.subject_name
-                subject_completed[subject_name] = subject_completed.get(subject_name, 0) + 1
-
-        # 과목별 진행률 계산
-        for subject_name, completed in subject_completed.items():
-            total_in_subject = subject_total_exams_dict.get(subject_name, 0)
+        for subject_name, completed in snapshot['subjects_completed'].items():
+            total_in_subject = snapshot['subjects_enrolled'].get(subject_name, 0)
 
             if total_in_subject > 0:
                 pct = round((completed / total_in_subject) * 100)
@@ -308,55 +373,67 @@ class StudentDashboardService:
 
         return progress
 
-    def _get_recent_submissions(self, recent_submissions_list: list) -> list:
+    @classmethod
+    def _recent_entry(cls, sub) -> dict:
         """
-        최근 제출 내역 (최근 5개)
+        최근 제출 1건의 성적 추이/제출 내역 직렬화
 
         Args:
-            recent_submissions_list: 최근 제출 내역 목록 (재사용)
+            sub: exam, test_paper, user가 함께 조회된 TestScores
         """
-        recent_submissions = []
-
-        for sub in recent_submissions_list:
-            if sub.exam:
-                exam = sub.exam
-                # prefetch된 시험지 조회
-                exam_papers = getattr(exam, 'prefetched_exam_papers', [])
-                exam_paper = exam_papers[0] if exam_papers else None
-
-                # Helper method 사용하여 testpaper 직렬화
-                testpaper_data = None
-                if exam_paper and exam_paper.paper:
-                    testpaper_data = self._serialize_testpaper(exam_paper.paper)
-
-                recent_submissions.append({
-                    'id': sub.id,
-                    'examination': {
-                        'id': exam.id,
-                        'exam_name': exam.name,
-                        'testpaper': testpaper_data,
-                        'start_time': exam.start_time.isoformat() if exam.start_time else None,
-                        'end_time': exam.end_time.isoformat() if exam.end_time else None,
-                        'is_public': exam.exam_state != '0',
-                        'creat_user': {
-                            'id': exam.create_user.id,
-                            'nick_name': exam.create_user.nick_name,
-                        } if exam.create_user else None,
-                        'created_at': exam.create_time.isoformat() if exam.create_time else None,
-                        'updated_at': exam.create_time.isoformat() if exam.create_time else None,
-                    },
-                    'student': {
-                        'id': self.student_info.id,
-                        'nick_name': self.user.nick_name,
-                    },
-                    'answers': [],
+        trend = None
+        submission = None
+
+        if sub.exam:
+            exam = sub.exam
+            if sub.test_paper:
+                percentage = round(
+                    (sub.test_score / sub.test_paper.total_score) * 100
+                ) if sub.test_paper.total_score > 0 else 0
+
+                trend = {
+                    'exam_name': exam.name,
                     'score': sub.test_score,
-                    'total_score': sub.test_paper.total_score if sub.test_paper else 0,
-                    'submitted_at': sub.submit_time.isoformat() if sub.submit_time else None,
-                    'created_at': sub.create_time.isoformat() if sub.create_time else None,
-                })
+                    'percentage': percentage,
+                    'date': sub.submit_time.strftime('%Y-%m-%d') if sub.submit_time else None,
+                }
 
-        return recent_submissions
+            # prefetch된 시험지 조회
+            exam_papers = getattr(exam, 'prefetched_exam_papers', [])
+            exam_paper = exam_papers[0] if exam_papers else None
+
+            testpaper_data = None
+            if exam_paper and exam_paper.paper:
+                testpaper_data = cls._serialize_testpaper(exam_paper.paper)
+
+            submission = {
+                'id': sub.id,
+                'examination': {
+                    'id': exam.id,
+                    'exam_name': exam.name,
+                    'testpaper': testpaper_data,
+                    'start_time': exam.start_time.isoformat() if exam.start_time else None,
+                    'end_time': exam.end_time.isoformat() if exam.end_time else None,
+                    'is_public': exam.exam_state != '0',
+                    'creat_user': {
+                        'id': exam.create_user.id,
+                        'nick_name': exam.create_user.nick_name,
+                    } if exam.create_user else None,
+                    'created_at': exam.create_time.isoformat() if exam.create_time else None,
+                    'updated_at': exam.create_time.isoformat() if exam.create_time else None,
+                },
+                'student': {
+                    'id': sub.user_id,
+                    'nick_name': sub.user.user.nick_name,
+                },
+                'answers': [],
+                'score': sub.test_score,
+                'total_score': sub.test_paper.total_score if sub.test_paper else 0,
+                'submitted_at': sub.submit_time.isoformat() if sub.submit_time else None,
+                'created_at': sub.create_time.isoformat() if sub.create_time else None,
+            }
+
+        return {'id': sub.id, 'submit_time': sub.submit_time, 'trend': trend, 'submission': submission}
 
 
 class TeacherDashboardService:
@@ -380,9 +457,12 @@ class TeacherDashboardService:
         recent_questions = self._get_recent_questions()
         recent_testpapers = self._get_recent_testpapers()
         ongoing_exams = self._get_ongoing_exams()
+
+        # 통계는 3회 round trip (문제 1 + 시험지/학생 수 1 + 제출 1)
+        authored_counts = self._get_authored_counts()
         question_statistics = self._get_question_statistics()
-        student_statistics = self._get_student_statistics()
-        testpaper_statistics = self._get_testpaper_statistics()
+        student_statistics = self._get_student_statistics(authored_counts['students'])
+        testpaper_statistics = self._get_testpaper_statistics(authored_counts)
 
         return {
             'recent_questions': recent_questions,
@@ -515,121 +595,104 @@ class TeacherDashboardService:
 
         return ongoing_exams
 
+    def _month_starts(self):
+        """이번 달, 지난 달 시작 시각"""
+        this_month_start = self.now.replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        last_month_start = (this_month_start - timedelta(days=1)).replace(day=1)
+        return this_month_start, last_month_start
+
     def _get_question_statistics(self) -> dict:
         """
-        문제 통계 (쿼리 최적화: 6개 -> 3개)
+        문제 통계 (1개 쿼리)
 
-        기존: 6개 쿼리 (total, shared, type별, degree별, this_month, last_month)
-        개선: 3개 쿼리 (aggregate 1개 + type 1개 + degree 1개)
+        유형 x 난이도 조합별 조건부 집계 1회로 합계, 공유/월별 수, 유형별/난이도별 분포를 함께 계산
+        (조합 수는 유형 수 x 난이도 수로 고정)
         """
-        # 월별 날짜 계산
-        this_month_start = self.now.replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        last_month_end = this_month_start - timedelta(days=1)
-        last_month_start = last_month_end.replace(day=1)
+        this_month_start, last_month_start = self._month_starts()
 
-        user_questions = TestQuestionInfo.objects.filter(
+        rows = TestQuestionInfo.objects.filter(
             create_user=self.user, is_del=False
-        )
-
-        # 단일 aggregate 쿼리로 total, shared, this_month, last_month 계산
-        stats = user_questions.aggregate(
+        ).values('tq_type', 'tq_degree').annotate(
             total=Count('id'),
-            shared=Count(Case(When(is_share=True, then=1))),
-            this_month=Count(Case(When(create_time__gte=this_month_start, then=1))),
-            last_month=Count(Case(When(
-                create_time__gte=last_month_start,
-                create_time__lt=this_month_start,
-                then=1
-            ))),
-        )
-
-        # 유형별 집계 (별도 쿼리, 동적 카테고리)
-        type_counts = user_questions.values('tq_type').annotate(count=Count('id'))
-        questions_by_type = {item['tq_type']: item['count'] for item in type_counts}
-
-        # 난이도별 집계 (별도 쿼리, 동적 카테고리)
-        degree_counts = user_questions.values('tq_degree').annotate(count=Count('id'))
-        questions_by_difficulty = {item['tq_degree']: item['count'] for item in degree_counts}
+            shared=Count('id', filter=Q(is_share=True)),
+            this_month=Count('id', filter=Q(create_time__gte=this_month_start)),
+            last_month=Count('id', filter=Q(create_time__gte=last_month_start, create_time__lt=this_month_start)),
+        ).order_by()
+
+        totals = Counter()
+        questions_by_type = Counter()
+        questions_by_difficulty = Counter()
+        for row in rows:
+            totals.update({field: row[field] for field in ('total', 'shared', 'this_month', 'last_month')})
+            questions_by_type[row['tq_type']] += row['total']
+            questions_by_difficulty[row['tq_degree']] += row['total']
 
         return {
-            'total_questions': stats['total'] or 0,
-            'shared_questions': stats['shared'] or 0,
-            'questions_by_type': questions_by_type,
-            'questions_by_difficulty': questions_by_difficulty,
-            'trend': (stats['this_month'] or 0) - (stats['last_month'] or 0),
-            'this_month_created': stats['this_month'] or 0,
+            'total_questions': totals['total'],
+            'shared_questions': totals['shared'],
+            'questions_by_type': dict(questions_by_type),
+            'questions_by_difficulty': dict(questions_by_difficulty),
+            'trend': totals['this_month'] - totals['last_month'],
+            'this_month_created': totals['this_month'],
         }
 
-    def _get_student_statistics(self) -> dict:
+    def _get_authored_counts(self) -> dict:
         """
-        학생 통계 (쿼리 최적화)
+        시험지 수와 등록 학생 수 (1개 쿼리)
 
-        기존: 10개+ 쿼리
-        개선: 3개 쿼리 (teacher_exam_ids 1개 + total_students 1개 + aggregate 1개)
+        교사 1행에 시험지 join 조건부 집계와 등록 학생 수 scalar subquery를 함께 계산
         """
-        # 월별 날짜 계산
-        this_month_start = self.now.replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        last_month_end = this_month_start - timedelta(days=1)
-        last_month_start = last_month_end.replace(day=1)
+        this_month_start, last_month_start = self._month_starts()
+
+        # 교사가 출제한 시험의 등록 학생 수 (중복 제거)
+        students = ExamStudentsInfo.objects.filter(
+            exam__create_user=OuterRef('pk')
+        ).values('exam__create_user').annotate(
+            total=Count('student', distinct=True)
+        ).values('total')
+
+        return UserProfile.objects.filter(pk=self.user.pk).annotate(
+            testpapers=Count('testpaperinfo'),
+            testpapers_this_month=Count('testpaperinfo', filter=Q(testpaperinfo__create_time__gte=this_month_start)),
+            testpapers_last_month=Count('testpaperinfo', filter=Q(
+                testpaperinfo__create_time__gte=last_month_start,
+                testpaperinfo__create_time__lt=this_month_start,
+            )),
+            students=Coalesce(Subquery(students), 0),
+        ).values('testpapers', 'testpapers_this_month', 'testpapers_last_month', 'students').get()
 
-        # 교사가 출제한 시험 ID 목록
-        teacher_exam_ids = list(
-            ExaminationInfo.objects.filter(create_user=self.user).values_list('id', flat=True)
-        )
+    def _get_student_statistics(self, total_students: int) -> dict:
+        """
+        학생 통계 (1개 쿼리)
 
-        # 등록된 학생 수 (중복 제거)
-        total_students = ExamStudentsInfo.objects.filter(
-            exam_id__in=teacher_exam_ids
-        ).values('student').distinct().count()
+        시험 ID 목록을 Python으로 가져와 id__in으로 넘기지 않고,
+        시험 작성자 join 위에서 합계/평균/합격 수/월별 추이를 조건부 집계 1회로 계산
 
-        # 제출된 답안 조회
-        submissions = TestScores.objects.filter(
-            exam_id__in=teacher_exam_ids,
-            is_submitted=True
-        ).select_related('test_paper')
+        Args:
+            total_students: 등록 학생 수 (_get_authored_counts 결과 재사용)
+        """
+        this_month_start, last_month_start = self._month_starts()
+        this_month = Q(submit_time__gte=this_month_start)
+        last_month = Q(submit_time__gte=last_month_start, submit_time__lt=this_month_start)
 
-        # 단일 aggregate 쿼리로 대부분의 통계 계산
-        stats = submissions.aggregate(
+        stats = TestScores.objects.filter(
+            exam__create_user=self.user,
+            is_submitted=True
+        ).aggregate(
             total=Count('id'),
             avg_score=Avg('test_score'),
-            this_month_count=Count(Case(When(submit_time__gte=this_month_start, then=1))),
-            last_month_count=Count(Case(When(
-                submit_time__gte=last_month_start,
-                submit_time__lt=this_month_start,
-                then=1
-            ))),
-            this_month_avg=Avg(Case(
-                When(submit_time__gte=this_month_start, then=F('test_score'))
-            )),
-            last_month_avg=Avg(Case(
-                When(
-                    submit_time__gte=last_month_start,
-                    submit_time__lt=this_month_start,
-                    then=F('test_score')
-                )
-            )),
+            passed=Count('id', filter=Q(test_score__gte=F('test_paper__passing_score'))),
+            this_month_count=Count('id', filter=this_month),
+            last_month_count=Count('id', filter=last_month),
+            this_month_avg=Avg('test_score', filter=this_month),
+            last_month_avg=Avg('test_score', filter=last_month),
         )
 
         total_submissions = stats['total'] or 0
         average_score = round(stats['avg_score'] or 0, 1)
-
-        # 합격률 계산 (list 순회 대신 DB 쿼리로 계산)
-        # test_score >= test_paper__passing_score 조건은 F 표현식으로 처리
-        if total_submissions > 0:
-            passed_count = submissions.filter(
-                test_score__gte=F('test_paper__passing_score')
-            ).count()
-            pass_rate = round((passed_count / total_submissions) * 100, 1)
-        else:
-            pass_rate = 0.0
-
-        # 월별 submission trend
-        this_month_submissions = stats['this_month_count'] or 0
-        last_month_submissions = stats['last_month_count'] or 0
+        pass_rate = round((stats['passed'] / total_submissions) * 100, 1) if total_submissions > 0 else 0.0
 
         # 평균 점수 Trend 계산
         this_month_avg = stats['this_month_avg']
@@ -645,37 +708,19 @@ class TeacherDashboardService:
             'average_score': average_score,
             'pass_rate': pass_rate,
             'recent_submissions': [],
-            'submissions_trend': this_month_submissions - last_month_submissions,
+            'submissions_trend': stats['this_month_count'] - stats['last_month_count'],
             'score_trend': score_trend,
         }
 
-    def _get_testpaper_statistics(self) -> dict:
+    def _get_testpaper_statistics(self, counts: dict) -> dict:
         """
-        시험지 통계 (쿼리 최적화: 3개 -> 1개)
+        시험지 통계
 
-        기존: 3개 쿼리 (total, this_month, last_month)
-        개선: 1개 쿼리 (aggregate)
+        Args:
+            counts: 시험지 수 집계 (_get_authored_counts 결과 재사용)
         """
-        # 월별 날짜 계산
-        this_month_start = self.now.replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        last_month_end = this_month_start - timedelta(days=1)
-        last_month_start = last_month_end.replace(day=1)
-
-        # 단일 aggregate 쿼리로 모든 통계 계산
-        stats = TestPaperInfo.objects.filter(create_user=self.user).aggregate(
-            total=Count('id'),
-            this_month=Count(Case(When(create_time__gte=this_month_start, then=1))),
-            last_month=Count(Case(When(
-                create_time__gte=last_month_start,
-                create_time__lt=this_month_start,
-                then=1
-            ))),
-        )
-
         return {
-            'total_testpapers': stats['total'] or 0,
-            'trend': (stats['this_month'] or 0) - (stats['last_month'] or 0),
-            'this_month_created': stats['this_month'] or 0,
+            'total_testpapers': counts['testpapers'],
+            'trend': counts['testpapers_this_month'] - counts['testpapers_last_month'],
+            'this_month_created': counts['testpapers_this_month'],
         }
@@ -0,0 +1,28 @@
+"""
+User signal handlers.
+
+수강 등록/시험 변경 시 cache된 학생 대시보드 snapshot을 무효화.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from examination.models import ExaminationInfo, ExamStudentsInfo
+from examination.services import exam_state_changed
+from user.services import StudentDashboardService
+
+
+@receiver([post_save, post_delete], sender=ExamStudentsInfo)
+def invalidate_enrollment_dashboard(sender, instance, **kwargs):
+    StudentDashboardService.invalidate([instance.student_id])
+
+
+@receiver(post_save, sender=ExaminationInfo)
+def invalidate_exam_dashboard(sender, instance, created, **kwargs):
+    # 새 시험은 아직 등록된 학생이 없음 (bulk_create 등록은 student_num 저장 시 무효화)
+    if not created:
+        StudentDashboardService.invalidate_for_exams([instance.id])
+
+
+@receiver(exam_state_changed, sender=ExaminationInfo)
+def invalidate_exam_state_dashboard(sender, exam_ids, **kwargs):
+    StudentDashboardService.invalidate_for_exams(exam_ids)
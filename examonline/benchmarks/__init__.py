@@ -0,0 +1,7 @@
+"""
+Exam lifecycle benchmark.
+
+대규모 응시 데이터를 생성하고(dataset) 학생별 start -> info -> save-answer x k -> submit -> result 흐름을
+동시에 실행하여(runner) endpoint별 latency 백분위, 처리량, query 수를 JSON으로 기록한다.
+commit 간 비교용이며 실행은 manage.py run_benchmark를 사용.
+"""
@@ -0,0 +1,157 @@
+"""
+Benchmark dataset.
+
+교사/시험/학생을 bulk_create로 생성하고 응시 대상(학생, 시험, 문항별 선택지) 목록을 반환.
+모든 username에 prefix를 붙여 실행마다 독립된 data를 만들고 cleanup으로 한 번에 삭제한다.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStudentsInfo
+from testpaper.models import TestPaperInfo, TestPaperTestQ
+from testquestion.models import OptionInfo, TestQuestionInfo
+from user.models import StudentsInfo, SubjectInfo, TeacherInfo, UserProfile
+
+SUBJECT_NAMES = ['수학', '영어', '과학', '국어', '사회']
+PASSWORD = 'bench1234!'
+OPTIONS_PER_QUESTION = 4
+BATCH_SIZE = 1000
+
+
+@dataclass
+class Attempt:
+    """학생 1명의 응시 대상"""
+
+    user_id: int
+    exam_id: int
+    # [(question_id, [option_id, ...]), ...] 문항 순서대로, 첫 번째 선택지가 정답
+    questions: list = field(default_factory=list)
+
+
+@dataclass
+class Dataset:
+    prefix: str
+    attempts: list
+
+    def cleanup(self):
+        """생성한 data 삭제 (사용자 삭제로 시험/문제/시험지/성적이 함께 삭제되지 않는 부분 포함)"""
+        users = UserProfile.objects.filter(username__startswith=f'{self.prefix}_')
+        with transaction.atomic():
+            ExaminationInfo.objects.filter(create_user__in=users).delete()
+            TestPaperInfo.objects.filter(create_user__in=users).delete()
+            TestQuestionInfo.objects.filter(create_user__in=users).delete()
+            users.delete()
+
+
+def seed_exam_load(prefix, teachers=1, exams_per_teacher=1, students=100, questions=10, seed=0):
+    """
+    진행 중인 시험과 등록 학생 생성.
+
+    학생은 시험에 순서대로 나누어 등록하고(학생 i -> 시험 i % 시험 수), 시험마다 객관식 문항과
+    시험지를 새로 만든다. 모든 계정의 비밀번호는 PASSWORD.
+
+    Args:
+        prefix: username prefix (실행별 고유값)
+        teachers: 교사 수
+        exams_per_teacher: 교사별 시험 수
+        students: 학생 수
+        questions: 시험별 문항 수
+        seed: 문항/선택지 순서 난수 seed
+
+    Returns:
+        Dataset: 응시 대상 목록
+    """
+    rng = random.Random(seed)
+    password = make_password(PASSWORD)
+    now = timezone.now()
+
+    with transaction.atomic():
+        subjects = [SubjectInfo.objects.get_or_create(subject_name=name)[0] for name in SUBJECT_NAMES]
+
+        teacher_users = UserProfile.objects.bulk_create([
+            UserProfile(
+                username=f'{prefix}_teacher{idx}', password=password, nick_name=f'교사{idx}', user_type='teacher'
+            )
+            for idx in range(teachers)
+        ])
+        TeacherInfo.objects.bulk_create([
+            TeacherInfo(user=user, teacher_name=f'교사{idx}', subject=subjects[idx % len(subjects)])
+            for idx, user in enumerate(teacher_users)
+        ])
+
+        student_users = UserProfile.objects.bulk_create([
+            UserProfile(
+                username=f'{prefix}_student{idx}', password=password, nick_name=f'학생{idx}', user_type='student'
+            )
+            for idx in range(students)
+        ], batch_size=BATCH_SIZE)
+        student_infos = StudentsInfo.objects.bulk_create([
+            StudentsInfo(user=user, student_name=f'학생{idx}', student_id=f'B{idx:08d}')
+            for idx, user in enumerate(student_users)
+        ], batch_size=BATCH_SIZE)
+
+        exams = []
+        exam_questions = []
+        for teacher_idx, teacher in enumerate(teacher_users):
+            for exam_idx in range(exams_per_teacher):
+                subject = subjects[(teacher_idx + exam_idx) % len(subjects)]
+                exam, question_options = _create_exam(
+                    teacher, subject, f'{prefix} {teacher_idx}-{exam_idx}', questions, now, rng
+                )
+                exams.append(exam)
+                exam_questions.append(question_options)
+
+        enrollments = []
+        attempts = []
+        for idx, (user, student) in enumerate(zip(student_users, student_infos)):
+            exam_idx = idx % len(exams)
+            enrollments.append(ExamStudentsInfo(exam=exams[exam_idx], student=student))
+            attempts.append(Attempt(user.id, exams[exam_idx].id, exam_questions[exam_idx]))
+        ExamStudentsInfo.objects.bulk_create(enrollments, batch_size=BATCH_SIZE)
+
+        for exam_idx, exam in enumerate(exams):
+            exam.student_num = len(range(exam_idx, students, len(exams)))
+        ExaminationInfo.objects.bulk_update(exams, ['student_num'])
+
+    return Dataset(prefix, attempts)
+
+
+def _create_exam(teacher, subject, name, question_count, now, rng):
+    """시험 1개와 시험지, 객관식 문항 생성"""
+    questions = TestQuestionInfo.objects.bulk_create([
+        TestQuestionInfo(
+            name=f'{name} Q{idx}', subject=subject, score=10, tq_type='xz',
+            tq_degree=rng.choice(['jd', 'zd', 'kn']), create_user=teacher,
+        )
+        for idx in range(question_count)
+    ])
+    options = OptionInfo.objects.bulk_create([
+        OptionInfo(test_question=question, option=f'{idx}', is_right=idx == 0)
+        for question in questions
+        for idx in range(OPTIONS_PER_QUESTION)
+    ])
+
+    paper = TestPaperInfo.objects.create(
+        name=name, subject=subject, total_score=10 * question_count, passing_score=6 * question_count,
+        question_count=question_count, create_user=teacher,
+    )
+    TestPaperTestQ.objects.bulk_create([
+        TestPaperTestQ(test_paper=paper, test_question=question, score=10, order=order)
+        for order, question in enumerate(questions, start=1)
+    ])
+    exam = ExaminationInfo.objects.create(
+        name=name, subject=subject, start_time=now - timedelta(minutes=5), end_time=now + timedelta(hours=3),
+        exam_state='1', create_user=teacher,
+    )
+    ExamPaperInfo.objects.create(exam=exam, paper=paper)
+
+    question_options = [
+        (question.id, [option.id for option in options[idx * OPTIONS_PER_QUESTION:(idx + 1) * OPTIONS_PER_QUESTION]])
+        for idx, question in enumerate(questions)
+    ]
+    return exam, question_options
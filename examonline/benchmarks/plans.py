@@ -0,0 +1,219 @@
+"""
+Query plan regression harness.
+
+주요 목록 API(QuestionViewSet, TestPaperViewSet, ExaminationViewSet, ScoresViewSet)와
+대시보드 service를 실행하면서 SQL을 기록하고, SELECT마다 EXPLAIN (ANALYZE, BUFFERS)로 실행 계획을 수집한다.
+수집 결과를 baseline(JSON)과 비교하여 다음을 regression으로 보고:
+
+- 큰 table(통계상 min_rows 행 이상)에 baseline에 없던 Seq Scan이 생긴 경우
+- 추정 비용(Total Cost)이 baseline 대비 cost_threshold 비율 이상 늘어난 경우
+
+seed_bulk로 생성한 운영 규모 DB에서 실행하는 것을 전제로 하며, 실행은 manage.py check_query_plans를 사용.
+"""
+import hashlib
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connections
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.api.pagination import CountStrategy, StandardResultsSetPagination
+from core.query_budget import QueryRecorder, fingerprint
+from examination.api.views import ExaminationViewSet
+from examination.models import ExaminationInfo, ExamStatistics
+from testpaper.api.scores_views import ScoresViewSet
+from testpaper.api.views import TestPaperViewSet
+from testpaper.models import TestScores
+from testquestion.api.views import QuestionViewSet
+from testquestion.models import TestQuestionInfo
+from testquestion.services import QuestionVisibilityService
+from user.services import StudentDashboardService, TeacherDashboardService
+
+COST_THRESHOLD = 0.5
+MIN_ROWS = 10_000
+# 추정 비용이 이보다 작은 query는 비용 증가를 regression으로 보지 않음 (통계 오차)
+COST_FLOOR = 100.0
+DEEP_PAGE = 50
+
+
+@dataclass(frozen=True)
+class PlanContext:
+    """plan 측정 대상 사용자와 시험"""
+
+    teacher: object
+    student: object
+    exam: object
+    # 교사 문제 목록의 깊은 page 번호 (DEEP_PAGE, 문제가 적으면 마지막 page)
+    question_page: int = 1
+
+
+def plan_context() -> PlanContext:
+    """
+    제출 인원이 가장 많은 시험과 그 출제 교사, 응시 학생 1명 선택
+
+    Raises:
+        ValueError: 제출된 성적이 없는 경우
+    """
+    stats = ExamStatistics.objects.filter(submitted_count__gt=0).order_by('-submitted_count', 'pk').first()
+    exam_id = stats.exam_id if stats else (
+        TestScores.objects.filter(is_submitted=True, exam__isnull=False).order_by('pk')
+        .values_list('exam_id', flat=True).first()
+    )
+    if exam_id is None:
+        raise ValueError('plan 측정에 사용할 제출 성적이 없습니다. (seed_bulk로 data 생성)')
+
+    exam = ExaminationInfo.objects.select_related('create_user').get(pk=exam_id)
+    score = TestScores.objects.filter(exam=exam, is_submitted=True).select_related('user__user').order_by('pk').first()
+    visible = QuestionVisibilityService.union(TestQuestionInfo.objects.all(), exam.create_user).count()
+    question_page = max(1, min(DEEP_PAGE, math.ceil(visible / StandardResultsSetPagination.page_size)))
+    return PlanContext(teacher=exam.create_user, student=score.user, exam=exam, question_page=question_page)
+
+
+def _call_view(viewset, action, user, path='/', **kwargs):
+    """ViewSet action을 인증된 GET 요청으로 실행 (기본값 page 1, 기본 정렬)"""
+    request = APIRequestFactory().get(path, HTTP_HOST='localhost')
+    force_authenticate(request, user=user)
+    response = viewset.as_view({'get': action})(request, **kwargs)
+    response.render()
+    if response.status_code != 200:
+        raise ValueError(f'{viewset.__name__}.{action} 응답 오류: {response.status_code}')
+
+
+def _student_dashboard(context):
+    # cache된 snapshot이 아니라 집계 query를 측정
+    cache.delete(StudentDashboardService.cache_key(context.student.id))
+    StudentDashboardService(context.student).get_dashboard_data()
+
+
+CASES = {
+    'question.list.teacher': lambda context: _call_view(QuestionViewSet, 'list', context.teacher),
+    'question.list.student': lambda context: _call_view(QuestionViewSet, 'list', context.student.user),
+    'question.list.teacher.deep': lambda context: _call_view(
+        QuestionViewSet, 'list', context.teacher, f'/?page={context.question_page}'
+    ),
+    'testpaper.list': lambda context: _call_view(TestPaperViewSet, 'list', context.teacher),
+    'examination.list.teacher': lambda context: _call_view(ExaminationViewSet, 'list', context.teacher),
+    'examination.list.student': lambda context: _call_view(ExaminationViewSet, 'list', context.student.user),
+    'scores.my': lambda context: _call_view(ScoresViewSet, 'my_scores', context.student.user),
+    'scores.exam': lambda context: _call_view(ScoresViewSet, 'exam_scores', context.teacher, exam_id=context.exam.id),
+    'dashboard.student': _student_dashboard,
+    'dashboard.teacher': lambda context: TeacherDashboardService(context.teacher).get_dashboard_data(),
+}
+
+
+def explain(alias, sql, params) -> dict:
+    """EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) 결과의 최상위 object"""
+    with connections[alias].cursor() as cursor:
+        cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}', params)
+        result = cursor.fetchone()[0]
+    return (json.loads(result) if isinstance(result, str) else result)[0]
+
+
+def _walk(node):
+    yield node
+    for child in node.get('Plans', ()):
+        yield from _walk(child)
+
+
+def summarize_plan(plan, relation_rows) -> dict:
+    """
+    실행 계획 요약
+
+    Args:
+        plan: explain() 결과
+        relation_rows: {table 이름: 통계상 행 수}
+
+    Returns:
+        dict: cost, time_ms, buffers(shared hit/read), nodes(node 종류별 개수), seq_scans(table, 행 수)
+    """
+    root = plan['Plan']
+    nodes = list(_walk(root))
+    return {
+        'cost': root['Total Cost'],
+        'time_ms': round(plan.get('Execution Time', 0.0), 3),
+        'buffers': {'hit': root.get('Shared Hit Blocks', 0), 'read': root.get('Shared Read Blocks', 0)},
+        'nodes': dict(sorted(Counter(node['Node Type'] for node in nodes).items())),
+        'seq_scans': sorted(
+            {node['Relation Name']: relation_rows.get(node['Relation Name'], 0)
+             for node in nodes if node['Node Type'] == 'Seq Scan'}.items()
+        ),
+    }
+
+
+def relation_rows(alias='default') -> dict:
+    """사용자 table별 통계상 행 수 (pg_class.reltuples)"""
+    with connections[alias].cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname, c.reltuples::bigint FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE c.relkind = 'r' AND n.nspname NOT IN ('pg_catalog', 'information_schema')"
+        )
+        return {name: max(rows, 0) for name, rows in cursor.fetchall()}
+
+
+def collect(context, cases=None) -> dict:
+    """
+    case별 SELECT 실행 계획 수집.
+
+    같은 case 안의 query는 SQL fingerprint(+ 같은 fingerprint 내 순번)로 식별하므로
+    parameter 값이 달라도 baseline과 비교할 수 있다.
+
+    Returns:
+        dict: {case: {query key: {'sql', 'cost', 'time_ms', 'buffers', 'nodes', 'seq_scans'}}}
+    """
+    rows = relation_rows()
+    report = {}
+    for name in cases or CASES:
+        recorder = QueryRecorder(capture_sql=True)
+        # 목록 count도 cache가 아니라 COUNT query를 측정
+        with mock.patch.object(CountStrategy, 'cache_timeout', 0), recorder.record():
+            CASES[name](context)
+
+        queries = {}
+        occurrences = Counter()
+        for alias, sql, params in recorder.statements:
+            # UNION 등 compound query는 '(SELECT ...'로 시작
+            if not sql.lstrip().upper().startswith(('SELECT', 'WITH', '(')):
+                continue
+            shape = fingerprint(sql)
+            occurrences[shape] += 1
+            key = f'{hashlib.sha1(shape.encode()).hexdigest()[:12]}:{occurrences[shape]}'
+            queries[key] = {'sql': shape[:300], **summarize_plan(explain(alias, sql, params), rows)}
+        report[name] = queries
+    return report
+
+
+def check(report, baseline, cost_threshold=COST_THRESHOLD, min_rows=MIN_ROWS, cost_floor=COST_FLOOR) -> list:
+    """
+    baseline 대비 plan regression 목록
+
+    Args:
+        report: collect() 결과
+        baseline: 이전 collect() 결과 (case가 없으면 비교 대상 없음)
+        cost_threshold: 허용 비용 증가 비율 (0.5 = 50%)
+        min_rows: Seq Scan을 regression으로 볼 최소 table 행 수
+        cost_floor: 비용 증가를 regression으로 볼 최소 비용
+    """
+    regressions = []
+    for case, queries in report.items():
+        baseline_queries = baseline.get(case, {})
+        for key, current in queries.items():
+            previous = baseline_queries.get(key)
+            allowed = {table for table, _ in previous['seq_scans']} if previous else set()
+            for table, rows in current['seq_scans']:
+                if rows >= min_rows and table not in allowed:
+                    regressions.append(f'{case} [{key}] Seq Scan on {table} ({rows} rows): {current["sql"][:120]}')
+
+            if previous is None:
+                continue
+            limit = previous['cost'] * (1 + cost_threshold)
+            if current['cost'] > max(limit, cost_floor):
+                regressions.append(
+                    f'{case} [{key}] cost {previous["cost"]} -> {current["cost"]} '
+                    f'(허용 {round(limit, 2)}): {current["sql"][:120]}'
+                )
+    return regressions
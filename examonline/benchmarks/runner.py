@@ -0,0 +1,216 @@
+"""
+Benchmark runner.
+
+asyncio worker가 학생별 응시 흐름(start -> info -> save-answer x k -> submit -> result)을 동시에 실행하고
+요청마다 endpoint, 응답 코드, latency, query 수(Server-Timing header)를 기록한다.
+
+요청은 transport가 worker thread에서 동기로 처리:
+- ClientTransport: Django test client로 현재 process에서 처리 (server 불필요, GIL을 공유하므로 처리량은 상대 비교용)
+- HttpTransport: 실행 중인 server(runserver, gunicorn 등)에 HTTP 요청
+"""
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from django.db import connections
+from django.test import Client
+from rest_framework_simplejwt.tokens import AccessToken
+
+from user.models import UserProfile
+
+API_PREFIX = '/api/v1'
+_SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    status: int
+    elapsed: float
+    queries: int | None
+
+
+def parse_query_count(server_timing):
+    """Server-Timing header의 query 수 (QueryBudgetMiddleware가 꺼져 있으면 None)"""
+    match = _SERVER_TIMING_QUERIES.search(server_timing or '')
+    return int(match.group(1)) if match else None
+
+
+class ClientTransport:
+    """Django test client transport (thread별 client 사용)"""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def request(self, method, path, data, token):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = Client(HTTP_HOST='localhost')
+        response = client.generic(
+            method, path, json.dumps(data) if data is not None else '', content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {token}',
+        )
+        return response.status_code, parse_query_count(response.get('Server-Timing'))
+
+
+class HttpTransport:
+    """실행 중인 server로 HTTP 요청"""
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def request(self, method, path, data, token):
+        request = urllib.request.Request(
+            f'{self.base_url}{path}',
+            data=json.dumps(data).encode('utf-8') if data is not None else None,
+            headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {token}'},
+            method=method,
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+                return response.status, parse_query_count(response.headers.get('Server-Timing'))
+        except urllib.error.HTTPError as exc:
+            exc.read()
+            return exc.code, parse_query_count(exc.headers.get('Server-Timing'))
+
+
+def run_lifecycle(transport, attempts, concurrency=10, answers_per_attempt=5, correct_rate=0.7, seed=0):
+    """
+    응시 흐름 동시 실행.
+
+    Args:
+        transport: ClientTransport | HttpTransport
+        attempts: dataset.Attempt 목록
+        concurrency: 동시 worker 수
+        answers_per_attempt: 응시당 save-answer 호출 수
+        correct_rate: 정답 선택 확률
+        seed: 답안 선택 난수 seed
+
+    Returns:
+        tuple: (Sample 목록, 전체 실행 시간(초))
+    """
+    # access token 만료(15분)를 피하기 위해 실행 직전에 발급
+    users = UserProfile.objects.in_bulk([attempt.user_id for attempt in attempts])
+    tokens = {user_id: str(AccessToken.for_user(user)) for user_id, user in users.items()}
+    rng = random.Random(seed)
+    plans = [_plan(attempt, answers_per_attempt, correct_rate, rng) for attempt in attempts]
+
+    start = time.perf_counter()
+    samples = asyncio.run(_run_workers(transport, plans, tokens, concurrency))
+    return samples, time.perf_counter() - start
+
+
+def _plan(attempt, answers_per_attempt, correct_rate, rng):
+    """응시 1건의 요청 순서 [(endpoint, method, path, data), ...]"""
+    base = f'{API_PREFIX}/exams/{attempt.exam_id}'
+    answers = [
+        {'question_id': question_id, 'selected_options': [options[0] if rng.random() < correct_rate else options[1]]}
+        for question_id, options in attempt.questions
+    ]
+    steps = [('start', 'POST', f'{base}/start/', None), ('info', 'GET', f'{base}/info/', None)]
+    steps += [
+        ('save-answer', 'POST', f'{base}/save-answer/', answers[idx % len(answers)])
+        for idx in range(answers_per_attempt if answers else 0)
+    ]
+    steps += [
+        ('submit', 'POST', f'{base}/submit/', {'answers': answers}),
+        ('result', 'GET', f'{base}/result/', None),
+    ]
+    return attempt.user_id, steps
+
+
+async def _run_workers(transport, plans, tokens, concurrency):
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    for plan in plans:
+        queue.put_nowait(plan)
+    samples = []
+
+    async def worker():
+        # worker마다 전용 thread 1개 사용 (종료 시 그 thread의 DB connection 정리)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while not queue.empty():
+                user_id, steps = queue.get_nowait()
+                for endpoint, method, path, data in steps:
+                    start = time.perf_counter()
+                    status, queries = await loop.run_in_executor(
+                        executor, transport.request, method, path, data, tokens[user_id]
+                    )
+                    samples.append(Sample(endpoint, status, time.perf_counter() - start, queries))
+            await loop.run_in_executor(executor, connections.close_all)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples
+
+
+def summarize(samples, elapsed):
+    """
+    endpoint별 latency 백분위(ms), 처리량, 오류 수, query 수 집계
+
+    Returns:
+        dict: total, endpoints
+    """
+    endpoints = {}
+    for endpoint in dict.fromkeys(sample.endpoint for sample in samples):
+        group = [sample for sample in samples if sample.endpoint == endpoint]
+        latency = np.array([sample.elapsed for sample in group]) * 1000
+        p50, p95, p99 = np.percentile(latency, [50, 95, 99])
+        queries = [sample.queries for sample in group if sample.queries is not None]
+        endpoints[endpoint] = {
+            'count': len(group),
+            'errors': sum(1 for sample in group if sample.status >= 400),
+            'rps': round(len(group) / elapsed, 2) if elapsed else 0.0,
+            'latency_ms': {
+                'p50': round(float(p50), 2),
+                'p95': round(float(p95), 2),
+                'p99': round(float(p99), 2),
+                'mean': round(float(latency.mean()), 2),
+                'max': round(float(latency.max()), 2),
+            },
+            'queries': {
+                'mean': round(sum(queries) / len(queries), 2),
+                'max': max(queries),
+            } if queries else None,
+        }
+
+    return {
+        'total': {
+            'requests': len(samples),
+            'errors': sum(1 for sample in samples if sample.status >= 400),
+            'duration_s': round(elapsed, 3),
+            'rps': round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        },
+        'endpoints': endpoints,
+    }
+
+
+def compare(current, baseline):
+    """
+    baseline 결과 대비 endpoint별 p95 latency, 평균 query 수 변화
+
+    Returns:
+        dict: {endpoint: {'p95_ms': (baseline, current), 'queries': (baseline, current)}}
+    """
+    changes = {}
+    for endpoint, stats in current['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(endpoint)
+        if previous is None:
+            continue
+        changes[endpoint] = {
+            'p95_ms': (previous['latency_ms']['p95'], stats['latency_ms']['p95']),
+            'queries': (
+                (previous.get('queries') or {}).get('mean'),
+                (stats.get('queries') or {}).get('mean'),
+            ),
+        }
+    return changes
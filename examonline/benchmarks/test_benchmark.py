@@ -0,0 +1,71 @@
+"""
+Exam Lifecycle Benchmark Tests.
+"""
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from benchmarks.dataset import seed_exam_load
+from benchmarks.runner import Sample, compare, parse_query_count, summarize
+from examination.models import ExaminationInfo, ExamStudentsInfo
+from testpaper.models import TestScores
+from user.models import UserProfile
+
+
+def test_parse_query_count():
+    assert parse_query_count('db;dur=1.2;desc="7 queries", total;dur=3.0') == 7
+    assert parse_query_count(None) is None
+
+
+def test_summarize_percentiles():
+    samples = [Sample('info', 200, ms / 1000, 3) for ms in range(1, 101)] + [Sample('submit', 400, 0.05, None)]
+
+    report = summarize(samples, elapsed=2.0)
+
+    info = report['endpoints']['info']
+    assert info['count'] == 100
+    assert info['latency_ms']['p50'] == 50.5
+    assert info['latency_ms']['p99'] == 99.01
+    assert info['queries'] == {'mean': 3.0, 'max': 3}
+    assert report['endpoints']['submit']['errors'] == 1
+    assert report['endpoints']['submit']['queries'] is None
+    assert report['total'] == {'requests': 101, 'errors': 1, 'duration_s': 2.0, 'rps': 50.5}
+    assert compare(report, report)['info']['p95_ms'][0] == info['latency_ms']['p95']
+
+
+@pytest.mark.django_db
+def test_seed_exam_load_distributes_students():
+    dataset = seed_exam_load('seedtest', teachers=2, exams_per_teacher=2, students=10, questions=3)
+
+    assert len(dataset.attempts) == 10
+    assert ExamStudentsInfo.objects.filter(student__user__username__startswith='seedtest_').count() == 10
+    assert sorted(ExaminationInfo.objects.filter(name__startswith='seedtest').values_list('student_num', flat=True)) \
+        == [2, 2, 3, 3]
+    assert all(len(attempt.questions) == 3 and len(attempt.questions[0][1]) == 4 for attempt in dataset.attempts)
+
+    dataset.cleanup()
+    assert not UserProfile.objects.filter(username__startswith='seedtest_').exists()
+    assert not ExaminationInfo.objects.filter(name__startswith='seedtest').exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_benchmark_command(tmp_path):
+    """worker thread가 별도 DB connection을 사용하므로 transaction test로 실행"""
+    output = tmp_path / 'bench.json'
+
+    call_command(
+        'run_benchmark', '--students', '4', '--teachers', '1', '--exams-per-teacher', '2', '--questions', '3',
+        '--answers', '2', '--concurrency', '2', '--output', str(output), stderr=StringIO(),
+    )
+
+    report = json.loads(output.read_text(encoding='utf-8'))
+    assert list(report['endpoints']) == ['start', 'info', 'save-answer', 'submit', 'result']
+    assert report['total']['requests'] == 4 * 6
+    assert report['total']['errors'] == 0
+    assert report['endpoints']['submit']['queries']['max'] > 0
+    assert report['meta']['students'] == 4
+    # 기본값은 생성 데이터 삭제
+    assert not TestScores.objects.exists()
+    assert not UserProfile.objects.filter(username__startswith='bench').exists()
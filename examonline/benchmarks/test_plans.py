@@ -0,0 +1,91 @@
+"""
+Query Plan Harness Tests.
+"""
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from benchmarks.plans import CASES, check, collect, plan_context, summarize_plan
+from benchmarks.volume import VolumeSpec, seed_volume
+
+
+@pytest.fixture
+def context(db):
+    seed_volume('plan', VolumeSpec(teachers=2, students=10, questions=20, exams=2, questions_per_exam=5, scores=10))
+    return plan_context()
+
+
+def _plan(node_type='Seq Scan', relation='testpaper_testscores', cost=10.0):
+    return {
+        'Plan': {
+            'Node Type': 'Limit', 'Total Cost': cost, 'Shared Hit Blocks': 3,
+            'Plans': [{'Node Type': node_type, 'Relation Name': relation, 'Total Cost': cost}],
+        },
+        'Execution Time': 0.5,
+    }
+
+
+def test_summarize_plan():
+    summary = summarize_plan(_plan(), {'testpaper_testscores': 20000})
+
+    assert summary['cost'] == 10.0
+    assert summary['buffers'] == {'hit': 3, 'read': 0}
+    assert summary['nodes'] == {'Limit': 1, 'Seq Scan': 1}
+    assert summary['seq_scans'] == [('testpaper_testscores', 20000)]
+
+
+def test_check_reports_new_seq_scan_and_cost_growth():
+    index_scan = {'q': {'sql': 'SELECT 1', **summarize_plan(_plan('Index Scan', cost=200.0), {})}}
+    seq_scan = {'q': {'sql': 'SELECT 1', **summarize_plan(_plan(cost=200.0), {'testpaper_testscores': 20000})}}
+    expensive = {'q': {'sql': 'SELECT 1', **summarize_plan(_plan('Index Scan', cost=400.0), {})}}
+
+    assert check({'case': index_scan}, {'case': index_scan}) == []
+    assert 'Seq Scan on testpaper_testscores' in check({'case': seq_scan}, {'case': index_scan})[0]
+    # baseline에 이미 있던 Seq Scan과 작은 table의 Seq Scan은 허용
+    assert check({'case': seq_scan}, {'case': seq_scan}) == []
+    assert check({'case': seq_scan}, {'case': index_scan}, min_rows=50000) == []
+    assert 'cost 200.0 -> 400.0' in check({'case': expensive}, {'case': index_scan})[0]
+    assert check({'case': expensive}, {'case': index_scan}, cost_threshold=1.5) == []
+
+
+def test_collect_explains_every_case(context):
+    report = collect(context)
+
+    assert set(report) == set(CASES)
+    for case, queries in report.items():
+        assert queries, case
+        for key, query in queries.items():
+            assert query['sql'].startswith(('SELECT', '('))
+            assert query['cost'] > 0
+            assert query['nodes']
+
+    # 같은 data에서 다시 수집하면 같은 query key
+    assert {case: set(queries) for case, queries in collect(context).items()} == \
+        {case: set(queries) for case, queries in report.items()}
+
+
+@pytest.mark.usefixtures('context')
+def test_check_query_plans_command(tmp_path):
+    baseline = tmp_path / 'plans.json'
+    args = ['--case', 'question.list.teacher', '--case', 'scores.exam', '--baseline', str(baseline)]
+
+    with pytest.raises(CommandError):
+        call_command('check_query_plans', *args, stdout=StringIO())
+
+    call_command('check_query_plans', *args, '--update-baseline', stdout=StringIO())
+    saved = json.loads(baseline.read_text(encoding='utf-8'))
+    assert set(saved['cases']) == {'question.list.teacher', 'scores.exam'}
+    assert saved['meta']['rows']['testpaper_testscores'] >= 0
+
+    call_command('check_query_plans', *args, stdout=StringIO())
+
+    # baseline 비용을 낮추면 regression
+    for query in saved['cases']['scores.exam'].values():
+        query['cost'] = 1.0
+    baseline.write_text(json.dumps(saved), encoding='utf-8')
+    out = StringIO()
+    with pytest.raises(CommandError):
+        call_command('check_query_plans', *args, '--cost-threshold', '0', '--cost-floor', '0', stdout=out)
+    assert 'scores.exam' in out.getvalue()
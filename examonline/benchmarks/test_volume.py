@@ -0,0 +1,85 @@
+"""
+Volume Dataset Tests.
+"""
+from dataclasses import replace
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from benchmarks.volume import VolumeSpec, seed_volume
+from examination.answer_key import build_answer_key
+from examination.grading import grade_one
+from examination.models import ExaminationInfo, ExamStatistics, ExamStudentsInfo
+from examination.services import ExamStatisticsService
+from testpaper.models import AnswerRecord, TestScores
+
+SPEC = VolumeSpec(teachers=2, students=15, questions=20, exams=4, questions_per_exam=5, scores=30)
+
+
+def _statistics(stats):
+    return (stats.submitted_count, stats.score_sum, stats.score_sq_sum, stats.pass_count, stats.histogram)
+
+
+@pytest.mark.django_db
+def test_seed_volume_creates_graded_scores():
+    counts = seed_volume('vol', SPEC, seed=1)
+
+    assert counts['scores'] == counts['enrollments'] == 30
+    assert counts['statistics'] == counts['exams'] == 4
+    scores = TestScores.objects.filter(exam__name__startswith='vol')
+    assert scores.count() == 30
+    assert ExamStudentsInfo.objects.filter(exam__name__startswith='vol').count() == 30
+    assert sorted(ExaminationInfo.objects.filter(name__startswith='vol').values_list('student_num', flat=True)) \
+        == [7, 7, 8, 8]
+    # 시험 안에서 학생 중복 없음
+    assert scores.values('exam', 'user').distinct().count() == 30
+
+    # 생성된 detail_records와 점수는 채점 engine 결과와 같음
+    for score in scores:
+        result = grade_one(build_answer_key(score.test_paper_id), score.detail_records)
+        assert result.total_score == score.test_score
+        assert result.records == score.detail_records
+
+    # 시험 통계는 TestScores 재집계 결과와 같음
+    for stats in ExamStatistics.objects.filter(exam__name__startswith='vol'):
+        expected = _statistics(stats)
+        assert _statistics(ExamStatisticsService.rebuild(stats.exam_id)) == expected
+
+
+@pytest.mark.django_db
+def test_seed_volume_is_deterministic():
+    seed_volume('first', SPEC, seed=7)
+    seed_volume('second', SPEC, seed=7)
+
+    def scores(prefix):
+        return list(
+            TestScores.objects.filter(exam__name__startswith=prefix).order_by('pk')
+            .values_list('test_score', 'time_used')
+        )
+
+    assert scores('first') == scores('second')
+
+
+@pytest.mark.django_db
+def test_seed_volume_answer_records():
+    counts = seed_volume('rec', replace(SPEC, answer_records=True), seed=1)
+
+    total_answers = sum(
+        len(records) for records in TestScores.objects.filter(exam__name__startswith='rec')
+        .values_list('detail_records', flat=True)
+    )
+    assert counts['answer_records'] == total_answers == AnswerRecord.objects.count()
+
+
+@pytest.mark.django_db
+def test_seed_bulk_command_rejects_invalid_volume():
+    with pytest.raises(CommandError):
+        call_command('seed_bulk', '--teachers', '5', '--questions', '10', '--questions-per-exam', '5', stdout=StringIO())
+
+    call_command(
+        'seed_bulk', '--prefix', 'dup', '--teachers', '1', '--students', '2', '--questions', '5', '--exams', '1',
+        '--questions-per-exam', '5', '--scores', '2', stdout=StringIO(),
+    )
+    with pytest.raises(CommandError):
+        call_command('seed_bulk', '--prefix', 'dup', stdout=StringIO())
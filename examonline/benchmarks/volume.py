@@ -0,0 +1,357 @@
+"""
+Volume dataset.
+
+운영 규모(학생 10만 명, 성적 100만 건, 문항 20만 개 등)의 data를 bulk_create로 batch 단위 생성하여
+production과 비슷한 크기의 table에서 query plan을 재현한다.
+
+- 학생 능력치와 문항 난이도로 정답 확률을 정해(1PL 문항반응 모형) 시험별 점수가 정규분포에 가깝게 나온다.
+- 성적(TestScores)마다 채점 결과와 같은 형식의 detail_records를 채우고, 시험 통계(ExamStatistics)도 함께 생성한다.
+- 같은 seed와 규모면 같은 data(문항 구성, 응시자, 정답 여부, 점수)가 생성된다.
+"""
+from collections import Counter
+from dataclasses import dataclass
+from datetime import timedelta
+
+import numpy as np
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import JSONField, Value
+from django.utils import timezone
+
+from benchmarks.dataset import PASSWORD, SUBJECT_NAMES
+from examination.models import ExaminationInfo, ExamPaperInfo, ExamStatistics, ExamStudentsInfo
+from examination.services import AnswerRecordService, ExamStatisticsService
+from testpaper.models import TestPaperInfo, TestPaperTestQ, TestScores
+from testquestion.models import OptionInfo, TestQuestionInfo
+from testquestion.services import QuestionSearchService
+from user.models import StudentsInfo, SubjectInfo, TeacherInfo, UserProfile
+
+BATCH_SIZE = 2000
+# 문제 유형 비율과 유형별 선택지 수 (빈칸 채우기는 정답 텍스트 1개)
+QUESTION_TYPES = ('xz', 'pd', 'tk')
+QUESTION_TYPE_WEIGHTS = (0.7, 0.2, 0.1)
+OPTION_COUNTS = {'xz': 4, 'pd': 2, 'tk': 1}
+QUESTION_SCORES = (3, 4, 5, 6)
+# 난이도별 문항 난이도 모수 평균 (능력치와 같은 척도)
+DEGREES = ('jd', 'zd', 'kn')
+DEGREE_DIFFICULTY = {'jd': -1.5, 'zd': -0.5, 'kn': 0.5}
+SKIP_RATE = 0.03
+SHARE_RATE = 0.1
+DELETE_RATE = 0.02
+TOPICS = {
+    '수학': ['방정식', '함수', '확률', '미분', '적분', '수열', '도형', '통계'],
+    '영어': ['vocabulary', 'grammar', 'reading', 'tense', 'preposition', 'idiom', 'listening', 'writing'],
+    '과학': ['화학 반응', '원소', '세포', '유전', '전기', '역학', '태양계', '생태계'],
+    '국어': ['맞춤법', '문법', '고전 문학', '현대시', '비문학', '어휘', '띄어쓰기', '화법'],
+    '사회': ['경제', '정치', '지리', '역사', '법', '문화', '인권', '세계화'],
+}
+FORMS = ['다음 중 옳은 것은?', '다음 중 틀린 것은?', '빈칸에 알맞은 것은?', '설명으로 가장 적절한 것은?']
+
+
+@dataclass(frozen=True)
+class VolumeSpec:
+    """생성 규모"""
+
+    teachers: int = 100
+    students: int = 10_000
+    questions: int = 20_000
+    exams: int = 500
+    questions_per_exam: int = 20
+    scores: int = 100_000
+    months: int = 12
+    answer_records: bool = False
+
+    def validate(self):
+        """규모 검증 (잘못된 경우 ValueError)"""
+        if min(self.teachers, self.students, self.exams, self.questions_per_exam) < 1:
+            raise ValueError('teachers, students, exams, questions_per_exam은 1 이상이어야 합니다.')
+        if self.questions < self.teachers * self.questions_per_exam:
+            raise ValueError('교사별 문항 수가 시험별 문항 수보다 적습니다. (questions >= teachers * questions_per_exam)')
+        if self.scores > self.exams * self.students:
+            raise ValueError('성적 수는 시험 수 x 학생 수를 넘을 수 없습니다. (시험별 학생당 성적 1건)')
+
+
+@dataclass
+class _QuestionPool:
+    """생성한 문항 정보 (question index 기준 numpy 배열)"""
+
+    ids: np.ndarray
+    types: list
+    scores: np.ndarray
+    difficulty: np.ndarray
+    # question index -> (정답 option id, 오답 option id 목록, 정답 텍스트)
+    options: list
+
+
+def seed_volume(prefix, spec, seed=0, log=None) -> dict:
+    """
+    대량 data 생성.
+
+    Args:
+        prefix: username/시험 이름 prefix (이미 있으면 ValueError)
+        spec: VolumeSpec
+        seed: 난수 seed
+        log: 진행 상황 출력 함수 (str 1개를 받음)
+
+    Returns:
+        dict: model별 생성 건수
+    """
+    spec.validate()
+    if UserProfile.objects.filter(username__startswith=f'{prefix}_').exists():
+        raise ValueError(f'prefix "{prefix}"로 생성된 data가 이미 있습니다.')
+
+    log = log or (lambda message: None)
+    rng = np.random.default_rng(seed)
+    now = timezone.now()
+    subjects = [SubjectInfo.objects.get_or_create(subject_name=name)[0] for name in SUBJECT_NAMES]
+
+    # 중간에 실패하면 일부만 남지 않도록 전체를 transaction 1개로 생성
+    with transaction.atomic():
+        teachers = _create_teachers(prefix, spec, subjects)
+        log(f'교사 {len(teachers)}명 생성')
+        student_ids = _create_students(prefix, spec)
+        log(f'학생 {len(student_ids)}명 생성')
+        pool = _create_questions(prefix, spec, teachers, rng, now)
+        log(f'문항 {len(pool.ids)}개 생성')
+        # 성적은 시험마다 고르게 배분
+        exam_sizes = np.full(spec.exams, spec.scores // spec.exams)
+        exam_sizes[:spec.scores % spec.exams] += 1
+        exams = _create_exams(prefix, spec, teachers, pool, exam_sizes, rng, now)
+        log(f'시험/시험지 {len(exams)}개 생성')
+        counts = _create_scores(spec, student_ids, exams, exam_sizes, pool, rng, log)
+
+    counts.update(
+        teachers=len(teachers), students=len(student_ids), questions=len(pool.ids),
+        options=sum(len(wrong) + 1 for _, wrong, _ in pool.options), exams=len(exams),
+    )
+    return dict(counts)
+
+
+def _create_teachers(prefix, spec, subjects):
+    """교사 계정 생성, [(UserProfile, SubjectInfo), ...] 반환"""
+    password = make_password(PASSWORD)
+    users = UserProfile.objects.bulk_create([
+        UserProfile(
+            username=f'{prefix}_teacher{idx}', password=password, nick_name=f'교사{idx}', user_type='teacher'
+        )
+        for idx in range(spec.teachers)
+    ], batch_size=BATCH_SIZE)
+    teacher_subjects = [subjects[idx % len(subjects)] for idx in range(spec.teachers)]
+    TeacherInfo.objects.bulk_create([
+        TeacherInfo(user=user, teacher_name=f'교사{idx}', subject=subject, work_years=idx % 30)
+        for idx, (user, subject) in enumerate(zip(users, teacher_subjects))
+    ], batch_size=BATCH_SIZE)
+    return list(zip(users, teacher_subjects))
+
+
+def _create_students(prefix, spec):
+    """학생 계정 생성, StudentsInfo id 목록 반환"""
+    password = make_password(PASSWORD)
+    student_ids = []
+    for start in range(0, spec.students, BATCH_SIZE):
+        indexes = range(start, min(start + BATCH_SIZE, spec.students))
+        users = UserProfile.objects.bulk_create([
+            UserProfile(
+                username=f'{prefix}_student{idx}', password=password, nick_name=f'학생{idx}',
+                user_type='student', email=f'{prefix}_student{idx}@example.com',
+            )
+            for idx in indexes
+        ])
+        students = StudentsInfo.objects.bulk_create([
+            StudentsInfo(
+                user=user, student_name=f'학생{idx}', student_id=f'S{idx:08d}',
+                student_class=f'{idx % 10 + 1}반', student_school=f'학교{idx % 50}',
+            )
+            for idx, user in zip(indexes, users)
+        ])
+        student_ids.extend(student.id for student in students)
+    return student_ids
+
+
+def _create_questions(prefix, spec, teachers, rng, now):
+    """교사별 문항과 선택지 생성 (교사 과목의 문항, 일부 공유/삭제)"""
+    types = rng.choice(QUESTION_TYPES, size=spec.questions, p=QUESTION_TYPE_WEIGHTS).tolist()
+    degrees = rng.choice(DEGREES, size=spec.questions).tolist()
+    scores = rng.choice(QUESTION_SCORES, size=spec.questions)
+    difficulty = np.array([DEGREE_DIFFICULTY[degree] for degree in degrees]) + rng.normal(0, 0.5, spec.questions)
+    shared = rng.random(spec.questions) < SHARE_RATE
+    deleted = rng.random(spec.questions) < DELETE_RATE
+    created_days = rng.integers(0, spec.months * 30 + 60, spec.questions)
+    correct_positions = rng.integers(0, OPTION_COUNTS['xz'], spec.questions)
+
+    ids = []
+    options = []
+    for start in range(0, spec.questions, BATCH_SIZE):
+        indexes = range(start, min(start + BATCH_SIZE, spec.questions))
+        batch = []
+        for idx in indexes:
+            teacher, subject = teachers[idx % len(teachers)]
+            topics = TOPICS.get(subject.subject_name, TOPICS['수학'])
+            batch.append(TestQuestionInfo(
+                name=f'[{topics[idx % len(topics)]}] {FORMS[idx // len(topics) % len(FORMS)]} ({prefix} #{idx})',
+                subject=subject, score=int(scores[idx]), tq_type=types[idx], tq_degree=degrees[idx],
+                is_share=bool(shared[idx]), is_del=bool(deleted[idx]), create_user=teacher,
+                create_time=now - timedelta(days=int(created_days[idx])),
+            ))
+
+        questions = TestQuestionInfo.objects.bulk_create(batch)
+        option_rows = []
+        for idx, question in zip(indexes, questions):
+            count = OPTION_COUNTS[types[idx]]
+            correct_position = correct_positions[idx] % count
+            option_rows.extend(
+                OptionInfo(
+                    test_question=question, is_right=position == correct_position,
+                    option=f'정답{idx}' if types[idx] == 'tk' else f'보기 {position + 1}',
+                )
+                for position in range(count)
+            )
+        created = iter(OptionInfo.objects.bulk_create(option_rows))
+
+        for idx, question in zip(indexes, questions):
+            question_options = [next(created) for _ in range(OPTION_COUNTS[types[idx]])]
+            right = next(option for option in question_options if option.is_right)
+            options.append((right.id, [option.id for option in question_options if not option.is_right], right.option))
+            ids.append(question.id)
+        # bulk_create는 signal을 보내지 않으므로 검색 vector를 batch마다 계산
+        QuestionSearchService.refresh([question.id for question in questions])
+
+    return _QuestionPool(np.array(ids), types, scores, difficulty, options)
+
+
+def _create_exams(prefix, spec, teachers, pool, exam_sizes, rng, now):
+    """
+    시험마다 시험지 1개 생성 (출제 교사의 문항에서 선택, 이후 삭제된 문항이 포함될 수 있음).
+
+    Returns:
+        list: [(ExaminationInfo, TestPaperInfo, question index 배열), ...]
+    """
+    exams = []
+    for start in range(0, spec.exams, BATCH_SIZE):
+        indexes = range(start, min(start + BATCH_SIZE, spec.exams))
+        papers, exam_rows, selections = [], [], []
+        for idx in indexes:
+            teacher, subject = teachers[idx % len(teachers)]
+            # 문항 idx는 idx % 교사 수 번째 교사가 출제
+            teacher_questions = np.arange(idx % len(teachers), spec.questions, len(teachers))
+            selected = rng.choice(teacher_questions, size=spec.questions_per_exam, replace=False)
+            total_score = int(pool.scores[selected].sum())
+            end_time = now - timedelta(days=int(rng.integers(1, spec.months * 30)), minutes=int(rng.integers(0, 720)))
+            start_time = end_time - timedelta(minutes=int(rng.choice([60, 90, 120])))
+            name = f'{prefix} 시험 {idx}'
+            papers.append(TestPaperInfo(
+                name=name, subject=subject, tp_degree=DEGREES[idx % len(DEGREES)], total_score=total_score,
+                passing_score=round(total_score * 0.6), question_count=len(selected), create_user=teacher,
+                create_time=start_time - timedelta(days=7),
+            ))
+            exam_rows.append(ExaminationInfo(
+                name=name, subject=subject, start_time=start_time, end_time=end_time, exam_state='2',
+                student_num=int(exam_sizes[idx]), actual_num=int(exam_sizes[idx]), create_user=teacher,
+                create_time=start_time - timedelta(days=7),
+            ))
+            selections.append(selected)
+
+        papers = TestPaperInfo.objects.bulk_create(papers)
+        exam_rows = ExaminationInfo.objects.bulk_create(exam_rows)
+        ExamPaperInfo.objects.bulk_create([
+            ExamPaperInfo(exam=exam, paper=paper) for exam, paper in zip(exam_rows, papers)
+        ])
+        TestPaperTestQ.objects.bulk_create([
+            TestPaperTestQ(
+                test_paper=paper, test_question_id=int(pool.ids[question]), score=int(pool.scores[question]),
+                order=order,
+            )
+            for paper, selected in zip(papers, selections)
+            for order, question in enumerate(selected, start=1)
+        ], batch_size=BATCH_SIZE)
+        exams.extend(zip(exam_rows, papers, selections))
+    return exams
+
+
+def _create_scores(spec, student_ids, exams, exam_sizes, pool, rng, log):
+    """
+    시험별 응시자 등록, 제출 성적, 시험 통계 생성.
+
+    시험마다 임의 위치부터 연속된 학생(순환)이 응시하므로 시험 안에서 학생이 중복되지 않는다.
+    """
+    abilities = rng.normal(0, 1, len(student_ids))
+    counts = Counter()
+    scores, enrollments, statistics = [], [], []
+
+    def flush():
+        created = TestScores.objects.bulk_create(scores)
+        ExamStudentsInfo.objects.bulk_create(enrollments)
+        if spec.answer_records:
+            for score in created:
+                score.detail_records = score.detail_records.value
+            AnswerRecordService.create(created)
+            counts['answer_records'] += sum(len(score.detail_records) for score in created)
+        counts['scores'] += len(scores)
+        counts['enrollments'] += len(enrollments)
+        if counts['scores'] // (BATCH_SIZE * 50) > (counts['scores'] - len(scores)) // (BATCH_SIZE * 50):
+            log(f'  성적 {counts["scores"]}/{spec.scores}건')
+        scores.clear()
+        enrollments.clear()
+
+    for (exam, paper, selected), size in zip(exams, exam_sizes):
+        students = (rng.integers(0, len(student_ids)) + np.arange(size)) % len(student_ids)
+        # 정답 확률 = 1 / (1 + exp(-1.7 * (능력치 - 문항 난이도)))
+        probability = 1 / (1 + np.exp(-1.7 * (abilities[students, None] - pool.difficulty[selected][None, :])))
+        answered = rng.random(probability.shape) >= SKIP_RATE
+        correct = (rng.random(probability.shape) < probability) & answered
+        wrong_picks = rng.integers(0, OPTION_COUNTS['xz'], probability.shape)
+        max_scores = pool.scores[selected]
+        totals = (correct * max_scores).sum(axis=1)
+        duration = (exam.end_time - exam.start_time).total_seconds() / 60
+        time_used = rng.integers(int(duration * 0.3), int(duration) + 1, size)
+        start_offsets = rng.integers(0, int(duration) - time_used + 1)
+
+        questions = [
+            (str(pool.ids[question]), pool.types[question], *pool.options[question], int(max_scores[position]))
+            for position, question in enumerate(selected)
+        ]
+        for row, student in enumerate(students.tolist()):
+            records = {}
+            for question, is_answered, is_correct, pick in zip(
+                questions, answered[row].tolist(), correct[row].tolist(), wrong_picks[row].tolist()
+            ):
+                if not is_answered:
+                    continue
+                question_id, tq_type, right_id, wrong_ids, right_text, max_score = question
+                if tq_type == 'tk':
+                    answer, selected_options = (right_text if is_correct else '오답'), []
+                else:
+                    answer, selected_options = '', [right_id if is_correct else wrong_ids[pick % len(wrong_ids)]]
+                records[question_id] = {
+                    'answer': answer,
+                    'selected_options': selected_options,
+                    'is_correct': is_correct,
+                    'score': max_score if is_correct else 0,
+                    'max_score': max_score,
+                }
+
+            start_time = exam.start_time + timedelta(minutes=int(start_offsets[row]))
+            submit_time = start_time + timedelta(minutes=int(time_used[row]))
+            scores.append(TestScores(
+                user_id=student_ids[student], test_paper=paper, exam=exam, test_score=int(totals[row]),
+                # 식(Value)으로 넘기면 UNNEST 대신 VALUES 목록으로 insert 되어
+                # JSON 문자열마다 배열 literal escape를 하지 않음 (대량 insert 시 2배 이상 빠름)
+                detail_records=Value(records, JSONField()), start_time=start_time, submit_time=submit_time,
+                is_submitted=True, time_used=int(time_used[row]), create_time=start_time,
+            ))
+            enrollments.append(ExamStudentsInfo(exam=exam, student_id=student_ids[student]))
+            if len(scores) >= BATCH_SIZE:
+                flush()
+
+        statistics.append(ExamStatistics(
+            exam=exam, passing_score=paper.passing_score, total_score=paper.total_score,
+            **ExamStatisticsService.summarize(Counter(totals.tolist()), paper.passing_score, paper.total_score),
+        ))
+
+    if scores:
+        flush()
+    ExamStatistics.objects.bulk_create(statistics, batch_size=BATCH_SIZE)
+    log(f'성적 {counts["scores"]}건, 시험 통계 {len(statistics)}건 생성')
+
+    counts['statistics'] = len(statistics)
+    return counts
@@ -18,6 +18,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third-party apps
     'rest_framework',
     'rest_framework_simplejwt.token_blacklist',
@@ -37,6 +38,7 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = 'user.UserProfile'
 
 MIDDLEWARE = [
+    'core.middleware.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -103,6 +105,22 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Exam taking
+# save-answer 답안을 Redis buffer에 모아 주기적으로 DB에 반영 (manage.py flush_answer_buffer 실행 필요)
+ANSWER_BUFFER_ENABLED = os.getenv('ANSWER_BUFFER_ENABLED', 'False').lower() == 'true'
+ANSWER_BUFFER_FLUSH_INTERVAL = int(os.getenv('ANSWER_BUFFER_FLUSH_INTERVAL', 5))
+# 제출 시 채점하지 않고 대기열에 접수 후 202 반환 (manage.py run_grading_workers 실행 필요)
+# 켜져 있으면 재채점 API도 대기열에 접수만 하고 worker가 처리 (꺼져 있으면 요청 안에서 바로 재채점)
+ASYNC_SUBMIT_ENABLED = os.getenv('ASYNC_SUBMIT_ENABLED', 'False').lower() == 'true'
+
+# Query budget
+# 요청별 query 수/중복 SQL/DB 시간 기록 및 Server-Timing header (core.middleware.QueryBudgetMiddleware)
+QUERY_BUDGET_ENABLED = os.getenv('QUERY_BUDGET_ENABLED', 'False').lower() == 'true'
+# view에 선언된 query budget(@query_budget) 초과 시 예외 발생 (False면 warning log만 기록)
+QUERY_BUDGET_RAISE = os.getenv('QUERY_BUDGET_RAISE', 'False').lower() == 'true'
+# 같은 SQL이 이 횟수 이상 반복되면 N+1 의심으로 warning log
+QUERY_BUDGET_DUPLICATE_THRESHOLD = int(os.getenv('QUERY_BUDGET_DUPLICATE_THRESHOLD', 3))
+
 # Import REST Framework and related settings
 from config.api import (  # noqa: E402, F401
     CORS_ALLOW_CREDENTIALS,
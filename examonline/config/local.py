@@ -60,6 +60,11 @@ CACHES = {
     }
 }
 
+# Query budget: 개발 환경에서는 query를 기록하고 budget 초과는 warning log로 남김
+# (예외는 commit 이후 응답을 500으로 바꾸므로 테스트에서만 발생시킴, conftest.py 참고)
+QUERY_BUDGET_ENABLED = os.getenv('QUERY_BUDGET_ENABLED', 'True').lower() == 'true'
+QUERY_BUDGET_RAISE = os.getenv('QUERY_BUDGET_RAISE', 'False').lower() == 'true'
+
 # Development-only apps
 INSTALLED_APPS += [
     'django.contrib.admindocs',
@@ -0,0 +1,29 @@
+"""
+공통 pytest 설정.
+
+CI 환경에는 Redis가 없으므로 테스트에서는 LocMemCache를 사용한다.
+query budget 초과는 테스트에서만 예외로 발생시킨다.
+"""
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """테스트마다 독립된 LocMemCache 사용"""
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'examonline-tests',
+        }
+    }
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def query_budget_raise(settings):
+    """테스트에서는 view의 query budget 초과 시 예외 발생"""
+    settings.QUERY_BUDGET_ENABLED = True
+    settings.QUERY_BUDGET_RAISE = True
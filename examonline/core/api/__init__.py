@@ -4,13 +4,14 @@ Core API utilities.
 
 from core.api.exceptions import custom_exception_handler
 from core.api.fields import XSSSanitizedCharField
-from core.api.pagination import StandardResultsSetPagination
+from core.api.pagination import KeysetPagination, StandardResultsSetPagination
 from core.api.permissions import IsOwnerOrTeacher, IsStudent, IsTeacher
 
 __all__ = [
     'IsTeacher',
     'IsStudent',
     'IsOwnerOrTeacher',
+    'KeysetPagination',
     'StandardResultsSetPagination',
     'custom_exception_handler',
     'XSSSanitizedCharField',
@@ -2,26 +2,400 @@
 Custom pagination classes.
 """
 
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+import json
+from functools import cached_property, partial
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from core.cache import get_or_build
+
+
+def estimate_count(queryset) -> int:
+    """
+    planner 추정 행 수 (EXPLAIN의 최상위 Plan Rows).
+
+    COUNT(*) 없이 통계(pg_class, pg_statistic)로 계산하므로 큰 table에서도 비용이 일정하지만,
+    ANALYZE 이후 변경분이나 상관관계가 있는 조건에서는 오차가 있다.
+    """
+    if queryset.query.is_empty():
+        return 0
+    plan = queryset.order_by().explain(format='json')
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class CountStrategy:
+    """
+    목록 count 계산 방식.
+
+    planner 추정 행 수로 결과 크기를 먼저 판단하여
+    - exact_threshold 미만: COUNT(*) (작은 결과는 매번 계산)
+    - estimate_threshold 이상: 추정치를 그대로 사용 (approximate)
+    - 그 사이: COUNT(*) 결과 사용
+
+    판단 결과(추정치, COUNT(*) 결과, 작은 결과 여부)는 (view, SQL + parameter hash) 단위로 cache_timeout초 cache하여
+    cache가 유효한 동안에는 EXPLAIN을 다시 실행하지 않는다.
+    """
+
+    exact_threshold = 1_000
+    estimate_threshold = 100_000
+    cache_timeout = 30
+    cache_prefix = 'pagination:count'
+
+    def __init__(self, view=None):
+        self.view = view
+
+    def __call__(self, queryset):
+        """(count, 추정 여부)"""
+        if queryset.query.is_empty():
+            return 0, False
+        count, approximate = get_or_build(
+            self.cache_key(queryset), partial(self.measure, queryset), timeout=self.cache_timeout
+        )
+        if count is None:
+            return queryset.count(), False
+        return count, approximate
+
+    def measure(self, queryset):
+        """
+        (count, 추정 여부) 계산 (cache 대상).
+
+        작은 결과는 count를 None으로 두어 요청마다 COUNT(*)로 계산하게 한다.
+        """
+        estimate = estimate_count(queryset)
+        if estimate < self.exact_threshold:
+            return None, False
+        if estimate >= self.estimate_threshold:
+            return estimate, True
+        return queryset.count(), False
+
+    def cache_key(self, queryset):
+        """view와 filter(SQL, parameter)별 cache key (사용자별 조건도 parameter에 포함)"""
+        sql, params = queryset.order_by().query.sql_with_params()
+        digest = hashlib.sha1(f'{sql}|{params!r}'.encode()).hexdigest()
+        view = f'{type(self.view).__module__}.{type(self.view).__qualname__}' if self.view is not None else '-'
+        return f'{self.cache_prefix}:{view}:{digest}'
+
+
+class CountedPage(Page):
+    """다음 page 존재 여부를 실제 조회 결과로 판단하는 page (추정 count용)"""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class CountedPaginator(DjangoPaginator):
+    """
+    count를 CountStrategy로 계산하는 Django paginator.
+
+    추정 count는 실제 행 수와 다를 수 있으므로 page 범위를 count로 검사하지 않고,
+    page_size + 1행을 조회하여 다음 page 여부를 판단한다. 마지막 page에 도달하면 count를 실제 값으로 보정한다.
+    """
+
+    def __init__(self, object_list, per_page, counter=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.counter = counter
+        self.count_approximate = False
+
+    @cached_property
+    def count(self):
+        if self.counter is None:
+            return super().count
+        count, self.count_approximate = self.counter(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        if not self.count_approximate:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        # count를 계산해야 추정 여부가 정해짐
+        if not (self.count and self.count_approximate):
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+
+        has_next = len(rows) > self.per_page
+        if not has_next:
+            self.count, self.count_approximate = bottom + len(rows), False
+        return CountedPage(rows[:self.per_page], number, self, has_next)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset(cursor) pagination.
+
+    OFFSET 대신 마지막 행의 정렬 값((create_time, id) 등) 이후를 WHERE 조건으로 조회하므로
+    page 깊이와 관계없이 index 범위 scan 한 번으로 page를 가져온다.
+
+    - 정렬은 queryset의 order_by(OrderingFilter, 검색 순위 포함)를 따르고, pk를 마지막 정렬 기준으로 추가
+    - cursor는 정렬 기준과 위치 값을 서명한 opaque 문자열 (변조, 다른 정렬의 cursor는 404)
+    - count: auto(CountStrategy), exact(COUNT(*)), estimate(planner 추정), none(생략) 중 count query param으로 선택
+    - 응답은 page 번호 방식과 같은 results/count/next/previous 구조에 count_approximate 추가
+    """
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    count_modes = ('auto', 'exact', 'estimate', 'none')
+    count_mode = 'auto'
+    count_strategy_class = CountStrategy
+    default_ordering = ('-create_time',)
+    cursor_salt = 'core.api.pagination.keyset'
+    invalid_cursor_message = '유효하지 않은 cursor입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.view = view
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        self.fields = [self._resolve_field(queryset, name.lstrip('-')) for name in self.ordering]
+
+        position, reverse = self.decode_cursor(request)
+        self.count, self.count_approximate = self.get_count(queryset, request)
+
+        ordering = [self._invert(name) for name in self.ordering] if reverse else self.ordering
+        page = queryset.order_by(*ordering)
+        if position is not None:
+            page = page.filter(self._after(ordering, position))
+
+        rows = list(page[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'results': data,
+            'count': self.count,
+            'count_approximate': self.count_approximate,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+        })
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param], strict=True, cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_ordering(self, queryset):
+        """
+        queryset 정렬 기준 + pk tie-breaker
+
+        Raises:
+            ValidationError: 식(expression) 정렬 등 keyset으로 표현할 수 없는 정렬
+        """
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering or self.default_ordering)
+        if not all(isinstance(name, str) and name != '?' for name in ordering):
+            raise ValidationError({self.cursor_query_param: 'cursor pagination에서 지원하지 않는 정렬입니다.'})
+
+        pk_names = {'pk', queryset.model._meta.pk.name, queryset.model._meta.pk.attname}
+        if not any(name.lstrip('-') in pk_names for name in ordering):
+            ordering.append('-pk' if ordering[0].startswith('-') else 'pk')
+        return ordering
+
+    def get_count(self, queryset, request):
+        """(count, 추정 여부)"""
+        mode = request.query_params.get(self.count_query_param, self.count_mode)
+        if mode not in self.count_modes:
+            raise ValidationError({self.count_query_param: f'{", ".join(self.count_modes)} 중 하나여야 합니다.'})
+        if mode == 'none':
+            return None, False
+        if mode == 'estimate':
+            return estimate_count(queryset), True
+        if mode == 'auto':
+            return self.count_strategy_class(self.view)(queryset)
+        return queryset.count(), False
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, row, reverse):
+        """row 위치를 서명된 cursor로 만든 link"""
+        position = [
+            self._dump(self._value(row, name.lstrip('-'), field)) for name, field in zip(self.ordering, self.fields)
+        ]
+        cursor = signing.dumps({'o': self.ordering, 'p': position, 'r': reverse}, salt=self.cursor_salt)
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        """
+        (위치 값 목록 또는 None, 역방향 여부)
+
+        Raises:
+            NotFound: 서명이 맞지 않거나 현재 정렬과 다른 cursor
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = signing.loads(encoded, salt=self.cursor_salt)
+            if payload['o'] != self.ordering or len(payload['p']) != len(self.fields):
+                raise ValueError('ordering mismatch')
+            position = [field.to_python(value) for field, value in zip(self.fields, payload['p'])]
+        except (signing.BadSignature, KeyError, TypeError, ValueError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, bool(payload.get('r'))
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param, 'required': False, 'in': 'query',
+                'description': 'page 위치 cursor (next/previous link 값, 빈 값이면 첫 page)',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.count_query_param, 'required': False, 'in': 'query',
+                'description': 'count 계산 방식 (auto, exact, estimate, none)',
+                'schema': {'type': 'string', 'enum': list(self.count_modes)},
+            },
+            {
+                'name': self.page_size_query_param, 'required': False, 'in': 'query',
+                'description': 'page 크기', 'schema': {'type': 'integer'},
+            },
+        ]
+
+    def _resolve_field(self, queryset, name):
+        """정렬 이름의 model field 또는 annotation output field (null 허용 field는 keyset 비교 불가)"""
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        try:
+            field = queryset.model._meta.pk if name == 'pk' else queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or field.null:
+            raise ValidationError({self.cursor_query_param: f'cursor pagination에서 지원하지 않는 정렬입니다: {name}'})
+        return field
+
+    @staticmethod
+    def _value(row, name, field):
+        return row.pk if name == 'pk' else getattr(row, getattr(field, 'attname', None) or name)
+
+    @staticmethod
+    def _dump(value):
+        # DjangoJSONEncoder는 datetime을 millisecond까지만 남기므로 microsecond까지 보존
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+    @staticmethod
+    def _invert(name):
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+    @staticmethod
+    def _after(ordering, position):
+        """
+        정렬 순서상 position 다음 행 조건.
+
+        (a, b, pk) > (x, y, z) 를 a > x OR (a = x AND b > y) OR (a = x AND b = y AND pk > z)로 풀고,
+        첫 정렬 기준 범위 조건(a >= x)을 함께 두어 index 범위 scan이 가능하게 한다.
+        """
+        condition = Q()
+        equal = Q()
+        for name, value in zip(ordering, position):
+            field = name.lstrip('-')
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{field}__{lookup}': value})
+            equal &= Q(**{field: value})
+
+        first = ordering[0].lstrip('-')
+        bound = Q(**{f'{first}__{"lte" if ordering[0].startswith("-") else "gte"}': position[0]})
+        return bound & condition
 
 
 class StandardResultsSetPagination(PageNumberPagination):
     """
     Standard pagination class with customizable page size.
+
+    count는 CountStrategy로 계산하며(결과 크기에 따라 exact, cache, planner 추정),
+    추정치인 경우 응답의 count_approximate가 True.
+
+    view에 cursor_pagination = True가 설정되어 있고 요청에 cursor query param이 있으면
+    (첫 page는 빈 값 ?cursor=) KeysetPagination으로 처리한다.
     """
 
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+    keyset_class = KeysetPagination
+    count_strategy_class = CountStrategy
+
+    @property
+    def django_paginator_class(self):
+        return partial(CountedPaginator, counter=self.count_strategy_class(self.view))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        self.keyset = None
+        if getattr(view, 'cursor_pagination', False) and self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
         """
         Return paginated response in standard DRF format (Frontend 호환).
         """
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
         return Response({
             'results': data,
             'count': self.page.paginator.count,
+            'count_approximate': self.page.paginator.count_approximate,
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
         })
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if getattr(view, 'cursor_pagination', False):
+            parameters += [
+                parameter for parameter in self.keyset_class().get_schema_operation_parameters(view)
+                if parameter['name'] != self.page_size_query_param
+            ]
+        return parameters
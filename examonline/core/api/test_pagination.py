@@ -0,0 +1,182 @@
+"""
+Pagination Tests.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.api.pagination import CountStrategy, estimate_count
+from testquestion.models import TestQuestionInfo
+from user.models import SubjectInfo, UserProfile
+
+
+@pytest.fixture
+def teacher(db):
+    return UserProfile.objects.create_user(username='teacher', password='testpass', user_type='teacher')
+
+
+@pytest.fixture
+def client(teacher):
+    api_client = APIClient()
+    api_client.force_authenticate(user=teacher)
+    return api_client
+
+
+@pytest.fixture
+def questions(teacher):
+    subject = SubjectInfo.objects.create(subject_name='Keyset')
+    now = timezone.now()
+    # 같은 create_time이 여러 개 있어야 pk tie-breaker를 검증할 수 있음
+    return TestQuestionInfo.objects.bulk_create([
+        TestQuestionInfo(
+            name=f'Question {idx}', subject=subject, score=idx % 4, tq_type='xz', tq_degree='jd',
+            create_user=teacher, create_time=now - timedelta(minutes=idx // 3),
+        )
+        for idx in range(11)
+    ])
+
+
+def _walk(client, url, params, link='next'):
+    pages = []
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data)
+        if not response.data[link]:
+            return pages
+        response = client.get(response.data[link])
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """KeysetPagination 테스트"""
+
+    def test_walks_all_rows_in_order(self, client, questions):
+        """next link를 따라가면 (create_time, id) 역순으로 모든 행을 한 번씩 반환"""
+        pages = _walk(client, '/api/v1/questions/', {'cursor': '', 'page_size': 4})
+        ids = [item['id'] for page in pages for item in page['results']]
+
+        expected = sorted(questions, key=lambda question: (question.create_time, question.id), reverse=True)
+        assert ids == [question.id for question in expected]
+        assert [len(page['results']) for page in pages] == [4, 4, 3]
+        assert pages[0]['previous'] is None
+        assert all(page['count'] == 11 and page['count_approximate'] is False for page in pages)
+
+    def test_previous_link_returns_to_prior_page(self, client, questions):
+        """previous link는 직전 page와 같은 결과"""
+        first = client.get('/api/v1/questions/', {'cursor': '', 'page_size': 4}).data
+        second = client.get(first['next']).data
+        back = client.get(second['previous']).data
+
+        assert [item['id'] for item in back['results']] == [item['id'] for item in first['results']]
+        assert back['previous'] is None
+        assert back['next'] is not None
+
+    def test_ordering_param(self, client, questions):
+        """OrderingFilter 정렬(score 오름차순)도 keyset으로 이어진다"""
+        pages = _walk(client, '/api/v1/questions/', {'cursor': '', 'page_size': 3, 'ordering': 'score'})
+        ids = [item['id'] for page in pages for item in page['results']]
+        assert ids == [question.id for question in sorted(questions, key=lambda q: (q.score, q.id))]
+
+    def test_tampered_or_foreign_cursor(self, client, questions):
+        """변조된 cursor, 다른 정렬의 cursor는 404"""
+        first = client.get('/api/v1/questions/', {'cursor': '', 'page_size': 4}).data
+        cursor = first['next'].split('cursor=')[1].split('&')[0]
+
+        assert client.get('/api/v1/questions/', {'cursor': cursor[:-2] + 'xx'}).status_code == status.HTTP_404_NOT_FOUND
+        response = client.get('/api/v1/questions/', {'cursor': cursor, 'ordering': 'score'})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_count_modes(self, client, questions):
+        """count=estimate는 planner 추정치, count=none은 count 생략"""
+        estimated = client.get('/api/v1/questions/', {'cursor': '', 'count': 'estimate'}).data
+        assert estimated['count_approximate'] is True
+        assert isinstance(estimated['count'], int)
+
+        assert client.get('/api/v1/questions/', {'cursor': '', 'count': 'none'}).data['count'] is None
+        assert client.get('/api/v1/questions/', {'cursor': '', 'count': 'all'}).status_code == 400
+
+    def test_page_number_without_cursor(self, client, questions):
+        """cursor param이 없으면 기존 page 번호 응답"""
+        response = client.get('/api/v1/questions/', {'page': 2, 'page_size': 4})
+        assert set(response.data) == {'results', 'count', 'count_approximate', 'next', 'previous'}
+        assert 'page=3' in response.data['next']
+
+    def test_view_without_opt_in_ignores_cursor(self, client):
+        """cursor_pagination을 설정하지 않은 view는 page 번호 방식 유지"""
+        response = client.get('/api/v1/testpapers/', {'cursor': 'invalid'})
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestCountStrategy:
+    """StandardResultsSetPagination count 계산 방식 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    def _add_question(self, questions):
+        question = questions[0]
+        return TestQuestionInfo.objects.create(
+            name='Added', subject=question.subject, score=1, tq_type='xz', tq_degree='jd',
+            create_user=question.create_user,
+        )
+
+    def test_small_result_is_exact(self, client, questions):
+        """exact_threshold 미만은 매번 COUNT(*)"""
+        assert client.get('/api/v1/questions/').data['count'] == 11
+        self._add_question(questions)
+        response = client.get('/api/v1/questions/')
+        assert response.data['count'] == 12
+        assert response.data['count_approximate'] is False
+
+    def test_medium_result_is_cached(self, client, questions, monkeypatch):
+        """exact_threshold 이상은 filter별로 cache된 COUNT(*) 사용"""
+        monkeypatch.setattr(CountStrategy, 'exact_threshold', 0)
+        assert client.get('/api/v1/questions/').data['count'] == 11
+        self._add_question(questions)
+
+        response = client.get('/api/v1/questions/')
+        assert response.data['count'] == 11
+        assert response.data['count_approximate'] is False
+        # 다른 filter는 별도 cache
+        assert client.get('/api/v1/questions/', {'score_min': 0}).data['count'] == 12
+
+    def test_estimate_is_cached(self, client, questions, monkeypatch):
+        """cache가 유효한 동안에는 EXPLAIN을 다시 실행하지 않음 (작은 결과는 COUNT(*)만 다시 계산)"""
+        calls = []
+
+        def counting_estimate(queryset):
+            calls.append(queryset)
+            return estimate_count(queryset)
+
+        monkeypatch.setattr('core.api.pagination.estimate_count', counting_estimate)
+        assert client.get('/api/v1/questions/').data['count'] == 11
+        self._add_question(questions)
+
+        assert client.get('/api/v1/questions/').data['count'] == 12
+        assert len(calls) == 1
+
+    def test_large_result_uses_estimate(self, client, questions, monkeypatch):
+        """estimate_threshold 이상은 planner 추정치, page 이동은 실제 행 기준"""
+        monkeypatch.setattr(CountStrategy, 'exact_threshold', 0)
+        monkeypatch.setattr(CountStrategy, 'estimate_threshold', 0)
+
+        first = client.get('/api/v1/questions/', {'page_size': 5}).data
+        assert first['count_approximate'] is True
+        assert first['next'] is not None
+
+        # 마지막 page에서는 실제 행 수로 보정
+        last = client.get('/api/v1/questions/', {'page_size': 5, 'page': 3}).data
+        assert len(last['results']) == 1
+        assert last['next'] is None
+        assert (last['count'], last['count_approximate']) == (11, False)
+
+        response = client.get('/api/v1/questions/', {'page_size': 5, 'page': 4})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
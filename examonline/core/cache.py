@@ -0,0 +1,73 @@
+"""
+Cache utilities.
+"""
+import time
+import uuid
+
+from django.core.cache import cache
+
+# cache.get()에서 "값 없음"과 None 값을 구분하기 위한 sentinel
+MISSING = object()
+
+
+def _lock_key(key) -> str:
+    return f'{key}:lock'
+
+
+def get_or_build(key, builder, timeout=None, lock_timeout=10, wait_timeout=5, poll_interval=0.05):
+    """
+    Single-flight cache 조회.
+
+    cache miss 시 lock을 획득한 요청 하나만 builder를 실행하고,
+    동시에 들어온 나머지 요청은 결과가 저장될 때까지 대기한다 (thundering herd 방지).
+    lock 보유자가 실패하거나 wait_timeout이 지나면 직접 builder를 실행한다.
+    build 중 invalidate()가 호출되면 lock이 삭제되므로, lock 보유자는 invalidate 이전 데이터로 만든 값을 저장하지 않는다.
+
+    Args:
+        key: cache key
+        builder: cache miss 시 값을 생성하는 callable
+        timeout: 값의 cache 유지 시간 (초)
+        lock_timeout: lock 만료 시간 (초, builder 실행 시간보다 길어야 함)
+        wait_timeout: lock 대기 최대 시간 (초)
+        poll_interval: 대기 중 cache 재확인 간격 (초)
+    """
+    value = cache.get(key, MISSING)
+    if value is not MISSING:
+        return value
+
+    lock_key = _lock_key(key)
+    token = uuid.uuid4().hex
+
+    if cache.add(lock_key, token, lock_timeout):
+        try:
+            value = builder()
+            if cache.get(lock_key) == token:
+                cache.set(key, value, timeout)
+            return value
+        finally:
+            # 다른 요청이 만료 후 재획득한 lock은 해제하지 않음
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        value = cache.get(key, MISSING)
+        if value is not MISSING:
+            return value
+        if cache.get(lock_key) is None:
+            # lock 보유자가 값을 저장하지 못하고 종료됨
+            break
+
+    value = builder()
+    cache.add(key, value, timeout)
+    return value
+
+
+def invalidate(*keys):
+    """
+    get_or_build cache 값 삭제.
+
+    진행 중인 build의 lock도 함께 삭제하여 invalidate 이전에 시작된 build 결과가 저장되지 않게 한다.
+    """
+    cache.delete_many([cache_key for key in keys for cache_key in (key, _lock_key(key))])
@@ -0,0 +1,121 @@
+"""
+Database expressions.
+"""
+import json
+
+from django.db import NotSupportedError
+from django.db.models import Func, JSONField
+
+
+class JSONMerge(Func):
+    """
+    JSONField에 여러 key를 한 번에 병합하는 UPDATE expression.
+
+    order_key를 지정하면 key별 last-writer-wins: 새 값의 order_key가 기존 값의 order_key보다
+    작으면(더 오래된 값이면) 해당 key는 병합하지 않는다. 기존 값에 order_key가 없으면 새 값을 사용.
+    order_key 값은 문자열로 비교하므로 고정 길이 형식(예: UTC ISO 8601)이어야 한다.
+
+    - PostgreSQL: field || (SELECT jsonb_object_agg(...) FROM jsonb_each(values) WHERE ...)
+    - SQLite: json_patch (교체할 key를 먼저 null로 삭제 후 병합)
+
+    Usage:
+        TestScores.objects.filter(pk=pk).update(
+            detail_records=JSONMerge('detail_records', {'1': {'answer': 'a', 'ts': '...'}}, order_key='ts')
+        )
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, values, order_key=None):
+        self.values = values
+        self.order_key = order_key
+        super().__init__(expression)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        lhs, lhs_params = compiler.compile(self.source_expressions[0])
+        base = f"COALESCE(NULLIF({lhs}, 'null'::jsonb), '{{}}'::jsonb)"
+        if self.order_key is None:
+            return f'{base} || %s::jsonb', (*lhs_params, json.dumps(self.values))
+
+        sql = (
+            f"{base} || COALESCE(("
+            f"SELECT jsonb_object_agg(new.key, new.value) FROM jsonb_each(%s::jsonb) AS new "
+            f"WHERE ({lhs} -> new.key ->> %s) IS NULL OR ({lhs} -> new.key ->> %s) <= (new.value ->> %s)"
+            f"), '{{}}'::jsonb)"
+        )
+        params = (
+            *lhs_params, json.dumps(self.values),
+            *lhs_params, self.order_key, *lhs_params, self.order_key, self.order_key,
+        )
+        return sql, params
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        lhs, lhs_params = compiler.compile(self.source_expressions[0])
+        base = f"COALESCE(NULLIF({lhs}, 'null'), '{{}}')"
+        if self.order_key is None:
+            condition, condition_params = '1', ()
+        else:
+            existing = f"json_extract({lhs}, '$.\"' || new.key || '\".' || %s)"
+            condition = f"{existing} IS NULL OR {existing} <= json_extract(new.value, '$.' || %s)"
+            condition_params = (*lhs_params, self.order_key, *lhs_params, self.order_key, self.order_key)
+
+        # json_patch는 object를 재귀 병합하므로, 교체할 key를 먼저 null로 삭제한 뒤 새 값을 병합
+        winners = f'FROM json_each(%s) AS new WHERE {condition}'
+        sql = (
+            f"json_patch(json_patch({base}, "
+            f"(SELECT json_group_object(new.key, json('null')) {winners})), "
+            f"(SELECT json_group_object(new.key, json(new.value)) {winners}))"
+        )
+        values = json.dumps(self.values)
+        params = (*lhs_params, values, *condition_params, values, *condition_params)
+        return sql, params
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f'JSONMerge는 {connection.vendor} database를 지원하지 않습니다.')
+
+
+class JSONIncrement(Func):
+    """
+    JSONField의 숫자 값을 key별로 증감하는 UPDATE expression.
+
+    F('count') + 1 처럼 현재 값을 기준으로 계산하므로 동시에 실행되어도 증감이 누락되지 않는다.
+    (없는 key는 0으로 취급)
+
+    - PostgreSQL: field || (SELECT jsonb_object_agg(key, (field ->> key)::bigint + delta) ...)
+    - SQLite: json_patch(field, (SELECT json_group_object(key, json_extract(field, key) + delta) ...))
+
+    Usage:
+        ExamStatistics.objects.filter(pk=exam_id).update(
+            histogram=JSONIncrement('histogram', {'3': -1, '7': 1})
+        )
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, deltas):
+        self.deltas = {str(key): int(delta) for key, delta in deltas.items()}
+        super().__init__(expression)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        lhs, params = compiler.compile(self.source_expressions[0])
+        base = f"COALESCE(NULLIF({lhs}, 'null'::jsonb), '{{}}'::jsonb)"
+        sql = (
+            f"{base} || COALESCE(("
+            f"SELECT jsonb_object_agg(delta.key, COALESCE(({lhs} ->> delta.key)::bigint, 0) + delta.value::bigint) "
+            f"FROM jsonb_each_text(%s::jsonb) AS delta"
+            f"), '{{}}'::jsonb)"
+        )
+        return sql, (*params, *params, json.dumps(self.deltas))
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        lhs, params = compiler.compile(self.source_expressions[0])
+        base = f"COALESCE(NULLIF({lhs}, 'null'), '{{}}')"
+        sql = (
+            f"json_patch({base}, (SELECT json_group_object(delta.key, "
+            f"COALESCE(json_extract({lhs}, '$.\"' || delta.key || '\"'), 0) + delta.value) "
+            f"FROM json_each(%s) AS delta))"
+        )
+        return sql, (*params, *params, json.dumps(self.deltas))
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f'JSONIncrement는 {connection.vendor} database를 지원하지 않습니다.')
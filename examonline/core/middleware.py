@@ -0,0 +1,61 @@
+"""
+Core middleware.
+"""
+import logging
+import time
+
+from django.conf import settings
+
+from core.query_budget import QueryBudgetExceeded, QueryRecorder, get_query_budget
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """
+    요청별 query 수/중복 SQL/DB 시간 기록.
+
+    - 같은 SQL이 QUERY_BUDGET_DUPLICATE_THRESHOLD회 이상 반복되면 N+1 의심으로 warning log
+    - view에 선언된 query budget(@query_budget) 초과 시 warning log,
+      QUERY_BUDGET_RAISE가 켜져 있으면 QueryBudgetExceeded 발생 (개발/테스트 환경)
+    - Server-Timing header로 DB 시간, query 수, 전체 처리 시간 노출
+
+    QUERY_BUDGET_ENABLED가 꺼져 있으면 아무것도 기록하지 않음.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, 'QUERY_BUDGET_ENABLED', False):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        request.query_budget = None
+        start = time.perf_counter()
+        with recorder.record():
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        response['Server-Timing'] = (
+            f'db;dur={recorder.duration * 1000:.1f};desc="{recorder.count} queries", '
+            f'total;dur={elapsed * 1000:.1f}'
+        )
+
+        threshold = getattr(settings, 'QUERY_BUDGET_DUPLICATE_THRESHOLD', 3)
+        for sql, count in recorder.duplicates(threshold).items():
+            logger.warning(f'[N+1] {request.method} {request.path}: {count}x {sql[:200]}')
+
+        if request.query_budget is not None:
+            violations = request.query_budget.violations(recorder)
+            if violations:
+                message = f'{request.method} {request.path} exceeded query budget: ' + '; '.join(violations)
+                if getattr(settings, 'QUERY_BUDGET_RAISE', False):
+                    raise QueryBudgetExceeded(message)
+                logger.warning(f'[QUERY_BUDGET] {message}')
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if hasattr(request, 'query_budget'):
+            request.query_budget = get_query_budget(view_func, request.method)
@@ -0,0 +1,132 @@
+"""
+Query budget utilities.
+
+요청 처리 중 실행된 SQL을 기록하여 query 수, 중복 SQL(N+1 의심), DB 시간을 집계하고
+view별 query budget을 선언하는 decorator를 제공 (core.middleware.QueryBudgetMiddleware에서 사용).
+"""
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+
+from django.db import connections
+
+# IN (%s, %s, ...)처럼 bind parameter 개수만 다른 SQL은 같은 fingerprint로 취급
+_PLACEHOLDER_LIST = re.compile(r'\(\s*%s(?:\s*,\s*%s)*\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql):
+    """parameter 값과 개수를 제외한 SQL 형태"""
+    return _WHITESPACE.sub(' ', _PLACEHOLDER_LIST.sub('(...)', sql)).strip()
+
+
+class QueryBudgetExceeded(Exception):
+    """view에 선언된 query budget 초과"""
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """
+    view별 query 허용량.
+
+    Attributes:
+        max_queries: 요청당 최대 query 수
+        max_duplicates: 같은 SQL fingerprint의 최대 반복 횟수 (N+1 방지)
+    """
+
+    max_queries: int | None = None
+    max_duplicates: int | None = None
+
+    def violations(self, recorder) -> list:
+        """budget 위반 내역"""
+        violations = []
+        if self.max_queries is not None and recorder.count > self.max_queries:
+            violations.append(f'{recorder.count} queries (budget {self.max_queries})')
+        if self.max_duplicates is not None:
+            for sql, count in recorder.duplicates(self.max_duplicates + 1).items():
+                violations.append(f'{count}x duplicated (budget {self.max_duplicates}): {sql[:200]}')
+        return violations
+
+
+def query_budget(max_queries=None, max_duplicates=None):
+    """
+    view query budget 선언 decorator.
+
+    함수 view, APIView handler(get/post ...), ViewSet action/method, view class에 사용 가능.
+
+        @query_budget(max_queries=6, max_duplicates=1)
+        @action(detail=True, methods=['post'])
+        def submit(self, request, pk=None):
+            ...
+    """
+    budget = QueryBudget(max_queries, max_duplicates)
+
+    def decorator(view):
+        view.query_budget = budget
+        return view
+
+    return decorator
+
+
+def get_query_budget(view_func, method):
+    """
+    요청을 처리할 view의 query budget 조회
+
+    DRF view는 as_view()가 반환한 함수에 class(cls)와 HTTP method -> action mapping(actions)이 남아 있으므로
+    실제 handler method의 budget을 먼저 찾고, 없으면 class에 선언된 budget을 사용
+    """
+    budget = getattr(view_func, 'query_budget', None)
+    if budget is not None:
+        return budget
+
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    if view_class is None:
+        return None
+
+    method = method.lower()
+    actions = getattr(view_func, 'actions', None) or {}
+    handler = getattr(view_class, actions.get(method, method), None)
+    return getattr(handler, 'query_budget', None) or getattr(view_class, 'query_budget', None)
+
+
+class QueryRecorder:
+    """
+    실행된 SQL 기록 (connection.execute_wrapper).
+
+    Attributes:
+        count: 실행된 query 수
+        duration: DB 실행 시간 합계 (초)
+        fingerprints: SQL fingerprint별 실행 횟수
+        statements: 실행된 (connection alias, SQL, parameter) 목록 (capture_sql=True인 경우만)
+    """
+
+    def __init__(self, capture_sql=False):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self.statements = [] if capture_sql else None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+            if self.statements is not None and not many:
+                self.statements.append((context['connection'].alias, sql, params))
+
+    @contextmanager
+    def record(self):
+        """block 안에서 모든 DB connection의 query 기록"""
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+    def duplicates(self, threshold=2) -> dict:
+        """threshold회 이상 반복된 SQL fingerprint"""
+        return {sql: count for sql, count in self.fingerprints.items() if count >= threshold}
@@ -0,0 +1,68 @@
+"""
+QuerySet utilities.
+"""
+from django.db.models import QuerySet
+
+
+class UnionAllQuerySet(QuerySet):
+    """
+    UNION ALL queryset.
+
+    Django의 union() 결과는 filter()와 branch별 LIMIT을 지원하지 않으므로 다음을 추가로 처리한다.
+
+    - filter()/exclude(): 각 branch의 WHERE에 적용 (UNION ALL에 대한 선택은 branch별 선택의 UNION ALL과 같음)
+    - 정렬 후 slicing: 바깥 ORDER BY/LIMIT과 같은 정렬과 LIMIT(끝 위치)을 각 branch에도 적용하여
+      branch마다 index 순서대로 필요한 행만 읽는다 (top-N push-down)
+
+    branch는 서로 겹치지 않아야 하며(DISTINCT 없음), annotate/select_related 등은 union_all() 전에 적용한다.
+    """
+
+    def filter(self, *args, **kwargs):
+        return self._push_down('filter', *args, **kwargs)
+
+    def exclude(self, *args, **kwargs):
+        return self._push_down('exclude', *args, **kwargs)
+
+    def __getitem__(self, k):
+        if not (self.query.combinator and isinstance(k, slice) and k.stop is not None and self.query.order_by):
+            return super().__getitem__(k)
+
+        clone = self._chain()
+        clone.query.combined_queries = tuple(self._top(query, k.stop) for query in clone.query.combined_queries)
+        return super(UnionAllQuerySet, clone).__getitem__(k)
+
+    def _push_down(self, method, *args, **kwargs):
+        if not self.query.combinator:
+            return getattr(super(), method)(*args, **kwargs)
+        if self.query.is_sliced:
+            raise TypeError('Cannot filter a query once a slice has been taken.')
+
+        clone = self._chain()
+        clone.query.combined_queries = tuple(
+            getattr(QuerySet(self.model, query.chain()), method)(*args, **kwargs).query
+            for query in clone.query.combined_queries
+        )
+        return clone
+
+    def _top(self, query, stop):
+        query = query.chain()
+        query.clear_ordering(force=True)
+        query.add_ordering(*self.query.order_by)
+        query.set_limits(high=stop)
+        return query
+
+
+def union_all(*querysets, ordering=()):
+    """
+    겹치지 않는 queryset들의 UNION ALL (queryset이 하나면 그대로 정렬만 적용)
+
+    Args:
+        querysets: 같은 model, 같은 select 구성의 queryset (branch 정렬은 제거)
+        ordering: 바깥 정렬 (select에 포함된 field/annotation 이름)
+    """
+    first, *others = [queryset.order_by() for queryset in querysets]
+    if not others:
+        return first.order_by(*ordering)
+
+    combined = first.union(*others, all=True).order_by(*ordering)
+    return UnionAllQuerySet(model=combined.model, query=combined.query, using=combined._db)
@@ -0,0 +1,138 @@
+"""
+Query Budget Middleware Tests.
+"""
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.middleware import QueryBudgetMiddleware
+from core.query_budget import QueryBudgetExceeded, QueryRecorder, fingerprint, get_query_budget, query_budget
+from examination.api.taking_views import ExamTakingViewSet
+from user.api.views import TeacherDashboardView
+from user.models import SubjectInfo
+
+
+def list_subjects(request):
+    """과목 수만큼 같은 query를 반복하는 N+1 view"""
+    for subject in SubjectInfo.objects.all():
+        SubjectInfo.objects.filter(pk=subject.pk).exists()
+    return HttpResponse('ok')
+
+
+def budgeted(**budget):
+    """budget이 선언된 list_subjects view"""
+    @query_budget(**budget)
+    def view(request):
+        return list_subjects(request)
+    return view
+
+
+def call(view, method='get'):
+    """process_view -> view 순서로 실행하는 handler를 middleware로 감싸 호출"""
+    request = getattr(RequestFactory(), method)('/budget/')
+
+    def handler(request):
+        middleware.process_view(request, view, (), {})
+        return view(request)
+
+    middleware = QueryBudgetMiddleware(handler)
+    return middleware(request)
+
+
+@pytest.fixture
+def subjects(db):
+    return [SubjectInfo.objects.create(subject_name=f'Budget {idx}') for idx in range(4)]
+
+
+@pytest.fixture
+def budget_settings(settings):
+    settings.QUERY_BUDGET_ENABLED = True
+    settings.QUERY_BUDGET_RAISE = True
+    settings.QUERY_BUDGET_DUPLICATE_THRESHOLD = 3
+    return settings
+
+
+class TestFingerprint:
+    """SQL fingerprint 테스트"""
+
+    def test_in_list_collapsed(self):
+        assert fingerprint('SELECT 1 WHERE id IN (%s, %s, %s)') == fingerprint('SELECT 1 WHERE id IN (%s)')
+
+    def test_whitespace_normalized(self):
+        assert fingerprint('SELECT  1\n FROM t') == 'SELECT 1 FROM t'
+
+
+@pytest.mark.django_db
+class TestQueryBudgetMiddleware:
+    """QueryBudgetMiddleware 테스트"""
+
+    def test_recorder_counts_duplicates(self, subjects):
+        recorder = QueryRecorder()
+        with recorder.record():
+            list_subjects(None)
+
+        assert recorder.count == 5
+        assert list(recorder.duplicates().values()) == [4]
+        assert recorder.duration > 0
+        assert recorder.statements is None
+
+    def test_recorder_captures_sql(self, subjects):
+        recorder = QueryRecorder(capture_sql=True)
+        with recorder.record():
+            list_subjects(None)
+
+        assert len(recorder.statements) == 5
+        alias, sql, params = recorder.statements[-1]
+        assert alias == 'default'
+        assert sql.startswith('SELECT') and params
+
+    def test_server_timing_header(self, budget_settings, subjects):
+        response = call(list_subjects)
+
+        assert response.status_code == 200
+        assert 'desc="5 queries"' in response['Server-Timing']
+        assert 'total;dur=' in response['Server-Timing']
+
+    def test_disabled_records_nothing(self, settings, subjects):
+        settings.QUERY_BUDGET_ENABLED = False
+        assert not call(list_subjects).has_header('Server-Timing')
+
+    def test_duplicate_queries_logged(self, budget_settings, subjects, caplog):
+        with caplog.at_level('WARNING', logger='core.middleware'):
+            call(list_subjects)
+
+        assert '[N+1] GET /budget/: 4x SELECT' in caplog.text
+
+    def test_budget_exceeded_raises(self, budget_settings, subjects):
+        with pytest.raises(QueryBudgetExceeded, match='5 queries \\(budget 3\\)'):
+            call(budgeted(max_queries=3))
+
+        with pytest.raises(QueryBudgetExceeded, match='4x duplicated'):
+            call(budgeted(max_duplicates=1))
+
+    def test_budget_exceeded_logged_without_raise(self, budget_settings, subjects, caplog):
+        budget_settings.QUERY_BUDGET_RAISE = False
+        with caplog.at_level('WARNING', logger='core.middleware'):
+            response = call(budgeted(max_queries=3))
+
+        assert response.status_code == 200
+        assert '[QUERY_BUDGET] GET /budget/ exceeded query budget' in caplog.text
+
+    def test_budget_within_limit(self, budget_settings, subjects):
+        assert call(budgeted(max_queries=5)).status_code == 200
+
+
+class TestGetQueryBudget:
+    """DRF view budget 조회 테스트"""
+
+    def test_viewset_action_budget(self):
+        view = ExamTakingViewSet.as_view({'post': 'submit'})
+        assert get_query_budget(view, 'POST') == ExamTakingViewSet.submit.query_budget
+
+    def test_api_view_handler_budget(self):
+        budget = get_query_budget(TeacherDashboardView.as_view(), 'GET')
+        assert budget.max_queries == 10
+
+    def test_undeclared_view(self):
+        assert get_query_budget(ExamTakingViewSet.as_view({'get': 'status'}), 'GET') is None
+        assert get_query_budget(list_subjects, 'GET') is None
@@ -0,0 +1,62 @@
+"""
+QuerySet Utility Tests.
+"""
+from datetime import timedelta
+
+import pytest
+from django.db.models import Q
+from django.utils import timezone
+
+from core.querysets import UnionAllQuerySet, union_all
+from user.models import UserProfile
+
+
+@pytest.fixture
+def users(db):
+    now = timezone.now()
+    return UserProfile.objects.bulk_create([
+        UserProfile(
+            username=f'union{idx}', user_type='teacher' if idx % 3 == 0 else 'student',
+            date_joined=now - timedelta(minutes=idx), age=idx,
+        )
+        for idx in range(12)
+    ])
+
+
+def _branches():
+    base = UserProfile.objects.filter(username__startswith='union')
+    return base.filter(user_type='teacher'), base.filter(user_type='student')
+
+
+@pytest.mark.django_db
+class TestUnionAll:
+    """union_all / UnionAllQuerySet 테스트"""
+
+    def test_matches_or_query(self, users):
+        """UNION ALL 결과는 같은 조건의 OR 결과와 같은 순서"""
+        combined = union_all(*_branches(), ordering=['-date_joined', 'pk'])
+        expected = UserProfile.objects.filter(username__startswith='union').order_by('-date_joined', 'pk')
+
+        assert isinstance(combined, UnionAllQuerySet)
+        assert [user.pk for user in combined] == [user.pk for user in expected]
+        assert combined.count() == 12
+
+    def test_filter_pushed_into_branches(self, users):
+        """filter/exclude는 각 branch에 적용"""
+        combined = union_all(*_branches(), ordering=['age']).filter(age__gte=3).exclude(Q(age=5) | Q(age=6))
+        assert [user.age for user in combined] == [3, 4, 7, 8, 9, 10, 11]
+
+    def test_slice_pushes_limit_into_branches(self, users):
+        """정렬 후 slicing은 branch마다 같은 정렬과 LIMIT 적용"""
+        page = union_all(*_branches(), ordering=['age'])[2:5]
+        sql = str(page.query)
+
+        assert sql.count('LIMIT 5') == 2
+        assert [user.age for user in page] == [2, 3, 4]
+
+    def test_single_queryset(self, users):
+        """queryset이 하나면 UNION 없이 정렬만 적용"""
+        teachers, _ = _branches()
+        combined = union_all(teachers, ordering=['-age'])
+        assert combined.query.combinator is None
+        assert [user.age for user in combined] == [9, 6, 3, 0]
@@ -0,0 +1,120 @@
+"""
+Database Expression Tests.
+"""
+import json
+import sqlite3
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from core.expressions import JSONIncrement, JSONMerge
+from testpaper.models import TestScores
+from user.models import StudentsInfo, UserProfile
+
+
+class FakeCompiler:
+    """lhs를 bind parameter 하나로 compile하는 compiler (SQLite SQL 검증용)"""
+
+    def __init__(self, document):
+        self.document = document
+
+    def compile(self, expression):
+        return '%s', [self.document]
+
+
+def run_sqlite(expression, document):
+    sql, params = expression.as_sqlite(FakeCompiler(document), None)
+    with sqlite3.connect(':memory:') as conn:
+        (result,) = conn.execute(f'SELECT {sql}'.replace('%s', '?'), params).fetchone()
+    return json.loads(result)
+
+
+@pytest.fixture
+def test_score(db):
+    user = UserProfile.objects.create_user(username='student_json', password='testpass123', user_type='student')
+    student = StudentsInfo.objects.create(user=user, student_name='JSON Student', student_id='20250501')
+    return TestScores.objects.create(
+        user=student, start_time=timezone.now() - timedelta(minutes=1),
+        detail_records={'1': {'answer': 'a'}, '2': {'answer': 'b'}},
+    )
+
+
+class TestJSONMergeSQLite:
+    """SQLite fallback 테스트"""
+
+    def test_last_writer_wins(self):
+        document = json.dumps({'1': {'answer': 'a', 'ts': '2'}, '2': {'answer': 'b', 'ts': '5'}, '3': 'c'})
+        values = {'1': {'answer': 'new', 'ts': '3'}, '2': {'answer': 'stale', 'ts': '1'}, '4': {'answer': 'd', 'ts': '1'}}
+
+        result = run_sqlite(JSONMerge('detail_records', values, order_key='ts'), document)
+
+        assert result == {
+            '1': {'answer': 'new', 'ts': '3'}, '2': {'answer': 'b', 'ts': '5'}, '3': 'c', '4': {'answer': 'd', 'ts': '1'}
+        }
+
+    def test_replaces_whole_value(self):
+        """병합 대상 key는 재귀 병합하지 않고 통째로 교체"""
+        document = json.dumps({'1': {'answer': 'a', 'extra': True}})
+
+        result = run_sqlite(JSONMerge('detail_records', {'1': {'answer': 'b'}}), document)
+
+        assert result == {'1': {'answer': 'b'}}
+
+
+class TestJSONIncrementSQLite:
+    """SQLite fallback 테스트"""
+
+    def test_increments_and_adds_keys(self):
+        result = run_sqlite(JSONIncrement('histogram', {'1': -1, 3: 2}), json.dumps({'1': 4, '2': 1}))
+        assert result == {'1': 3, '2': 1, '3': 2}
+        assert run_sqlite(JSONIncrement('histogram', {'0': 1}), None) == {'0': 1}
+
+
+@pytest.mark.django_db
+class TestJSONMergePostgres:
+    """PostgreSQL JSONMerge 테스트"""
+
+    def test_last_writer_wins(self, test_score):
+        TestScores.objects.filter(pk=test_score.pk).update(
+            detail_records={'1': {'answer': 'a', 'ts': '2'}, '2': {'answer': 'b', 'ts': '5'}, '3': 'c'}
+        )
+        values = {'1': {'answer': 'new', 'ts': '3'}, '2': {'answer': 'stale', 'ts': '1'}, '4': {'answer': 'd', 'ts': '1'}}
+
+        TestScores.objects.filter(pk=test_score.pk).update(
+            detail_records=JSONMerge('detail_records', values, order_key='ts')
+        )
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records == {
+            '1': {'answer': 'new', 'ts': '3'}, '2': {'answer': 'b', 'ts': '5'}, '3': 'c', '4': {'answer': 'd', 'ts': '1'}
+        }
+
+    def test_merge_without_order_key(self, test_score):
+        TestScores.objects.filter(pk=test_score.pk).update(
+            detail_records=JSONMerge('detail_records', {'2': {'answer': 'x'}})
+        )
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records == {'1': {'answer': 'a'}, '2': {'answer': 'x'}}
+
+
+@pytest.mark.django_db
+class TestJSONIncrementPostgres:
+    """PostgreSQL JSONIncrement 테스트"""
+
+    def test_increments_and_adds_keys(self, test_score):
+        TestScores.objects.filter(pk=test_score.pk).update(detail_records={'1': 4, '2': 1})
+
+        TestScores.objects.filter(pk=test_score.pk).update(
+            detail_records=JSONIncrement('detail_records', {'1': -1, 3: 2})
+        )
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records == {'1': 3, '2': 1, '3': 2}
+
+    def test_empty_deltas_keep_document(self, test_score):
+        TestScores.objects.filter(pk=test_score.pk).update(detail_records=JSONIncrement('detail_records', {}))
+
+        test_score.refresh_from_db()
+        assert test_score.detail_records == {'1': {'answer': 'a'}, '2': {'answer': 'b'}}